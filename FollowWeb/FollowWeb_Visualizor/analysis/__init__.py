@@ -3,7 +3,8 @@ Analysis layer for FollowWeb social network analysis.
 
 This module provides network analysis algorithms including community detection,
 centrality calculations, path analysis, fame analysis, connectivity metrics,
-and large-scale graph partitioning for distributed processing.
+large-scale graph partitioning for distributed processing, and expansion of
+hub-represented sample groups.
 """
 
 from .centrality import (
@@ -14,9 +15,19 @@ from .centrality import (
 )
 from .connectivity import (
     calculate_connectivity_metrics,
+    calculate_topology_connectivity,
     validate_connectivity,
 )
 from .fame import FameAnalyzer
+from .groups import (
+    expand_groups,
+    get_sample_groups,
+    group_degree,
+    group_edge_count,
+    group_membership,
+    group_neighbors,
+    iter_group_edges,
+)
 from .network import NetworkAnalyzer
 from .partition_merger import MergedResults, PartitionResultsMerger
 from .partition_worker import PartitionAnalysisWorker, PartitionResults
@@ -32,7 +43,15 @@ __all__ = [
     "set_default_centrality_values",
     "display_centrality_results",
     "calculate_connectivity_metrics",
+    "calculate_topology_connectivity",
     "validate_connectivity",
+    "get_sample_groups",
+    "group_edge_count",
+    "iter_group_edges",
+    "group_membership",
+    "group_neighbors",
+    "group_degree",
+    "expand_groups",
     "GraphPartitioner",
     "PartitionInfo",
     "PartitionAnalysisWorker",
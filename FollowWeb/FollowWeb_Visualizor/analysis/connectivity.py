@@ -8,7 +8,7 @@ and graph density measurements.
 
 # Standard library imports
 import logging
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 # Third-party imports
 import networkx as nx
@@ -17,6 +17,9 @@ import networkx as nx
 from ..data.cache import get_cached_undirected_graph
 from ..utils.progress import ProgressTracker
 
+if TYPE_CHECKING:
+    from ..data.storage.csr_topology import CSRTopology
+
 
 def calculate_connectivity_metrics(
     graph: nx.Graph, logger: Optional[logging.Logger] = None
@@ -145,6 +148,110 @@ def calculate_connectivity_metrics(
     return metrics
 
 
+def calculate_topology_connectivity(
+    topology: "CSRTopology", logger: Optional[logging.Logger] = None
+) -> dict[str, Any]:
+    """
+    Calculate connectivity metrics on CSR topology arrays.
+
+    Same metrics as calculate_connectivity_metrics(), computed with
+    scipy.sparse.csgraph on the symmetric adjacency pattern instead of a
+    NetworkX graph, so a memory-mapped checkpoint topology (see
+    load_checkpoint_csr()) never has to be converted to a DiGraph.
+
+    Args:
+        topology: Directed CSR topology to analyze
+        logger: Optional logger instance
+
+    Returns:
+        Dictionary with the keys of calculate_connectivity_metrics()
+
+    Example:
+        >>> topology = load_checkpoint_csr("data/freesound_library")
+        >>> metrics = calculate_topology_connectivity(topology, logger)
+    """
+    import numpy as np
+    from scipy import sparse
+    from scipy.sparse.csgraph import connected_components
+
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    graph_size = topology.num_nodes
+
+    if graph_size == 0:
+        logger.warning("Empty topology provided for connectivity analysis")
+        return {
+            "num_components": 0,
+            "largest_component_size": 0,
+            "largest_component_pct": 0.0,
+            "avg_clustering": 0.0,
+            "density": 0.0,
+            "is_connected": False,
+        }
+
+    logger.debug(
+        f"Calculating connectivity metrics for topology with {graph_size:,} nodes"
+    )
+
+    # Undirected simple graph: symmetric 0/1 pattern without self-loops
+    xadj, adjncy = topology.to_undirected_adjacency()
+    adjacency = sparse.csr_matrix(
+        (np.ones(len(adjncy), dtype=np.float64), adjncy, xadj),
+        shape=(graph_size, graph_size),
+    )
+
+    num_components, labels = connected_components(adjacency, directed=False)
+    largest_component_size = int(np.bincount(labels).max())
+    largest_component_pct = (largest_component_size / graph_size) * 100
+
+    # Each undirected edge appears twice in the pattern; nx.density also
+    # counts self-loops, which the pattern leaves out
+    self_loops = int(np.count_nonzero(topology.sources() == topology.indices))
+    density = (
+        (adjacency.nnz + 2 * self_loops) / (graph_size * (graph_size - 1))
+        if graph_size > 1
+        else 0.0
+    )
+
+    # Clustering from triangle counts: rows of (A @ A) * A summed per node.
+    # Sample rows for large graphs, as calculate_connectivity_metrics() does.
+    if graph_size > 10000:
+        sample_size = min(5000, max(1000, graph_size // 10))
+        rows = np.random.default_rng().choice(graph_size, sample_size, replace=False)
+    else:
+        rows = np.arange(graph_size)
+
+    sampled = adjacency[rows]
+    triangles = np.asarray((sampled @ adjacency).multiply(sampled).sum(axis=1))
+    degrees = np.diff(xadj)[rows].astype(np.float64)
+    possible = degrees * (degrees - 1)
+    clustering = np.divide(
+        triangles.ravel(),
+        possible,
+        out=np.zeros_like(possible),
+        where=possible > 0,
+    )
+    avg_clustering = float(clustering.mean())
+
+    metrics = {
+        "num_components": int(num_components),
+        "largest_component_size": largest_component_size,
+        "largest_component_pct": largest_component_pct,
+        "avg_clustering": avg_clustering,
+        "density": float(density),
+        "is_connected": num_components == 1,
+    }
+
+    logger.debug(
+        f"Connectivity metrics: {num_components} components, "
+        f"{largest_component_pct:.1f}% in largest, "
+        f"density={density:.4f}, clustering={avg_clustering:.4f}"
+    )
+
+    return metrics
+
+
 def validate_connectivity(
     graph: nx.Graph, logger: Optional[logging.Logger] = None
 ) -> dict[str, Any]:
@@ -0,0 +1,217 @@
+"""
+Sample group analysis for hub-represented user and pack relationships.
+
+A group of k samples (same uploader, same pack) stored as pairwise edges takes
+k·(k−1) directed edges. With group_edges='hub' the Freesound loader stores
+each group once as a membership list in graph.graph['sample_groups'] instead:
+
+    {"by_same_user": {"alice": ["1", "2", "3"]}, "in_same_pack": {...}}
+
+This module expands those groups on demand: lazily edge by edge, per node, or
+into a materialized copy of the graph with the clique edges added.
+"""
+
+# Standard library imports
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+# Third-party imports
+import networkx as nx
+
+SAMPLE_GROUPS_KEY = "sample_groups"
+"""Graph attribute holding the group membership table"""
+
+
+def get_sample_groups(
+    graph: nx.Graph, edge_types: Optional[Iterable[str]] = None
+) -> dict[str, dict[str, list[Any]]]:
+    """
+    Get the group membership table of a graph, restricted to its nodes.
+
+    Args:
+        graph: Graph whose groups to read
+        edge_types: Group types to include (default: all)
+
+    Returns:
+        Dictionary mapping edge type to group name to member node IDs. Members
+        no longer in the graph are dropped, as are groups left with fewer than
+        two members.
+    """
+    table = graph.graph.get(SAMPLE_GROUPS_KEY, {})
+    wanted = set(table) if edge_types is None else set(edge_types)
+
+    groups: dict[str, dict[str, list[Any]]] = {}
+    for edge_type, type_groups in table.items():
+        if edge_type not in wanted:
+            continue
+        present = {}
+        for name, members in type_groups.items():
+            members = [node for node in members if node in graph]
+            if len(members) >= 2:
+                present[name] = members
+        groups[edge_type] = present
+    return groups
+
+
+def group_edge_count(graph: nx.Graph) -> int:
+    """
+    Count the directed edges the groups of a graph stand for.
+
+    Upper bound of the edges expand_groups() adds: pairs already connected,
+    or sharing more than one group, are only added once.
+
+    Args:
+        graph: Graph with a group membership table
+
+    Returns:
+        Sum of k·(k−1) over all groups
+    """
+    return sum(
+        len(members) * (len(members) - 1)
+        for type_groups in get_sample_groups(graph).values()
+        for members in type_groups.values()
+    )
+
+
+def iter_group_edges(
+    graph: nx.Graph, edge_types: Optional[Iterable[str]] = None
+) -> Iterator[tuple[Any, Any, dict[str, Any]]]:
+    """
+    Yield the clique edges of every group without materializing them.
+
+    Edges come in the order the loader's clique mode adds them: per group,
+    each member pair (j < k) as j → k then k → j. A pair sharing several
+    groups is yielded once per group.
+
+    Args:
+        graph: Graph with a group membership table
+        edge_types: Group types to expand (default: all)
+
+    Yields:
+        (source, target, attributes) tuples with 'type' and 'weight'
+    """
+    for edge_type, type_groups in get_sample_groups(graph, edge_types).items():
+        for members in type_groups.values():
+            for j, source in enumerate(members):
+                for target in members[j + 1 :]:
+                    yield source, target, {"type": edge_type, "weight": 1.0}
+                    yield target, source, {"type": edge_type, "weight": 1.0}
+
+
+def group_membership(graph: nx.Graph) -> dict[Any, list[tuple[str, str]]]:
+    """
+    Index the groups each node belongs to.
+
+    Args:
+        graph: Graph with a group membership table
+
+    Returns:
+        Dictionary mapping node ID to its (edge_type, group name) pairs
+    """
+    membership: dict[Any, list[tuple[str, str]]] = {}
+    for edge_type, type_groups in get_sample_groups(graph).items():
+        for name, members in type_groups.items():
+            for node in members:
+                membership.setdefault(node, []).append((edge_type, name))
+    return membership
+
+
+def group_neighbors(
+    graph: nx.Graph,
+    node: Any,
+    membership: Optional[dict[Any, list[tuple[str, str]]]] = None,
+) -> set[Any]:
+    """
+    Get the nodes sharing a group with a node (its virtual clique neighbours).
+
+    Args:
+        graph: Graph with a group membership table
+        node: Node to look up
+        membership: Index from group_membership(), reused across lookups
+            (built on each call if None)
+
+    Returns:
+        Set of other members of the node's groups
+    """
+    if membership is None:
+        membership = group_membership(graph)
+    table = graph.graph.get(SAMPLE_GROUPS_KEY, {})
+
+    neighbors = set()
+    for edge_type, name in membership.get(node, []):
+        neighbors.update(m for m in table[edge_type][name] if m in graph)
+    neighbors.discard(node)
+    return neighbors
+
+
+def group_degree(graph: nx.DiGraph) -> dict[Any, int]:
+    """
+    Get the degree of each node as it would be in expand_groups(graph).
+
+    Counts the group edges per node without materializing them, for sizing
+    and statistics on graphs whose groups are too large to expand.
+
+    Args:
+        graph: Graph with a group membership table
+
+    Returns:
+        Dictionary mapping node ID to degree (in + out for directed graphs)
+    """
+    membership = group_membership(graph)
+    directed = graph.is_directed()
+
+    degrees = dict(graph.degree())  # type: ignore[operator]
+    for node in membership:
+        for neighbor in group_neighbors(graph, node, membership):
+            # A directed group pair adds j → k and k → j where missing
+            if directed:
+                degrees[node] += (
+                    2 - graph.has_edge(node, neighbor) - graph.has_edge(neighbor, node)
+                )
+            else:
+                degrees[node] += 1 - graph.has_edge(node, neighbor)
+    return degrees
+
+
+def expand_groups(
+    graph: nx.DiGraph,
+    edge_types: Optional[Iterable[str]] = None,
+    copy: bool = True,
+) -> nx.DiGraph:
+    """
+    Materialize group cliques as edges, for analysis that needs them.
+
+    Existing edges are kept as they are; a group edge is only added between
+    nodes not connected yet. Expanded groups are removed from the table.
+
+    Args:
+        graph: Graph with a group membership table
+        edge_types: Group types to expand (default: all)
+        copy: Expand a copy (True) or the graph itself (False)
+
+    Returns:
+        Graph with the group edges added
+
+    Example:
+        >>> expanded = expand_groups(loader.graph)
+        >>> expanded.number_of_edges() - loader.graph.number_of_edges()
+    """
+    wanted = None if edge_types is None else set(edge_types)
+    expanded = graph.copy() if copy else graph
+    for source, target, attributes in iter_group_edges(expanded, wanted):
+        if not expanded.has_edge(source, target):
+            expanded.add_edge(source, target, **attributes)
+
+    table = expanded.graph.get(SAMPLE_GROUPS_KEY)
+    if table is not None:
+        # graph.copy() shares graph-level attribute values, so rebuild the table
+        remaining = {
+            edge_type: type_groups
+            for edge_type, type_groups in table.items()
+            if wanted is not None and edge_type not in wanted
+        }
+        if remaining:
+            expanded.graph[SAMPLE_GROUPS_KEY] = remaining
+        else:
+            del expanded.graph[SAMPLE_GROUPS_KEY]
+    return expanded
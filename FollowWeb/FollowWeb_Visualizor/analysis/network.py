@@ -31,6 +31,7 @@ from ..utils.parallel import (
     get_nx_parallel_status_message,
     log_parallel_usage,
 )
+from .groups import expand_groups, get_sample_groups
 
 
 class NetworkAnalyzer:
@@ -91,6 +92,8 @@ class NetworkAnalyzer:
         Note:
             For graphs with fewer than 2 nodes, analysis is skipped and the original
             graph is returned unchanged. Uses sampling for large graphs based on mode.
+            Hub-represented sample groups (graph.graph['sample_groups']) are
+            analyzed as the clique edges they stand for.
         """
         MIN_NODES_FOR_ANALYSIS = 2
 
@@ -115,6 +118,9 @@ class NetworkAnalyzer:
             )
             return graph
 
+        if any(get_sample_groups(graph).values()):
+            return self._analyze_with_groups(graph)
+
         # Get performance configurations
         community_config = self._get_component_config("community_detection", graph_size)
         centrality_config = self._get_component_config(
@@ -218,6 +224,34 @@ class NetworkAnalyzer:
 
         return graph
 
+    def _analyze_with_groups(self, graph: nx.DiGraph) -> nx.DiGraph:
+        """
+        Analyze a graph with its sample groups expanded into edges.
+
+        Communities and centrality are computed on an expanded copy, so
+        grouped samples are connected as in clique mode; the resulting node
+        attributes are copied back to the original graph, which keeps its
+        compact group table.
+
+        Args:
+            graph: Graph with a group membership table
+
+        Returns:
+            nx.DiGraph: The original graph with the analysis node attributes
+        """
+        expanded = expand_groups(graph)
+        self.logger.info(
+            f"Expanded sample groups for analysis: "
+            f"{expanded.number_of_edges() - graph.number_of_edges()} group edges"
+        )
+        self.analyze_network(expanded)
+
+        for attribute in ("community", "degree", "betweenness", "eigenvector"):
+            values = nx.get_node_attributes(expanded, attribute)
+            if values:
+                nx.set_node_attributes(graph, values, attribute)
+        return graph
+
     def _should_execute_component(self, component_name: str) -> bool:
         """Check if a component should be executed based on configuration."""
         if self.stages_controller:
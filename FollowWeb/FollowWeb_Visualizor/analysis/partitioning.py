@@ -14,6 +14,7 @@ import logging
 import math
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional
 
 import networkx as nx
 
@@ -25,6 +26,7 @@ except ImportError:
     PYMETIS_AVAILABLE = False
 
 from ..utils.parallel import ParallelProcessingManager
+from .groups import expand_groups
 
 
 @dataclass
@@ -128,7 +130,8 @@ class GraphPartitioner:
         Partition graph using METIS algorithm to minimize edge cuts.
 
         METIS provides optimal partitioning with minimal edge cuts and
-        balanced partition sizes.
+        balanced partition sizes. Hub-represented sample groups are
+        partitioned as the clique edges they stand for.
 
         Args:
             graph: NetworkX directed graph to partition
@@ -152,8 +155,9 @@ class GraphPartitioner:
             f"into {num_partitions} partitions using METIS"
         )
 
-        # Convert to undirected for partitioning
-        undirected = graph.to_undirected()
+        # Convert to undirected for partitioning (a copy, so groups can be
+        # expanded in place)
+        undirected = expand_groups(graph.to_undirected(), copy=False)
 
         # Create node mapping (METIS requires 0-indexed nodes)
         node_list = list(undirected.nodes())
@@ -191,6 +195,59 @@ class GraphPartitioner:
 
         return partitions
 
+    def partition_topology(
+        self,
+        topology,
+        num_partitions: int,
+        sample_groups: Optional[dict[str, dict[str, list]]] = None,
+    ) -> list[list]:
+        """
+        Partition a CSR topology with METIS without building a NetworkX graph.
+
+        The METIS adjacency (xadj/adjncy) is derived directly from the
+        memory-mapped CSR arrays, so partitioning a checkpoint never has to
+        unpickle or materialize the full graph.
+
+        Args:
+            topology: CSRTopology (e.g. load_checkpoint_csr(checkpoint_dir))
+            num_partitions: Number of partitions to create
+            sample_groups: Optional hub group membership table (e.g.
+                load_checkpoint_sample_groups(checkpoint_dir)); group members
+                are partitioned as if connected by clique edges
+
+        Returns:
+            List[list]: Node IDs assigned to each partition
+        """
+        if not PYMETIS_AVAILABLE:
+            raise ImportError(
+                "pymetis is required for graph partitioning but is not available. "
+                "pymetis is only supported on Linux and macOS."
+            )
+
+        node_ids = [topology.node_id(i) for i in range(topology.num_nodes)]
+
+        if num_partitions <= 1:
+            self.logger.info("Single partition requested, returning all nodes")
+            return [node_ids]
+
+        self.logger.info(
+            f"Partitioning CSR topology with {topology.num_nodes} nodes "
+            f"into {num_partitions} partitions using METIS"
+        )
+
+        xadj, adjncy = topology.to_undirected_adjacency(sample_groups)
+        n_cuts, membership = pymetis.part_graph(
+            num_partitions, xadj=xadj, adjncy=adjncy
+        )
+
+        self.logger.info(f"METIS partitioning complete with {n_cuts} edge cuts")
+
+        partitions: list[list] = [[] for _ in range(num_partitions)]
+        for idx, part in enumerate(membership):
+            partitions[part].append(node_ids[idx])
+
+        return partitions
+
     def save_partition(
         self, partition: nx.DiGraph, partition_id: int, output_dir: str
     ) -> str:
@@ -13,8 +13,20 @@ Modules:
     cache: CentralizedCache class and caching utilities
     processors: Graph filtering, reciprocal filtering, k-core operations
     checkpoint: GraphCheckpoint for incremental graph building
+    topology_journal: TopologyJournal for delta checkpoint saves,
+        TrackedDiGraph for detecting unjournaled graph edits
+    checkpoint_reader: load_checkpoint_topology (snapshot + journal),
+        load_checkpoint_csr and load_checkpoint_sample_groups for scripts
+        reading a checkpoint directory
+    checkpoint_writer: CheckpointWriter for background checkpoint saves
+    fetch_engine: FetchEngine for concurrent prefetching of API results
+    budget_planner: RequestBudgetPlanner for splitting the daily API budget
+    tag_similarity: jaccard_pairs exact tag similarity join (inverted index),
+        jaccard_edges exact join (sparse matrix kernel), minhash_pairs
+        approximate join (MinHash-LSH)
 """
 
+from .budget_planner import RequestBudgetPlanner
 from .cache import (
     CentralizedCache,
     calculate_graph_hash,
@@ -24,13 +36,29 @@ from .cache import (
     get_cached_undirected_graph,
 )
 from .checkpoint import GraphCheckpoint
+from .checkpoint_reader import (
+    load_checkpoint_csr,
+    load_checkpoint_sample_groups,
+    load_checkpoint_topology,
+)
 from .checkpoint_verifier import CheckpointVerifier
+from .checkpoint_writer import CheckpointSnapshot, CheckpointWriter
+from .fetch_engine import FetchEngine
 from .loaders import (
     DataLoader,
     IncrementalFreesoundLoader,
     InstagramLoader,
 )
 from .processors import GraphProcessor
+from .tag_similarity import (
+    jaccard_edges,
+    jaccard_pairs,
+    lsh_parameters,
+    measure_recall,
+    minhash_pairs,
+    minhash_signatures,
+)
+from .topology_journal import TopologyJournal, TrackedDiGraph
 
 __all__ = [
     # Cache functionality
@@ -47,6 +75,22 @@ __all__ = [
     # Checkpoint management
     "GraphCheckpoint",
     "CheckpointVerifier",
+    "CheckpointSnapshot",
+    "CheckpointWriter",
+    "TopologyJournal",
+    "TrackedDiGraph",
+    "load_checkpoint_topology",
+    "load_checkpoint_csr",
+    "load_checkpoint_sample_groups",
+    # API fetching
+    "FetchEngine",
+    "RequestBudgetPlanner",
     # Graph processing
     "GraphProcessor",
+    "jaccard_pairs",
+    "jaccard_edges",
+    "minhash_pairs",
+    "minhash_signatures",
+    "lsh_parameters",
+    "measure_recall",
 ]
@@ -0,0 +1,374 @@
+"""
+Daily request budget allocation across crawl, validation and refresh.
+
+The Freesound API key allows a fixed number of requests per day, and the
+fetch, validation and metadata refresh workflows all draw from it.
+RequestBudgetPlanner splits the daily budget between three activities:
+
+- ``discovery``: pagination or similar-sound crawling (yield: new nodes)
+- ``validation``: batched existence checks (yield: deleted samples found)
+- ``refresh``: metadata refresh (yield: samples whose metadata changed)
+
+Allocation:
+    Each activity's share is proportional to its configured weight times a
+    yield factor: the observed yield per request (exponential moving average
+    over past runs) divided by the activity's reference yield, clamped to
+    [MIN_YIELD_FACTOR, MAX_YIELD_FACTOR]. Activities without history use a
+    factor of 1. A crawl that stops finding new samples therefore cedes
+    budget to validation, and a week without deletions cedes validation
+    budget back to discovery.
+
+Usage:
+    Workflows call ``begin()`` before spending, which returns how many
+    requests they may make today, ``charge()`` for each request made,
+    ``add_yield()`` as results come in and ``end()`` when done. Requests
+    spent reset at UTC midnight.
+
+Allocation log:
+    Every ``begin()`` appends an entry (date, activity, allowance, shares,
+    yield factors, then requests used and yield) to a bounded log. The log
+    and today's spending are saved with ``get_state()`` in the checkpoint
+    metadata, so the next run continues the same day's budget and the
+    weights can be tuned from real yields.
+"""
+
+import logging
+import math
+import threading
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+ACTIVITIES = ("discovery", "validation", "refresh")
+
+
+class RequestBudgetPlanner:
+    """
+    Splits a daily API request budget between activities by weight and yield.
+
+    Example:
+        planner = RequestBudgetPlanner(daily_budget=1950)
+        allowance = planner.begin("validation")
+        for batch in batches[:allowance]:
+            check(batch)
+            planner.charge("validation")
+        planner.add_yield("validation", deleted_count)
+        planner.end("validation")
+    """
+
+    DEFAULT_WEIGHTS: dict[str, float] = {
+        "discovery": 0.7,
+        "validation": 0.2,
+        "refresh": 0.1,
+    }
+    """Relative share of the daily budget before yields are known"""
+
+    DEFAULT_REFERENCE_YIELDS: dict[str, float] = {
+        "discovery": 1.0,
+        "validation": 1.0,
+        "refresh": 10.0,
+    }
+    """Yield per request at which an activity keeps exactly its weighted share"""
+
+    YIELD_SMOOTHING = 0.3
+    """Weight of the newest run in the moving average of yield per request"""
+
+    MIN_YIELD_FACTOR = 0.25
+    MAX_YIELD_FACTOR = 4.0
+
+    MAX_LOG_ENTRIES = 200
+    """Allocation log entries kept (oldest are dropped)"""
+
+    def __init__(
+        self,
+        daily_budget: int,
+        weights: Optional[dict[str, float]] = None,
+        reference_yields: Optional[dict[str, float]] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize planner.
+
+        Args:
+            daily_budget: Total API requests per UTC day for all activities
+            weights: Per-activity weight overrides ('discovery', 'validation',
+                'refresh'); 0 gives an activity no budget
+            reference_yields: Per-activity yield per request that keeps the
+                weighted share unchanged
+            logger: Optional logger instance
+
+        Raises:
+            ValueError: If the budget, a weight or a reference yield is invalid
+        """
+        if daily_budget < 0:
+            raise ValueError("daily_budget must be non-negative")
+        self.daily_budget = int(daily_budget)
+        self.weights = self._merge(self.DEFAULT_WEIGHTS, weights, "weight")
+        self.reference_yields = self._merge(
+            self.DEFAULT_REFERENCE_YIELDS, reference_yields, "reference yield"
+        )
+        if any(value <= 0 for value in self.reference_yields.values()):
+            raise ValueError("Reference yields must be positive")
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._lock = threading.Lock()
+        self.day = self._today()
+        self.spent = dict.fromkeys(ACTIVITIES, 0)
+        self.log: list[dict[str, Any]] = []
+        self._open: dict[str, dict[str, Any]] = {}
+
+    @staticmethod
+    def _merge(
+        defaults: dict[str, float], overrides: Optional[dict[str, float]], name: str
+    ) -> dict[str, float]:
+        """Apply per-activity overrides to defaults."""
+        merged = dict(defaults)
+        for activity, value in (overrides or {}).items():
+            if activity not in merged:
+                raise ValueError(f"Unknown activity '{activity}' in {name}s")
+            if value < 0:
+                raise ValueError(f"{name.capitalize()} of '{activity}' is negative")
+            merged[activity] = float(value)
+        return merged
+
+    @staticmethod
+    def _today() -> str:
+        """Current UTC date (the API quota resets daily)."""
+        return datetime.now(timezone.utc).date().isoformat()
+
+    def _roll_day(self) -> None:
+        """Reset spending when the UTC day changed (lock held)."""
+        today = self._today()
+        if today != self.day:
+            self.day = today
+            self.spent = dict.fromkeys(ACTIVITIES, 0)
+
+    @staticmethod
+    def _check_activity(activity: str) -> None:
+        if activity not in ACTIVITIES:
+            raise ValueError(
+                f"Unknown activity '{activity}'. Must be one of {', '.join(ACTIVITIES)}"
+            )
+
+    def observed_yield(self, activity: str) -> Optional[float]:
+        """
+        Moving average of yield per request over logged runs.
+
+        Args:
+            activity: Activity name
+
+        Returns:
+            Yield per request, or None if the activity has made no requests
+        """
+        self._check_activity(activity)
+        with self._lock:
+            return self._observed_yield(activity)
+
+    def _observed_yield(self, activity: str) -> Optional[float]:
+        """Moving average of yield per request, without open runs (lock held)."""
+        average = None
+        for entry in self.log:
+            if (
+                entry["activity"] != activity
+                or entry["requests"] <= 0
+                or entry is self._open.get(activity)
+            ):
+                continue
+            run_yield = entry["yield"] / entry["requests"]
+            if average is None:
+                average = run_yield
+            else:
+                average += self.YIELD_SMOOTHING * (run_yield - average)
+        return average
+
+    def _yield_factor(self, activity: str) -> float:
+        """Observed yield relative to the reference yield, clamped (lock held)."""
+        observed = self._observed_yield(activity)
+        if observed is None:
+            return 1.0
+        factor = observed / self.reference_yields[activity]
+        return min(self.MAX_YIELD_FACTOR, max(self.MIN_YIELD_FACTOR, factor))
+
+    def _allocation(self) -> dict[str, int]:
+        """Today's share of the daily budget per activity (lock held)."""
+        scores = {
+            activity: self.weights[activity] * self._yield_factor(activity)
+            for activity in ACTIVITIES
+        }
+        total = sum(scores.values())
+        if total <= 0:
+            return dict.fromkeys(ACTIVITIES, 0)
+        return {
+            activity: math.floor(self.daily_budget * score / total)
+            for activity, score in scores.items()
+        }
+
+    def allocation(self) -> dict[str, int]:
+        """
+        Get today's share of the daily budget per activity.
+
+        Returns:
+            Dictionary mapping activity to its requests for the day
+        """
+        with self._lock:
+            return self._allocation()
+
+    def _allowance(self, activity: str) -> int:
+        """Requests left for an activity today (lock held)."""
+        self._roll_day()
+        share = self._allocation()[activity]
+        remaining_total = self.daily_budget - sum(self.spent.values())
+        return max(0, min(share - self.spent[activity], remaining_total))
+
+    def allowance(self, activity: str) -> int:
+        """
+        Get the requests an activity may still make today.
+
+        Args:
+            activity: Activity name
+
+        Returns:
+            Requests left of the activity's share (never more than the
+            unspent daily budget)
+        """
+        self._check_activity(activity)
+        with self._lock:
+            return self._allowance(activity)
+
+    def begin(self, activity: str) -> int:
+        """
+        Start spending on an activity and log the allocation.
+
+        Args:
+            activity: Activity name
+
+        Returns:
+            Requests the activity may make (see allowance())
+        """
+        self._check_activity(activity)
+        with self._lock:
+            allowance = self._allowance(activity)
+            entry = {
+                "date": self.day,
+                "started_at": datetime.now(timezone.utc).isoformat(),
+                "activity": activity,
+                "allowance": allowance,
+                "allocation": self._allocation(),
+                "yield_factors": {
+                    name: round(self._yield_factor(name), 4) for name in ACTIVITIES
+                },
+                "requests": 0,
+                "yield": 0,
+            }
+            self.log.append(entry)
+            del self.log[: -self.MAX_LOG_ENTRIES]
+            self._open[activity] = entry
+            spent_today = sum(self.spent.values())
+
+        self.logger.info(
+            f"Request budget: {allowance} requests for {activity} "
+            f"({spent_today}/{self.daily_budget} spent today)"
+        )
+        return allowance
+
+    def charge(self, activity: str, requests: int = 1) -> None:
+        """
+        Record requests made by an activity.
+
+        Args:
+            activity: Activity name
+            requests: Number of requests made
+        """
+        self._check_activity(activity)
+        with self._lock:
+            self._roll_day()
+            self.spent[activity] += requests
+            entry = self._open.get(activity)
+            if entry is not None:
+                entry["requests"] += requests
+
+    def add_yield(self, activity: str, count: int) -> None:
+        """
+        Record results of an activity's requests (new nodes, deletions, ...).
+
+        Args:
+            activity: Activity name
+            count: Number of results
+        """
+        self._check_activity(activity)
+        with self._lock:
+            entry = self._open.get(activity)
+            if entry is not None:
+                entry["yield"] += count
+
+    def end(self, activity: str) -> None:
+        """
+        Finish spending on an activity (closes its allocation log entry).
+
+        Args:
+            activity: Activity name
+        """
+        self._check_activity(activity)
+        with self._lock:
+            entry = self._open.pop(activity, None)
+            if entry is not None:
+                entry["finished_at"] = datetime.now(timezone.utc).isoformat()
+
+        if entry is not None:
+            self.logger.info(
+                f"Request budget: {activity} used {entry['requests']}/"
+                f"{entry['allowance']} requests, yield {entry['yield']}"
+            )
+
+    def get_state(self) -> dict[str, Any]:
+        """
+        Get state to persist in checkpoint metadata.
+
+        Returns:
+            Dictionary with the day, requests spent per activity and the
+            allocation log
+        """
+        with self._lock:
+            self._roll_day()
+            return {
+                "daily_budget": self.daily_budget,
+                "weights": dict(self.weights),
+                "day": self.day,
+                "spent": dict(self.spent),
+                "log": [dict(entry) for entry in self.log],
+            }
+
+    def restore_state(self, state: Optional[dict[str, Any]]) -> None:
+        """
+        Continue from a persisted state.
+
+        Spending is only restored if it belongs to the current UTC day; the
+        allocation log (and with it the observed yields) is always restored.
+
+        Args:
+            state: Value returned by get_state(), or None
+        """
+        if not state:
+            return
+        with self._lock:
+            self.log = [dict(entry) for entry in state.get("log", [])][
+                -self.MAX_LOG_ENTRIES :
+            ]
+            self._roll_day()
+            if state.get("day") == self.day:
+                spent = state.get("spent", {})
+                self.spent = {
+                    activity: int(spent.get(activity, 0)) for activity in ACTIVITIES
+                }
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get allocation statistics for logging."""
+        with self._lock:
+            self._roll_day()
+            return {
+                "daily_budget": self.daily_budget,
+                "spent": dict(self.spent),
+                "allocation": self._allocation(),
+                "observed_yields": {
+                    activity: self._observed_yield(activity) for activity in ACTIVITIES
+                },
+            }
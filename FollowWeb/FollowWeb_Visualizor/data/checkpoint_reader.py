@@ -0,0 +1,184 @@
+"""
+Read-only access to split checkpoints for scripts and analysis.
+
+IncrementalFreesoundLoader resumes from its checkpoint directory itself.
+Other consumers (visualization, edge generation and validation scripts) use
+this module so they see the same topology the loader would: the last full
+snapshot plus every batch in the delta checkpoint journal.
+
+load_checkpoint_topology() returns a NetworkX graph. load_checkpoint_csr()
+returns a CSRTopology instead, memory-mapping graph_topology_csr/ without
+building a DiGraph, for analysis that runs on sparse matrices.
+load_checkpoint_sample_groups() returns the hub group membership table
+(group_edges='hub'), which load_checkpoint_topology() attaches to the graph.
+"""
+
+import logging
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+import networkx as nx
+
+from .topology_journal import TopologyJournal
+
+if TYPE_CHECKING:
+    from .storage.csr_topology import CSRTopology
+
+GRAPH_TOPOLOGY_FILENAME = "graph_topology.gpickle"
+CSR_TOPOLOGY_DIRNAME = "graph_topology_csr"
+TOPOLOGY_JOURNAL_FILENAME = "graph_topology.journal"
+METADATA_CACHE_FILENAME = "metadata_cache.db"
+SAMPLE_GROUPS_KEY = "sample_groups"
+
+
+def load_checkpoint_topology(
+    checkpoint_dir: Union[str, Path], logger: Optional[logging.Logger] = None
+) -> nx.DiGraph:
+    """
+    Load the current topology of a split checkpoint.
+
+    Reads graph_topology.gpickle (or graph_topology_csr/ when there is no
+    pickle) and replays graph_topology.journal on top of it, so nodes and
+    edges saved by delta checkpoints since the last compaction are included.
+    Hub groups are restored into graph.graph['sample_groups'].
+
+    Args:
+        checkpoint_dir: Checkpoint directory
+        logger: Optional logger instance
+
+    Returns:
+        Attribute-free topology graph (edge type and weight for CSR snapshots
+        and journaled edges)
+
+    Raises:
+        FileNotFoundError: If the directory has no topology snapshot
+        TypeError: If the pickle doesn't contain a NetworkX graph
+        ValueError: If the journal is corrupt before its last line
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    logger = logger or logging.getLogger(__name__)
+
+    gpickle_path = checkpoint_dir / GRAPH_TOPOLOGY_FILENAME
+    csr_path = checkpoint_dir / CSR_TOPOLOGY_DIRNAME
+
+    if gpickle_path.exists():
+        with open(gpickle_path, "rb") as f:
+            # Loading our own checkpoint data, not untrusted input
+            graph = pickle.load(f)  # nosec B301
+        if not isinstance(graph, (nx.Graph, nx.DiGraph)):
+            raise TypeError(
+                f"Expected NetworkX Graph or DiGraph, got {type(graph).__name__}"
+            )
+    else:
+        from .storage.csr_topology import CSRTopology
+
+        if not CSRTopology.exists(csr_path):
+            raise FileNotFoundError(
+                f"No topology snapshot in {checkpoint_dir} "
+                f"({GRAPH_TOPOLOGY_FILENAME} or {CSR_TOPOLOGY_DIRNAME}/)"
+            )
+        graph = CSRTopology.load(csr_path).to_networkx()
+
+    TopologyJournal(str(checkpoint_dir / TOPOLOGY_JOURNAL_FILENAME), logger).replay(
+        graph
+    )
+
+    sample_groups = load_checkpoint_sample_groups(checkpoint_dir)
+    if sample_groups:
+        graph.graph[SAMPLE_GROUPS_KEY] = sample_groups
+    return graph
+
+
+def load_checkpoint_sample_groups(
+    checkpoint_dir: Union[str, Path],
+) -> dict[str, dict[str, list[str]]]:
+    """
+    Load the hub group membership table of a split checkpoint.
+
+    Reads the sample_groups table of metadata_cache.db through a read-only
+    connection, so older databases are never migrated by a reader.
+
+    Args:
+        checkpoint_dir: Checkpoint directory
+
+    Returns:
+        Dictionary mapping edge type to group name to member node IDs, in
+        the layout of graph.graph['sample_groups'] (empty for clique
+        checkpoints and databases without the table)
+    """
+    db_path = Path(checkpoint_dir) / METADATA_CACHE_FILENAME
+    if not db_path.exists():
+        return {}
+
+    conn = sqlite3.connect(f"{db_path.resolve().as_uri()}?mode=ro", uri=True)
+    try:
+        has_table = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (SAMPLE_GROUPS_KEY,),
+        ).fetchone()
+        if not has_table:
+            return {}
+        cursor = conn.execute(
+            "SELECT edge_type, group_name, sample_id FROM sample_groups "
+            "ORDER BY edge_type, group_name, sample_id"
+        )
+        groups: dict[str, dict[str, list[str]]] = {}
+        for edge_type, group_name, sample_id in cursor:
+            # Cache IDs are integers, graph node IDs are strings
+            groups.setdefault(edge_type, {}).setdefault(group_name, []).append(
+                str(sample_id)
+            )
+        return groups
+    finally:
+        conn.close()
+
+
+def load_checkpoint_csr(
+    checkpoint_dir: Union[str, Path], logger: Optional[logging.Logger] = None
+) -> "CSRTopology":
+    """
+    Load the current topology of a split checkpoint as CSR arrays.
+
+    graph_topology_csr/ is memory-mapped, so an empty journal gives a
+    zero-copy topology. Journaled batches are merged with
+    CSRTopology.extend(), which builds new in-memory arrays but no DiGraph.
+    Checkpoints with only graph_topology.gpickle are converted via
+    load_checkpoint_topology().
+
+    Args:
+        checkpoint_dir: Checkpoint directory
+        logger: Optional logger instance
+
+    Returns:
+        CSRTopology with edge type and weight
+
+    Raises:
+        FileNotFoundError: If the directory has no topology snapshot
+        ValueError: If the CSR arrays or the journal are corrupt
+    """
+    from .storage.csr_topology import CSRTopology
+
+    checkpoint_dir = Path(checkpoint_dir)
+    logger = logger or logging.getLogger(__name__)
+
+    csr_path = checkpoint_dir / CSR_TOPOLOGY_DIRNAME
+    if not CSRTopology.exists(csr_path):
+        return CSRTopology.from_graph(load_checkpoint_topology(checkpoint_dir, logger))
+
+    topology = CSRTopology.load(csr_path)
+    topology.validate()
+
+    journal = TopologyJournal(str(checkpoint_dir / TOPOLOGY_JOURNAL_FILENAME), logger)
+    nodes: list = []
+    edges: list = []
+    for record in journal.iter_batches():
+        nodes.extend(record.get("nodes", []))
+        edges.extend(tuple(edge) for edge in record.get("edges", []))
+
+    if nodes or edges:
+        logger.info(f"Merging {len(edges)} journaled edges into {CSR_TOPOLOGY_DIRNAME}")
+        topology = topology.extend(nodes, edges)
+
+    return topology
@@ -15,9 +15,14 @@ class CheckpointVerifier:
     Verifies checkpoint save operations for fail-fast architecture.
 
     Ensures all three checkpoint files exist and are valid:
-    1. graph_topology.gpickle - Graph structure
+    1. graph_topology.gpickle and/or graph_topology_csr/ - Graph structure
+       (each snapshot present is validated)
     2. metadata_cache.db - SQLite metadata database
     3. checkpoint_metadata.json - Checkpoint metadata
+
+    The optional graph_topology.journal (delta checkpoints) is validated when
+    present; a partial last line from an interrupted append is accepted, as
+    it is by the loader.
     """
 
     def __init__(self, checkpoint_dir: Path, logger: Optional[logging.Logger] = None):
@@ -39,12 +44,15 @@ class CheckpointVerifier:
             Tuple of (success: bool, message: str)
         """
         topology_path = self.checkpoint_dir / "graph_topology.gpickle"
+        csr_topology_path = self.checkpoint_dir / "graph_topology_csr"
         metadata_db_path = self.checkpoint_dir / "metadata_cache.db"
         checkpoint_meta_path = self.checkpoint_dir / "checkpoint_metadata.json"
 
         # Check if all files exist
         missing_files = []
-        if not topology_path.exists():
+        has_csr = (csr_topology_path / "meta.json").exists()
+        has_gpickle = topology_path.exists()
+        if not (has_csr or has_gpickle):
             missing_files.append("graph_topology.gpickle")
         if not metadata_db_path.exists():
             missing_files.append("metadata_cache.db")
@@ -58,7 +66,7 @@ class CheckpointVerifier:
 
         # Check if files are non-empty (no minimum size, just validate content)
         empty_files = []
-        if topology_path.stat().st_size == 0:
+        if has_gpickle and topology_path.stat().st_size == 0:
             empty_files.append("graph_topology.gpickle (0 bytes)")
 
         if metadata_db_path.stat().st_size == 0:
@@ -83,35 +91,56 @@ class CheckpointVerifier:
             self.logger.error(f"❌ Checkpoint verification failed: {message}")
             return False, message
 
-        # Verify pickle file can be loaded
-        try:
-            import pickle
+        # Verify CSR topology arrays are consistent
+        if has_csr:
+            try:
+                from .storage.csr_topology import CSRTopology
 
-            with open(topology_path, "rb") as f:
-                # Loading our own checkpoint data, not untrusted input
-                graph = pickle.load(f)  # nosec B301
+                topology = CSRTopology.load(csr_topology_path)
+                topology.validate()
 
-            # Verify it's a NetworkX graph
-            import networkx as nx
+                if topology.num_nodes == 0:
+                    message = "graph_topology_csr contains empty graph (0 nodes)"
+                    self.logger.error(f"❌ Checkpoint verification failed: {message}")
+                    return False, message
 
-            if not isinstance(
-                graph, (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph)
-            ):
-                message = f"graph_topology.gpickle contains invalid type: {type(graph)}"
+            except Exception as e:
+                message = f"Invalid graph_topology_csr: {e}"
                 self.logger.error(f"❌ Checkpoint verification failed: {message}")
                 return False, message
 
-            # Verify graph has nodes
-            if graph.number_of_nodes() == 0:
-                message = "graph_topology.gpickle contains empty graph (0 nodes)"
+        # Verify pickle file can be loaded
+        if has_gpickle:
+            try:
+                import pickle
+
+                with open(topology_path, "rb") as f:
+                    # Loading our own checkpoint data, not untrusted input
+                    graph = pickle.load(f)  # nosec B301
+
+                # Verify it's a NetworkX graph
+                import networkx as nx
+
+                if not isinstance(
+                    graph, (nx.Graph, nx.DiGraph, nx.MultiGraph, nx.MultiDiGraph)
+                ):
+                    message = (
+                        f"graph_topology.gpickle contains invalid type: {type(graph)}"
+                    )
+                    self.logger.error(f"❌ Checkpoint verification failed: {message}")
+                    return False, message
+
+                # Verify graph has nodes
+                if graph.number_of_nodes() == 0:
+                    message = "graph_topology.gpickle contains empty graph (0 nodes)"
+                    self.logger.error(f"❌ Checkpoint verification failed: {message}")
+                    return False, message
+
+            except Exception as e:
+                message = f"Invalid graph_topology.gpickle: {e}"
                 self.logger.error(f"❌ Checkpoint verification failed: {message}")
                 return False, message
 
-        except Exception as e:
-            message = f"Invalid graph_topology.gpickle: {e}"
-            self.logger.error(f"❌ Checkpoint verification failed: {message}")
-            return False, message
-
         # Verify SQLite database is valid
         try:
             import sqlite3
@@ -142,6 +171,19 @@ class CheckpointVerifier:
             self.logger.error(f"❌ Checkpoint verification failed: {message}")
             return False, message
 
+        # Verify topology journal (delta checkpoints) is readable if present.
+        # Same rule as replay on load: a partial last line is tolerated
+        journal_path = self.checkpoint_dir / "graph_topology.journal"
+        if journal_path.exists():
+            from .topology_journal import TopologyJournal
+
+            try:
+                TopologyJournal(str(journal_path), self.logger).count_batches()
+            except Exception as e:
+                message = f"Invalid graph_topology.journal: {e}"
+                self.logger.error(f"❌ Checkpoint verification failed: {message}")
+                return False, message
+
         # All checks passed
         self.logger.debug("✅ Checkpoint verification passed")
         return True, "All checkpoint files verified"
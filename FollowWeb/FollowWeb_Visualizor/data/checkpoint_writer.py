@@ -0,0 +1,206 @@
+"""
+Background checkpoint writer for non-blocking checkpoint saves.
+
+This module moves checkpoint persistence (topology pickle, SQLite upserts,
+JSON metadata, backups and verification) off the collection thread. The
+collector captures a cheap snapshot of the state that changed and hands it to
+a single writer thread, which persists snapshots strictly in submission order.
+
+Back-pressure:
+    At most ``max_pending`` snapshots wait in the queue. If the collector
+    requests another save while the queue is full, ``submit()`` blocks until
+    the writer catches up, so memory held by snapshots stays bounded.
+
+Failure handling:
+    A write failure is stored and re-raised in the collector thread on the
+    next ``submit()``/``flush()``/``close()`` call, preserving the fail-fast
+    behavior of synchronous saves. Snapshots queued after a failure are
+    discarded, since delta snapshots depend on their predecessors.
+"""
+
+import logging
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+
+@dataclass
+class CheckpointSnapshot:
+    """
+    Point-in-time copy of the state a checkpoint save persists.
+
+    Node attribute dicts in ``metadata_rows`` are copied in the collector
+    thread, including mutable values (tag lists, preview and image dicts), so
+    in-place edits made while the writer serializes them can't leak into the
+    saved rows. ``sample_groups`` is a copy of the hub group table, or None
+    when it hasn't changed since the previous save. ``processed_ids`` holds
+    every processed sample ID for full snapshots and only the IDs added since
+    the previous save for deltas.
+    """
+
+    checkpoint_dir: Path
+    checkpoint_metadata: dict[str, Any]
+    full_snapshot: bool
+    nodes: list[str] = field(default_factory=list)
+    edges: list[tuple] = field(default_factory=list)
+    metadata_rows: dict[int, dict[str, Any]] = field(default_factory=dict)
+    sample_groups: Optional[dict[str, dict[str, list[str]]]] = None
+    processed_ids: list[str] = field(default_factory=list)
+    create_backup: bool = False
+
+
+_STOP = object()
+
+
+class CheckpointWriter:
+    """
+    Single background thread that persists checkpoint snapshots in order.
+
+    Attributes:
+        saves_completed: Number of snapshots written successfully
+        total_write_seconds: Time spent writing snapshots in the background
+        total_wait_seconds: Time the collector spent blocked by back-pressure
+
+    Example:
+        writer = CheckpointWriter(loader._write_checkpoint_snapshot, logger)
+        writer.submit(snapshot)   # returns immediately unless queue is full
+        writer.flush()            # wait until everything is on disk
+        writer.close()            # flush and stop the thread
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Any], None],
+        logger: Optional[logging.Logger] = None,
+        max_pending: int = 1,
+        on_exit: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize and start the writer thread.
+
+        Args:
+            write_fn: Function called in the writer thread for each snapshot
+            logger: Optional logger instance
+            max_pending: Maximum snapshots queued behind the one being written
+            on_exit: Optional cleanup called in the writer thread before it
+                    exits (e.g. closing thread-bound SQLite connections)
+        """
+        self.write_fn = write_fn
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.on_exit = on_exit
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        self.saves_completed = 0
+        self.total_write_seconds = 0.0
+        self.total_wait_seconds = 0.0
+
+        self._thread = threading.Thread(
+            target=self._run, name="checkpoint-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """Writer thread main loop."""
+        try:
+            while True:
+                item = self._queue.get()
+                try:
+                    if item is _STOP:
+                        return
+                    if self._error is not None:
+                        # Later snapshots depend on the failed one - drop them
+                        continue
+
+                    start = time.perf_counter()
+                    self.write_fn(item)
+                    self.total_write_seconds += time.perf_counter() - start
+                    self.saves_completed += 1
+                except Exception as e:
+                    self._error = e
+                    self.logger.error(f"Background checkpoint write failed: {e}")
+                finally:
+                    self._queue.task_done()
+        finally:
+            if self.on_exit is not None:
+                try:
+                    self.on_exit()
+                except Exception as e:
+                    self.logger.warning(f"Checkpoint writer cleanup failed: {e}")
+
+    def _raise_if_failed(self) -> None:
+        """Re-raise a stored background failure in the calling thread."""
+        if self._error is not None:
+            error = self._error
+            self._error = None
+            raise error
+
+    @property
+    def pending(self) -> int:
+        """Number of snapshots queued or being written."""
+        return self._queue.unfinished_tasks
+
+    def submit(self, snapshot: Any) -> None:
+        """
+        Queue a snapshot for writing.
+
+        Blocks while the queue is full (back-pressure).
+
+        Args:
+            snapshot: Snapshot passed to write_fn in the writer thread
+
+        Raises:
+            RuntimeError: If the writer has been closed
+            Exception: A failure from a previous background write
+        """
+        if self._closed:
+            raise RuntimeError("Checkpoint writer is closed")
+        self._raise_if_failed()
+
+        start = time.perf_counter()
+        self._queue.put(snapshot)
+        waited = time.perf_counter() - start
+        self.total_wait_seconds += waited
+        if waited > 0.01:
+            self.logger.debug(
+                f"Checkpoint save waited {waited:.2f}s for the background writer"
+            )
+
+    def flush(self) -> None:
+        """
+        Block until every submitted snapshot has been written.
+
+        Raises:
+            Exception: A failure from a background write
+        """
+        self._queue.join()
+        self._raise_if_failed()
+
+    def close(self) -> None:
+        """
+        Flush pending snapshots, stop the writer thread and join it.
+
+        Safe to call more than once.
+
+        Raises:
+            Exception: A failure from a background write
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        self._queue.join()
+        self._queue.put(_STOP)
+        self._thread.join()
+
+        self.logger.debug(
+            f"Checkpoint writer stopped: {self.saves_completed} saves, "
+            f"{self.total_write_seconds:.2f}s writing, "
+            f"{self.total_wait_seconds:.2f}s back-pressure"
+        )
+        self._raise_if_failed()
@@ -0,0 +1,218 @@
+"""
+Concurrent prefetching of API results for frontier-driven crawls.
+
+Recursive discovery expands one sample at a time, so each similar-sound
+lookup pays a full network round trip even when the rate limiter would
+allow a burst. FetchEngine overlaps those round trips: the crawler calls
+``prefetch()`` for the samples it expects to expand next, a bounded pool of
+worker threads fetches them, and ``result()`` hands each result back when
+the crawler actually reaches that sample.
+
+Determinism:
+    The engine never decides what is expanded or in which order. The
+    crawler still pops its priority queue and merges results one sample at
+    a time on its own thread, so the graph it builds does not depend on
+    which fetch finishes first. Throttling stays with the shared rate
+    limiter the fetch function uses.
+
+Budget:
+    At most ``max_pending`` results are fetched ahead of the crawler.
+    ``close()`` cancels prefetches that have not started yet; results that
+    were fetched but never consumed (e.g. the crawl stopped early) are
+    counted as ``wasted``.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Hashable
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Optional
+
+
+class FetchEngine:
+    """
+    Bounded worker pool that fetches results ahead of a sequential consumer.
+
+    Example:
+        engine = FetchEngine(loader._fetch_similar_sounds_for_sample, max_workers=4)
+        engine.prefetch(12345)
+        similar = engine.result(12345)   # waits only if still in flight
+        engine.close()
+    """
+
+    def __init__(
+        self,
+        fetch_fn: Callable[[Any], Any],
+        max_workers: int = 4,
+        max_pending: Optional[int] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize engine and its worker pool.
+
+        Args:
+            fetch_fn: Thread-safe function fetching the result for one key
+            max_workers: Number of worker threads
+            max_pending: Maximum prefetched results not yet consumed
+                (default: max_workers)
+            logger: Optional logger instance
+        """
+        self.fetch_fn = fetch_fn
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending or self.max_workers)
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="fetch-worker"
+        )
+        self._futures: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.prefetched = 0
+        self.prefetch_hits = 0
+        self.direct_fetches = 0
+        self.wasted = 0
+        self.cancelled = 0
+        self.wait_seconds = 0.0
+
+    @property
+    def pending(self) -> int:
+        """Number of prefetched results not yet consumed."""
+        return len(self._futures)
+
+    @property
+    def running(self) -> int:
+        """Number of prefetches queued or in progress."""
+        with self._lock:
+            return sum(1 for future in self._futures.values() if not future.done())
+
+    @property
+    def full(self) -> bool:
+        """Whether prefetch() would refuse another key."""
+        return len(self._futures) >= self.max_pending
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key has been prefetched and not yet consumed."""
+        return key in self._futures
+
+    def prefetch(self, key: Hashable) -> bool:
+        """
+        Start fetching a key in the background.
+
+        Args:
+            key: Argument passed to fetch_fn
+
+        Returns:
+            True if the key is (now) being fetched, False if the engine is
+            full or closed
+        """
+        with self._lock:
+            if key in self._futures:
+                return True
+            if self._closed or len(self._futures) >= self.max_pending:
+                return False
+            self._futures[key] = self._executor.submit(self.fetch_fn, key)
+            self.prefetched += 1
+        return True
+
+    def result(self, key: Hashable) -> Any:
+        """
+        Get the result for a key, fetching it directly if it wasn't prefetched.
+
+        Args:
+            key: Argument passed to fetch_fn
+
+        Returns:
+            fetch_fn's return value
+
+        Raises:
+            Exception: Whatever fetch_fn raised
+        """
+        with self._lock:
+            future = self._futures.pop(key, None)
+
+        if future is None:
+            self.direct_fetches += 1
+            return self.fetch_fn(key)
+
+        self.prefetch_hits += 1
+        if not future.done():
+            start_time = time.perf_counter()
+            try:
+                return future.result()
+            finally:
+                self.wait_seconds += time.perf_counter() - start_time
+        return future.result()
+
+    def wait(self) -> None:
+        """Wait until every pending prefetch has finished (results are kept)."""
+        with self._lock:
+            futures = list(self._futures.values())
+        start_time = time.perf_counter()
+        wait(futures)
+        self.wait_seconds += time.perf_counter() - start_time
+
+    def keys(self) -> list[Hashable]:
+        """Get the keys prefetched and not yet consumed."""
+        with self._lock:
+            return list(self._futures)
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Drop a prefetched key that will not be consumed.
+
+        Args:
+            key: Key passed to prefetch()
+        """
+        with self._lock:
+            future = self._futures.pop(key, None)
+        if future is None:
+            return
+        if future.cancel():
+            self.cancelled += 1
+        else:
+            self.wasted += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get engine statistics.
+
+        Returns:
+            Dictionary with prefetch, hit, direct fetch, waste and wait counters
+        """
+        return {
+            "workers": self.max_workers,
+            "prefetched": self.prefetched,
+            "prefetch_hits": self.prefetch_hits,
+            "direct_fetches": self.direct_fetches,
+            "wasted": self.wasted,
+            "cancelled": self.cancelled,
+            "wait_seconds": self.wait_seconds,
+        }
+
+    def close(self) -> None:
+        """
+        Cancel prefetches that haven't started and stop the worker threads.
+
+        Fetches already in progress are allowed to finish (their requests are
+        already made); their results are discarded. Safe to call more than once.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            futures = list(self._futures.values())
+            self._futures.clear()
+
+        cancelled = sum(1 for future in futures if future.cancel())
+        self.cancelled += cancelled
+        self.wasted += len(futures) - cancelled
+        self._executor.shutdown(wait=True)
+
+        if futures:
+            self.logger.debug(
+                f"Discarded {len(futures)} unused prefetches "
+                f"({cancelled} cancelled before starting)"
+            )
@@ -25,12 +25,17 @@ Two-Pass Processing:
     discovered yet during the first pass.
 """
 
+import contextlib
+import functools
 import heapq
+import itertools
 import time
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
-from typing import Any, Callable, Optional, Union, cast
+from typing import Any, Callable, Optional, TypeVar, Union, cast
 
 import networkx as nx
+import numpy as np
 
 from ...core.exceptions import DataProcessingError
 from ...output.formatters import EmojiFormatter
@@ -38,9 +43,47 @@ from ...utils import ProgressTracker
 from ...utils.math import format_time_duration
 from ...utils.validation import validate_choice
 from ..backup_manager import BackupManager
+from ..budget_planner import RequestBudgetPlanner
 from ..checkpoint import GraphCheckpoint
+from ..checkpoint_writer import CheckpointSnapshot, CheckpointWriter
+from ..fetch_engine import FetchEngine
+from ..storage import (
+    CachingSession,
+    CrawlFrontier,
+    LazyAttributeStore,
+    LazyNodeAttributes,
+    ResponseCache,
+    SoundCache,
+)
+from ..storage.metadata_cache import extract_pack_name, normalize_timestamp
+from ..tag_similarity import (
+    MINHASH_SEED,
+    jaccard_edges,
+    lsh_parameters,
+    measure_recall,
+    minhash_pairs,
+    minhash_signatures,
+    tag_fingerprint,
+)
+from ..topology_journal import TopologyJournal, TrackedDiGraph
 from .base import DataLoader
 
+_Method = TypeVar("_Method", bound=Callable[..., Any])
+
+
+def _budgeted(activity: str) -> Callable[[_Method], _Method]:
+    """Run a loader method within the activity's share of the daily budget."""
+
+    def decorator(method: _Method) -> _Method:
+        @functools.wraps(method)
+        def wrapper(self: "IncrementalFreesoundLoader", *args: Any, **kwargs: Any):
+            with self._spending(activity):
+                return method(self, *args, **kwargs)
+
+        return cast(_Method, wrapper)
+
+    return decorator
+
 
 class IncrementalFreesoundLoader(DataLoader):
     """
@@ -70,6 +113,49 @@ class IncrementalFreesoundLoader(DataLoader):
     Higher values = smaller, tighter communities.
     Range: 0.0 (all nodes connect) to 1.0 (only identical tags connect)"""
 
+    DEFAULT_GROUP_EDGES = "clique"
+    """How same-user and same-pack relationships are stored.
+    'clique' = bidirectional edges between every pair of members, k·(k−1)
+    directed edges for a group of k samples.
+    'hub' = one membership list per user/pack in graph.graph['sample_groups'],
+    saved in the sample_groups table of metadata_cache.db (expanded on demand
+    by analysis.groups, drawn as stars by the renderers)"""
+
+    DEFAULT_INCREMENTAL_EDGES = True
+    """Generate user, pack and tag edges only for nodes added since the
+    previous edge generation (new ↔ all pairs). Tag edges are regenerated in
+    full when the tag similarity threshold or mode changes.
+    False = regenerate every edge type on every run"""
+
+    DEFAULT_MAX_TAG_FREQUENCY: Optional[int] = None
+    """Document-frequency cap for tag similarity candidate counting.
+    Tags used by more samples than this are left out of the sparse products
+    and matched per candidate instead. Only changes the work done, never the
+    edges. None = count every tag through the products"""
+
+    DEFAULT_TAG_SIMILARITY_WORKERS: Optional[int] = 1
+    """Processes the sparse tag similarity blocks are spread over.
+    1 = compute in the loader's process, None = one spawned process per CPU
+    core (spawned, not forked, so the loader's threads can't leave locks held
+    in the children)"""
+
+    DEFAULT_TAG_SIMILARITY_MODE = "exact"
+    """How tag similarity pairs are found.
+    'exact' = inverted tag index, every pair above the threshold.
+    'minhash' = MinHash-LSH candidates verified with exact Jaccard
+    (approximate: misses some pairs, never adds a wrong one)"""
+
+    DEFAULT_MINHASH_PERMUTATIONS = 128
+    """MinHash signature length in 'minhash' mode (longer = better recall
+    at low thresholds, larger signatures in metadata_cache.db)"""
+
+    DEFAULT_MINHASH_RECALL = 0.95
+    """Target recall the LSH bands and rows are chosen for in 'minhash' mode"""
+
+    DEFAULT_MINHASH_RECALL_SAMPLE = 200
+    """New nodes whose exact pairs are computed to report the measured
+    recall of 'minhash' mode (0 = don't measure)"""
+
     # Checkpoint & Persistence
     DEFAULT_CHECKPOINT_DIR = "data/freesound_library"
     """Directory for storing checkpoint files (graph topology, metadata DB, state)"""
@@ -79,6 +165,73 @@ class IncrementalFreesoundLoader(DataLoader):
     Lower = more frequent saves (safer but slower).
     Higher = less frequent saves (faster but more data loss risk)"""
 
+    DEFAULT_CHECKPOINT_MODE = "full"
+    """Checkpoint save strategy.
+    'full' = rewrite topology pickle and upsert every node on each save.
+    'delta' = append new nodes/edges and processed IDs to the topology journal
+    and upsert only dirty nodes, writing a full snapshot (with the full
+    processed ID set) every checkpoint_compaction_interval saves"""
+
+    DEFAULT_CHECKPOINT_COMPACTION_INTERVAL = 20
+    """Number of delta saves between full topology snapshots (journal compaction)"""
+
+    DEFAULT_TOPOLOGY_FORMAT = "gpickle"
+    """On-disk format for full topology snapshots.
+    'gpickle' = pickled attribute-free NetworkX graph (graph_topology.gpickle).
+    'csr' = memory-mappable .npy CSR arrays with edge type and weight
+    (graph_topology_csr/), loaded in preference to the pickle. The pickle is
+    still written for scripts that read it. Existing checkpoints are migrated
+    on load"""
+
+    DEFAULT_METADATA_CODEC = "json"
+    """Payload codec for rows written to metadata_cache.db.
+    'json' = plain JSON text (queryable with SQLite json_extract).
+    'zlib' = compact JSON compressed with a preset dictionary (smaller DB).
+    Rows record their codec, so switching never requires a rewrite"""
+
+    DEFAULT_LAZY_NODE_ATTRIBUTES = False
+    """Read node attributes of resumed samples from metadata_cache.db on demand
+    instead of decoding every row on load. Hot fields (tags, username, pack,
+    num_downloads, duration) stay in compact in-memory columns"""
+
+    DEFAULT_ATTRIBUTE_CACHE_SIZE = 10000
+    """Decoded metadata rows kept in the LRU cache for lazy node attributes"""
+
+    DEFAULT_SOUND_CACHE_MAX_MB = 64
+    """Memory budget (MB, approximate) for metadata of fetched-but-unprocessed
+    sounds. Least recently used entries spill to metadata_cache.db"""
+
+    DEFAULT_HTTP_CACHE_MAX_MB = 256
+    """Disk budget (MB, compressed) for cached API responses when
+    http_cache_path is set. Least recently used responses are evicted"""
+
+    DEFAULT_ASYNC_CHECKPOINTS = False
+    """Persist checkpoints on a background writer thread so saves don't block
+    API collection. The collector only captures a snapshot of changed state"""
+
+    DEFAULT_CHECKPOINT_MAX_PENDING = 1
+    """Snapshots allowed to queue behind the one being written before
+    _save_checkpoint blocks (back-pressure for async checkpoints)"""
+
+    DEFAULT_FETCH_WORKERS = 1
+    """Worker threads fetching similar sounds ahead of recursive discovery.
+    1 fetches synchronously; the shared rate limiter throttles all workers"""
+
+    DEFAULT_SEARCH_PREFETCH_PAGES = 0
+    """Search result pages requested ahead of the page being processed in
+    pagination mode. 0 requests each page after the previous one is done"""
+
+    DEFAULT_PERSISTENT_FRONTIER = False
+    """Keep the recursive discovery queue in crawl_frontier.db, so a crawl
+    stopped by the time or request limit resumes with the same candidates"""
+
+    FRONTIER_POP_BATCH_SIZE = 50
+    """Candidates moved from the persistent frontier into the heap at once"""
+
+    REQUESTS_PER_EXPANSION = 2
+    """API requests made by one similar-sound expansion (get_sound +
+    get_similar), reserved against max_requests before prefetching"""
+
     # API Rate Limiting
     DEFAULT_MAX_REQUESTS = 1950
     """Maximum API requests per session (Freesound rate limit: 2000/day).
@@ -87,6 +240,32 @@ class IncrementalFreesoundLoader(DataLoader):
     DEFAULT_PAGE_SIZE = 150
     """Freesound API maximum page size for search results"""
 
+    EXISTENCE_CHECK_BATCH_SIZE = 150
+    """Sample IDs verified per id:(a OR b ...) search request (one full page)"""
+
+    # Complete response fields (29); original_filename and md5 are filter-only
+    # parameters and OAuth2-only fields (bookmark, rate) are excluded
+    COMPREHENSIVE_FIELDS = (
+        "id,url,name,tags,description,category,subcategory,geotag,created,"
+        "license,type,channels,filesize,bitrate,bitdepth,duration,samplerate,"
+        "username,pack,previews,images,num_downloads,avg_rating,num_ratings,"
+        "num_comments,comments,similar_sounds,analysis,ac_analysis"
+    )
+    """Fields requested when a search or list response should carry full metadata"""
+
+    CRAWL_ATTRIBUTES = frozenset(
+        {
+            "type",
+            "collected_at",
+            "priority_score",
+            "is_dormant",
+            "dormant_since",
+            "last_existence_check_at",
+            "last_metadata_update_at",
+        }
+    )
+    """Node attributes set by the crawler rather than the API (kept on replace)"""
+
     # Backup Management
     DEFAULT_BACKUP_INTERVAL_NODES = 25
     """Create backup every N nodes added to graph"""
@@ -189,6 +368,64 @@ class IncrementalFreesoundLoader(DataLoader):
                    - verify_existing_sounds: Verify samples via API (default: False)
                    - max_samples_mode: Collection mode - 'limit' or 'queue-empty' (default: 'limit')
                    - max_requests: Maximum API requests per session (default: 1950)
+                   - checkpoint_mode: 'full' or 'delta' (default: 'full')
+                   - checkpoint_compaction_interval: Delta saves between full
+                     snapshots (default: 20)
+                   - async_checkpoints: Write checkpoints on a background
+                     thread (default: False)
+                   - topology_format: 'gpickle' or 'csr' (default: 'gpickle')
+                   - metadata_codec: 'json' or 'zlib' payload encoding for
+                     metadata_cache.db rows (default: 'json')
+                   - lazy_node_attributes: Load resumed node attributes from
+                     SQLite on demand (default: False)
+                   - attribute_cache_size: Decoded rows kept for lazy
+                     attributes (default: 10000)
+                   - sound_cache_max_mb: Memory budget for cached sound
+                     metadata before spilling to SQLite (default: 64)
+                   - fetch_workers: Threads fetching similar sounds ahead
+                     of recursive discovery (default: 1, no prefetching)
+                   - search_prefetch_pages: Search pages fetched ahead in
+                     pagination mode (default: 0, no prefetching)
+                   - group_edges: 'hub' (membership list per user/pack) or
+                     'clique' (edges between all members) (default: 'clique')
+                   - incremental_edges: Generate edges only for nodes added
+                     since the previous edge generation (default: True)
+                   - max_tag_frequency: Tags used by more samples than this are
+                     matched per candidate instead of through the sparse tag
+                     products; never changes the edges (default: None)
+                   - tag_similarity_workers: Processes for the sparse tag
+                     similarity kernel (default: 1; None = CPU count)
+                   - tag_similarity_mode: 'exact' or 'minhash' (MinHash-LSH
+                     candidates verified with exact Jaccard) (default: 'exact')
+                   - minhash_permutations: MinHash signature length
+                     (default: 128)
+                   - minhash_recall: Target recall for the LSH bands and rows
+                     (default: 0.95)
+                   - minhash_recall_sample: New nodes checked against the
+                     exact join to report recall (default: 200)
+                   - persistent_frontier: Persist queued discovery candidates
+                     and unresolved similar-sound relationships in
+                     crawl_frontier.db (default: False)
+                   - rate_limit_state_path: SQLite file holding a token bucket
+                     shared with other processes on the same API key
+                     (default: None, per-process bucket)
+                   - adaptive_rate_limit: Lower the request rate on 429
+                     responses and recover it after sustained success,
+                     persisting the learned rate (default: False)
+                   - http_cache_path: SQLite file caching API responses
+                     across runs and processes (default: None, disabled)
+                   - http_cache_max_mb: Disk budget of the response cache
+                     (default: 256)
+                   - http_cache_ttl: Per-endpoint TTL overrides in seconds,
+                     e.g. {"search": 3600} (default: ResponseCache.DEFAULT_TTLS)
+                   - daily_request_budget: API requests per UTC day split
+                     between discovery, validation and refresh by a
+                     RequestBudgetPlanner (default: None, no daily budget)
+                   - budget_weights: Per-activity weight overrides
+                     (default: RequestBudgetPlanner.DEFAULT_WEIGHTS)
+                   - budget_reference_yields: Per-activity yield per request
+                     keeping the weighted share (default:
+                     RequestBudgetPlanner.DEFAULT_REFERENCE_YIELDS)
                    Plus all FreesoundLoader config options
         """
         super().__init__(config)
@@ -198,7 +435,7 @@ class IncrementalFreesoundLoader(DataLoader):
 
         import freesound
 
-        from ...utils.rate_limiter import RateLimiter
+        from ...utils.rate_limiter import AdaptiveRateController, RateLimiter
 
         api_key = self.config.get("api_key") or os.getenv("FREESOUND_API_KEY")
         if not api_key:
@@ -213,13 +450,48 @@ class IncrementalFreesoundLoader(DataLoader):
         self.client.set_token(api_key)
 
         requests_per_minute = self.config.get("requests_per_minute", 60)
-        self.rate_limiter = RateLimiter(requests_per_minute=requests_per_minute)
-
-        # Sound cache for efficiency
-        self._sound_cache: dict[int, Any] = {}
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=requests_per_minute,
+            shared_state_path=self.config.get("rate_limit_state_path"),
+        )
+        self.rate_controller: Optional[AdaptiveRateController] = None
+        if self.config.get("adaptive_rate_limit", False):
+            self.rate_controller = AdaptiveRateController(self.rate_limiter)
+
+        # Metadata of fetched sounds (similar-sound and search responses), so
+        # expanding them later needs no get_sound() request. Spills to the
+        # metadata cache once it is open
+        self._sound_cache = SoundCache(
+            max_bytes=int(
+                self.config.get("sound_cache_max_mb", self.DEFAULT_SOUND_CACHE_MAX_MB)
+                * 1024
+                * 1024
+            ),
+            logger=self.logger,
+        )
         self._cache_hits = 0
         self._cache_misses = 0
 
+        # Responses shared across runs and processes, served from disk by the
+        # client's HTTP session
+        self.response_cache: Optional[ResponseCache] = None
+        http_cache_path = self.config.get("http_cache_path")
+        if http_cache_path:
+            self.response_cache = ResponseCache(
+                http_cache_path,
+                max_bytes=int(
+                    self.config.get("http_cache_max_mb", self.DEFAULT_HTTP_CACHE_MAX_MB)
+                    * 1024
+                    * 1024
+                ),
+                ttls=self.config.get("http_cache_ttl"),
+                logger=self.logger,
+            )
+            # Tokens are taken per network request, so cache hits are free
+            self.client.session = CachingSession(
+                self.response_cache, before_send=self.rate_limiter.acquire
+            )
+
         # Checkpoint configuration
         checkpoint_dir = self.config.get("checkpoint_dir", self.DEFAULT_CHECKPOINT_DIR)
         self.checkpoint_interval = self.config.get(
@@ -228,11 +500,72 @@ class IncrementalFreesoundLoader(DataLoader):
         self.max_runtime_hours = self.config.get("max_runtime_hours")
         self.verify_existing_sounds = self.config.get("verify_existing_sounds", False)
         self.max_samples_mode = self.config.get("max_samples_mode", "limit")
+        self.checkpoint_mode = self.config.get(
+            "checkpoint_mode", self.DEFAULT_CHECKPOINT_MODE
+        )
+        self.checkpoint_compaction_interval = self.config.get(
+            "checkpoint_compaction_interval",
+            self.DEFAULT_CHECKPOINT_COMPACTION_INTERVAL,
+        )
+
+        # Delta checkpoint tracking (changes since the last persisted save)
+        self._dirty_nodes: set[str] = set()
+        self._journal_nodes: list[str] = []
+        self._journal_edges: list[tuple[str, str, Optional[str], Any]] = []
+        self._journal_processed: list[str] = []
+        # Size of processed_ids when the journal last described it
+        self._journaled_processed_count = 0
+        self._force_full_checkpoint = False
+        self._topology_snapshot_captured = False
+        self._sample_groups_dirty = False
+
+        # Edge generation watermarks: edge type → config the edges were
+        # generated with and the nodes already edge-processed
+        self._edge_watermarks: dict[str, dict[str, Any]] = {}
+        self._last_tag_threshold: Optional[float] = None
+        self._delta_saves_since_compaction = 0
+        # (graph id, mutation count) when the journal last described the graph
+        self._journaled_topology_version: Optional[tuple[int, int]] = None
+
+        # Background checkpoint writer (started after the checkpoint is loaded)
+        import threading
+
+        self.async_checkpoints = self.config.get(
+            "async_checkpoints", self.DEFAULT_ASYNC_CHECKPOINTS
+        )
+        self._checkpoint_writer: Optional[CheckpointWriter] = None
+        self._validation_history: Optional[dict[str, Any]] = None
 
-        # API quota circuit breaker
+        # API quota circuit breaker (requests may be counted by fetch workers)
         self.session_request_count = 0
+        self._request_count_lock = threading.Lock()
+        self.fetch_workers = max(
+            1, int(self.config.get("fetch_workers", self.DEFAULT_FETCH_WORKERS))
+        )
+        self.search_prefetch_pages = max(
+            0,
+            int(
+                self.config.get(
+                    "search_prefetch_pages", self.DEFAULT_SEARCH_PREFETCH_PAGES
+                )
+            ),
+        )
         self.max_requests = self.config.get("max_requests", self.DEFAULT_MAX_REQUESTS)
 
+        # Daily budget shared with validation and refresh runs; while an
+        # activity spends, the circuit breaker stops at its allowance
+        self.budget_planner: Optional[RequestBudgetPlanner] = None
+        daily_request_budget = self.config.get("daily_request_budget")
+        if daily_request_budget is not None:
+            self.budget_planner = RequestBudgetPlanner(
+                daily_request_budget,
+                weights=self.config.get("budget_weights"),
+                reference_yields=self.config.get("budget_reference_yields"),
+                logger=self.logger,
+            )
+        self._budget_activity: Optional[str] = None
+        self._budget_limit: Optional[int] = None
+
         # Search pagination state (restored from checkpoint if exists)
         self.pagination_state = {"page": 1, "query": "", "sort": "downloads_desc"}
 
@@ -247,12 +580,42 @@ class IncrementalFreesoundLoader(DataLoader):
             "user_edges_created": 0,
             "pack_edges_created": 0,
             "tag_edges_created": 0,
+            "batched_requests_saved": 0,
+            "http_cache_requests_saved": 0,
         }
 
         # Validate max_samples_mode
         validate_choice(
             self.max_samples_mode, "max_samples_mode", ["limit", "queue-empty"]
         )
+        validate_choice(self.checkpoint_mode, "checkpoint_mode", ["full", "delta"])
+        self.topology_format = self.config.get(
+            "topology_format", self.DEFAULT_TOPOLOGY_FORMAT
+        )
+        validate_choice(self.topology_format, "topology_format", ["gpickle", "csr"])
+        self.metadata_codec = self.config.get(
+            "metadata_codec", self.DEFAULT_METADATA_CODEC
+        )
+        validate_choice(self.metadata_codec, "metadata_codec", ["json", "zlib"])
+        self.tag_similarity_mode = self.config.get(
+            "tag_similarity_mode", self.DEFAULT_TAG_SIMILARITY_MODE
+        )
+        validate_choice(
+            self.tag_similarity_mode, "tag_similarity_mode", ["exact", "minhash"]
+        )
+        self.group_edges = self.config.get("group_edges", self.DEFAULT_GROUP_EDGES)
+        validate_choice(self.group_edges, "group_edges", ["hub", "clique"])
+        self.lazy_node_attributes = self.config.get(
+            "lazy_node_attributes", self.DEFAULT_LAZY_NODE_ATTRIBUTES
+        )
+        self.attribute_cache_size = self.config.get(
+            "attribute_cache_size", self.DEFAULT_ATTRIBUTE_CACHE_SIZE
+        )
+        self.attribute_store: Optional[LazyAttributeStore] = None
+
+        self.topology_journal = TopologyJournal(
+            f"{checkpoint_dir}/graph_topology.journal", self.logger
+        )
 
         # Use persistent library file (committed to Git for crash recovery)
         # This file grows over time and persists across runs
@@ -260,6 +623,13 @@ class IncrementalFreesoundLoader(DataLoader):
         checkpoint_path = f"{checkpoint_dir}/{checkpoint_filename}"
         self.checkpoint = GraphCheckpoint(checkpoint_path)
 
+        # Discovery queue surviving between runs
+        self.frontier: Optional[CrawlFrontier] = None
+        if self.config.get("persistent_frontier", self.DEFAULT_PERSISTENT_FRONTIER):
+            self.frontier = CrawlFrontier(
+                f"{checkpoint_dir}/crawl_frontier.db", self.logger
+            )
+
         # Initialize backup manager with configurable intervals
         self.backup_manager = BackupManager(
             backup_dir=checkpoint_dir,
@@ -284,15 +654,27 @@ class IncrementalFreesoundLoader(DataLoader):
 
         # State tracking
         self.processed_ids: set[str] = set()
-        self.graph: nx.DiGraph = nx.DiGraph()
+        self.graph: nx.DiGraph = TrackedDiGraph()
         self.start_time: Optional[float] = None
 
         # Try to load existing checkpoint
         self._load_checkpoint()
+        self._sound_cache.spill_store = getattr(self, "metadata_cache", None)
 
         # Track initial state for calculating additions during this session
         self._initial_node_count = self.graph.number_of_nodes()
         self._initial_edge_count = self.graph.number_of_edges()
+        self._journaled_topology_version = self._topology_version()
+        self._journaled_processed_count = len(self.processed_ids)
+
+        if self.async_checkpoints:
+            self._checkpoint_writer = CheckpointWriter(
+                self._write_checkpoint_snapshot,
+                logger=self.logger,
+                max_pending=self.config.get(
+                    "checkpoint_max_pending", self.DEFAULT_CHECKPOINT_MAX_PENDING
+                ),
+            )
 
         self.logger.info(
             f"IncrementalFreesoundLoader initialized: "
@@ -366,7 +748,10 @@ class IncrementalFreesoundLoader(DataLoader):
         """
         Retry a function on rate limit and network errors using tenacity library.
 
-        Uses exponential backoff with configurable retry attempts.
+        Uses exponential backoff with configurable retry attempts. With
+        adaptive rate control, throttled attempts report their send time (a
+        burst of 429s backs off once) and only attempts that reached the API
+        count as successes: calls the response cache answered are skipped.
         """
         import logging
 
@@ -388,16 +773,84 @@ class IncrementalFreesoundLoader(DataLoader):
 
         @retry_decorator
         def _wrapped_func():
-            return func(*args, **kwargs)
+            issued_at = time.monotonic()
+            misses_before = self._thread_cache_misses()
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                # Back off the request rate, not just this call
+                if self.rate_controller is not None and self._is_throttle_error(e):
+                    self.rate_controller.on_throttle(
+                        self._get_retry_after(e), issued_at=issued_at
+                    )
+                raise
+            if self.rate_controller is not None and (
+                misses_before is None or self._thread_cache_misses() != misses_before
+            ):
+                self.rate_controller.on_success()
+            return result
 
         return _wrapped_func()
 
-    def _extract_sample_metadata(self, sound) -> Optional[dict[str, Any]]:
+    def _thread_cache_misses(self) -> Optional[int]:
+        """
+        Get the response cache misses of the calling thread so far.
+
+        Every request that goes to the API is a cache miss, so a call that
+        doesn't change the count was served from disk (or sent nothing).
+
+        Returns:
+            Miss count, or None without a response cache
+        """
+        if self.response_cache is None:
+            return None
+        return self.response_cache.peek_thread_outcome()[1]
+
+    @staticmethod
+    def _is_throttle_error(exception: Exception) -> bool:
+        """Check if an exception is an HTTP 429 (rate limit) response."""
+        code = getattr(exception, "code", None)
+        if code is None:
+            response = getattr(exception, "response", None)
+            code = getattr(response, "status_code", None)
+        return code == 429
+
+    @staticmethod
+    def _get_retry_after(exception: Exception) -> Optional[float]:
+        """
+        Get the Retry-After delay of a throttling error, if the server sent one.
+
+        Reads a retry_after attribute, the Retry-After header of an attached
+        response, or a retry_after field in the error detail. HTTP-date values
+        are ignored.
+        """
+        candidates: list[Any] = [getattr(exception, "retry_after", None)]
+        headers = getattr(getattr(exception, "response", None), "headers", None)
+        if headers:
+            candidates.append(headers.get("Retry-After"))
+        detail = getattr(exception, "detail", None)
+        if isinstance(detail, dict):
+            candidates.append(detail.get("retry_after"))
+
+        for value in candidates:
+            try:
+                seconds = float(value)
+            except (TypeError, ValueError):
+                continue
+            if seconds >= 0:
+                return seconds
+        return None
+
+    def _extract_sample_metadata(
+        self, sound, warn: bool = True
+    ) -> Optional[dict[str, Any]]:
         """
         Extract metadata from Freesound sound object.
 
         Args:
             sound: Freesound sound object from API
+            warn: Log warnings for invalid or unplayable samples (disabled when
+                only caching sounds that may never be used)
 
         Returns:
             Dictionary with sample metadata, or None if invalid
@@ -406,9 +859,10 @@ class IncrementalFreesoundLoader(DataLoader):
 
         # Validate filesize
         if sound_dict.get("filesize", 0) == 0:
-            self.logger.warning(
-                f"Skipping sample {sound.id} with invalid filesize (0 bytes)"
-            )
+            if warn:
+                self.logger.warning(
+                    f"Skipping sample {sound.id} with invalid filesize (0 bytes)"
+                )
             return None
 
         metadata = sound_dict.copy()
@@ -418,7 +872,7 @@ class IncrementalFreesoundLoader(DataLoader):
             uploader_id = self._extract_uploader_id(sound_dict["previews"])
             if uploader_id:
                 metadata["uploader_id"] = uploader_id
-            else:
+            elif warn:
                 # Log warning - sample cannot be played without uploader_id
                 self.logger.warning(
                     f"Sample {sound_dict.get('id', 'unknown')} missing uploader_id - "
@@ -445,13 +899,47 @@ class IncrementalFreesoundLoader(DataLoader):
 
     def close(self) -> None:
         """Close resources and cleanup."""
+        # Flush and join the background writer before closing its database
+        writer = getattr(self, "_checkpoint_writer", None)
+        if writer is not None:
+            try:
+                writer.close()
+            except Exception as e:
+                self.logger.error(f"Error flushing background checkpoints: {e}")
+            self._checkpoint_writer = None
+
+        attribute_store = getattr(self, "attribute_store", None)
+        if attribute_store is not None:
+            self.logger.debug(
+                f"Lazy attribute cache stats: {attribute_store.get_stats()}"
+            )
+            attribute_store.close()
+
         if hasattr(self, "metadata_cache") and self.metadata_cache:
             try:
+                if getattr(self, "_sound_cache", None) is not None:
+                    self.logger.debug(
+                        f"Sound cache stats: {self._sound_cache.get_stats()}"
+                    )
+                    self._sound_cache.flush()
                 self.metadata_cache.close()
                 self.logger.debug("Metadata cache closed")
             except Exception as e:
                 self.logger.error(f"Error closing metadata cache: {e}")
 
+        rate_limiter = getattr(self, "rate_limiter", None)
+        if rate_limiter is not None:
+            rate_limiter.close()
+
+        frontier = getattr(self, "frontier", None)
+        if frontier is not None:
+            frontier.close()
+
+        cache = getattr(self, "response_cache", None)
+        if cache is not None:
+            self.logger.debug(f"Response cache stats: {cache.get_stats()}")
+            cache.close()
+
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -477,50 +965,98 @@ class IncrementalFreesoundLoader(DataLoader):
         )
 
         # Check for split checkpoint files
-        topology_path = checkpoint_dir / "graph_topology.gpickle"
         metadata_db_path = checkpoint_dir / "metadata_cache.db"
         checkpoint_meta_path = checkpoint_dir / "checkpoint_metadata.json"
 
         # Try loading split checkpoint first (new architecture)
-        if topology_path.exists() and metadata_db_path.exists():
+        if self._find_topology(checkpoint_dir) and metadata_db_path.exists():
             try:
-                # Load graph topology (edges only, no attributes)
-                import pickle
+                # Load graph topology (gpickle or CSR, migrating to topology_format)
+                self.graph = TrackedDiGraph.track(self._load_topology(checkpoint_dir))
 
-                with open(topology_path, "rb") as f:
-                    # nosec B301 - Loading our own checkpoint data, not untrusted input
-                    self.graph = pickle.load(f)  # nosec
+                # Apply topology changes journaled since the last full snapshot
+                journaled_processed: set[str] = set()
+                batches, _ = self.topology_journal.replay(
+                    self.graph, journaled_processed
+                )
+                self._delta_saves_since_compaction = batches
 
                 # Connect to metadata cache
-                self.metadata_cache = MetadataCache(str(metadata_db_path), self.logger)
+                self.metadata_cache = MetadataCache(
+                    str(metadata_db_path), self.logger, codec=self.metadata_codec
+                )
+
+                # Restore hub groups (cache IDs are integers, node IDs strings)
+                sample_groups = self.metadata_cache.get_group_memberships()
+                if sample_groups:
+                    self.graph.graph["sample_groups"] = {
+                        edge_type: {
+                            name: [str(sample_id) for sample_id in members]
+                            for name, members in type_groups.items()
+                        }
+                        for edge_type, type_groups in sample_groups.items()
+                    }
 
                 # Restore nodes from metadata cache
                 # The graph topology file only contains edges, nodes must be restored from SQLite
-                all_metadata = self.metadata_cache.get_all_metadata()
-                for sample_id, metadata in all_metadata.items():
-                    node_id = str(sample_id)
-                    if node_id not in self.graph:
-                        self.graph.add_node(node_id, **metadata)
+                if self.lazy_node_attributes:
+                    self.attribute_store = LazyAttributeStore(
+                        metadata_db_path, self.logger, self.attribute_cache_size
+                    )
+                    node_ids = self.attribute_store.load_hot_columns()
+                    self.attribute_store.attach(self.graph, node_ids)
+                else:
+                    # Stream rows so only one page of decoded JSON is held
+                    for sample_id, metadata in self.metadata_cache.iter_metadata():
+                        self.graph.add_node(str(sample_id), **metadata)
 
                 # Load checkpoint metadata
                 if checkpoint_meta_path.exists():
                     with open(checkpoint_meta_path) as f:
                         checkpoint_metadata = json.load(f)
 
-                    self.processed_ids = set(
-                        checkpoint_metadata.get("processed_ids", [])
-                    )
+                    # Delta saves leave the full set to the last compaction
+                    if "processed_ids" in checkpoint_metadata:
+                        self.processed_ids = set(checkpoint_metadata["processed_ids"])
+                    else:
+                        self.processed_ids = self._load_processed_ids_base(
+                            checkpoint_dir
+                        )
+                    self.processed_ids |= journaled_processed
                     self.pagination_state = checkpoint_metadata.get(
                         "pagination_state",
                         {"page": 1, "query": "", "sort": "downloads_desc"},
                     )
                     last_update = checkpoint_metadata.get("timestamp", "unknown")
 
+                    # Start near the request rate learned by the previous run
+                    if self.rate_controller is not None:
+                        self.rate_controller.restore_state(
+                            checkpoint_metadata.get("rate_control")
+                        )
+
+                    # Continue today's request budget and yield history
+                    if self.budget_planner is not None:
+                        self.budget_planner.restore_state(
+                            checkpoint_metadata.get("request_budget")
+                        )
+
                     # Restore edge generation metadata
                     edge_gen_metadata = checkpoint_metadata.get("edge_generation", {})
                     self._last_tag_threshold = edge_gen_metadata.get(
                         "tag_similarity_threshold"
                     )
+                    graph_node_ids = set(self.graph.nodes())
+                    self._edge_watermarks = {
+                        edge_type: {
+                            "config": watermark.get("config", {}),
+                            "processed": graph_node_ids
+                            - set(watermark.get("pending", [])),
+                        }
+                        for edge_type, watermark in edge_gen_metadata.get(
+                            "watermarks", {}
+                        ).items()
+                    }
 
                     self.logger.info(
                         f"Resumed from split checkpoint: {self.graph.number_of_nodes()} nodes, "
@@ -545,12 +1081,20 @@ class IncrementalFreesoundLoader(DataLoader):
         checkpoint_data = self.checkpoint.load()
 
         if checkpoint_data:
-            self.graph = checkpoint_data["graph"]
+            self.graph = TrackedDiGraph.track(checkpoint_data["graph"])
             self.processed_ids = checkpoint_data["processed_ids"]
 
             # Load sound cache for efficiency (avoids re-fetching known samples)
-            self._sound_cache = checkpoint_data.get("sound_cache", {})
-            if self._sound_cache:
+            # Older checkpoints hold client sound objects instead of metadata
+            sound_cache = checkpoint_data.get("sound_cache") or {}
+            for sample_id, sound in sound_cache.items():
+                self._sound_cache.put(
+                    sample_id,
+                    sound
+                    if sound is None or isinstance(sound, dict)
+                    else self._extract_sample_metadata(sound, warn=False),
+                )
+            if sound_cache:
                 self.logger.info(
                     f"Loaded sound cache with {len(self._sound_cache)} samples"
                 )
@@ -575,7 +1119,9 @@ class IncrementalFreesoundLoader(DataLoader):
                 self.config.get("checkpoint_dir", "data/freesound_library")
             )
             metadata_db_path = checkpoint_dir / "metadata_cache.db"
-            self.metadata_cache = MetadataCache(str(metadata_db_path), self.logger)
+            self.metadata_cache = MetadataCache(
+                str(metadata_db_path), self.logger, codec=self.metadata_codec
+            )
             self.pagination_state = {"page": 1, "query": "", "sort": "downloads_desc"}
 
     def _migrate_to_split_checkpoint(self) -> None:
@@ -591,7 +1137,9 @@ class IncrementalFreesoundLoader(DataLoader):
 
         # Create metadata cache
         metadata_db_path = checkpoint_dir / "metadata_cache.db"
-        self.metadata_cache = MetadataCache(str(metadata_db_path), self.logger)
+        self.metadata_cache = MetadataCache(
+            str(metadata_db_path), self.logger, codec=self.metadata_codec
+        )
 
         # Extract metadata from graph nodes and store in SQLite
         metadata_dict = {}
@@ -620,6 +1168,17 @@ class IncrementalFreesoundLoader(DataLoader):
         2. Sample metadata to SQLite database
         3. Checkpoint metadata to JSON
 
+        In 'delta' checkpoint mode, step 1 appends only the nodes and edges added
+        since the last save to graph_topology.journal and step 2 upserts only
+        dirty nodes. A full snapshot is written every
+        checkpoint_compaction_interval saves, before backups, at the end of a
+        run (_save_final_checkpoint), and whenever untracked changes (e.g.
+        node removals) are detected.
+
+        With async_checkpoints enabled, only the snapshot is captured here; the
+        writes, backup and verification run on the background checkpoint
+        writer and failures surface on the next save or flush.
+
         Creates backups every 100 nodes to prevent data loss.
 
         Implements fail-fast verification: verifies all files exist after save.
@@ -631,17 +1190,42 @@ class IncrementalFreesoundLoader(DataLoader):
         Raises:
             RuntimeError: If checkpoint verification fails after save
         """
-        import json
+        snapshot = self._capture_checkpoint_snapshot(metadata)
+
+        if self._checkpoint_writer is None:
+            self._write_checkpoint_snapshot(snapshot)
+            return
+
+        try:
+            self._checkpoint_writer.submit(snapshot)
+        except Exception:
+            self._handle_background_checkpoint_failure()
+            raise
+
+    def _capture_checkpoint_snapshot(
+        self, metadata: Optional[dict[str, Any]] = None
+    ) -> CheckpointSnapshot:
+        """
+        Capture the state to persist without touching the filesystem.
+
+        Runs in the collection thread. Only node IDs, edge pairs and copies
+        of dirty node attributes are taken; mutable attribute values (tag
+        lists, image dicts) are deep-copied, so the crawl can keep mutating
+        the graph, in place or not, while the snapshot is written.
+
+        Args:
+            metadata: Optional metadata to include in checkpoint
+
+        Returns:
+            CheckpointSnapshot ready for _write_checkpoint_snapshot
+        """
+        import copy
         from pathlib import Path
 
         checkpoint_dir = Path(
             self.config.get("checkpoint_dir", "data/freesound_library")
         )
-        checkpoint_dir.mkdir(parents=True, exist_ok=True)
-
-        # Define checkpoint file paths
-        topology_path = checkpoint_dir / "graph_topology.gpickle"
-        metadata_db_path = checkpoint_dir / "metadata_cache.db"
+        topology_path = self._topology_path(checkpoint_dir)
 
         # Calculate nodes and edges added during this session
         current_nodes = self.graph.number_of_nodes()
@@ -654,16 +1238,18 @@ class IncrementalFreesoundLoader(DataLoader):
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "nodes": current_nodes,
             "edges": current_edges,
-            "processed_ids": list(self.processed_ids),
-            "pagination_state": getattr(
-                self,
-                "pagination_state",
-                {"page": 1, "query": "", "sort": "downloads_desc"},
+            "pagination_state": dict(
+                getattr(
+                    self,
+                    "pagination_state",
+                    {"page": 1, "query": "", "sort": "downloads_desc"},
+                )
             ),
             "edge_generation": {
                 "last_tag_edge_check": time.time(),
                 "processed_node_count": current_nodes,
                 "tag_similarity_threshold": getattr(self, "_last_tag_threshold", None),
+                "watermarks": self._edge_watermark_state(),
             },
             "collection_stats": {
                 "nodes_added": nodes_added,
@@ -673,101 +1259,190 @@ class IncrementalFreesoundLoader(DataLoader):
                 "duplicates_skipped": self.stats.get("samples_skipped", 0),
                 "max_requests": self.max_requests,  # Save for repair workflow
             },
+            "validation_history": self._get_validation_history(checkpoint_dir),
         }
+        if self.rate_controller is not None:
+            checkpoint_metadata["rate_control"] = self.rate_controller.get_state()
+        if self.budget_planner is not None:
+            checkpoint_metadata["request_budget"] = self.budget_planner.get_state()
 
-        # Add validation history to metadata if not already present
-        if "validation_history" not in checkpoint_metadata:
-            # Try to get existing validation history from previous checkpoint
-            checkpoint_meta_path = checkpoint_dir / "checkpoint_metadata.json"
-            if checkpoint_meta_path.exists():
-                try:
-                    with open(checkpoint_meta_path) as f:
-                        existing_metadata = json.load(f)
-                    existing_validation_history = existing_metadata.get(
-                        "validation_history", {}
-                    )
-                    checkpoint_metadata["validation_history"] = (
-                        existing_validation_history
-                    )
-                except Exception:
-                    checkpoint_metadata["validation_history"] = {
-                        "last_full_existence_check": None,
-                        "last_partial_existence_check": None,
-                        "last_metadata_refresh": None,
-                    }
+        if metadata:
+            # Deep copy so the writer never sees later mutations (e.g. api_stats)
+            checkpoint_metadata.update(copy.deepcopy(metadata))
+        self._validation_history = checkpoint_metadata["validation_history"]
+
+        # Decide between a full snapshot and a delta
+        full_snapshot = self._needs_full_checkpoint(topology_path)
+
+        if full_snapshot:
+            nodes = list(self.graph.nodes())
+            if self.topology_format == "csr":
+                edges = [
+                    (u, v, data.get("type"), data.get("weight"))
+                    for u, v, data in self.graph.edges(data=True)
+                ]
             else:
-                checkpoint_metadata["validation_history"] = {
-                    "last_full_existence_check": None,
-                    "last_partial_existence_check": None,
-                    "last_metadata_refresh": None,
+                edges = list(self.graph.edges())
+            saved_ids = nodes
+            processed_ids = list(self.processed_ids)
+            checkpoint_metadata["processed_ids"] = processed_ids
+            self._delta_saves_since_compaction = 0
+            self._topology_snapshot_captured = True
+        else:
+            nodes = list(self._journal_nodes)
+            edges = list(self._journal_edges)
+            saved_ids = [n for n in self._dirty_nodes if n in self.graph]
+            # Only the additions; the full set is written at compaction
+            processed_ids = list(self._journal_processed)
+            self._delta_saves_since_compaction += 1
+
+        metadata_rows = {}
+        if hasattr(self, "metadata_cache"):
+            for node_id in saved_ids:
+                node_attrs = self.graph.nodes[node_id]
+                # Unmodified lazy attributes are already stored in SQLite
+                if (
+                    isinstance(node_attrs, LazyNodeAttributes)
+                    and not node_attrs.is_materialized
+                ):
+                    continue
+                node_data = {
+                    key: copy.deepcopy(value)
+                    if isinstance(value, (list, dict))
+                    else value
+                    for key, value in node_attrs.items()
                 }
+                # Only save if metadata exists
+                if node_data:
+                    metadata_rows[int(node_id)] = node_data
+
+        # The group table is small (one ID per sample), so it's saved whole
+        sample_groups = None
+        if self._sample_groups_dirty or full_snapshot:
+            sample_groups = {
+                edge_type: {name: list(ids) for name, ids in type_groups.items()}
+                for edge_type, type_groups in self.graph.graph.get(
+                    "sample_groups", {}
+                ).items()
+            }
+            self._sample_groups_dirty = False
 
-        if metadata:
-            # Preserve validation_history if it exists in metadata
-            if "validation_history" in metadata:
-                checkpoint_metadata["validation_history"] = metadata[
-                    "validation_history"
-                ]
-            checkpoint_metadata.update(metadata)
+        checkpoint_metadata["topology_journal"] = {
+            "checkpoint_mode": self.checkpoint_mode,
+            "full_snapshot": full_snapshot,
+            "pending_batches": self._delta_saves_since_compaction,
+            "nodes_saved": len(saved_ids),
+        }
 
-        # 1. Save graph topology (clean graph without attributes)
-        # Create a new graph with only edges (more memory fast than copy + clear)
-        import networkx as nx
+        # Everything tracked so far now belongs to this snapshot
+        self._dirty_nodes.clear()
+        self._journal_nodes.clear()
+        self._journal_edges.clear()
+        self._journal_processed.clear()
+        self._force_full_checkpoint = False
+        self._journaled_topology_version = self._topology_version()
+        self._journaled_processed_count = len(self.processed_ids)
+
+        return CheckpointSnapshot(
+            checkpoint_dir=checkpoint_dir,
+            checkpoint_metadata=checkpoint_metadata,
+            full_snapshot=full_snapshot,
+            nodes=nodes,
+            edges=edges,
+            metadata_rows=metadata_rows,
+            sample_groups=sample_groups,
+            processed_ids=processed_ids,
+            create_backup=self.backup_manager.should_create_backup(current_nodes),
+        )
 
-        graph_clean: nx.DiGraph = nx.DiGraph()
-        # Add nodes first (without attributes) to preserve isolated nodes
-        graph_clean.add_nodes_from(self.graph.nodes())
-        # Then add edges
-        graph_clean.add_edges_from(self.graph.edges())
+    def _get_validation_history(self, checkpoint_dir) -> dict[str, Any]:
+        """
+        Get the validation history to carry into the next checkpoint.
 
-        import pickle
+        Uses the in-memory copy from the previous save when available so the
+        collector never reads a JSON file the background writer may still be
+        replacing.
 
-        with open(topology_path, "wb") as f:
-            pickle.dump(graph_clean, f, pickle.HIGHEST_PROTOCOL)
+        Args:
+            checkpoint_dir: Checkpoint directory
 
-        # Explicitly delete to free memory immediately
-        del graph_clean
+        Returns:
+            Validation history dictionary
+        """
+        import json
 
-        # 2. Save metadata to SQLite (only new/updated samples)
-        if hasattr(self, "metadata_cache"):
-            # Extract metadata from graph nodes
-            metadata_dict = {}
-            for node_id in self.graph.nodes():
-                node_data = dict(self.graph.nodes[node_id])
-                # Only save if metadata exists
-                if node_data:
-                    metadata_dict[int(node_id)] = node_data
+        if self._validation_history is not None:
+            return self._validation_history
+
+        checkpoint_meta_path = checkpoint_dir / "checkpoint_metadata.json"
+        if checkpoint_meta_path.exists():
+            try:
+                with open(checkpoint_meta_path) as f:
+                    existing_metadata = json.load(f)
+                return existing_metadata.get("validation_history", {})
+            except Exception:
+                pass
+
+        return {
+            "last_full_existence_check": None,
+            "last_partial_existence_check": None,
+            "last_metadata_refresh": None,
+        }
+
+    def _write_checkpoint_snapshot(self, snapshot: CheckpointSnapshot) -> None:
+        """
+        Persist a captured snapshot, create backups and verify the result.
+
+        Runs inline for synchronous saves or on the background checkpoint
+        writer thread.
+
+        Args:
+            snapshot: Snapshot from _capture_checkpoint_snapshot
+
+        Raises:
+            RuntimeError: If checkpoint verification fails after save
+        """
+        import json
+
+        checkpoint_dir = snapshot.checkpoint_dir
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        checkpoint_metadata = snapshot.checkpoint_metadata
+
+        # Define checkpoint file paths
+        topology_path = self._topology_path(checkpoint_dir)
+        metadata_db_path = checkpoint_dir / "metadata_cache.db"
+
+        # 1. Save graph topology (full snapshot or journal delta)
+        if snapshot.full_snapshot:
+            # Written before the journal is truncated, so no addition is lost
+            self._write_processed_ids_base(checkpoint_dir, snapshot.processed_ids)
+            self._write_topology_snapshot(topology_path, snapshot.nodes, snapshot.edges)
+        else:
+            self.topology_journal.append(
+                snapshot.nodes, snapshot.edges, snapshot.processed_ids
+            )
 
-            # Bulk insert/update metadata
-            if metadata_dict:
-                self.metadata_cache.bulk_insert(metadata_dict)
-                # bulk_insert already logs this
+        # 2. Save metadata to SQLite (only rows captured in the snapshot).
+        # MetadataCache writes go through its connection manager's writer
+        # thread, so the background checkpoint writer shares the connection
+        if snapshot.metadata_rows:
+            self.metadata_cache.bulk_insert(snapshot.metadata_rows)
+            # bulk_insert already logs this
+        if snapshot.sample_groups is not None:
+            self.metadata_cache.put_group_memberships(snapshot.sample_groups)
 
         # 3. Save checkpoint metadata JSON
         checkpoint_meta_path = checkpoint_dir / "checkpoint_metadata.json"
         with open(checkpoint_meta_path, "w") as f:
             json.dump(checkpoint_metadata, f, indent=2)
 
-        # 4. Also call the GraphCheckpoint.save() method for compatibility with tests
-        # and to maintain the abstraction layer
-        try:
-            self.checkpoint.save(
-                graph=self.graph,
-                processed_ids=self.processed_ids,
-                metadata=checkpoint_metadata,
-                sound_cache=getattr(self, "_sound_cache", {}),
-            )
-        except Exception as e:
-            self.logger.warning(f"GraphCheckpoint.save() failed: {e}")
-
         self.logger.debug(
             f"Checkpoint saved: {checkpoint_metadata['nodes']} nodes, "
             f"{checkpoint_metadata['edges']} edges"
         )
 
         # Use BackupManager for intelligent tiered backups
-        if self.backup_manager.should_create_backup(self.graph.number_of_nodes()):
-            metadata_db_path = checkpoint_dir / "metadata_cache.db"
+        if snapshot.create_backup:
             self.backup_manager.create_backup(
                 topology_path=topology_path,
                 metadata_db_path=metadata_db_path,
@@ -811,11 +1486,9 @@ class IncrementalFreesoundLoader(DataLoader):
                 )
 
             # Close metadata cache before raising exception to prevent file locks
-            if hasattr(self, "metadata_cache") and self.metadata_cache:
-                try:
-                    self.metadata_cache.close()
-                except Exception as close_error:
-                    self.logger.error(f"Failed to close metadata cache: {close_error}")
+            # (the background writer does this in the collector thread instead)
+            if self._checkpoint_writer is None:
+                self._close_metadata_cache()
 
             # Raise exception to trigger fail-fast behavior
             raise RuntimeError(
@@ -823,76 +1496,538 @@ class IncrementalFreesoundLoader(DataLoader):
                 "Data may have been saved to permanent storage."
             )
 
-    def _create_backup(self) -> None:
-        """
-        Create timestamped backups of split checkpoint files.
+    def _close_metadata_cache(self) -> None:
+        """Close the collector's MetadataCache, logging any failure."""
+        # Evicted sounds are dropped from now on instead of spilled
+        self._sound_cache.spill_store = None
+        if hasattr(self, "metadata_cache") and self.metadata_cache:
+            try:
+                self.metadata_cache.close()
+            except Exception as close_error:
+                self.logger.error(f"Failed to close metadata cache: {close_error}")
 
-        Backs up both graph topology and metadata database.
+    def _handle_background_checkpoint_failure(self) -> None:
         """
-        try:
-            import shutil
-            from pathlib import Path
+        React to a failed background save in the collector thread.
 
-            checkpoint_dir = Path(
-                self.config.get("checkpoint_dir", "data/freesound_library")
-            )
+        Later delta snapshots were discarded by the writer, so the next save
+        must be a full snapshot; the metadata cache is closed to release file
+        locks, matching the synchronous fail-fast path.
+        """
+        self._force_full_checkpoint = True
+        self._close_metadata_cache()
 
-            # Create backup filenames with timestamp and node count
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            nodes = self.graph.number_of_nodes()
+    def flush_checkpoints(self) -> None:
+        """
+        Wait until all background checkpoint saves are on disk.
 
-            # Backup graph topology
-            topology_path = checkpoint_dir / "graph_topology.gpickle"
-            if topology_path.exists():
-                topology_backup = (
-                    checkpoint_dir
-                    / f"graph_topology_backup_{nodes}nodes_{timestamp}.gpickle"
-                )
-                shutil.copy2(topology_path, topology_backup)
-                self.logger.info(f"📦 Topology backup created: {topology_backup.name}")
+        No-op for synchronous checkpoints.
 
-            # Backup metadata database
-            metadata_db_path = checkpoint_dir / "metadata_cache.db"
-            if metadata_db_path.exists():
-                metadata_backup = (
-                    checkpoint_dir
-                    / f"metadata_cache_backup_{nodes}nodes_{timestamp}.db"
-                )
-                shutil.copy2(metadata_db_path, metadata_backup)
-                self.logger.info(f"📦 Metadata backup created: {metadata_backup.name}")
+        Raises:
+            RuntimeError: If a background checkpoint save failed
+        """
+        if self._checkpoint_writer is None:
+            return
 
-        except Exception as e:
-            self.logger.warning(f"Failed to create backup: {e}")
+        try:
+            self._checkpoint_writer.flush()
+        except Exception:
+            self._handle_background_checkpoint_failure()
+            raise
 
-    def _check_time_limit(self) -> bool:
+    def _save_final_checkpoint(self, metadata: Optional[dict[str, Any]] = None) -> None:
         """
-        Check if time limit has been reached.
+        Save the checkpoint a run ends with and wait until it is on disk.
 
-        Returns:
-            True if time limit reached, False otherwise
-        """
-        if not self.max_runtime_hours or not self.start_time:
-            return False
+        The final save is always a full topology snapshot, so the checkpoint
+        handed to scripts and workflows never has pending journal batches,
+        even for consumers that read graph_topology.gpickle without replaying
+        the journal.
 
-        elapsed_hours = (time.time() - self.start_time) / 3600
-        return elapsed_hours >= self.max_runtime_hours
+        Args:
+            metadata: Optional metadata to include in checkpoint
 
-    def _calculate_progress_stats(
-        self, current: int, total: int, elapsed_seconds: float
-    ) -> dict[str, Any]:
+        Raises:
+            RuntimeError: If checkpoint verification fails after save
         """
-        Calculate progress statistics.
+        self._force_full_checkpoint = True
+        self._save_checkpoint(metadata)
+        self.flush_checkpoints()
 
-        Args:
-            current: Current sample count
-            total: Total sample count
-            elapsed_seconds: Elapsed time in seconds
+    def export_legacy_checkpoint(self) -> str:
+        """
+        Export the monolithic legacy checkpoint (freesound_library.pkl).
+
+        The split checkpoint (topology + SQLite + JSON) is the source of truth
+        and is what _save_checkpoint writes. This export bundles the attributed
+        graph, processed IDs, checkpoint metadata and sound cache into a single
+        joblib file for tools that still read the legacy format. It is opt-in
+        because the compressed dump repeats everything the split checkpoint
+        already stores.
 
         Returns:
-            Dictionary with progress statistics
+            Path to the exported checkpoint file
+
+        Raises:
+            OSError: If the checkpoint cannot be written
         """
-        percentage = (current / total * 100) if total > 0 else 0
-        remaining = total - current
+        import json
+        from pathlib import Path
+
+        checkpoint_dir = Path(
+            self.config.get("checkpoint_dir", self.DEFAULT_CHECKPOINT_DIR)
+        )
+        checkpoint_meta_path = checkpoint_dir / "checkpoint_metadata.json"
+
+        checkpoint_metadata: dict[str, Any] = {}
+        if checkpoint_meta_path.exists():
+            with open(checkpoint_meta_path) as f:
+                checkpoint_metadata = json.load(f)
+
+        self.checkpoint.save(
+            graph=self.graph,
+            processed_ids=self.processed_ids,
+            metadata=checkpoint_metadata,
+            sound_cache=self._sound_cache.to_dict(),
+        )
+
+        self.logger.info(
+            EmojiFormatter.format(
+                "success",
+                f"Legacy checkpoint exported: {self.checkpoint.checkpoint_path}",
+            )
+        )
+        return str(self.checkpoint.checkpoint_path)
+
+    def _needs_full_checkpoint(self, topology_path) -> bool:
+        """
+        Decide whether the next save must write a full topology snapshot.
+
+        Delta saves are only safe when every change since the last save was
+        recorded through _add_edge/_add_edges/_add_node_to_graph; any other
+        structural mutation (direct graph edits, removals) shows up as a
+        TrackedDiGraph mutation the journal didn't see. A full snapshot is also
+        written to compact the journal and before backups, so backup copies
+        of the topology pickle are always complete.
+
+        Args:
+            topology_path: Path to graph_topology.gpickle or graph_topology_csr/
+
+        Returns:
+            True if a full snapshot is required, False if a delta save suffices
+        """
+        if self.checkpoint_mode != "delta":
+            return True
+        if self._force_full_checkpoint:
+            return True
+        # A full snapshot may still be queued on the background writer
+        if not (
+            self._topology_snapshot_captured
+            or (
+                self._topology_exists(topology_path)
+                and (topology_path.parent / "processed_ids.json").exists()
+            )
+        ):
+            return True
+        if self._delta_saves_since_compaction >= self.checkpoint_compaction_interval:
+            return True
+        if self.backup_manager.should_create_backup(self.graph.number_of_nodes()):
+            return True
+
+        # Untracked mutations (direct graph edits, removals) invalidate the delta
+        version = self._topology_version()
+        if version is None or version != self._journaled_topology_version:
+            self.logger.debug(
+                "Untracked graph changes detected, writing full topology snapshot"
+            )
+            return True
+        # Same for processed IDs added or discarded outside _mark_processed
+        if len(self.processed_ids) != self._journaled_processed_count + len(
+            self._journal_processed
+        ):
+            self.logger.debug(
+                "Untracked processed ID changes detected, writing full snapshot"
+            )
+            return True
+
+        return False
+
+    def _write_topology_snapshot(
+        self, topology_path, nodes: list[str], edges: list[tuple]
+    ) -> None:
+        """
+        Write the full attribute-free topology and truncate the journal.
+
+        graph_topology.gpickle is written in both formats because scripts,
+        workflows and backup restore read it directly; 'csr' additionally
+        writes graph_topology_csr/, which the loader and load_checkpoint_csr()
+        prefer. In 'gpickle' format a CSR snapshot left by an earlier 'csr'
+        run is removed, since it would no longer match the journal.
+
+        Args:
+            topology_path: Path to graph_topology.gpickle or graph_topology_csr/
+            nodes: All node IDs captured for the snapshot
+            edges: All (source, target[, type, weight]) tuples for the snapshot
+        """
+        import shutil
+
+        from ..storage import CSRTopology
+
+        checkpoint_dir = topology_path.parent
+        self._write_gpickle_snapshot(
+            checkpoint_dir / "graph_topology.gpickle", nodes, edges
+        )
+
+        csr_path = checkpoint_dir / "graph_topology_csr"
+        if self.topology_format == "csr":
+            CSRTopology.from_edges(nodes, edges).save(csr_path)
+        elif csr_path.exists():
+            shutil.rmtree(csr_path)
+
+        # The snapshot now contains every journaled change
+        self.topology_journal.clear()
+
+    def _write_processed_ids_base(
+        self, checkpoint_dir, processed_ids: list[str]
+    ) -> None:
+        """
+        Write the full processed ID set that delta saves journal additions to.
+
+        Delta checkpoints omit processed_ids from checkpoint_metadata.json, so
+        processed_ids.json keeps the set from the last full snapshot. In 'full'
+        mode the JSON always carries the set and a leftover file is removed,
+        so a later switch to 'delta' starts from a fresh snapshot.
+
+        Args:
+            checkpoint_dir: Checkpoint directory
+            processed_ids: Every processed sample ID
+        """
+        import json
+
+        base_path = checkpoint_dir / "processed_ids.json"
+        if self.checkpoint_mode != "delta":
+            base_path.unlink(missing_ok=True)
+            return
+
+        temp_path = base_path.with_suffix(".json.tmp")
+        with open(temp_path, "w") as f:
+            json.dump(processed_ids, f, separators=(",", ":"))
+        temp_path.replace(base_path)
+
+    def _load_processed_ids_base(self, checkpoint_dir) -> set[str]:
+        """
+        Load the processed IDs written with the last full delta-mode snapshot.
+
+        Args:
+            checkpoint_dir: Checkpoint directory
+
+        Returns:
+            Processed sample IDs (empty if processed_ids.json doesn't exist)
+        """
+        import json
+
+        base_path = checkpoint_dir / "processed_ids.json"
+        if not base_path.exists():
+            self.logger.warning(
+                "processed_ids.json not found, using journaled processed IDs only"
+            )
+            return set()
+        with open(base_path) as f:
+            return set(json.load(f))
+
+    def _mark_processed(self, sample_id: str) -> None:
+        """
+        Add a sample to processed_ids and journal the addition.
+
+        Args:
+            sample_id: Sample ID (string)
+        """
+        if sample_id not in self.processed_ids:
+            self.processed_ids.add(sample_id)
+            self._journal_processed.append(sample_id)
+
+    @staticmethod
+    def _write_gpickle_snapshot(
+        gpickle_path, nodes: Iterable[str], edges: Iterable[tuple]
+    ) -> None:
+        """
+        Atomically write an attribute-free topology pickle.
+
+        Args:
+            gpickle_path: Path to graph_topology.gpickle
+            nodes: All node IDs (isolated nodes are preserved)
+            edges: (source, target[, ...]) tuples, extra fields are dropped
+        """
+        import pickle
+
+        # Create a new graph with only edges (more memory fast than copy + clear)
+        graph_clean: nx.DiGraph = nx.DiGraph()
+        # Add nodes first (without attributes) to preserve isolated nodes
+        graph_clean.add_nodes_from(nodes)
+        # Then add edges
+        graph_clean.add_edges_from((edge[0], edge[1]) for edge in edges)
+
+        # Write to a temp file and rename so a crash never leaves a partial pickle
+        temp_path = gpickle_path.with_suffix(".gpickle.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(graph_clean, f, pickle.HIGHEST_PROTOCOL)
+        temp_path.replace(gpickle_path)
+
+        # Explicitly delete to free memory immediately
+        del graph_clean
+
+    def _add_edge(self, source: str, target: str, **attrs: Any) -> None:
+        """
+        Add an edge to the graph and record it for the next delta checkpoint.
+
+        Callers are responsible for duplicate checks (has_edge), matching the
+        existing edge builders.
+
+        Args:
+            source: Source node ID
+            target: Target node ID
+            **attrs: Edge attributes (type, weight)
+        """
+        with self._journaled_mutation():
+            self.graph.add_edge(source, target, **attrs)
+        self._journal_edges.append(
+            (source, target, attrs.get("type"), attrs.get("weight"))
+        )
+
+    def _add_edges(self, edges: list[tuple[str, str, str, float]]) -> None:
+        """
+        Add edges in one graph update and record them for the next delta
+        checkpoint.
+
+        Callers are responsible for duplicate checks (has_edge), as with
+        _add_edge().
+
+        Args:
+            edges: (source, target, type, weight) tuples
+        """
+        with self._journaled_mutation():
+            self.graph.add_edges_from(
+                (source, target, {"type": edge_type, "weight": weight})
+                for source, target, edge_type, weight in edges
+            )
+        self._journal_edges.extend(edges)
+
+    def _topology_version(self) -> Optional[tuple[int, int]]:
+        """
+        Identify the current graph state for untracked-mutation checks.
+
+        Returns:
+            (graph id, mutation count), or None if the graph doesn't count
+            its mutations (e.g. a plain DiGraph assigned from outside)
+        """
+        mutation_count = getattr(self.graph, "mutation_count", None)
+        if mutation_count is None:
+            return None
+        return id(self.graph), mutation_count
+
+    @contextlib.contextmanager
+    def _journaled_mutation(self) -> Iterator[None]:
+        """
+        Mark the graph mutation made in the block as recorded in the journal.
+
+        The journaled version only advances if the graph was in sync before
+        the block, so an earlier untracked edit still forces a full snapshot.
+        """
+        in_sync = self._topology_version() == self._journaled_topology_version
+        yield
+        if in_sync:
+            self._journaled_topology_version = self._topology_version()
+
+    def _mark_node_dirty(self, node_id: str) -> None:
+        """
+        Record that a node's attributes changed since the last checkpoint.
+
+        Args:
+            node_id: Node ID whose metadata must be upserted on the next save
+        """
+        self._dirty_nodes.add(node_id)
+
+    def _topology_path(self, checkpoint_dir):
+        """
+        Get the topology snapshot path for the configured topology_format.
+
+        Args:
+            checkpoint_dir: Checkpoint directory
+
+        Returns:
+            Path to graph_topology.gpickle or graph_topology_csr/
+        """
+        if self.topology_format == "csr":
+            return checkpoint_dir / "graph_topology_csr"
+        return checkpoint_dir / "graph_topology.gpickle"
+
+    @staticmethod
+    def _topology_exists(topology_path) -> bool:
+        """
+        Check if a complete topology snapshot exists at a path.
+
+        Args:
+            topology_path: Path to graph_topology.gpickle or graph_topology_csr/
+
+        Returns:
+            True if the snapshot exists
+        """
+        if topology_path.suffix == ".gpickle":
+            return topology_path.exists()
+
+        from ..storage import CSRTopology
+
+        return CSRTopology.exists(topology_path)
+
+    def _find_topology(self, checkpoint_dir):
+        """
+        Find the topology snapshot to load, preferring the configured format.
+
+        Args:
+            checkpoint_dir: Checkpoint directory
+
+        Returns:
+            Path to an existing topology snapshot, or None if there is none
+        """
+        preferred = self._topology_path(checkpoint_dir)
+        fallback = (
+            checkpoint_dir / "graph_topology.gpickle"
+            if self.topology_format == "csr"
+            else checkpoint_dir / "graph_topology_csr"
+        )
+        for topology_path in (preferred, fallback):
+            if self._topology_exists(topology_path):
+                return topology_path
+        return None
+
+    def _load_topology(self, checkpoint_dir) -> nx.DiGraph:
+        """
+        Load the topology snapshot into a NetworkX graph.
+
+        A snapshot stored in the other format is migrated to topology_format
+        immediately, so the journal and later delta saves always apply to an
+        up-to-date snapshot. Migrating to 'csr' keeps graph_topology.gpickle
+        (it is rewritten on every full snapshot); migrating to 'gpickle'
+        removes graph_topology_csr/.
+
+        Args:
+            checkpoint_dir: Checkpoint directory
+
+        Returns:
+            Graph with topology from the last full snapshot (journal not applied)
+        """
+        import pickle
+        import shutil
+
+        from ..storage import CSRTopology
+
+        topology_path = self._find_topology(checkpoint_dir)
+
+        if topology_path.suffix == ".gpickle":
+            with open(topology_path, "rb") as f:
+                # nosec B301 - Loading our own checkpoint data, not untrusted input
+                graph = pickle.load(f)  # nosec
+        else:
+            graph = CSRTopology.load(topology_path).to_networkx()
+
+        target_path = self._topology_path(checkpoint_dir)
+        if topology_path != target_path:
+            self.logger.info(
+                f"Migrating topology {topology_path.name} -> {target_path.name}"
+            )
+            # Journal is relative to the snapshot, so keep it intact
+            if self.topology_format == "csr":
+                # graph_topology.gpickle stays for consumers that read it
+                CSRTopology.from_graph(graph).save(target_path)
+            else:
+                self._write_gpickle_snapshot(target_path, graph.nodes(), graph.edges())
+                shutil.rmtree(topology_path)
+        elif self.topology_format == "gpickle":
+            # Delta saves won't keep an older CSR snapshot in sync
+            csr_path = checkpoint_dir / "graph_topology_csr"
+            if csr_path.exists():
+                shutil.rmtree(csr_path)
+
+        return graph
+
+    def _create_backup(self) -> None:
+        """
+        Create timestamped backups of split checkpoint files.
+
+        Backs up both graph topology and metadata database.
+        """
+        try:
+            import shutil
+            from pathlib import Path
+
+            checkpoint_dir = Path(
+                self.config.get("checkpoint_dir", "data/freesound_library")
+            )
+
+            # Create backup filenames with timestamp and node count
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            nodes = self.graph.number_of_nodes()
+
+            # Backup graph topology (pickle in both formats, plus CSR arrays)
+            gpickle_path = checkpoint_dir / "graph_topology.gpickle"
+            if gpickle_path.exists():
+                topology_backup = (
+                    checkpoint_dir
+                    / f"graph_topology_backup_{nodes}nodes_{timestamp}.gpickle"
+                )
+                shutil.copy2(gpickle_path, topology_backup)
+                self.logger.info(f"📦 Topology backup created: {topology_backup.name}")
+            csr_path = checkpoint_dir / "graph_topology_csr"
+            if self.topology_format == "csr" and csr_path.is_dir():
+                topology_backup = (
+                    checkpoint_dir
+                    / f"graph_topology_csr_backup_{nodes}nodes_{timestamp}"
+                )
+                shutil.copytree(csr_path, topology_backup)
+                self.logger.info(f"📦 Topology backup created: {topology_backup.name}")
+
+            # Backup metadata database
+            metadata_db_path = checkpoint_dir / "metadata_cache.db"
+            if metadata_db_path.exists():
+                metadata_backup = (
+                    checkpoint_dir
+                    / f"metadata_cache_backup_{nodes}nodes_{timestamp}.db"
+                )
+                shutil.copy2(metadata_db_path, metadata_backup)
+                self.logger.info(f"📦 Metadata backup created: {metadata_backup.name}")
+
+        except Exception as e:
+            self.logger.warning(f"Failed to create backup: {e}")
+
+    def _check_time_limit(self) -> bool:
+        """
+        Check if time limit has been reached.
+
+        Returns:
+            True if time limit reached, False otherwise
+        """
+        if not self.max_runtime_hours or not self.start_time:
+            return False
+
+        elapsed_hours = (time.time() - self.start_time) / 3600
+        return elapsed_hours >= self.max_runtime_hours
+
+    def _calculate_progress_stats(
+        self, current: int, total: int, elapsed_seconds: float
+    ) -> dict[str, Any]:
+        """
+        Calculate progress statistics.
+
+        Args:
+            current: Current sample count
+            total: Total sample count
+            elapsed_seconds: Elapsed time in seconds
+
+        Returns:
+            Dictionary with progress statistics
+        """
+        percentage = (current / total * 100) if total > 0 else 0
+        remaining = total - current
 
         # Estimate time remaining
         if current > 0 and elapsed_seconds > 0:
@@ -935,9 +2070,12 @@ class IncrementalFreesoundLoader(DataLoader):
 
         Notes:
             - Checks circuit breaker before each page request
-            - Updates pagination_state.current_page after each successful page
+            - Updates pagination_state.current_page after each fully processed
+              page; a page interrupted by the circuit breaker is retried on resume
             - Saves checkpoint with pagination state after each page
             - Resets pagination when search query or sort order changes
+            - With search_prefetch_pages > 0, the following pages are requested
+              in the background while the current page is processed
         """
         # Check if search parameters changed - reset pagination if so
         if (
@@ -957,6 +2095,7 @@ class IncrementalFreesoundLoader(DataLoader):
 
         samples: list[dict[str, Any]] = []
         current_page: int = self.pagination_state.get("page", 1)
+        page_engine: Optional[FetchEngine] = None
 
         self.logger.info(
             f"Starting pagination search from page {current_page}: "
@@ -992,20 +2131,9 @@ class IncrementalFreesoundLoader(DataLoader):
                 self.config.get("page_size", self.DEFAULT_PAGE_SIZE),
             )  # API max
 
-            while True:
-                # Check circuit breaker BEFORE making API request
-                if self._check_circuit_breaker():
-                    self.logger.info(
-                        f"Circuit breaker triggered at page {current_page}, "
-                        f"collected {len(samples)} samples this session"
-                    )
-                    break
-
-                # Rate limit the request
-                self.rate_limiter.acquire()
-
-                # Fetch page with retry logic
-                def _do_search(page=current_page):
+            # Fetch page with retry logic (may run on a prefetch worker)
+            def _fetch_page(page: int) -> Any:
+                def _do_search():
                     return self.client.text_search(
                         query=query or "",
                         filter=search_filter if search_filter else None,
@@ -1024,11 +2152,46 @@ class IncrementalFreesoundLoader(DataLoader):
                         fields="id,name,tags,description,duration,username,pack,license,created,type,channels,filesize,samplerate,category,category_code,category_is_user_provided,previews,images,num_downloads,num_ratings,avg_rating,num_comments,geotag,url",
                     )
 
+                # Rate limit the request
+                self._acquire_rate_limit()
                 results = self._retry_with_backoff(_do_search)
                 self._increment_request_count()
+                return results
+
+            if self.search_prefetch_pages > 0:
+                page_engine = FetchEngine(
+                    _fetch_page,
+                    max_workers=self.search_prefetch_pages,
+                    logger=self.logger,
+                )
+            last_page: Optional[int] = None
+
+            while True:
+                # Check circuit breaker BEFORE making API request
+                if self._check_circuit_breaker():
+                    self.logger.info(
+                        f"Circuit breaker triggered at page {current_page}, "
+                        f"collected {len(samples)} samples this session"
+                    )
+                    break
+
+                if page_engine is not None:
+                    results = page_engine.result(current_page)
+
+                    # Request the following pages while this one is processed
+                    count = getattr(results, "count", None)
+                    if isinstance(count, int):
+                        last_page = max(1, -(-count // page_size))
+                    if results.next:
+                        self._prefetch_search_pages(
+                            page_engine, current_page + 1, last_page, page_size
+                        )
+                else:
+                    results = _fetch_page(current_page)
 
                 # Process results from this page
                 page_samples = []
+                page_complete = True
                 for sound in results:
                     # Check if sample already exists (duplicate detection)
                     sample_id = sound.id
@@ -1045,11 +2208,12 @@ class IncrementalFreesoundLoader(DataLoader):
 
                     # Check circuit breaker before fetching full metadata
                     if self._check_circuit_breaker():
+                        page_complete = False
                         break
 
                     # Fetch full metadata for new sample
                     try:
-                        self.rate_limiter.acquire()
+                        self._acquire_rate_limit()
                         full_sound = self._retry_with_backoff(
                             self.client.get_sound, sample_id
                         )
@@ -1061,11 +2225,11 @@ class IncrementalFreesoundLoader(DataLoader):
                             samples.append(sample_data)
                         else:
                             # Mark as processed so we don't try to fetch it again
-                            self.processed_ids.add(str(sample_id))
+                            self._mark_processed(str(sample_id))
                     except Exception as e:
                         self.logger.warning(f"Skipping invalid sample {sample_id}: {e}")
                         # Mark as processed so we don't try to fetch it again
-                        self.processed_ids.add(str(sample_id))
+                        self._mark_processed(str(sample_id))
                         self.stats["samples_skipped"] = (
                             cast(int, self.stats["samples_skipped"]) + 1
                         )
@@ -1075,6 +2239,15 @@ class IncrementalFreesoundLoader(DataLoader):
                     f"(skipped {self.stats['samples_skipped']} duplicates)"
                 )
 
+                # Keep an interrupted page as the resume point; its collected
+                # samples are skipped as duplicates when it is fetched again
+                if not page_complete:
+                    self.logger.info(
+                        f"Page {current_page} interrupted by circuit breaker, "
+                        f"next run resumes from it"
+                    )
+                    break
+
                 # Update pagination state after successful page
                 current_page += 1
                 self.pagination_state["page"] = current_page
@@ -1108,6 +2281,12 @@ class IncrementalFreesoundLoader(DataLoader):
                 }
             )
             raise
+        finally:
+            if page_engine is not None:
+                page_engine.close()
+                self.logger.debug(
+                    f"Search page prefetch stats: {page_engine.get_stats()}"
+                )
 
         self.logger.info(
             f"Pagination search complete: {len(samples)} samples collected, "
@@ -1116,6 +2295,45 @@ class IncrementalFreesoundLoader(DataLoader):
 
         return samples
 
+    def _prefetch_search_pages(
+        self,
+        page_engine: FetchEngine,
+        next_page: int,
+        last_page: Optional[int],
+        page_size: int,
+    ) -> None:
+        """
+        Request upcoming search pages in the background.
+
+        A page is only prefetched if the request budget could still process
+        it completely: the current page and every buffered page are assumed
+        to need one get_sound() request per result (page_size), plus one
+        request per page still in flight. This keeps prefetching from using
+        requests that the circuit breaker would otherwise leave for samples.
+
+        Args:
+            page_engine: Engine fetching pages by number
+            next_page: First page after the one being processed
+            last_page: Last page of the result set, if known
+            page_size: Results per page
+        """
+        remaining = (
+            self._request_limit()
+            - self.session_request_count
+            - page_size
+            - page_engine.pending * page_size
+            - page_engine.running
+        )
+        page = next_page
+        while not page_engine.full and (last_page is None or page <= last_page):
+            if page not in page_engine:
+                if remaining < 1 + page_size:
+                    return
+                page_engine.prefetch(page)
+                remaining -= 1 + page_size
+            page += 1
+
+    @_budgeted("discovery")
     def fetch_data(  # type: ignore[override]
         self,
         query: Optional[str] = None,
@@ -1238,7 +2456,7 @@ class IncrementalFreesoundLoader(DataLoader):
                 processed_samples.append(sample)
 
                 # Mark as processed
-                self.processed_ids.add(str(sample["id"]))
+                self._mark_processed(str(sample["id"]))
 
                 # Periodic checkpoint save
                 if (i + 1) % self.checkpoint_interval == 0:
@@ -1338,7 +2556,7 @@ class IncrementalFreesoundLoader(DataLoader):
             len(processed_samples), len(new_samples), elapsed
         )
 
-        self._save_checkpoint(
+        self._save_final_checkpoint(
             {"completed": True, "final_stats": final_stats, "edge_stats": edge_stats}
         )
 
@@ -1351,6 +2569,7 @@ class IncrementalFreesoundLoader(DataLoader):
 
         return {"samples": processed_samples, "edge_stats": edge_stats}
 
+    @_budgeted("discovery")
     def _process_samples_recursive(
         self,
         seed_samples: list[dict[str, Any]],
@@ -1410,18 +2629,31 @@ class IncrementalFreesoundLoader(DataLoader):
         # Counter ensures stable ordering for samples with same priority
         # Priority = negative of calculated score (for max-heap behavior)
         # Tuple format: (priority, counter, sample_dict, depth)
+        # With a persistent frontier, the heap only holds the candidates popped
+        # from crawl_frontier.db and new candidates are queued there
         priority_queue: list[tuple[float, int, dict[str, Any], int]] = []
         counter = 0
-        for sample in seed_samples:
-            # Calculate intelligent priority score
-            priority_score = self.calculate_node_priority(sample)
-            priority = -priority_score  # Negative for max-heap behavior
-            heapq.heappush(priority_queue, (priority, counter, sample, 0))
-            counter += 1
+        if self.frontier is not None:
+            # Seeds join the candidates left by earlier runs
+            self.frontier.push_many(
+                (sample, self.calculate_node_priority(sample), 0)
+                for sample in seed_samples
+                if str(sample["id"]) not in self.processed_ids
+            )
+        else:
+            for sample in seed_samples:
+                # Calculate intelligent priority score
+                priority_score = self.calculate_node_priority(sample)
+                priority = -priority_score  # Negative for max-heap behavior
+                heapq.heappush(priority_queue, (priority, counter, sample, 0))
+                counter += 1
 
         # Dictionary to store relationships discovered during Pass 1
         # Maps source_id -> [(target_id, similarity_score), ...]
-        pending_edges: dict[str, list[tuple[str, float]]] = {}
+        # (including those of earlier runs not yet added as edges)
+        pending_edges: dict[str, list[tuple[str, float]]] = (
+            self.frontier.load_edges() if self.frontier is not None else {}
+        )
 
         # Dormant node tracking
         # Track number of NEW samples discovered during each node expansion
@@ -1468,215 +2700,308 @@ class IncrementalFreesoundLoader(DataLoader):
         # This ensures we build a connected graph starting from most useful samples
         # ============================================================================
 
-        while priority_queue:
-            # Dequeue next sample to process (highest priority = most popular)
-            priority, _, sample, current_depth = heapq.heappop(priority_queue)
-            sample_id = str(sample["id"])
+        # Optional worker pool fetching similar sounds for the next samples in
+        # the queue while this thread processes the current one
+        fetch_engine: Optional[FetchEngine] = None
+        if self.fetch_workers > 1 and depth > 0:
+            fetch_engine = FetchEngine(
+                self._fetch_similar_sounds_for_sample,
+                max_workers=self.fetch_workers,
+                logger=self.logger,
+            )
+            self.logger.info(
+                f"Prefetching similar sounds with {self.fetch_workers} workers"
+            )
 
-            # Skip if already processed (handles duplicate queue entries)
-            if sample_id in self.processed_ids:
-                continue
+        try:
+            while True:
+                if self.frontier is not None:
+                    counter = self._refill_from_frontier(priority_queue, counter)
+                if not priority_queue:
+                    break
 
-            # Check circuit breaker BEFORE making any API calls
-            if self._check_circuit_breaker():
-                elapsed = time.time() - start_time
-                self.logger.info(
-                    f"Gracefully stopping after {format_time_duration(elapsed)}, "
-                    f"saving checkpoint..."
-                )
-                self._save_checkpoint(
-                    {
-                        "stopped_reason": "circuit_breaker",
-                        "api_requests_used": self.session_request_count,
-                    }
-                )
-                return
+                # Dequeue next sample to process (highest priority = most popular)
+                priority, _, sample, current_depth = heapq.heappop(priority_queue)
+                sample_id = str(sample["id"])
 
-            # Check if time limit has been reached
-            if self._check_time_limit():
-                elapsed = time.time() - start_time
-                self.logger.warning(
-                    f"Time limit reached after {format_time_duration(elapsed)}, "
-                    f"saving checkpoint..."
-                )
-                self._save_checkpoint({"stopped_reason": "time_limit"})
-                return
+                # Skip if already processed (handles duplicate queue entries)
+                if sample_id in self.processed_ids:
+                    continue
 
-            # Check if we've reached the maximum number of samples (mode-dependent)
-            if self.max_samples_mode == "limit":
-                # Limit mode: Stop at max_total_samples
-                if self.graph.number_of_nodes() >= max_total_samples:
+                # Near the end of the request budget, let running prefetches
+                # spend their reserved requests before the circuit breaker check
+                if (
+                    fetch_engine is not None
+                    and int(sample_id) not in fetch_engine
+                    and self.session_request_count
+                    + (fetch_engine.running + 1) * self.REQUESTS_PER_EXPANSION
+                    > self._request_limit()
+                ):
+                    fetch_engine.wait()
+
+                # Check circuit breaker BEFORE making any API calls
+                if self._check_circuit_breaker():
+                    heapq.heappush(
+                        priority_queue, (priority, counter, sample, current_depth)
+                    )
                     elapsed = time.time() - start_time
                     self.logger.info(
-                        EmojiFormatter.format(
-                            "success",
-                            f"Reached max_total_samples limit ({max_total_samples}) "
-                            f"after {format_time_duration(elapsed)}",
-                        )
+                        f"Gracefully stopping after {format_time_duration(elapsed)}, "
+                        f"saving checkpoint..."
+                    )
+                    self._save_checkpoint(
+                        {
+                            "stopped_reason": "circuit_breaker",
+                            "api_requests_used": self.session_request_count,
+                        }
+                    )
+                    self.flush_checkpoints()
+                    return
+
+                # Check if time limit has been reached
+                if self._check_time_limit():
+                    heapq.heappush(
+                        priority_queue, (priority, counter, sample, current_depth)
                     )
-                    break
-            else:
-                # Queue-empty mode: Continue until queue is empty, but enforce safety limit
-                safety_limit = 10000
-                if self.graph.number_of_nodes() >= safety_limit:
                     elapsed = time.time() - start_time
                     self.logger.warning(
-                        EmojiFormatter.format(
-                            "warning",
-                            f"Reached safety limit ({safety_limit}) in queue-empty mode "
-                            f"after {format_time_duration(elapsed)}",
-                        )
+                        f"Time limit reached after {format_time_duration(elapsed)}, "
+                        f"saving checkpoint..."
                     )
-                    break
+                    self._save_checkpoint({"stopped_reason": "time_limit"})
+                    self.flush_checkpoints()
+                    return
+
+                # Check if we've reached the maximum number of samples (mode-dependent)
+                if self.max_samples_mode == "limit":
+                    # Limit mode: Stop at max_total_samples
+                    if self.graph.number_of_nodes() >= max_total_samples:
+                        heapq.heappush(
+                            priority_queue, (priority, counter, sample, current_depth)
+                        )
+                        elapsed = time.time() - start_time
+                        self.logger.info(
+                            EmojiFormatter.format(
+                                "success",
+                                f"Reached max_total_samples limit ({max_total_samples}) "
+                                f"after {format_time_duration(elapsed)}",
+                            )
+                        )
+                        break
+                else:
+                    # Queue-empty mode: Continue until queue is empty, but enforce safety limit
+                    safety_limit = 10000
+                    if self.graph.number_of_nodes() >= safety_limit:
+                        heapq.heappush(
+                            priority_queue, (priority, counter, sample, current_depth)
+                        )
+                        elapsed = time.time() - start_time
+                        self.logger.warning(
+                            EmojiFormatter.format(
+                                "warning",
+                                f"Reached safety limit ({safety_limit}) in queue-empty mode "
+                                f"after {format_time_duration(elapsed)}",
+                            )
+                        )
+                        break
 
-            # Add node to graph (without edges - edges come in Pass 2)
-            self._add_node_to_graph(sample)
-            self.processed_ids.add(sample_id)
-            checkpoint_counter += 1
+                # Add node to graph (without edges - edges come in Pass 2)
+                self._add_node_to_graph(sample)
+                self._mark_processed(sample_id)
+                checkpoint_counter += 1
 
-            # Fetch similar sounds if we haven't reached the depth limit
-            # Note: current_depth < depth (not <=) because we want to fetch
-            # similar sounds for samples at depth N to discover samples at depth N+1
-            if current_depth < depth:
-                # Apply quality thresholds - only expand from high-quality nodes
-                downloads = sample.get("num_downloads", 0)
-                avg_rating = sample.get("avg_rating", 0.0)
+                # Fetch similar sounds if we haven't reached the depth limit
+                # Note: current_depth < depth (not <=) because we want to fetch
+                # similar sounds for samples at depth N to discover samples at depth N+1
+                if current_depth < depth:
+                    # Apply quality thresholds - only expand from high-quality nodes
+                    downloads = sample.get("num_downloads", 0)
+                    avg_rating = sample.get("avg_rating", 0.0)
+
+                    # Skip expansion if sample doesn't meet minimum quality thresholds
+                    if (
+                        downloads < fetch_similar_threshold_downloads
+                        or avg_rating < fetch_similar_threshold_rating
+                    ):
+                        self.stats["samples_skipped"] = (
+                            cast(int, self.stats["samples_skipped"]) + 1
+                        )
+                        self.logger.debug(
+                            f"Skipping expansion for {sample_id}: "
+                            f"downloads={downloads} (threshold={fetch_similar_threshold_downloads}), "
+                            f"rating={avg_rating:.1f} (threshold={fetch_similar_threshold_rating})"
+                        )
+                        continue
 
-                # Skip expansion if sample doesn't meet minimum quality thresholds
-                if (
-                    downloads < fetch_similar_threshold_downloads
-                    or avg_rating < fetch_similar_threshold_rating
-                ):
-                    self.stats["samples_skipped"] = (
-                        cast(int, self.stats["samples_skipped"]) + 1
-                    )
                     self.logger.debug(
-                        f"Skipping expansion for {sample_id}: "
-                        f"downloads={downloads} (threshold={fetch_similar_threshold_downloads}), "
-                        f"rating={avg_rating:.1f} (threshold={fetch_similar_threshold_rating})"
+                        f"Fetching similar sounds for {sample_id} at depth {current_depth}"
                     )
-                    continue
+                    try:
+                        # Track new samples discovered before expansion
+                        len(self.processed_ids)
+
+                        # Fetch similar sounds via API, starting fetches for the
+                        # samples expected next before waiting on this one
+                        if fetch_engine is not None:
+                            self._prefetch_expansions(
+                                fetch_engine,
+                                priority_queue,
+                                int(sample_id),
+                                depth,
+                                max_total_samples,
+                            )
+                            similar_list = fetch_engine.result(int(sample_id))
+                        else:
+                            similar_list = self._fetch_similar_sounds_for_sample(
+                                int(sample_id)
+                            )
 
-                self.logger.debug(
-                    f"Fetching similar sounds for {sample_id} at depth {current_depth}"
-                )
-                try:
-                    # Track new samples discovered before expansion
-                    len(self.processed_ids)
-
-                    # Fetch similar sounds via API
-                    similar_list = self._fetch_similar_sounds_for_sample(int(sample_id))
-
-                    # Store relationships for Pass 2 (edge creation)
-                    # This is critical: we do NOT add edges here because target
-                    # nodes may not exist yet. We'll add edges in Pass 2 after
-                    # all nodes have been discovered.
-                    if similar_list:
-                        pending_edges[sample_id] = similar_list
-                        self.logger.debug(
-                            f"Stored {len(similar_list)} relationships for {sample_id}"
-                        )
-                    else:
-                        self.logger.debug(f"No similar sounds found for {sample_id}")
-
-                    # Track new samples discovered during expansion
-                    new_samples_discovered = 0
-
-                    # Enqueue unprocessed similar samples for next depth level
-                    # Each similar sample will be processed at depth = current_depth + 1
-                    # Priority by downloads ensures we explore most popular samples first
-                    for similar_id, _score in similar_list:
-                        similar_id_str = str(similar_id)
-
-                        # Only enqueue if:
-                        # 1. Not already processed (avoid duplicate work)
-                        # 2. Within sample limit (respect max_total_samples)
-                        if (
-                            similar_id_str not in self.processed_ids
-                            and self.graph.number_of_nodes() < max_total_samples
-                        ):
-                            try:
-                                # Fetch metadata for the similar sample (return_sound=False by default)
-                                similar_sample = cast(
-                                    dict[str, Any],
-                                    self._fetch_sample_metadata(similar_id),
-                                )
+                        # Store relationships for Pass 2 (edge creation)
+                        # This is critical: we do NOT add edges here because target
+                        # nodes may not exist yet. We'll add edges in Pass 2 after
+                        # all nodes have been discovered.
+                        if similar_list:
+                            pending_edges[sample_id] = similar_list
+                            if self.frontier is not None:
+                                self.frontier.add_edges(sample_id, similar_list)
+                            self.logger.debug(
+                                f"Stored {len(similar_list)} relationships for {sample_id}"
+                            )
+                        else:
+                            self.logger.debug(
+                                f"No similar sounds found for {sample_id}"
+                            )
 
-                                # Count as new sample discovered
-                                new_samples_discovered += 1
+                        # Track new samples discovered during expansion
+                        new_samples_discovered = 0
+
+                        # Enqueue unprocessed similar samples for next depth level
+                        # Each similar sample will be processed at depth = current_depth + 1
+                        # Priority by downloads ensures we explore most popular samples first
+                        for similar_id, _score in similar_list:
+                            similar_id_str = str(similar_id)
+
+                            # Only enqueue if:
+                            # 1. Not already processed (avoid duplicate work)
+                            # 2. Within sample limit (respect max_total_samples)
+                            if (
+                                similar_id_str not in self.processed_ids
+                                and self.graph.number_of_nodes() < max_total_samples
+                            ):
+                                # Queued by an earlier expansion: no metadata
+                                # request, one more link raises its priority
+                                if (
+                                    self.frontier is not None
+                                    and similar_id_str in self.frontier
+                                ):
+                                    self._link_frontier_candidate(similar_id_str)
+                                    continue
+
+                                try:
+                                    # Fetch metadata for the similar sample (return_sound=False by default)
+                                    similar_sample = cast(
+                                        dict[str, Any],
+                                        self._fetch_sample_metadata(similar_id),
+                                    )
+
+                                    # Count as new sample discovered
+                                    new_samples_discovered += 1
+
+                                    # Calculate intelligent priority score
+                                    similar_priority_score = (
+                                        self.calculate_node_priority(similar_sample)
+                                    )
+                                    similar_priority = (
+                                        -similar_priority_score
+                                    )  # Negative for max-heap
+
+                                    # Enqueue at next depth level with priority
+                                    if self.frontier is not None:
+                                        self.frontier.push_many(
+                                            [
+                                                (
+                                                    similar_sample,
+                                                    similar_priority_score,
+                                                    current_depth + 1,
+                                                )
+                                            ]
+                                        )
+                                        continue
+                                    heapq.heappush(
+                                        priority_queue,
+                                        (
+                                            similar_priority,
+                                            counter,
+                                            similar_sample,
+                                            current_depth + 1,
+                                        ),
+                                    )
+                                    counter += 1
+                                except Exception as e:
+                                    # Log but don't fail - continue with other samples
+                                    self.logger.debug(
+                                        f"Could not fetch metadata for {similar_id}: {e}"
+                                    )
+
+                        # Track expansion statistics
+                        cast(list, self.stats["new_samples_per_expansion"]).append(
+                            new_samples_discovered
+                        )
 
-                                # Calculate intelligent priority score
-                                similar_priority_score = self.calculate_node_priority(
-                                    similar_sample
+                        # Dormant node detection: mark node as dormant if it yielded 0 new samples
+                        if new_samples_discovered == 0:
+                            # Mark node as dormant in graph
+                            if sample_id in self.graph:
+                                now = datetime.now(timezone.utc).isoformat()
+                                self.graph.nodes[sample_id]["is_dormant"] = True
+                                self.graph.nodes[sample_id]["dormant_since"] = now
+
+                                # Recalculate priority score with dormant penalty
+                                # This will apply the dormant_penalty_multiplier (default: 0.01)
+                                updated_priority = self.calculate_node_priority(sample)
+                                self.graph.nodes[sample_id]["priority_score"] = (
+                                    updated_priority
                                 )
-                                similar_priority = (
-                                    -similar_priority_score
-                                )  # Negative for max-heap
-
-                                # Enqueue at next depth level with priority
-                                heapq.heappush(
-                                    priority_queue,
-                                    (
-                                        similar_priority,
-                                        counter,
-                                        similar_sample,
-                                        current_depth + 1,
-                                    ),
+                                self._mark_node_dirty(sample_id)
+
+                                dormant_nodes_count += 1
+                                self.stats["dormant_nodes_identified"] = (
+                                    cast(int, self.stats["dormant_nodes_identified"])
+                                    + 1
                                 )
-                                counter += 1
-                            except Exception as e:
-                                # Log but don't fail - continue with other samples
+
                                 self.logger.debug(
-                                    f"Could not fetch metadata for {similar_id}: {e}"
+                                    f"Node {sample_id} marked as dormant (0 new samples discovered), "
+                                    f"priority score updated to {updated_priority:.2f}"
                                 )
 
-                    # Track expansion statistics
-                    cast(list, self.stats["new_samples_per_expansion"]).append(
-                        new_samples_discovered
-                    )
-
-                    # Dormant node detection: mark node as dormant if it yielded 0 new samples
-                    if new_samples_discovered == 0:
-                        # Mark node as dormant in graph
-                        if sample_id in self.graph:
-                            now = datetime.now(timezone.utc).isoformat()
-                            self.graph.nodes[sample_id]["is_dormant"] = True
-                            self.graph.nodes[sample_id]["dormant_since"] = now
-
-                            # Recalculate priority score with dormant penalty
-                            # This will apply the dormant_penalty_multiplier (default: 0.01)
-                            updated_priority = self.calculate_node_priority(sample)
-                            self.graph.nodes[sample_id]["priority_score"] = (
-                                updated_priority
-                            )
-
-                            dormant_nodes_count += 1
-                            self.stats["dormant_nodes_identified"] = (
-                                cast(int, self.stats["dormant_nodes_identified"]) + 1
-                            )
-
-                            self.logger.debug(
-                                f"Node {sample_id} marked as dormant (0 new samples discovered), "
-                                f"priority score updated to {updated_priority:.2f}"
-                            )
+                    except Exception as e:
+                        # Log warning but continue processing other samples
+                        self.logger.warning(
+                            f"Failed to fetch similar sounds for {sample_id}: {e}"
+                        )
 
-                except Exception as e:
-                    # Log warning but continue processing other samples
-                    self.logger.warning(
-                        f"Failed to fetch similar sounds for {sample_id}: {e}"
+                # Save checkpoint periodically to enable recovery from interruptions
+                if checkpoint_counter >= self.checkpoint_interval:
+                    elapsed = time.time() - start_time
+                    if self.frontier is not None:
+                        self._return_to_frontier(priority_queue)
+                    self._save_checkpoint(
+                        {
+                            "depth": current_depth,
+                            "pending_edges_count": len(pending_edges),
+                            "elapsed": format_time_duration(elapsed),
+                        }
                     )
-
-            # Save checkpoint periodically to enable recovery from interruptions
-            if checkpoint_counter >= self.checkpoint_interval:
-                elapsed = time.time() - start_time
-                self._save_checkpoint(
-                    {
-                        "depth": current_depth,
-                        "pending_edges_count": len(pending_edges),
-                        "elapsed": format_time_duration(elapsed),
-                    }
-                )
-                checkpoint_counter = 0
+                    checkpoint_counter = 0
+        finally:
+            if fetch_engine is not None:
+                fetch_engine.close()
+                self.logger.info(f"Fetch engine stats: {fetch_engine.get_stats()}")
+            if self.frontier is not None:
+                # Unexpanded candidates wait for the next run
+                self._return_to_frontier(priority_queue)
+                self.logger.info(f"Crawl frontier stats: {self.frontier.get_stats()}")
 
         # ============================================================================
         # PASS 2: EDGE CREATION FROM STORED RELATIONSHIPS
@@ -1742,7 +3067,7 @@ class IncrementalFreesoundLoader(DataLoader):
                         and not self.graph.has_edge(source_id, target_id_str)
                         and source_id != target_id_str
                     ):
-                        self.graph.add_edge(
+                        self._add_edge(
                             source_id, target_id_str, type="similar", weight=score
                         )
                         edge_count += 1
@@ -1794,6 +3119,143 @@ class IncrementalFreesoundLoader(DataLoader):
                 "api_stats": self.stats,
             }
         )
+        self.flush_checkpoints()
+
+        # Relationships to samples not discovered yet stay for later runs
+        if self.frontier is not None:
+            self.frontier.prune_edges(self.graph)
+
+    def _refill_from_frontier(
+        self,
+        priority_queue: list[tuple[float, int, dict[str, Any], int]],
+        counter: int,
+    ) -> int:
+        """
+        Move the next batch of persistent candidates into the heap.
+
+        Pops a batch only when the frontier holds a candidate with a higher
+        priority than the heap's best (or the heap is empty), so samples are
+        expanded in global priority order.
+
+        Args:
+            priority_queue: Heap of (priority, counter, sample, depth) tuples
+            counter: Next tie-breaking counter value
+
+        Returns:
+            Next tie-breaking counter value
+        """
+        assert self.frontier is not None
+        best = self.frontier.best_priority()
+        if best is None or (priority_queue and -priority_queue[0][0] >= best):
+            return counter
+
+        batch = self.frontier.pop_batch(
+            self.FRONTIER_POP_BATCH_SIZE, self.processed_ids
+        )
+        for sample, priority, depth in batch:
+            heapq.heappush(priority_queue, (-priority, counter, sample, depth))
+            counter += 1
+        return counter
+
+    def _return_to_frontier(
+        self, priority_queue: list[tuple[float, int, dict[str, Any], int]]
+    ) -> None:
+        """
+        Move unprocessed heap candidates back to the persistent frontier.
+
+        Args:
+            priority_queue: Heap of (priority, counter, sample, depth) tuples
+                (emptied)
+        """
+        assert self.frontier is not None
+        self.frontier.push_many(
+            (sample, -priority, depth)
+            for priority, _, sample, depth in priority_queue
+            if str(sample["id"]) not in self.processed_ids
+        )
+        priority_queue.clear()
+
+    def _link_frontier_candidate(self, sample_id: str) -> None:
+        """
+        Raise a queued candidate's priority for another discovered link.
+
+        The candidate isn't in the graph yet, so its degree is the number of
+        expanded samples listing it as similar; each adds the degree weight.
+
+        Args:
+            sample_id: Candidate in the persistent frontier
+        """
+        assert self.frontier is not None
+        priority = self.frontier.get_priority(sample_id)
+        if priority is None:
+            return
+        degree_weight = self.config.get(
+            "priority_weight_degree", self.DEFAULT_PRIORITY_WEIGHT_DEGREE
+        )
+        self.frontier.update_priorities({sample_id: priority + degree_weight})
+
+    def _prefetch_expansions(
+        self,
+        fetch_engine: FetchEngine,
+        priority_queue: list[tuple[float, int, dict[str, Any], int]],
+        current_id: int,
+        depth: int,
+        max_total_samples: int,
+    ) -> None:
+        """
+        Start background fetches of similar sounds for the next queued samples.
+
+        Candidates are taken from the front of the priority queue in the order
+        they will be popped and filtered like the expansion step (depth limit,
+        quality thresholds, not yet processed). Prefetching stops before it
+        could exceed either budget: each pending prefetch will add one node,
+        so nodes + pending stay within max_total_samples, and the requests of
+        running fetches (plus the current sample's, if fetched directly) are
+        reserved against max_requests.
+
+        Args:
+            fetch_engine: Engine running _fetch_similar_sounds_for_sample
+            priority_queue: Heap of (priority, counter, sample, depth) tuples
+            current_id: Sample being expanded on the calling thread
+            depth: Maximum recursion depth
+            max_total_samples: Maximum total samples to discover
+        """
+        downloads_threshold = self.config.get("fetch_similar_threshold_downloads", 100)
+        rating_threshold = self.config.get("fetch_similar_threshold_rating", 3.5)
+        node_limit = max_total_samples if self.max_samples_mode == "limit" else 10000
+
+        # Samples processed without being expanded (e.g. a duplicate queue
+        # entry at the depth limit) would hold their slot forever
+        for key in fetch_engine.keys():
+            if key != current_id and str(key) in self.processed_ids:
+                fetch_engine.discard(key)
+
+        reserved_requests = fetch_engine.running * self.REQUESTS_PER_EXPANSION
+        if current_id not in fetch_engine:
+            reserved_requests += self.REQUESTS_PER_EXPANSION
+
+        window = fetch_engine.max_pending * 4
+        for _, _, sample, sample_depth in heapq.nsmallest(window, priority_queue):
+            if fetch_engine.full:
+                return
+            sample_id = int(sample["id"])
+            if (
+                sample_id == current_id
+                or sample_id in fetch_engine
+                or str(sample_id) in self.processed_ids
+                or sample_depth >= depth
+                or sample.get("num_downloads", 0) < downloads_threshold
+                or sample.get("avg_rating", 0.0) < rating_threshold
+            ):
+                continue
+
+            if self.graph.number_of_nodes() + fetch_engine.pending >= node_limit:
+                return
+            reserved_requests += self.REQUESTS_PER_EXPANSION
+            if self.session_request_count + reserved_requests > self._request_limit():
+                return
+
+            fetch_engine.prefetch(sample_id)
 
     def calculate_node_priority(self, sample: dict[str, Any]) -> float:
         """
@@ -1850,21 +3312,52 @@ class IncrementalFreesoundLoader(DataLoader):
         # Calculate base priority score
         priority = (w1 * downloads) + (w2 * degree) - (w3 * age_days)
 
-        # Apply dormant penalty (heavily deprioritize dormant nodes)
-        if is_dormant:
-            priority *= dormant_penalty
+        # Apply dormant penalty (heavily deprioritize dormant nodes)
+        if is_dormant:
+            priority *= dormant_penalty
+
+        return priority
+
+    def _acquire_rate_limit(self) -> None:
+        """
+        Wait for a rate-limit token before an API call.
+
+        With the response cache enabled the caching session acquires the
+        token itself, only when a request misses the cache, so this is a no-op.
+        """
+        if self.response_cache is None:
+            self.rate_limiter.acquire()
+
+    def _increment_request_count(self) -> None:
+        """
+        Increment API request counter for circuit breaker.
+
+        With the response cache enabled, a call whose requests were all served
+        from the cache (in the calling thread, since the previous increment)
+        doesn't use the request budget and is counted as saved instead.
+        """
+        if self.response_cache is not None:
+            hits, misses = self.response_cache.take_thread_outcome()
+            if hits and not misses:
+                with self._request_count_lock:
+                    self.stats["http_cache_requests_saved"] = (
+                        cast(int, self.stats["http_cache_requests_saved"]) + 1
+                    )
+                return
 
-        return priority
+        with self._request_count_lock:
+            self.session_request_count += 1
+            request_count = self.session_request_count
 
-    def _increment_request_count(self) -> None:
-        """Increment API request counter for circuit breaker."""
-        self.session_request_count += 1
+        activity = self._budget_activity
+        if self.budget_planner is not None and activity is not None:
+            self.budget_planner.charge(activity)
 
         # Log progress at milestones
-        if self.session_request_count % 100 == 0:
-            remaining = self.max_requests - self.session_request_count
+        if request_count % 100 == 0:
+            remaining = self.max_requests - request_count
             self.logger.info(
-                f"API requests: {self.session_request_count}/{self.max_requests} "
+                f"API requests: {request_count}/{self.max_requests} "
                 f"({remaining} remaining)"
             )
 
@@ -1872,19 +3365,66 @@ class IncrementalFreesoundLoader(DataLoader):
         """
         Check if API quota circuit breaker should trigger.
 
+        Within an activity with a daily request budget, the limit is the
+        lower of max_requests and the activity's allowance.
+
         Returns:
             True if circuit breaker triggered (limit reached), False otherwise
         """
-        if self.session_request_count >= self.max_requests:
+        limit = self._request_limit()
+        if self.session_request_count >= limit:
             warning_msg = EmojiFormatter.format(
                 "warning",
                 f"Circuit breaker triggered: {self.session_request_count} requests "
-                f"reached limit of {self.max_requests}",
+                f"reached limit of {limit}",
             )
             self.logger.warning(warning_msg)
             return True
         return False
 
+    def _request_limit(self) -> int:
+        """Session request count at which the circuit breaker triggers."""
+        if self._budget_limit is None:
+            return self.max_requests
+        return min(self.max_requests, self._budget_limit)
+
+    @contextlib.contextmanager
+    def _spending(self, activity: str) -> Iterator[None]:
+        """
+        Spend requests on an activity within its share of the daily budget.
+
+        Asks the budget planner for the activity's allowance and lowers the
+        circuit breaker limit to it; requests counted in the block are
+        charged to the activity. Nested activities run within the outer one.
+        Does nothing without daily_request_budget.
+
+        Args:
+            activity: 'discovery', 'validation' or 'refresh'
+        """
+        if self.budget_planner is None or self._budget_activity is not None:
+            yield
+            return
+
+        allowance = self.budget_planner.begin(activity)
+        self._budget_activity = activity
+        self._budget_limit = self.session_request_count + allowance
+        try:
+            yield
+        finally:
+            self._budget_activity = None
+            self._budget_limit = None
+            self.budget_planner.end(activity)
+
+    def _record_budget_yield(self, count: int) -> None:
+        """
+        Credit results to the activity currently spending the daily budget.
+
+        Args:
+            count: New nodes, deleted samples found or samples refreshed
+        """
+        if self.budget_planner is not None and self._budget_activity is not None:
+            self.budget_planner.add_yield(self._budget_activity, count)
+
     def handle_throttling(
         self, attempt: int = 0, max_attempts: Optional[int] = None
     ) -> bool:
@@ -1937,6 +3477,8 @@ class IncrementalFreesoundLoader(DataLoader):
         self.logger.warning(warning_msg)
 
         self.stats["throttle_retries"] = cast(int, self.stats["throttle_retries"]) + 1
+        if self.rate_controller is not None:
+            self.rate_controller.on_throttle()
         time.sleep(actual_delay)
         return True
 
@@ -1951,6 +3493,7 @@ class IncrementalFreesoundLoader(DataLoader):
         - Frontier expansion stats
         - Batch expansion stats
         - Error statistics
+        - Adaptive rate trajectory (if adaptive_rate_limit is enabled)
         """
         # Calculate cache efficiency
         total_cache_ops = self._cache_hits + self._cache_misses
@@ -1965,7 +3508,25 @@ class IncrementalFreesoundLoader(DataLoader):
             f"  Total API requests: {self.session_request_count}/{self.max_requests}"
         )
         self.logger.info(f"  Requests saved (cache): {self._cache_hits}")
+        self.logger.info(
+            f"  Requests saved (batched lookups): {self.stats['batched_requests_saved']}"
+        )
         self.logger.info(f"  Cache hit ratio: {cache_hit_ratio:.1f}%")
+        if self.response_cache is not None:
+            http_stats = self.response_cache.get_stats()
+            self.logger.info(
+                f"  Requests saved (HTTP cache): "
+                f"{self.stats['http_cache_requests_saved']} "
+                f"(hit rate {http_stats['hit_rate'] * 100:.1f}%, "
+                f"{http_stats['size_bytes'] / (1024 * 1024):.1f} MB on disk)"
+            )
+        sound_cache_stats = self._sound_cache.get_stats()
+        self.logger.info(
+            f"  Sound cache: {sound_cache_stats['entries']} in memory "
+            f"({sound_cache_stats['size_bytes'] / (1024 * 1024):.1f} MB), "
+            f"{sound_cache_stats['evictions']} evicted, "
+            f"{sound_cache_stats['spill_hits']} spill hits"
+        )
         self.logger.info(
             f"  Samples skipped (quality): {self.stats['samples_skipped']}"
         )
@@ -2006,6 +3567,43 @@ class IncrementalFreesoundLoader(DataLoader):
             )
             self.logger.info(f"  Failed requests: {self.stats['failed_requests']}")
 
+        # Log adaptive rate control
+        if self.rate_controller is not None:
+            rate_stats = self.rate_controller.get_stats()
+            rate_msg = EmojiFormatter.format("info", "Adaptive Rate Statistics:")
+            self.logger.info(rate_msg)
+            self.logger.info(
+                f"  Request rate: {rate_stats['rate']:.1f}/min "
+                f"(configured {rate_stats['max_rate']:.1f}, "
+                f"lowest {rate_stats['lowest_rate']:.1f})"
+            )
+            self.logger.info(
+                f"  Rate decreases: {rate_stats['decreases']}, "
+                f"increases: {rate_stats['increases']}"
+            )
+            trajectory = " -> ".join(
+                f"{point['rate']:g}@{point['elapsed']:.0f}s"
+                for point in rate_stats["trajectory"]
+            )
+            self.logger.info(f"  Rate trajectory: {trajectory}")
+
+        # Log daily request budget
+        if self.budget_planner is not None:
+            budget_stats = self.budget_planner.get_stats()
+            budget_msg = EmojiFormatter.format("info", "Request Budget Statistics:")
+            self.logger.info(budget_msg)
+            self.logger.info(
+                f"  Spent today: {sum(budget_stats['spent'].values())}/"
+                f"{budget_stats['daily_budget']}"
+            )
+            for activity, share in budget_stats["allocation"].items():
+                observed = budget_stats["observed_yields"][activity]
+                yield_text = "n/a" if observed is None else f"{observed:.2f}/request"
+                self.logger.info(
+                    f"  {activity}: {budget_stats['spent'][activity]}/{share} "
+                    f"requests, yield {yield_text}"
+                )
+
     def handle_api_error(self, error: Exception, context: str) -> str:
         """
         Handle specific API error codes with appropriate actions.
@@ -2150,52 +3748,95 @@ class IncrementalFreesoundLoader(DataLoader):
 
         return stats
 
-    def _add_user_edges_batch(self) -> int:
+    def _nodes_needing_python_scan(self) -> Optional[list[str]]:
         """
-        Add edges between samples by the same user using existing graph data.
+        Get nodes whose attributes can't be answered by the metadata cache.
 
-        NO API REQUESTS - uses only data already in the graph nodes.
+        Unmodified lazy nodes read straight from metadata_cache.db, so queries
+        over its promoted columns can run in SQL for them. Every other node
+        (eager dicts, modified lazy nodes) holds in-memory state that may not
+        be saved yet and is evaluated in Python.
 
         Returns:
-            Number of edges added
+            Node IDs to evaluate in Python, or None if SQL can't be used
         """
-        edge_count = 0
+        metadata_cache = getattr(self, "metadata_cache", None)
+        if (
+            self.attribute_store is None
+            or metadata_cache is None
+            or metadata_cache._conn is None
+        ):
+            return None
 
-        # Group samples by username from existing graph data
-        samples_by_user: dict[str, list[str]] = {}
+        return [
+            node_id
+            for node_id, attrs in self.graph._node.items()
+            if not isinstance(attrs, LazyNodeAttributes) or attrs.is_materialized
+        ]
 
-        for node_id in self.graph.nodes():
+    def _group_nodes_by_attribute(self, column: str) -> dict[str, list[str]]:
+        """
+        Group graph nodes by username or pack name.
+
+        Uses the indexed username/pack_name columns of the metadata cache for
+        lazily loaded nodes and falls back to node attributes for the rest.
+
+        Args:
+            column: 'username' or 'pack_name'
+
+        Returns:
+            Dictionary mapping username/pack name to node IDs
+        """
+        python_nodes = self._nodes_needing_python_scan()
+        groups: dict[str, list[str]] = {}
+
+        if python_nodes is None:
+            python_nodes = list(self.graph.nodes())
+        else:
+            # Singleton groups only matter if a Python-side node can join them
+            sql_groups = self.metadata_cache.get_sample_groups(
+                column, min_size=1 if python_nodes else 2
+            )
+            skip = set(python_nodes)
+            for value, sample_ids in sql_groups.items():
+                members = [
+                    node_id
+                    for node_id in map(str, sample_ids)
+                    if node_id in self.graph and node_id not in skip
+                ]
+                if members:
+                    groups[value] = members
+
+        for node_id in python_nodes:
             node_data = self.graph.nodes[node_id]
-            username = node_data.get("username")
+            if column == "username":
+                value = node_data.get("username")
+            else:
+                value = extract_pack_name(node_data.get("pack"))
+            if value:
+                groups.setdefault(value, []).append(node_id)
 
-            if username:
-                if username not in samples_by_user:
-                    samples_by_user[username] = []
-                samples_by_user[username].append(node_id)
+        return groups
 
-        # Add edges between samples by same user
-        for _username, sample_ids in samples_by_user.items():
-            # Only create edges if user has multiple samples
-            if len(sample_ids) < 2:
-                continue
+    def _add_user_edges_batch(self, new_node_ids: Optional[set[str]] = None) -> int:
+        """
+        Add edges between samples by the same user using existing graph data.
 
-            # Add edges between all pairs
-            for j in range(len(sample_ids)):
-                for k in range(j + 1, len(sample_ids)):
-                    source = sample_ids[j]
-                    target = sample_ids[k]
+        NO API REQUESTS - uses only data already in the graph nodes (grouped
+        via the indexed username column for lazily loaded nodes).
 
-                    # Add bidirectional edges
-                    if not self.graph.has_edge(source, target):
-                        self.graph.add_edge(
-                            source, target, type="by_same_user", weight=1.0
-                        )
-                        edge_count += 1
-                    if not self.graph.has_edge(target, source):
-                        self.graph.add_edge(
-                            target, source, type="by_same_user", weight=1.0
-                        )
-                        edge_count += 1
+        Args:
+            new_node_ids: Only add edges involving these nodes (if None, all
+                pairs)
+
+        Returns:
+            Number of edges added
+        """
+        # Group samples by username
+        samples_by_user = self._group_nodes_by_attribute("username")
+        edge_count = self._add_group_edges(
+            samples_by_user, "by_same_user", new_node_ids
+        )
 
         if edge_count > 0:
             self.logger.info(
@@ -2204,67 +3845,116 @@ class IncrementalFreesoundLoader(DataLoader):
 
         return edge_count
 
-    def _add_pack_edges_batch(self) -> int:
+    def _add_pack_edges_batch(self, new_node_ids: Optional[set[str]] = None) -> int:
         """
         Add edges between samples in the same pack using existing graph data.
 
-        NO API REQUESTS - uses only data already in the graph nodes.
+        NO API REQUESTS - uses only data already in the graph nodes (grouped
+        via the indexed pack_name column for lazily loaded nodes).
+
+        Args:
+            new_node_ids: Only add edges involving these nodes (if None, all
+                pairs)
 
         Returns:
             Number of edges added
         """
-        edge_count = 0
+        # Group samples by pack name (extracted from the pack URI)
+        samples_by_pack = self._group_nodes_by_attribute("pack_name")
+        edge_count = self._add_group_edges(
+            samples_by_pack, "in_same_pack", new_node_ids
+        )
 
-        # Group samples by pack from existing graph data
-        samples_by_pack: dict[str, list[str]] = {}
+        if edge_count > 0:
+            self.logger.info(
+                f"✅ Added {edge_count} pack relationship edges (0 API requests)"
+            )
 
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            pack = node_data.get("pack")
+        return edge_count
 
-            if pack:
-                # Extract pack name from URI if needed
-                if isinstance(pack, str) and "/" in pack:
-                    pack_name = pack.split("/")[-2]
-                else:
-                    pack_name = str(pack)
+    def _add_group_edges(
+        self,
+        groups: dict[str, list[str]],
+        edge_type: str,
+        new_node_ids: Optional[set[str]] = None,
+    ) -> int:
+        """
+        Add bidirectional edges between all members of each group.
+
+        With group_edges='hub' no edges are added: the groups are stored as
+        the edge type's membership table instead (see _set_sample_groups).
+
+        Args:
+            groups: Dictionary mapping group value to node IDs
+            edge_type: Edge 'type' attribute
+            new_node_ids: Only add edges involving these nodes (if None, all
+                pairs)
 
-                if pack_name:
-                    if pack_name not in samples_by_pack:
-                        samples_by_pack[pack_name] = []
-                    samples_by_pack[pack_name].append(node_id)
+        Returns:
+            Number of edges added
+        """
+        if self.group_edges == "hub":
+            self._set_sample_groups(edge_type, groups)
+            return 0
 
-        # Add edges between samples in same pack
-        for _pack_name, sample_ids in samples_by_pack.items():
-            # Only create edges if pack has multiple samples
+        edge_count = 0
+        for sample_ids in groups.values():
+            # Only create edges if the group has multiple samples
             if len(sample_ids) < 2:
                 continue
 
-            # Add edges between all pairs
-            for j in range(len(sample_ids)):
-                for k in range(j + 1, len(sample_ids)):
-                    source = sample_ids[j]
-                    target = sample_ids[k]
+            if new_node_ids is None:
+                # Add edges between all pairs
+                pairs = (
+                    (sample_ids[j], sample_ids[k])
+                    for j in range(len(sample_ids))
+                    for k in range(j + 1, len(sample_ids))
+                )
+            else:
+                # New members with every other member (new ↔ new pairs once)
+                new_members = [
+                    node_id for node_id in sample_ids if node_id in new_node_ids
+                ]
+                old_members = [
+                    node_id for node_id in sample_ids if node_id not in new_node_ids
+                ]
+                pairs = (
+                    (source, target)
+                    for n, source in enumerate(new_members)
+                    for target in new_members[n + 1 :] + old_members
+                )
 
-                    # Add bidirectional edges
-                    if not self.graph.has_edge(source, target):
-                        self.graph.add_edge(
-                            source, target, type="in_same_pack", weight=1.0
-                        )
-                        edge_count += 1
-                    if not self.graph.has_edge(target, source):
-                        self.graph.add_edge(
-                            target, source, type="in_same_pack", weight=1.0
-                        )
-                        edge_count += 1
+            for source, target in pairs:
+                # Add bidirectional edges
+                if not self.graph.has_edge(source, target):
+                    self._add_edge(source, target, type=edge_type, weight=1.0)
+                    edge_count += 1
+                if not self.graph.has_edge(target, source):
+                    self._add_edge(target, source, type=edge_type, weight=1.0)
+                    edge_count += 1
 
-        if edge_count > 0:
+        return edge_count
+
+    def _set_sample_groups(self, edge_type: str, groups: dict[str, list[str]]) -> None:
+        """
+        Store groups as a membership table in graph.graph['sample_groups'].
+
+        The table replaces the edge type's previous one, so it needs the
+        complete grouping (cheap: the groups come from the indexed columns).
+
+        Args:
+            edge_type: Edge 'type' the groups stand for
+            groups: Dictionary mapping group value to node IDs
+        """
+        table = {value: ids for value, ids in groups.items() if len(ids) >= 2}
+        self.graph.graph.setdefault("sample_groups", {})[edge_type] = table
+        self._sample_groups_dirty = True
+        if table:
             self.logger.info(
-                f"✅ Added {edge_count} pack relationship edges (0 API requests)"
+                f"✅ Stored {len(table)} {edge_type} groups as hubs "
+                f"({sum(len(ids) for ids in table.values())} samples, 0 edges)"
             )
 
-        return edge_count
-
     def _add_tag_edges_batch(self, similarity_threshold: Optional[float] = None) -> int:
         """
         Add edges between samples with similar tags using Jaccard similarity.
@@ -2326,119 +4016,407 @@ class IncrementalFreesoundLoader(DataLoader):
 
         Skips existing node ↔ existing node pairs (already processed).
 
+        Pairs are found with sparse sample × tag matrix products in row
+        blocks spread over a process pool (see jaccard_edges() in
+        data/tag_similarity.py); the edges are the same as comparing every
+        pair, and are added to the graph in one update. With
+        tag_similarity_mode 'minhash', pairs come from MinHash-LSH buckets
+        instead (see _minhash_tag_pairs()) and some of them are missed.
+
+        Existing nodes whose attributes are read lazily from the metadata
+        cache are not scanned: candidates sharing at least one tag with a new
+        node are looked up in the cache's tag index instead.
+
         Args:
             similarity_threshold: Minimum Jaccard similarity
             new_node_ids: Set of newly added node IDs (if None, regenerate all)
 
-        Returns:
-            Number of edges added
+        Returns:
+            Number of edges added
+        """
+        edge_count = 0
+
+        # Lazily loaded nodes are matched through the tag index (a zero
+        # threshold matches every pair, and MinHash needs every tag set, so
+        # these still scan all nodes)
+        minhash = self.tag_similarity_mode == "minhash" and similarity_threshold > 0
+        scan_nodes: Optional[set[str]] = None
+        if new_node_ids and similarity_threshold > 0 and not minhash:
+            python_nodes = self._nodes_needing_python_scan()
+            if python_nodes is not None:
+                scan_nodes = set(python_nodes) | set(new_node_ids)
+
+        # Get all nodes with tags
+        tag_sets: dict[str, set[str]] = {}
+        new_nodes_with_tags = []
+
+        for node_id in self.graph.nodes():
+            if scan_nodes is not None and node_id not in scan_nodes:
+                continue
+            node_data = self.graph.nodes[node_id]
+            tags = node_data.get("tags", [])
+
+            if tags and len(tags) > 0:
+                tag_set = set(tags) if isinstance(tags, list) else {tags}
+                tag_sets[node_id] = tag_set
+
+                if new_node_ids and node_id in new_node_ids:
+                    new_nodes_with_tags.append((node_id, tag_set))
+
+        # If no new nodes specified, nothing to do
+        if not new_node_ids:
+            self.logger.info("No new nodes specified, skipping edge generation")
+            return 0
+
+        # If no nodes have tags, nothing to do
+        if not tag_sets:
+            self.logger.info("No nodes with tags found")
+            return 0
+
+        # Determine if this is full regeneration or incremental
+        existing_count = len(tag_sets) - len(new_nodes_with_tags)
+        is_full_regen = existing_count == 0
+
+        if is_full_regen:
+            self.logger.info(
+                f"Generating tag edges for {len(new_nodes_with_tags)} nodes "
+                f"(threshold: {similarity_threshold})"
+            )
+        else:
+            self.logger.info(
+                f"Incremental tag edge generation: "
+                f"{len(new_nodes_with_tags)} new nodes, "
+                f"{existing_count} existing nodes "
+                f"(threshold: {similarity_threshold})"
+            )
+
+        # 1-2. New node ↔ new node and new node ↔ existing node pairs, from
+        # sparse sample × tag matrix products or from MinHash-LSH buckets
+        query_ids = [node_id for node_id, _ in new_nodes_with_tags]
+        if minhash:
+            pairs = self._minhash_tag_pairs(tag_sets, similarity_threshold, query_ids)
+            for node1_id, node2_id, similarity in pairs:
+                edge_count += self._add_tag_edge_pair(node1_id, node2_id, similarity)
+        else:
+            src, dst, weight = jaccard_edges(
+                tag_sets,
+                similarity_threshold,
+                query_ids=query_ids,
+                workers=self.config.get(
+                    "tag_similarity_workers", self.DEFAULT_TAG_SIMILARITY_WORKERS
+                ),
+                max_tag_frequency=self.config.get(
+                    "max_tag_frequency", self.DEFAULT_MAX_TAG_FREQUENCY
+                ),
+            )
+            node_ids = list(tag_sets)
+            edges = []
+            for a, b, similarity in zip(src.tolist(), dst.tolist(), weight.tolist()):
+                node1_id, node2_id = node_ids[a], node_ids[b]
+                for source, target in ((node1_id, node2_id), (node2_id, node1_id)):
+                    if not self.graph.has_edge(source, target):
+                        edges.append((source, target, "similar_tags", similarity))
+            self._add_edges(edges)
+            edge_count += len(edges)
+
+        # 3. Check new node ↔ indexed node pairs (candidates from the tag index)
+        if scan_nodes is not None:
+            for new_node_id, new_tags in new_nodes_with_tags:
+                overlaps = self.metadata_cache.get_tag_overlaps(new_tags)
+                for sample_id, (intersection, tag_count) in overlaps.items():
+                    existing_node_id = str(sample_id)
+                    if (
+                        existing_node_id in scan_nodes
+                        or existing_node_id not in self.graph
+                    ):
+                        continue
+
+                    union = len(new_tags) + tag_count - intersection
+                    similarity = intersection / union if union > 0 else 0
+
+                    if similarity >= similarity_threshold:
+                        edge_count += self._add_tag_edge_pair(
+                            new_node_id, existing_node_id, similarity
+                        )
+
+        if edge_count > 0:
+            self.logger.info(
+                f"✅ Added {edge_count} tag similarity edges incrementally "
+                f"(threshold: {similarity_threshold}, 0 API requests)"
+            )
+
+        return edge_count
+
+    def _minhash_tag_pairs(
+        self,
+        tag_sets: dict[str, set[str]],
+        similarity_threshold: float,
+        query_ids: list[str],
+    ) -> list[tuple[str, str, float]]:
+        """
+        Find tag similarity pairs from MinHash-LSH candidates.
+
+        Signatures are read from metadata_cache.db when the sample's tag set
+        is unchanged and computed (then stored) otherwise. The recall against
+        the exact join is measured on a sample of the new nodes and recorded
+        in stats['tag_similarity_recall'].
+
+        Args:
+            tag_sets: Tag set by node ID
+            similarity_threshold: Minimum Jaccard similarity
+            query_ids: New node IDs
+
+        Returns:
+            (new node ID, other node ID, similarity) tuples
+        """
+        num_perm = self.config.get(
+            "minhash_permutations", self.DEFAULT_MINHASH_PERMUTATIONS
+        )
+        target_recall = self.config.get("minhash_recall", self.DEFAULT_MINHASH_RECALL)
+        bands, rows = lsh_parameters(similarity_threshold, target_recall, num_perm)
+
+        signatures = self._minhash_signatures(tag_sets, num_perm)
+        pairs = minhash_pairs(
+            tag_sets, similarity_threshold, signatures, bands, rows, query_ids
+        )
+
+        sample_size = self.config.get(
+            "minhash_recall_sample", self.DEFAULT_MINHASH_RECALL_SAMPLE
+        )
+        recall = None
+        if sample_size > 0 and query_ids:
+            # Spread the sample over the new nodes, deterministically
+            step = max(1, len(query_ids) // sample_size)
+            recall = measure_recall(
+                tag_sets,
+                similarity_threshold,
+                pairs,
+                query_ids[::step][:sample_size],
+            )
+        self.stats["tag_similarity_recall"] = recall
+
+        self.logger.info(
+            f"MinHash-LSH tag similarity: {bands} bands x {rows} rows, "
+            f"{len(pairs)} pairs"
+            + (
+                f", measured recall {recall:.1%} (target {target_recall:.0%})"
+                if recall is not None
+                else ""
+            )
+        )
+        return pairs
+
+    def _minhash_signatures(self, tag_sets: dict[str, set[str]], num_perm: int) -> Any:
+        """
+        Get MinHash signatures of tag sets, computing only missing ones.
+
+        Args:
+            tag_sets: Tag set by node ID
+            num_perm: Signature length
+
+        Returns:
+            uint32 NumPy array of shape (len(tag_sets), num_perm)
+        """
+        node_ids = list(tag_sets)
+        fingerprints = [tag_fingerprint(tag_sets[node_id]) for node_id in node_ids]
+        metadata_cache = getattr(self, "metadata_cache", None)
+        if metadata_cache is None or metadata_cache._conn is None:
+            return minhash_signatures(
+                [tag_sets[node_id] for node_id in node_ids], num_perm
+            )
+
+        sample_ids = {
+            position: int(node_id)
+            for position, node_id in enumerate(node_ids)
+            if node_id.isdigit()
+        }
+        stored = metadata_cache.get_minhash_signatures(
+            sample_ids.values(), num_perm, MINHASH_SEED
+        )
+
+        signatures: np.ndarray = np.empty((len(node_ids), num_perm), dtype=np.uint32)
+        missing = []
+        for position in range(len(node_ids)):
+            row = stored.get(sample_ids.get(position, -1))
+            if row is not None and row[0] == fingerprints[position]:
+                signatures[position] = np.frombuffer(row[1], dtype=np.uint32)
+            else:
+                missing.append(position)
+
+        if missing:
+            signatures[missing] = minhash_signatures(
+                [tag_sets[node_ids[position]] for position in missing], num_perm
+            )
+            metadata_cache.put_minhash_signatures(
+                {
+                    sample_ids[position]: (
+                        fingerprints[position],
+                        signatures[position].tobytes(),
+                    )
+                    for position in missing
+                    if position in sample_ids
+                },
+                num_perm,
+                MINHASH_SEED,
+            )
+
+        self.logger.debug(
+            f"MinHash signatures: {len(node_ids) - len(missing)} stored, "
+            f"{len(missing)} computed"
+        )
+        return signatures
+
+    def _add_tag_edge_pair(
+        self, node1_id: str, node2_id: str, similarity: float
+    ) -> int:
+        """
+        Add bidirectional similar_tags edges between two nodes.
+
+        Args:
+            node1_id: First node ID
+            node2_id: Second node ID
+            similarity: Jaccard similarity used as edge weight
+
+        Returns:
+            Number of edges added (0-2, existing edges are kept)
+        """
+        edge_count = 0
+        if not self.graph.has_edge(node1_id, node2_id):
+            self._add_edge(node1_id, node2_id, type="similar_tags", weight=similarity)
+            edge_count += 1
+        if not self.graph.has_edge(node2_id, node1_id):
+            self._add_edge(node2_id, node1_id, type="similar_tags", weight=similarity)
+            edge_count += 1
+        return edge_count
+
+    def _edge_update_nodes(
+        self, edge_type: str, config: dict[str, Any]
+    ) -> Optional[set[str]]:
+        """
+        Get the nodes an edge type still has to be generated for.
+
+        Args:
+            edge_type: 'user', 'pack' or 'tag'
+            config: Parameters the edges are generated with
+
+        Returns:
+            Nodes added since the edge type's previous generation, or None if
+            it needs a full generation (no watermark, changed config or
+            incremental_edges disabled)
+        """
+        watermark = self._edge_watermarks.get(edge_type)
+        if (
+            not self.config.get("incremental_edges", self.DEFAULT_INCREMENTAL_EDGES)
+            or watermark is None
+            or watermark["config"] != config
+        ):
+            return None
+        new_node_ids = set(self.graph.nodes()) - watermark["processed"]
+        self.logger.info(
+            f"Incremental {edge_type} edge generation: {len(new_node_ids)} new nodes"
+        )
+        return new_node_ids
+
+    def _advance_edge_watermark(
+        self, edge_type: str, config: dict[str, Any], node_ids: set[str]
+    ) -> None:
         """
-        edge_count = 0
-
-        # Get all nodes with tags
-        all_nodes_with_tags = []
-        new_nodes_with_tags = []
-        existing_nodes_with_tags = []
+        Record that an edge type has been generated for a set of nodes.
 
-        for node_id in self.graph.nodes():
-            node_data = self.graph.nodes[node_id]
-            tags = node_data.get("tags", [])
-
-            if tags and len(tags) > 0:
-                tag_set = set(tags) if isinstance(tags, list) else {tags}
-                node_tuple = (node_id, tag_set)
-                all_nodes_with_tags.append(node_tuple)
+        Args:
+            edge_type: 'user', 'pack' or 'tag'
+            config: Parameters the edges were generated with
+            node_ids: Nodes whose edges of this type are now complete
+        """
+        self._edge_watermarks[edge_type] = {"config": config, "processed": node_ids}
 
-                if new_node_ids and node_id in new_node_ids:
-                    new_nodes_with_tags.append(node_tuple)
-                else:
-                    existing_nodes_with_tags.append(node_tuple)
+    def _edge_watermark_state(self) -> dict[str, dict[str, Any]]:
+        """
+        Get the edge watermarks for checkpoint metadata.
 
-        # If no new nodes specified, nothing to do
-        if not new_node_ids:
-            self.logger.info("No new nodes specified, skipping edge generation")
-            return 0
+        Stores the nodes not yet processed per edge type rather than the
+        processed ones, which are nearly the whole graph.
 
-        # If no nodes have tags, nothing to do
-        if len(new_nodes_with_tags) == 0 and len(existing_nodes_with_tags) == 0:
-            self.logger.info("No nodes with tags found")
-            return 0
+        Returns:
+            Dictionary mapping edge type to its config and pending node IDs
+        """
+        node_ids = set(self.graph.nodes())
+        return {
+            edge_type: {
+                "config": watermark["config"],
+                "pending": sorted(node_ids - watermark["processed"]),
+            }
+            for edge_type, watermark in self._edge_watermarks.items()
+        }
 
-        # Determine if this is full regeneration or incremental
-        is_full_regen = len(existing_nodes_with_tags) == 0
+    def _group_update_nodes(
+        self, edge_type: str, group_type: str, config: dict[str, Any]
+    ) -> Optional[set[str]]:
+        """
+        Get the nodes a user or pack relationship still has to be generated for.
 
-        if is_full_regen:
-            self.logger.info(
-                f"Generating tag edges for {len(new_nodes_with_tags)} nodes "
-                f"(threshold: {similarity_threshold})"
-            )
-        else:
-            self.logger.info(
-                f"Incremental tag edge generation: "
-                f"{len(new_nodes_with_tags)} new nodes, "
-                f"{len(existing_nodes_with_tags)} existing nodes "
-                f"(threshold: {similarity_threshold})"
-            )
+        Before a full generation the other representation is dropped: clique
+        edges when generating hubs, the membership table when generating
+        cliques.
 
-        # 1. Check new node ↔ new node pairs
-        for i in range(len(new_nodes_with_tags)):
-            node1_id, tags1 = new_nodes_with_tags[i]
+        Args:
+            edge_type: 'user' or 'pack'
+            group_type: Edge 'type' attribute, e.g. 'by_same_user'
+            config: Parameters the relationships are generated with
 
-            for j in range(i + 1, len(new_nodes_with_tags)):
-                node2_id, tags2 = new_nodes_with_tags[j]
+        Returns:
+            Nodes added since the previous generation, or None for a full one
+        """
+        new_node_ids = self._edge_update_nodes(edge_type, config)
+        if new_node_ids is None:
+            if self.group_edges == "hub":
+                removed = self._remove_edges_of_type(group_type)
+                if removed:
+                    self.logger.info(
+                        f"Replaced {removed} {group_type} clique edges with hubs"
+                    )
+            elif self.graph.graph.get("sample_groups", {}).pop(group_type, None):
+                self._sample_groups_dirty = True
+        return new_node_ids
 
-                # Calculate Jaccard similarity
-                intersection = len(tags1 & tags2)
-                union = len(tags1 | tags2)
-                similarity = intersection / union if union > 0 else 0
+    def _refresh_sample_groups(self) -> None:
+        """
+        Rebuild the hub membership tables from the current nodes.
 
-                if similarity >= similarity_threshold:
-                    # Add bidirectional edges
-                    if not self.graph.has_edge(node1_id, node2_id):
-                        self.graph.add_edge(
-                            node1_id, node2_id, type="similar_tags", weight=similarity
-                        )
-                        edge_count += 1
-                    if not self.graph.has_edge(node2_id, node1_id):
-                        self.graph.add_edge(
-                            node2_id, node1_id, type="similar_tags", weight=similarity
-                        )
-                        edge_count += 1
+        Checkpoints save the tables in metadata_cache.db, but they go stale
+        when deleted samples are removed, so they are rebuilt for each
+        relationship last generated as hubs.
+        """
+        for edge_type, column, group_type in (
+            ("user", "username", "by_same_user"),
+            ("pack", "pack_name", "in_same_pack"),
+        ):
+            watermark = self._edge_watermarks.get(edge_type)
+            if watermark and watermark["config"].get("representation") == "hub":
+                self._set_sample_groups(
+                    group_type, self._group_nodes_by_attribute(column)
+                )
 
-        # 2. Check new node ↔ existing node pairs
-        for new_node_id, new_tags in new_nodes_with_tags:
-            for existing_node_id, existing_tags in existing_nodes_with_tags:
-                # Calculate Jaccard similarity
-                intersection = len(new_tags & existing_tags)
-                union = len(new_tags | existing_tags)
-                similarity = intersection / union if union > 0 else 0
-
-                if similarity >= similarity_threshold:
-                    # Add bidirectional edges
-                    if not self.graph.has_edge(new_node_id, existing_node_id):
-                        self.graph.add_edge(
-                            new_node_id,
-                            existing_node_id,
-                            type="similar_tags",
-                            weight=similarity,
-                        )
-                        edge_count += 1
-                    if not self.graph.has_edge(existing_node_id, new_node_id):
-                        self.graph.add_edge(
-                            existing_node_id,
-                            new_node_id,
-                            type="similar_tags",
-                            weight=similarity,
-                        )
-                        edge_count += 1
+    def _remove_edges_of_type(self, edge_type: str) -> int:
+        """
+        Remove all edges of one type (before regenerating them).
 
-        if edge_count > 0:
-            self.logger.info(
-                f"✅ Added {edge_count} tag similarity edges incrementally "
-                f"(threshold: {similarity_threshold}, 0 API requests)"
-            )
+        Args:
+            edge_type: Edge 'type' attribute, e.g. 'similar_tags'
 
-        return edge_count
+        Returns:
+            Number of edges removed
+        """
+        edges = [
+            (source, target)
+            for source, target, data in self.graph.edges(data=True)
+            if data.get("type") == edge_type
+        ]
+        self.graph.remove_edges_from(edges)
+        if edges:
+            # The journal only records additions, so removals need a full snapshot
+            self._force_full_checkpoint = True
+        return len(edges)
 
     def _generate_all_edges(
         self,
@@ -2453,6 +4431,13 @@ class IncrementalFreesoundLoader(DataLoader):
         Wrapper method that calls individual edge generation methods based on flags.
         NO API REQUESTS - all methods work from existing graph node data.
 
+        Incremental by default: each edge type only pairs the nodes added
+        since its previous generation with all nodes. An edge type without a
+        watermark yet (or with incremental_edges disabled) is generated in
+        full; tag edges are removed and regenerated when the tag similarity
+        threshold or mode changed, user and pack relationships when
+        group_edges switched between hubs and cliques.
+
         This method is designed for validation/visualization pipelines where edges
         need to be generated after data collection is complete.
 
@@ -2490,22 +4475,53 @@ class IncrementalFreesoundLoader(DataLoader):
             "tag_edges": 0,
             "total_edges": 0,
         }
+        node_ids = set(self.graph.nodes())
+
+        group_config = {"representation": self.group_edges}
 
         # Generate user edges if requested
         if include_user:
-            user_edges = self._add_user_edges_batch()
+            user_edges = self._add_user_edges_batch(
+                self._group_update_nodes("user", "by_same_user", group_config)
+            )
+            self._advance_edge_watermark("user", group_config, node_ids)
             edge_stats["user_edges"] = user_edges
             self.stats["user_edges_created"] = user_edges
 
         # Generate pack edges if requested
         if include_pack:
-            pack_edges = self._add_pack_edges_batch()
+            pack_edges = self._add_pack_edges_batch(
+                self._group_update_nodes("pack", "in_same_pack", group_config)
+            )
+            self._advance_edge_watermark("pack", group_config, node_ids)
             edge_stats["pack_edges"] = pack_edges
             self.stats["pack_edges_created"] = pack_edges
 
         # Generate tag edges if requested
         if include_tag:
-            tag_edges = self._add_tag_edges_batch(tag_threshold)
+            tag_config = {"threshold": tag_threshold, "mode": self.tag_similarity_mode}
+            new_node_ids = self._edge_update_nodes("tag", tag_config)
+            if new_node_ids is None:
+                previous = self._edge_watermarks.get("tag", {}).get("config")
+                if previous is None and self._last_tag_threshold is not None:
+                    # Older checkpoints only record the threshold
+                    previous = {"threshold": self._last_tag_threshold}
+                # Compare the parameters the stored config records
+                if previous is not None and any(
+                    tag_config.get(key) != value for key, value in previous.items()
+                ):
+                    self.logger.info(
+                        f"Tag similarity config changed ({previous} → {tag_config}), "
+                        f"regenerating all tag edges"
+                    )
+                    self._remove_edges_of_type("similar_tags")
+                tag_edges = self._add_tag_edges_batch(tag_threshold)
+            elif new_node_ids:
+                tag_edges = self._add_tag_edges_incremental(tag_threshold, new_node_ids)
+            else:
+                tag_edges = 0
+            self._advance_edge_watermark("tag", tag_config, node_ids)
+            self._last_tag_threshold = tag_threshold
             edge_stats["tag_edges"] = tag_edges
             self.stats["tag_edges_created"] = tag_edges
 
@@ -2568,51 +4584,55 @@ class IncrementalFreesoundLoader(DataLoader):
             # Calculate priority score for this node
             priority_score = self.calculate_node_priority(sample)
 
-            self.graph.add_node(
-                sample_id,
-                # Basic metadata
-                name=sample["name"],
-                tags=sample.get("tags", []),
-                description=sample.get("description", ""),
-                duration=sample.get("duration", 0),
-                # User and pack relationships (for edge generation)
-                username=sample.get("username", ""),
-                pack=sample.get("pack", ""),  # Pack URI or empty string
-                # License and attribution (LEGAL REQUIREMENT)
-                license=sample.get("license", ""),
-                created=sample.get("created", ""),  # Upload timestamp
-                url=sample.get("url", ""),  # Freesound website URL (for attribution)
-                # Sound taxonomy (Broad Sound Taxonomy)
-                category=sample.get("category", []),  # [category, subcategory]
-                category_code=sample.get("category_code", ""),  # e.g. "fx-a"
-                category_is_user_provided=sample.get(
-                    "category_is_user_provided", False
-                ),
-                # Technical audio properties
-                file_type=sample.get("type", ""),  # File type (wav, mp3, ogg, etc.)
-                channels=sample.get("channels", 0),  # Mono=1, Stereo=2
-                filesize=sample.get("filesize", 0),  # Bytes
-                samplerate=sample.get("samplerate", 0),  # Hz (e.g. 44100, 48000)
-                # URLs and media assets - extract uploader_id for space efficiency (~200 bytes → ~7 bytes)
-                uploader_id=self._extract_uploader_id(sample.get("previews", {})),
-                images=sample.get("images", {}),  # Waveform and spectrogram URLs
-                # Note: download and analysis_files can be fetched on-demand via API
-                # Engagement and quality metrics
-                num_downloads=sample.get("num_downloads", 0),
-                num_ratings=sample.get("num_ratings", 0),  # Sample size for avg_rating
-                avg_rating=sample.get("avg_rating", 0.0),  # 0-5 scale
-                num_comments=sample.get("num_comments", 0),  # Community engagement
-                # Geographic metadata
-                geotag=sample.get("geotag", ""),  # "lat lon" format
-                # Internal metadata
-                collected_at=now,
-                # Validation history timestamps (ISO format)
-                last_existence_check_at=None,  # When we last verified sample exists
-                last_metadata_update_at=now,  # When we last refreshed metadata
-                # Priority scoring for SQL-based seed selection
-                priority_score=priority_score,
-                is_dormant=False,
-            )
+            with self._journaled_mutation():
+                self.graph.add_node(
+                    sample_id,
+                    # Basic metadata
+                    name=sample["name"],
+                    tags=sample.get("tags", []),
+                    description=sample.get("description", ""),
+                    duration=sample.get("duration", 0),
+                    # User and pack relationships (for edge generation)
+                    username=sample.get("username", ""),
+                    pack=sample.get("pack", ""),  # Pack URI or empty string
+                    # License and attribution (LEGAL REQUIREMENT)
+                    license=sample.get("license", ""),
+                    created=sample.get("created", ""),  # Upload timestamp
+                    url=sample.get("url", ""),  # Freesound page URL (for attribution)
+                    # Sound taxonomy (Broad Sound Taxonomy)
+                    category=sample.get("category", []),  # [category, subcategory]
+                    category_code=sample.get("category_code", ""),  # e.g. "fx-a"
+                    category_is_user_provided=sample.get(
+                        "category_is_user_provided", False
+                    ),
+                    # Technical audio properties
+                    file_type=sample.get("type", ""),  # File type (wav, mp3, ogg, etc.)
+                    channels=sample.get("channels", 0),  # Mono=1, Stereo=2
+                    filesize=sample.get("filesize", 0),  # Bytes
+                    samplerate=sample.get("samplerate", 0),  # Hz (e.g. 44100, 48000)
+                    # URLs and media assets - extract uploader_id for space efficiency (~200 bytes → ~7 bytes)
+                    uploader_id=self._extract_uploader_id(sample.get("previews", {})),
+                    images=sample.get("images", {}),  # Waveform and spectrogram URLs
+                    # Note: download and analysis_files can be fetched on-demand via API
+                    # Engagement and quality metrics
+                    num_downloads=sample.get("num_downloads", 0),
+                    num_ratings=sample.get("num_ratings", 0),  # avg_rating sample size
+                    avg_rating=sample.get("avg_rating", 0.0),  # 0-5 scale
+                    num_comments=sample.get("num_comments", 0),  # Community engagement
+                    # Geographic metadata
+                    geotag=sample.get("geotag", ""),  # "lat lon" format
+                    # Internal metadata
+                    collected_at=now,
+                    # Validation history timestamps (ISO format)
+                    last_existence_check_at=None,  # When we last verified sample exists
+                    last_metadata_update_at=now,  # When we last refreshed metadata
+                    # Priority scoring for SQL-based seed selection
+                    priority_score=priority_score,
+                    is_dormant=False,
+                )
+            self._journal_nodes.append(sample_id)
+            self._mark_node_dirty(sample_id)
+            self._record_budget_yield(1)
 
     def _add_sample_to_graph(self, sample: dict[str, Any]) -> None:
         """
@@ -2665,8 +4685,11 @@ class IncrementalFreesoundLoader(DataLoader):
             data: Dictionary from fetch_data() (not used in incremental mode)
 
         Returns:
-            The incrementally-built NetworkX DiGraph
+            The incrementally-built NetworkX DiGraph, with hub-represented
+            user and pack groups in graph.graph['sample_groups']
         """
+        self._refresh_sample_groups()
+
         success_msg = EmojiFormatter.format(
             "success",
             f"Incremental graph complete: {self.graph.number_of_nodes():,} nodes, "
@@ -2676,67 +4699,169 @@ class IncrementalFreesoundLoader(DataLoader):
 
         return self.graph
 
-    def cleanup_deleted_samples(self) -> int:
+    @_budgeted("validation")
+    def cleanup_deleted_samples(
+        self,
+        sample_ids: Optional[list[str]] = None,
+        max_age_days: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> int:
         """
         Remove nodes for samples that no longer exist on Freesound.
 
-        Queries the Freesound API to verify sample existence and removes
-        nodes for samples that return 404. Uses rate limiting to avoid
-        exceeding API limits.
+        Verifies samples in batches of EXISTENCE_CHECK_BATCH_SIZE with one
+        ``id:(a OR b ...)`` filter search per batch: requested IDs missing from
+        the results were deleted. Confirmed samples get
+        ``last_existence_check_at`` set. A batch whose request fails is
+        skipped (its samples are neither removed nor marked as checked).
+        Stops early when the circuit breaker triggers.
+
+        Args:
+            sample_ids: Optional list of specific sample IDs to verify
+            max_age_days: Only verify samples not checked for this many days
+                (see get_samples_by_existence_check_age)
+            limit: Maximum number of samples to verify, oldest check first
 
         Returns:
             Number of deleted samples removed
 
         Raises:
             DataProcessingError: If verification is not enabled in config
+
+        Example:
+            # Re-verify the 3000 least recently checked samples (20 requests)
+            loader.cleanup_deleted_samples(limit=3000)
         """
         if not self.verify_existing_sounds:
             raise DataProcessingError(
                 "Sample verification not enabled. Set verify_existing_sounds=True"
             )
 
+        if sample_ids is not None:
+            nodes_to_check = [n for n in sample_ids if n in self.graph]
+        elif max_age_days is not None or limit is not None:
+            nodes_to_check = self.get_samples_by_existence_check_age(
+                max_age_days=max_age_days, limit=limit
+            )
+        else:
+            nodes_to_check = list(self.graph.nodes())
+        nodes_to_check = [n for n in nodes_to_check if str(n).isdigit()]
+
+        batch_size = self.EXISTENCE_CHECK_BATCH_SIZE
         self.logger.info(
-            f"Verifying {self.graph.number_of_nodes()} samples for deletion..."
+            f"Verifying {len(nodes_to_check)} samples for deletion "
+            f"({(len(nodes_to_check) + batch_size - 1) // batch_size} requests)..."
         )
 
         deleted_nodes = []
+        confirmed = 0
+        checked = 0
+        now = datetime.now(timezone.utc).isoformat()
 
         with ProgressTracker(
-            total=self.graph.number_of_nodes(),
+            total=len(nodes_to_check),
             title="Verifying sample existence",
             logger=self.logger,
         ) as tracker:
-            for i, node_id in enumerate(list(self.graph.nodes())):
-                try:
-                    # Rate limit the request
-                    self.rate_limiter.acquire()
+            for start in range(0, len(nodes_to_check), batch_size):
+                if self._check_circuit_breaker():
+                    self.logger.info(
+                        f"Circuit breaker triggered, verified {checked} of "
+                        f"{len(nodes_to_check)} samples"
+                    )
+                    break
 
-                    # Try to fetch the sound
-                    self.client.get_sound(int(node_id))
-                    self._increment_request_count()
+                batch = nodes_to_check[start : start + batch_size]
+                existing = self._search_samples_by_id(batch, fresh=True)
+                checked += len(batch)
+                tracker.update(checked)
+                if existing is None:
+                    continue
 
-                except Exception as e:
-                    # Check if it's a 404 error
-                    error_str = str(e).lower()
-                    if "404" in error_str or "not found" in error_str:
+                for node_id in batch:
+                    if node_id in existing:
+                        self.graph.nodes[node_id]["last_existence_check_at"] = now
+                        self._mark_node_dirty(node_id)
+                        confirmed += 1
+                    else:
                         deleted_nodes.append(node_id)
                         self.logger.debug(f"Sample {node_id} no longer exists")
 
-                tracker.update(i + 1)
-
         # Remove deleted nodes from graph
         for node_id in deleted_nodes:
             self.graph.remove_node(node_id)
             self.processed_ids.discard(node_id)
+            self._dirty_nodes.discard(node_id)
 
+        self._record_budget_yield(len(deleted_nodes))
         if deleted_nodes:
+            # The journal only records additions, so removals need a full snapshot
+            self._force_full_checkpoint = True
             self.logger.info(f"Removed {len(deleted_nodes)} deleted samples")
-            self._save_checkpoint({"cleanup_performed": True})
+
+        if deleted_nodes or confirmed:
+            self.logger.info(f"Confirmed {confirmed} samples still exist")
+            self._save_final_checkpoint({"cleanup_performed": True})
 
         return len(deleted_nodes)
 
+    def _fresh_responses(
+        self, fresh: bool = True
+    ) -> contextlib.AbstractContextManager[None]:
+        """
+        Bypass the response cache in this thread, if enabled and fresh is True.
+
+        Args:
+            fresh: Whether the requests made in the block must reach the API
+        """
+        if fresh and self.response_cache is not None:
+            return self.response_cache.bypass()
+        return contextlib.nullcontext()
+
+    def _search_samples_by_id(
+        self, node_ids: list[str], fields: str = "id", fresh: bool = False
+    ) -> Optional[dict[str, Any]]:
+        """
+        Look up up to one page of samples with a single id:(a OR b ...) search.
+
+        Args:
+            node_ids: Sample IDs (numeric strings), at most DEFAULT_PAGE_SIZE
+            fields: Response fields to request
+            fresh: Bypass the response cache (existence checks and refreshes)
+
+        Returns:
+            Dictionary mapping each requested ID that exists to its sound
+            object (IDs missing from it were deleted), or None if the request
+            failed
+        """
+        self._acquire_rate_limit()
+        try:
+            with self._fresh_responses(fresh):
+                results = self._retry_with_backoff(
+                    self.client.text_search,
+                    query="",
+                    filter=f"id:({' OR '.join(node_ids)})",
+                    page_size=len(node_ids),
+                    fields=fields,
+                )
+        except Exception as e:
+            self.logger.warning(f"Batch lookup failed for {len(node_ids)} samples: {e}")
+            self.stats["failed_requests"] = cast(int, self.stats["failed_requests"]) + 1
+            return None
+        finally:
+            self._increment_request_count()
+
+        # One request instead of one get_sound() per sample
+        for key in ("api_requests_saved", "batched_requests_saved"):
+            self.stats[key] = cast(int, self.stats[key]) + len(node_ids) - 1
+        return {str(sound.id): sound for sound in results}
+
+    @_budgeted("refresh")
     def update_metadata(
-        self, mode: str = "merge", sample_ids: Optional[list[str]] = None
+        self,
+        mode: str = "merge",
+        sample_ids: Optional[list[str]] = None,
+        batched: bool = False,
     ) -> dict[str, Any]:
         """
         Update metadata for existing nodes.
@@ -2745,10 +4870,17 @@ class IncrementalFreesoundLoader(DataLoader):
         Supports both merge (add new fields, update existing) and replace
         (completely replace metadata) modes.
 
+        By default each sample is fetched with get_sound() and a checkpoint is
+        saved at the end. With batched=True, up to DEFAULT_PAGE_SIZE samples
+        are fetched per id:(a OR b ...) search with COMPREHENSIVE_FIELDS, and
+        only samples whose metadata actually changed are written to the
+        metadata cache (unchanged samples keep their last_metadata_update_at).
+
         Args:
             mode: Update mode - 'merge' or 'replace' (default: 'merge')
             sample_ids: Optional list of specific sample IDs to update.
                        If None, updates all nodes.
+            batched: Fetch a page of samples per request (default: False)
 
         Returns:
             Dictionary with update statistics:
@@ -2756,6 +4888,9 @@ class IncrementalFreesoundLoader(DataLoader):
             - nodes_failed: Number of nodes that failed to update
             - fields_added: Set of new fields added
             - fields_updated: Set of existing fields updated
+            - nodes_unchanged: Batched mode only; samples with identical metadata
+            - nodes_missing: Batched mode only; samples no longer on Freesound
+            - requests_saved: Batched mode only; get_sound() calls avoided
 
         Raises:
             ValueError: If mode is not 'merge' or 'replace'
@@ -2777,6 +4912,12 @@ class IncrementalFreesoundLoader(DataLoader):
             "fields_updated": set(),
         }
 
+        if batched:
+            self._update_metadata_batched(mode, nodes_to_update, stats)
+            # Persist the request budget, adaptive rate and metadata_updated flag
+            self._save_final_checkpoint({"metadata_updated": True})
+            return stats
+
         now = datetime.now(timezone.utc).isoformat()
 
         with ProgressTracker(
@@ -2785,12 +4926,20 @@ class IncrementalFreesoundLoader(DataLoader):
             logger=self.logger,
         ) as tracker:
             for i, node_id in enumerate(nodes_to_update):
+                if self._check_circuit_breaker():
+                    self.logger.info(
+                        f"Circuit breaker triggered, refreshed {i} of "
+                        f"{len(nodes_to_update)} samples"
+                    )
+                    break
+
                 try:
                     # Rate limit the request
-                    self.rate_limiter.acquire()
+                    self._acquire_rate_limit()
 
                     # Fetch fresh metadata
-                    sound = self.client.get_sound(int(node_id))
+                    with self._fresh_responses():
+                        sound = self.client.get_sound(int(node_id))
                     self._increment_request_count()
                     new_metadata = self._extract_sample_metadata(sound)
 
@@ -2822,8 +4971,10 @@ class IncrementalFreesoundLoader(DataLoader):
 
                     # Update metadata refresh timestamp
                     self.graph.nodes[node_id]["last_metadata_update_at"] = now
+                    self._mark_node_dirty(node_id)
 
                     stats["nodes_updated"] = cast(int, stats["nodes_updated"]) + 1
+                    self._record_budget_yield(1)
 
                 except Exception as e:
                     self.logger.warning(f"Failed to update metadata for {node_id}: {e}")
@@ -2832,7 +4983,7 @@ class IncrementalFreesoundLoader(DataLoader):
                 tracker.update(i + 1)
 
         # Save checkpoint after metadata update
-        self._save_checkpoint({"metadata_updated": True})
+        self._save_final_checkpoint({"metadata_updated": True})
 
         self.logger.info(
             f"Metadata update complete: {stats['nodes_updated']} updated, "
@@ -2843,6 +4994,158 @@ class IncrementalFreesoundLoader(DataLoader):
 
         return stats
 
+    def _update_metadata_batched(
+        self,
+        mode: str,
+        node_ids: list[str],
+        stats: dict[str, Union[int, set[str]]],
+    ) -> None:
+        """
+        Refresh metadata a page of samples per request (see update_metadata).
+
+        Changed rows are written straight to the metadata cache; the caller
+        saves the final checkpoint for the run-level state.
+
+        Args:
+            mode: Update mode - 'merge' or 'replace'
+            node_ids: Sample IDs to refresh
+            stats: Statistics dictionary to update in place
+        """
+        node_ids = [n for n in node_ids if n in self.graph and str(n).isdigit()]
+        stats.update({"nodes_unchanged": 0, "nodes_missing": 0, "requests_saved": 0})
+        now = datetime.now(timezone.utc).isoformat()
+        batch_size = self.DEFAULT_PAGE_SIZE
+
+        # Direct cache writes must not be overwritten by an older queued snapshot
+        self.flush_checkpoints()
+
+        with ProgressTracker(
+            total=len(node_ids),
+            title=f"Updating metadata ({mode} mode, batched)",
+            logger=self.logger,
+        ) as tracker:
+            for start in range(0, len(node_ids), batch_size):
+                if self._check_circuit_breaker():
+                    self.logger.info(
+                        f"Circuit breaker triggered, refreshed {start} of "
+                        f"{len(node_ids)} samples"
+                    )
+                    break
+
+                batch = node_ids[start : start + batch_size]
+                sounds = self._search_samples_by_id(
+                    batch, self.COMPREHENSIVE_FIELDS, fresh=True
+                )
+                tracker.update(start + len(batch))
+                if sounds is None:
+                    stats["nodes_failed"] = cast(int, stats["nodes_failed"]) + len(
+                        batch
+                    )
+                    continue
+                stats["requests_saved"] = (
+                    cast(int, stats["requests_saved"]) + len(batch) - 1
+                )
+
+                changed_rows = {}
+                for node_id in batch:
+                    sound = sounds.get(node_id)
+                    if sound is None:
+                        # Deletions are handled by cleanup_deleted_samples
+                        stats["nodes_missing"] = cast(int, stats["nodes_missing"]) + 1
+                        continue
+
+                    new_metadata = self._extract_sample_metadata(sound)
+                    if new_metadata is None:
+                        self.logger.warning(
+                            f"Skipping node {node_id} with invalid metadata"
+                        )
+                        continue
+
+                    if not self._apply_metadata_update(
+                        node_id, new_metadata, mode, stats
+                    ):
+                        stats["nodes_unchanged"] = (
+                            cast(int, stats["nodes_unchanged"]) + 1
+                        )
+                        continue
+
+                    self.graph.nodes[node_id]["last_metadata_update_at"] = now
+                    changed_rows[int(node_id)] = dict(self.graph.nodes[node_id])
+                    stats["nodes_updated"] = cast(int, stats["nodes_updated"]) + 1
+
+                self._record_budget_yield(len(changed_rows))
+                if changed_rows and hasattr(self, "metadata_cache"):
+                    self.metadata_cache.bulk_insert(changed_rows)
+
+        self.logger.info(
+            f"Batched metadata update complete: {stats['nodes_updated']} updated, "
+            f"{stats['nodes_unchanged']} unchanged, {stats['nodes_missing']} missing, "
+            f"{stats['nodes_failed']} failed, {stats['requests_saved']} requests saved"
+        )
+
+    def _apply_metadata_update(
+        self,
+        node_id: str,
+        new_metadata: dict[str, Any],
+        mode: str,
+        stats: dict[str, Union[int, set[str]]],
+    ) -> bool:
+        """
+        Apply fresh metadata to a node if it differs from the current attributes.
+
+        Only API fields are compared; in replace mode the crawl attributes
+        (CRAWL_ATTRIBUTES) are kept and the API fields are swapped wholesale.
+
+        Args:
+            node_id: Node ID
+            new_metadata: Metadata extracted from the API response
+            mode: Update mode - 'merge' or 'replace'
+            stats: Statistics dictionary (fields_added/fields_updated)
+
+        Returns:
+            True if the node's attributes changed
+        """
+        current_attrs = dict(self.graph.nodes[node_id])
+
+        if mode == "merge":
+            changes = {
+                key: value
+                for key, value in new_metadata.items()
+                if key not in current_attrs or current_attrs[key] != value
+            }
+            if not changes:
+                return False
+            for key in changes:
+                if key in current_attrs:
+                    cast(set, stats["fields_updated"]).add(key)
+                else:
+                    cast(set, stats["fields_added"]).add(key)
+            self.graph.nodes[node_id].update(changes)
+            return True
+
+        crawl_attrs = {
+            key: value
+            for key, value in current_attrs.items()
+            if key in self.CRAWL_ATTRIBUTES
+        }
+        current_api = {
+            key: value
+            for key, value in current_attrs.items()
+            if key not in self.CRAWL_ATTRIBUTES
+        }
+        new_api = {
+            key: value
+            for key, value in new_metadata.items()
+            if key not in self.CRAWL_ATTRIBUTES
+        }
+        if current_api == new_api:
+            return False
+        self.graph.nodes[node_id].clear()
+        self.graph.nodes[node_id].update(new_api)
+        self.graph.nodes[node_id].update(crawl_attrs)
+        self.graph.nodes[node_id]["type"] = "sample"
+        return True
+
     def get_samples_by_existence_check_age(
         self, max_age_days: Optional[int] = None, limit: Optional[int] = None
     ) -> list[str]:
@@ -2867,54 +5170,10 @@ class IncrementalFreesoundLoader(DataLoader):
             # Get all samples not checked in last 30 days
             samples = loader.get_samples_by_existence_check_age(max_age_days=30)
         """
-        from datetime import datetime, timedelta, timezone
-
-        # Build list of (sample_id, last_check_timestamp) tuples
-        samples_with_age: list[tuple[str, Optional[datetime]]] = []
-
-        for node_id in self.graph.nodes():
-            last_check = self.graph.nodes[node_id].get("last_existence_check_at")
-
-            # Samples with no timestamp (never checked) get priority
-            if last_check is None:
-                samples_with_age.append((str(node_id), None))
-            else:
-                # Parse ISO timestamp
-                try:
-                    check_time = datetime.fromisoformat(
-                        last_check.replace("Z", "+00:00")
-                    )
-                    samples_with_age.append((str(node_id), check_time))
-                except (ValueError, AttributeError):
-                    # Invalid timestamp, treat as never checked
-                    samples_with_age.append((str(node_id), None))
-
-        # Sort: None (never checked) first, then oldest timestamps
-        samples_with_age.sort(
-            key=lambda x: (
-                x[1] is not None,
-                x[1] or datetime.min.replace(tzinfo=timezone.utc),
-            )
+        return self._get_samples_by_timestamp_age(
+            "last_existence_check_at", max_age_days, limit
         )
 
-        # Filter by max age if specified
-        if max_age_days is not None:
-            cutoff_time = datetime.now(timezone.utc) - timedelta(days=max_age_days)
-            samples_with_age = [
-                (sample_id, check_time)
-                for sample_id, check_time in samples_with_age
-                if check_time is None or check_time < cutoff_time
-            ]
-
-        # Extract sample IDs
-        sample_ids = [sample_id for sample_id, _ in samples_with_age]
-
-        # Apply limit if specified
-        if limit is not None:
-            sample_ids = sample_ids[:limit]
-
-        return sample_ids
-
     def get_samples_by_metadata_age(
         self, max_age_days: Optional[int] = None, limit: Optional[int] = None
     ) -> list[str]:
@@ -2939,53 +5198,64 @@ class IncrementalFreesoundLoader(DataLoader):
             # Get all samples not updated in last 90 days
             samples = loader.get_samples_by_metadata_age(max_age_days=90)
         """
-        from datetime import datetime, timedelta, timezone
-
-        # Build list of (sample_id, last_update_timestamp) tuples
-        samples_with_age: list[tuple[str, Optional[datetime]]] = []
+        return self._get_samples_by_timestamp_age(
+            "last_metadata_update_at", max_age_days, limit
+        )
 
-        for node_id in self.graph.nodes():
-            last_update = self.graph.nodes[node_id].get("last_metadata_update_at")
+    def _get_samples_by_timestamp_age(
+        self, column: str, max_age_days: Optional[int], limit: Optional[int]
+    ) -> list[str]:
+        """
+        Get sample IDs sorted by a timestamp attribute, oldest first.
 
-            # Samples with no timestamp (never updated) get priority
-            if last_update is None:
-                samples_with_age.append((str(node_id), None))
-            else:
-                # Parse ISO timestamp
-                try:
-                    update_time = datetime.fromisoformat(
-                        last_update.replace("Z", "+00:00")
-                    )
-                    samples_with_age.append((str(node_id), update_time))
-                except (ValueError, AttributeError):
-                    # Invalid timestamp, treat as never updated
-                    samples_with_age.append((str(node_id), None))
+        Samples with a missing or invalid timestamp come first. Lazily loaded
+        nodes are read in index order from the metadata cache; other nodes are
+        sorted in memory and merged in, so only as many rows as ``limit``
+        needs are read.
 
-        # Sort: None (never updated) first, then oldest timestamps
-        samples_with_age.sort(
-            key=lambda x: (
-                x[1] is not None,
-                x[1] or datetime.min.replace(tzinfo=timezone.utc),
-            )
-        )
+        Args:
+            column: Timestamp attribute (a MetadataCache TIMESTAMP_COLUMNS entry)
+            max_age_days: Optional maximum age in days
+            limit: Optional maximum number of samples to return
 
-        # Filter by max age if specified
-        if max_age_days is not None:
-            cutoff_time = datetime.now(timezone.utc) - timedelta(days=max_age_days)
-            samples_with_age = [
-                (sample_id, update_time)
-                for sample_id, update_time in samples_with_age
-                if update_time is None or update_time < cutoff_time
-            ]
+        Returns:
+            List of sample IDs sorted by age
+        """
+        from datetime import timedelta
 
-        # Extract sample IDs
-        sample_ids = [sample_id for sample_id, _ in samples_with_age]
+        python_nodes = self._nodes_needing_python_scan()
 
-        # Apply limit if specified
-        if limit is not None:
-            sample_ids = sample_ids[:limit]
+        cutoff = None
+        if max_age_days is not None:
+            cutoff = (
+                datetime.now(timezone.utc) - timedelta(days=max_age_days)
+            ).isoformat()
+
+        def age_key(entry: tuple[str, Optional[str]]) -> tuple[bool, str]:
+            return (entry[1] is not None, entry[1] or "")
+
+        # Normalized timestamps are UTC isoformat strings, so they sort as text
+        in_memory = []
+        for node_id in python_nodes if python_nodes is not None else self.graph:
+            timestamp = normalize_timestamp(self.graph.nodes[node_id].get(column))
+            if cutoff is None or timestamp is None or timestamp < cutoff:
+                in_memory.append((str(node_id), timestamp))
+        in_memory.sort(key=age_key)
+
+        if python_nodes is None:
+            ordered = iter(in_memory)
+        else:
+            skip = set(python_nodes)
+            from_cache = (
+                (str(sample_id), timestamp)
+                for sample_id, timestamp in self.metadata_cache.iter_sample_ids_by_age(
+                    column, max_age_days
+                )
+                if str(sample_id) in self.graph and str(sample_id) not in skip
+            )
+            ordered = heapq.merge(from_cache, in_memory, key=age_key)
 
-        return sample_ids
+        return [sample_id for sample_id, _ in itertools.islice(ordered, limit)]
 
     def _search_samples(
         self, query: Optional[str], tags: Optional[list[str]], max_samples: int
@@ -3004,15 +5274,6 @@ class IncrementalFreesoundLoader(DataLoader):
         Returns:
             List of sample dictionaries with metadata
         """
-        # complete fields parameter (29 response fields)
-        # Note: original_filename and md5 are filter-only parameters, not response fields
-        comprehensive_fields = (
-            "id,url,name,tags,description,category,subcategory,geotag,created,"
-            "license,type,channels,filesize,bitrate,bitdepth,duration,samplerate,"
-            "username,pack,previews,images,num_downloads,avg_rating,num_ratings,"
-            "num_comments,comments,similar_sounds,analysis,ac_analysis"
-        )
-
         samples: list[Any] = []
         now = datetime.now(timezone.utc).isoformat()
 
@@ -3024,7 +5285,7 @@ class IncrementalFreesoundLoader(DataLoader):
                 search_filter = tag_filter
 
             # Perform search with rate limiting and retry on 429
-            self.rate_limiter.acquire()
+            self._acquire_rate_limit()
             self._increment_request_count()
 
             # Use text_search with pagination and complete fields
@@ -3069,7 +5330,7 @@ class IncrementalFreesoundLoader(DataLoader):
                     filter=search_filter if search_filter else None,
                     page_size=page_size,
                     sort=current_sort,
-                    fields=comprehensive_fields,  # Get ALL metadata in one call!
+                    fields=self.COMPREHENSIVE_FIELDS,  # Get ALL metadata in one call!
                     page=start_page,  # Resume from last page
                 )
 
@@ -3096,15 +5357,20 @@ class IncrementalFreesoundLoader(DataLoader):
                 ):
                     continue
 
-                # Cache the sound object for future use
-                self._sound_cache[sound.id] = sound
-
                 # Extract complete metadata
                 sample_data = self._extract_sample_metadata(sound)
 
+                # Cache invalid samples (None) so they aren't fetched again
+                if sample_data is None:
+                    self._sound_cache.put(sound.id, None)
+                    continue
+
                 # Set last_metadata_update_at timestamp
                 sample_data["last_metadata_update_at"] = now
 
+                # Cache the metadata for future use
+                self._sound_cache.put(sound.id, dict(sample_data))
+
                 samples.append(sample_data)
 
             # If first page had samples but we got 0 new ones, advance to next page
@@ -3127,7 +5393,7 @@ class IncrementalFreesoundLoader(DataLoader):
                     )
                     break
 
-                self.rate_limiter.acquire()
+                self._acquire_rate_limit()
                 self._increment_request_count()
                 results = self._retry_with_backoff(results.next_page)
                 current_page += 1
@@ -3147,12 +5413,14 @@ class IncrementalFreesoundLoader(DataLoader):
                     ):
                         continue
 
-                    # Cache the sound object
-                    self._sound_cache[sound.id] = sound
-
                     # Extract complete metadata
                     sample_data = self._extract_sample_metadata(sound)
 
+                    # Cache the metadata (None marks the sample invalid)
+                    self._sound_cache.put(
+                        sound.id, dict(sample_data) if sample_data else None
+                    )
+
                     # Skip invalid samples (e.g., 0 byte filesize) but mark as processed
                     if sample_data is None:
                         # Add to metadata cache so we don't retry this sample
@@ -3205,37 +5473,40 @@ class IncrementalFreesoundLoader(DataLoader):
         Returns:
             Dictionary with sample metadata, or tuple if return_sound=True
         """
-        # Check cache first
-        if sample_id in self._sound_cache:
-            self._cache_hits += 1
-            sound = self._sound_cache[sample_id]
-            metadata = self._extract_sample_metadata(sound)
-            if metadata is None:
-                raise ValueError(f"Sample {sample_id} has invalid metadata")
-            if return_sound:
-                return metadata, sound
-            return metadata
+        # Check cache first (only metadata is cached, so callers that need
+        # the sound object always fetch it)
+        if not return_sound:
+            hit, metadata = self._sound_cache.lookup(sample_id)
+            if hit:
+                self._cache_hits += 1
+                if metadata is None:
+                    raise ValueError(f"Sample {sample_id} has invalid metadata")
+                return metadata
 
         # Cache miss - fetch from API
         self._cache_misses += 1
-        self._increment_request_count()
-
-        # Rate limit and fetch
-        self.rate_limiter.acquire()
-        sound = self._retry_with_backoff(self.client.get_sound, sample_id)
 
-        # Cache the sound object
-        self._sound_cache[sample_id] = sound
+        # Rate limit and fetch (counted after the call so response cache
+        # hits are recognized)
+        self._acquire_rate_limit()
+        try:
+            sound = self._retry_with_backoff(self.client.get_sound, sample_id)
+        finally:
+            self._increment_request_count()
 
         # Extract metadata
         metadata = self._extract_sample_metadata(sound)
         if metadata is None:
+            self._sound_cache.put(sample_id, None)
             raise ValueError(f"Sample {sample_id} has invalid metadata")
 
         # Set timestamp
         now = datetime.now(timezone.utc).isoformat()
         metadata["last_metadata_update_at"] = now
 
+        # Cache the metadata
+        self._sound_cache.put(sample_id, dict(metadata))
+
         if return_sound:
             return metadata, sound
         return metadata
@@ -3265,22 +5536,11 @@ class IncrementalFreesoundLoader(DataLoader):
         # Increment counter for similar sounds request
         self._increment_request_count()
 
-        # complete fields parameter (ALL 30 available fields)
-        # Note: OAuth2-only fields (bookmark, rate) and non-public fields excluded
-        # analysis_stats/analysis_frames are inside analysis object
-        # Note: original_filename and md5 are filter-only parameters, not response fields
-        comprehensive_fields = (
-            "id,url,name,tags,description,category,subcategory,geotag,created,"
-            "license,type,channels,filesize,bitrate,bitdepth,duration,samplerate,"
-            "username,pack,previews,images,num_downloads,avg_rating,num_ratings,"
-            "num_comments,comments,similar_sounds,analysis,ac_analysis"
-        )
-
         similar_list = []
 
         try:
             # Rate limit the request
-            self.rate_limiter.acquire()
+            self._acquire_rate_limit()
 
             # Fetch similar sounds with tuned parameters
             # page_size=150 (API maximum) and complete fields
@@ -3288,7 +5548,7 @@ class IncrementalFreesoundLoader(DataLoader):
                 self.client.get_sound, sample_id
             ).get_similar(
                 page_size=150,  # API maximum for list endpoints
-                fields=comprehensive_fields,
+                fields=self.COMPREHENSIVE_FIELDS,
             )
             self._increment_request_count()  # Count the get_similar API call
 
@@ -3302,13 +5562,11 @@ class IncrementalFreesoundLoader(DataLoader):
                 if similar_id == sample_id:
                     continue
 
-                # Cache the complete sound object (saves future API calls!)
-                self._sound_cache[similar_id] = similar
-
-                # Update last_metadata_update_at for cached sample
-                # This is stored in the sound object's metadata
-                if hasattr(similar, "_metadata"):
-                    similar._metadata["last_metadata_update_at"] = now
+                # Cache the complete metadata (saves future API calls!)
+                metadata = self._extract_sample_metadata(similar, warn=False)
+                if metadata is not None:
+                    metadata["last_metadata_update_at"] = now
+                self._sound_cache.put(similar_id, metadata)
 
                 score = 1.0
                 similar_list.append((similar_id, score))
@@ -3352,7 +5610,7 @@ class IncrementalFreesoundLoader(DataLoader):
         # Step 1: Save current checkpoint to disk
         try:
             self.logger.info("Step 1/3: Saving checkpoint to disk...")
-            self._save_checkpoint(
+            self._save_final_checkpoint(
                 {
                     "error_context": context,
                     "error_message": str(error),
@@ -3376,6 +5634,7 @@ class IncrementalFreesoundLoader(DataLoader):
 
             # Create backup using BackupManager
             if hasattr(self, "backup_manager"):
+                # The pickle is written in both topology formats
                 topology_path = checkpoint_dir / "graph_topology.gpickle"
                 metadata_db_path = checkpoint_dir / "metadata_cache.db"
 
@@ -2,9 +2,28 @@
 Storage modules for persistent data management.
 
 This package provides storage backends for checkpoint data, including
-SQLite-based metadata caching for scalable checkpoint architecture.
+SQLite-based metadata caching, thread-safe SQLite connection management, a
+bounded fetched-sound cache, an on-disk API response cache, a persistent
+crawl frontier, lazy node attributes and memory-mappable CSR topology storage
+for scalable checkpoint architecture.
 """
 
+from .crawl_frontier import CrawlFrontier
+from .csr_topology import CSRTopology
+from .lazy_attributes import LazyAttributeStore, LazyNodeAttributes
 from .metadata_cache import MetadataCache
+from .response_cache import CachingSession, ResponseCache
+from .sound_cache import SoundCache
+from .sqlite_connections import SQLiteConnectionManager
 
-__all__ = ["MetadataCache"]
+__all__ = [
+    "CachingSession",
+    "CrawlFrontier",
+    "CSRTopology",
+    "LazyAttributeStore",
+    "LazyNodeAttributes",
+    "MetadataCache",
+    "ResponseCache",
+    "SoundCache",
+    "SQLiteConnectionManager",
+]
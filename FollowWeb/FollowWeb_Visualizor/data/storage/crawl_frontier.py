@@ -0,0 +1,289 @@
+"""
+SQLite-backed priority frontier for resumable recursive discovery.
+
+Recursive discovery keeps its candidates in an in-memory heap, so a crawl
+stopped by the time limit or the request budget loses every queued sample,
+and the next run re-discovers and re-scores them with new API requests.
+CrawlFrontier persists the queue next to the checkpoint:
+
+- ``frontier``: one row per queued sample (sample_id, priority, depth,
+  enqueued_at) with the sample's metadata, indexed on priority. Pushing a
+  sample that is already queued keeps the higher priority and the lower
+  depth, so every sample is queued once.
+- ``frontier_edges``: similar-sound relationships of expanded samples that
+  are not in the graph yet, so answered get_similar() requests are not
+  repeated when the crawl resumes.
+
+Candidates leave the table in batches (``pop_batch``) ordered by priority,
+skipping samples that were processed in the meantime.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Container, Iterable
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+class CrawlFrontier:
+    """
+    Persistent priority queue of samples waiting to be expanded.
+
+    Example:
+        frontier = CrawlFrontier("data/freesound_library/crawl_frontier.db")
+        frontier.push_many([(sample, priority, depth)])
+        for sample, priority, depth in frontier.pop_batch(50, processed_ids):
+            expand(sample)
+        frontier.close()
+    """
+
+    def __init__(
+        self, db_path: Union[str, Path], logger: Optional[logging.Logger] = None
+    ):
+        """
+        Open (and create if needed) the frontier database.
+
+        Args:
+            db_path: SQLite database file
+            logger: Optional logger instance
+        """
+        self.db_path = Path(db_path)
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            str(self.db_path), timeout=30.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS frontier (
+                sample_id TEXT PRIMARY KEY,
+                priority REAL NOT NULL,
+                depth INTEGER NOT NULL,
+                enqueued_at REAL NOT NULL,
+                sample TEXT NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_frontier_priority "
+            "ON frontier(priority DESC, enqueued_at)"
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS frontier_edges (
+                source_id TEXT NOT NULL,
+                target_id TEXT NOT NULL,
+                score REAL NOT NULL,
+                PRIMARY KEY (source_id, target_id)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        """Number of queued samples."""
+        with self._lock:
+            assert self._conn is not None
+            return int(
+                self._conn.execute("SELECT COUNT(*) FROM frontier").fetchone()[0]
+            )
+
+    def __contains__(self, sample_id: object) -> bool:
+        """Whether a sample is queued."""
+        with self._lock:
+            assert self._conn is not None
+            row = self._conn.execute(
+                "SELECT 1 FROM frontier WHERE sample_id = ?", (str(sample_id),)
+            ).fetchone()
+            return row is not None
+
+    def push_many(self, items: Iterable[tuple[dict[str, Any], float, int]]) -> None:
+        """
+        Queue samples, merging with samples already queued.
+
+        Args:
+            items: (sample metadata, priority, depth) tuples; higher priority
+                is popped first
+        """
+        now = time.time()
+        rows = [
+            (str(sample["id"]), priority, depth, now, json.dumps(sample))
+            for sample, priority, depth in items
+        ]
+        if not rows:
+            return
+        with self._lock:
+            assert self._conn is not None
+            self._conn.executemany(
+                """
+                INSERT INTO frontier (sample_id, priority, depth, enqueued_at, sample)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(sample_id) DO UPDATE SET
+                    priority = MAX(priority, excluded.priority),
+                    depth = MIN(depth, excluded.depth)
+                """,
+                rows,
+            )
+            self._conn.commit()
+
+    def best_priority(self) -> Optional[float]:
+        """Priority of the next sample pop_batch() returns, or None if empty."""
+        with self._lock:
+            assert self._conn is not None
+            row = self._conn.execute(
+                "SELECT priority FROM frontier ORDER BY priority DESC, enqueued_at "
+                "LIMIT 1"
+            ).fetchone()
+            return None if row is None else row[0]
+
+    def pop_batch(
+        self, size: int, processed_ids: Container[str] = ()
+    ) -> list[tuple[dict[str, Any], float, int]]:
+        """
+        Remove and return the highest-priority samples.
+
+        Samples in processed_ids are removed without being returned.
+
+        Args:
+            size: Maximum number of samples to return
+            processed_ids: IDs of samples that no longer need expanding
+
+        Returns:
+            (sample metadata, priority, depth) tuples, highest priority first
+        """
+        batch: list[tuple[dict[str, Any], float, int]] = []
+        with self._lock:
+            assert self._conn is not None
+            while len(batch) < size:
+                rows = self._conn.execute(
+                    "SELECT sample_id, priority, depth, sample FROM frontier "
+                    "ORDER BY priority DESC, enqueued_at LIMIT ?",
+                    (size - len(batch),),
+                ).fetchall()
+                if not rows:
+                    break
+                self._conn.executemany(
+                    "DELETE FROM frontier WHERE sample_id = ?",
+                    [(row[0],) for row in rows],
+                )
+                batch.extend(
+                    (json.loads(sample), priority, depth)
+                    for sample_id, priority, depth, sample in rows
+                    if sample_id not in processed_ids
+                )
+            self._conn.commit()
+        return batch
+
+    def get_priority(self, sample_id: str) -> Optional[float]:
+        """Priority of a queued sample, or None if it is not queued."""
+        with self._lock:
+            assert self._conn is not None
+            row = self._conn.execute(
+                "SELECT priority FROM frontier WHERE sample_id = ?", (str(sample_id),)
+            ).fetchone()
+            return None if row is None else row[0]
+
+    def update_priorities(self, priorities: dict[str, float]) -> None:
+        """
+        Re-score queued samples (e.g. after their degree changed).
+
+        Args:
+            priorities: New priority by sample ID; IDs not queued are ignored
+        """
+        if not priorities:
+            return
+        with self._lock:
+            assert self._conn is not None
+            self._conn.executemany(
+                "UPDATE frontier SET priority = ? WHERE sample_id = ?",
+                [
+                    (priority, str(sample_id))
+                    for sample_id, priority in priorities.items()
+                ],
+            )
+            self._conn.commit()
+
+    def add_edges(self, source_id: str, similar: list[tuple[Any, float]]) -> None:
+        """
+        Store the similar-sound relationships of an expanded sample.
+
+        Args:
+            source_id: Expanded sample
+            similar: (target ID, similarity score) tuples
+        """
+        if not similar:
+            return
+        with self._lock:
+            assert self._conn is not None
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO frontier_edges (source_id, target_id, score) "
+                "VALUES (?, ?, ?)",
+                [(str(source_id), str(target), score) for target, score in similar],
+            )
+            self._conn.commit()
+
+    def load_edges(self) -> dict[str, list[tuple[str, float]]]:
+        """
+        Get stored relationships.
+
+        Returns:
+            Dictionary mapping source ID to (target ID, score) tuples
+        """
+        edges: dict[str, list[tuple[str, float]]] = {}
+        with self._lock:
+            assert self._conn is not None
+            for source_id, target_id, score in self._conn.execute(
+                "SELECT source_id, target_id, score FROM frontier_edges"
+            ):
+                edges.setdefault(source_id, []).append((target_id, score))
+        return edges
+
+    def prune_edges(self, node_ids: Container[str]) -> int:
+        """
+        Delete relationships whose source and target are both in node_ids.
+
+        Args:
+            node_ids: IDs of samples in the graph (their edges were added)
+
+        Returns:
+            Number of relationships deleted
+        """
+        with self._lock:
+            assert self._conn is not None
+            done = [
+                (source_id, target_id)
+                for source_id, target_id in self._conn.execute(
+                    "SELECT source_id, target_id FROM frontier_edges"
+                )
+                if source_id in node_ids and target_id in node_ids
+            ]
+            self._conn.executemany(
+                "DELETE FROM frontier_edges WHERE source_id = ? AND target_id = ?",
+                done,
+            )
+            self._conn.commit()
+        return len(done)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get frontier statistics."""
+        with self._lock:
+            assert self._conn is not None
+            queued = self._conn.execute("SELECT COUNT(*) FROM frontier").fetchone()[0]
+            edges = self._conn.execute(
+                "SELECT COUNT(*) FROM frontier_edges"
+            ).fetchone()[0]
+        return {"queued": int(queued), "pending_edges": int(edges)}
+
+    def close(self) -> None:
+        """Close the database connection (idempotent)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,637 @@
+"""
+Memory-mappable CSR topology storage for large checkpoint graphs.
+
+This module stores graph topology as compressed sparse row (CSR) arrays in
+plain ``.npy`` files instead of a pickled NetworkX graph. Opening a topology
+maps the arrays with ``np.load(mmap_mode='r')``, so adjacency is available
+without unpickling millions of Python objects; a NetworkX graph is only built
+when a caller asks for one.
+
+On-disk layout (``graph_topology_csr/``):
+    node_ids.npy   - Node ID for each integer node index
+    indptr.npy     - int64[num_nodes + 1], row offsets into indices
+    indices.npy    - int32/int64[num_edges], target node index per edge
+    edge_type.npy  - uint8[num_edges], code into meta.json "edge_types"
+    weight.npy     - float32[num_edges], edge weight
+    meta.json      - Format version, counts and code tables (written last)
+
+Edges of each row are sorted by target index. Edge type code 0 means the edge
+had no ``type`` attribute.
+"""
+
+import json
+import logging
+import shutil
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Literal, Optional, Union
+
+import networkx as nx
+import numpy as np
+
+CSR_FORMAT_VERSION = 1
+
+_ARRAY_NAMES = ("node_ids", "indptr", "indices", "edge_type", "weight")
+
+
+class CSRTopology:
+    """
+    Directed graph topology stored as CSR arrays.
+
+    Attributes:
+        node_ids: Node ID per node index (int64, or unicode for string IDs)
+        indptr: Row offsets, edges of node i are indices[indptr[i]:indptr[i+1]]
+        indices: Target node index per edge
+        edge_type: Edge type code per edge (see edge_types)
+        weight: Edge weight per edge (float32)
+        edge_types: Edge type name per code (code 0 is None)
+        node_id_kind: How node IDs map back to Python ('int', 'str_int', 'str')
+
+    Example:
+        topology = CSRTopology.from_graph(graph)
+        topology.save('data/freesound_library/graph_topology_csr')
+
+        topology = CSRTopology.load('data/freesound_library/graph_topology_csr')
+        targets = topology.successor_indices(0)
+        graph = topology.to_networkx()
+    """
+
+    def __init__(
+        self,
+        node_ids: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        edge_type: np.ndarray,
+        weight: np.ndarray,
+        edge_types: list[Optional[str]],
+        node_id_kind: str = "str_int",
+    ):
+        """
+        Initialize topology from CSR arrays.
+
+        Args:
+            node_ids: Node ID per node index
+            indptr: Row offsets (length num_nodes + 1)
+            indices: Target node index per edge
+            edge_type: Edge type code per edge
+            weight: Edge weight per edge
+            edge_types: Edge type name per code (index 0 must be None)
+            node_id_kind: 'int', 'str_int' or 'str'
+        """
+        self.node_ids = node_ids
+        self.indptr = indptr
+        self.indices = indices
+        self.edge_type = edge_type
+        self.weight = weight
+        self.edge_types = edge_types
+        self.node_id_kind = node_id_kind
+        self._index: Optional[dict[Any, int]] = None
+
+    # ------------------------------------------------------------------
+    # Construction
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_edges(
+        cls,
+        nodes: Iterable[Any],
+        edges: Iterable[tuple],
+    ) -> "CSRTopology":
+        """
+        Build a topology from node IDs and edge tuples.
+
+        Args:
+            nodes: All node IDs (isolated nodes are preserved)
+            edges: (source, target) or (source, target, type, weight) tuples
+
+        Returns:
+            CSRTopology instance
+        """
+        node_list = list(nodes)
+        index = {node: i for i, node in enumerate(node_list)}
+        num_nodes = len(node_list)
+
+        edge_types: list[Optional[str]] = [None]
+        type_codes: dict[Optional[str], int] = {None: 0}
+
+        src: list[int] = []
+        dst: list[int] = []
+        codes: list[int] = []
+        weights: list[float] = []
+
+        for edge in edges:
+            source, target = edge[0], edge[1]
+            if source not in index:
+                index[source] = num_nodes
+                node_list.append(source)
+                num_nodes += 1
+            if target not in index:
+                index[target] = num_nodes
+                node_list.append(target)
+                num_nodes += 1
+
+            edge_type = edge[2] if len(edge) > 2 else None
+            code = type_codes.get(edge_type)
+            if code is None:
+                code = len(edge_types)
+                if code > np.iinfo(np.uint8).max:
+                    raise ValueError("CSR topology supports at most 255 edge types")
+                type_codes[edge_type] = code
+                edge_types.append(edge_type)
+
+            weight = edge[3] if len(edge) > 3 and edge[3] is not None else 1.0
+
+            src.append(index[source])
+            dst.append(index[target])
+            codes.append(code)
+            weights.append(weight)
+
+        index_dtype = np.int32 if num_nodes < np.iinfo(np.int32).max else np.int64
+        src_arr = np.asarray(src, dtype=np.int64)
+        dst_arr = np.asarray(dst, dtype=index_dtype)
+        code_arr = np.asarray(codes, dtype=np.uint8)
+        weight_arr = np.asarray(weights, dtype=np.float32)
+
+        # Sort edges by (source, target) so each row is contiguous and ordered
+        order = np.lexsort((dst_arr, src_arr))
+        counts = np.bincount(src_arr, minlength=num_nodes)
+        indptr: np.ndarray = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        node_ids, node_id_kind = cls._encode_node_ids(node_list)
+
+        topology = cls(
+            node_ids=node_ids,
+            indptr=indptr,
+            indices=dst_arr[order],
+            edge_type=code_arr[order],
+            weight=weight_arr[order],
+            edge_types=edge_types,
+            node_id_kind=node_id_kind,
+        )
+        topology._index = index
+        return topology
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> "CSRTopology":
+        """
+        Build a topology from a NetworkX graph (type/weight edge attributes).
+
+        Args:
+            graph: Directed graph to convert
+
+        Returns:
+            CSRTopology instance
+        """
+        return cls.from_edges(
+            graph.nodes(),
+            (
+                (u, v, data.get("type"), data.get("weight"))
+                for u, v, data in graph.edges(data=True)
+            ),
+        )
+
+    def extend(self, nodes: Iterable[Any], edges: Iterable[tuple]) -> "CSRTopology":
+        """
+        Build a new topology with extra nodes and edges applied.
+
+        Follows NetworkX add_edge semantics, so applying a delta checkpoint
+        journal gives the same result as replaying it into a DiGraph: existing
+        nodes are ignored, an existing edge keeps its position and only takes
+        the type/weight values that are not None.
+
+        Args:
+            nodes: Node IDs to add
+            edges: (source, target) or (source, target, type, weight) tuples
+
+        Returns:
+            New in-memory CSRTopology
+        """
+        num_nodes = self.num_nodes
+        new_nodes: list[Any] = []
+        new_index: dict[Any, int] = {}
+
+        def index_of(node: Any) -> int:
+            try:
+                return self.index_of(node)
+            except KeyError:
+                pass
+            if node not in new_index:
+                new_index[node] = num_nodes + len(new_nodes)
+                new_nodes.append(node)
+            return new_index[node]
+
+        for node in nodes:
+            index_of(node)
+
+        edge_types = list(self.edge_types)
+        type_codes = {name: code for code, name in enumerate(edge_types)}
+        edge_type = np.array(self.edge_type, dtype=np.uint8)
+        weight = np.array(self.weight, dtype=np.float32)
+        added: dict[tuple[int, int], list] = {}
+
+        for edge in edges:
+            source, target = index_of(edge[0]), index_of(edge[1])
+            type_name = edge[2] if len(edge) > 2 else None
+            edge_weight = edge[3] if len(edge) > 3 else None
+
+            code = None
+            if type_name is not None:
+                code = type_codes.get(type_name)
+                if code is None:
+                    code = len(edge_types)
+                    if code > np.iinfo(np.uint8).max:
+                        raise ValueError("CSR topology supports at most 255 edge types")
+                    type_codes[type_name] = code
+                    edge_types.append(type_name)
+
+            position = self._edge_position(source, target)
+            if position is not None:
+                if code is not None:
+                    edge_type[position] = code
+                if edge_weight is not None:
+                    weight[position] = edge_weight
+                continue
+
+            entry = added.setdefault((source, target), [0, 1.0])
+            if code is not None:
+                entry[0] = code
+            if edge_weight is not None:
+                entry[1] = edge_weight
+
+        total_nodes = num_nodes + len(new_nodes)
+        index_dtype = np.int32 if total_nodes < np.iinfo(np.int32).max else np.int64
+        src = np.concatenate(
+            [
+                self.sources().astype(np.int64),
+                np.fromiter((s for s, _ in added), dtype=np.int64, count=len(added)),
+            ]
+        )
+        dst = np.concatenate(
+            [
+                np.asarray(self.indices, dtype=index_dtype),
+                np.fromiter((t for _, t in added), dtype=index_dtype, count=len(added)),
+            ]
+        )
+        codes = np.concatenate(
+            [edge_type, np.asarray([e[0] for e in added.values()], dtype=np.uint8)]
+        )
+        weights = np.concatenate(
+            [weight, np.asarray([e[1] for e in added.values()], dtype=np.float32)]
+        )
+
+        order = np.lexsort((dst, src))
+        counts = np.bincount(src, minlength=total_nodes)
+        indptr: np.ndarray = np.zeros(total_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        node_ids, node_id_kind = self.node_ids, self.node_id_kind
+        if new_nodes:
+            node_ids, node_id_kind = self._encode_node_ids(
+                [self.node_id(i) for i in range(num_nodes)] + new_nodes
+            )
+
+        topology = CSRTopology(
+            node_ids=node_ids,
+            indptr=indptr,
+            indices=dst[order],
+            edge_type=codes[order],
+            weight=weights[order],
+            edge_types=edge_types,
+            node_id_kind=node_id_kind,
+        )
+        if self._index is not None:
+            topology._index = {**self._index, **new_index}
+        return topology
+
+    def _edge_position(self, source: int, target: int) -> Optional[int]:
+        """Find the position of an existing edge in indices, or None."""
+        if source >= self.num_nodes or target >= self.num_nodes:
+            return None
+        start, end = int(self.indptr[source]), int(self.indptr[source + 1])
+        position = start + int(
+            np.searchsorted(self.indices[start:end], target, side="left")
+        )
+        if position < end and self.indices[position] == target:
+            return position
+        return None
+
+    @staticmethod
+    def _encode_node_ids(node_list: list[Any]) -> tuple[np.ndarray, str]:
+        """Encode node IDs as int64 when possible, unicode otherwise."""
+        if all(
+            isinstance(n, (int, np.integer)) and not isinstance(n, bool)
+            for n in node_list
+        ):
+            return np.asarray(node_list, dtype=np.int64), "int"
+
+        if all(
+            isinstance(n, str) and n.isdigit() and str(int(n)) == n for n in node_list
+        ):
+            return np.asarray([int(n) for n in node_list], dtype=np.int64), "str_int"
+
+        return np.asarray([str(n) for n in node_list], dtype=np.str_), "str"
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def exists(directory: Union[str, Path]) -> bool:
+        """
+        Check if a complete CSR topology exists in a directory.
+
+        Args:
+            directory: Topology directory
+
+        Returns:
+            True if meta.json (written last) exists
+        """
+        return (Path(directory) / "meta.json").exists()
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """
+        Write the topology atomically.
+
+        Arrays are written to a sibling temp directory which then replaces
+        the existing topology, so readers never see a partial write.
+
+        Args:
+            directory: Target topology directory
+        """
+        directory = Path(directory)
+        temp_dir = directory.with_name(directory.name + ".tmp")
+        old_dir = directory.with_name(directory.name + ".old")
+
+        if temp_dir.exists():
+            shutil.rmtree(temp_dir)
+        temp_dir.mkdir(parents=True)
+
+        for name in _ARRAY_NAMES:
+            np.save(temp_dir / f"{name}.npy", np.ascontiguousarray(getattr(self, name)))
+
+        meta = {
+            "format_version": CSR_FORMAT_VERSION,
+            "num_nodes": self.num_nodes,
+            "num_edges": self.num_edges,
+            "edge_types": self.edge_types,
+            "node_id_kind": self.node_id_kind,
+            "directed": True,
+        }
+        with open(temp_dir / "meta.json", "w") as f:
+            json.dump(meta, f, indent=2)
+
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
+        if directory.exists():
+            directory.rename(old_dir)
+        temp_dir.rename(directory)
+        if old_dir.exists():
+            shutil.rmtree(old_dir)
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "CSRTopology":
+        """
+        Open a topology written by save().
+
+        Args:
+            directory: Topology directory
+            mmap: Memory-map arrays read-only instead of reading them into RAM
+
+        Returns:
+            CSRTopology instance
+
+        Raises:
+            FileNotFoundError: If the topology is missing or incomplete
+            ValueError: If the format version is unsupported
+        """
+        directory = Path(directory)
+        meta_path = directory / "meta.json"
+        if not meta_path.exists():
+            raise FileNotFoundError(f"CSR topology not found: {directory}")
+
+        with open(meta_path) as f:
+            meta = json.load(f)
+
+        if meta.get("format_version") != CSR_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported CSR topology version: {meta.get('format_version')}"
+            )
+
+        mmap_mode: Optional[Literal["r+", "r", "w+", "c"]] = "r" if mmap else None
+        arrays = {
+            name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode)
+            for name in _ARRAY_NAMES
+        }
+
+        return cls(
+            edge_types=meta["edge_types"],
+            node_id_kind=meta.get("node_id_kind", "str_int"),
+            **arrays,
+        )
+
+    def validate(self) -> None:
+        """
+        Check that the CSR arrays are mutually consistent.
+
+        Raises:
+            ValueError: If array lengths or offsets are inconsistent
+        """
+        if len(self.node_ids) != self.num_nodes:
+            raise ValueError(
+                f"node_ids has {len(self.node_ids)} entries, expected {self.num_nodes}"
+            )
+        if self.indptr[0] != 0 or self.indptr[-1] != self.num_edges:
+            raise ValueError("indptr does not span the indices array")
+        if len(self.edge_type) != self.num_edges or len(self.weight) != self.num_edges:
+            raise ValueError("edge_type/weight length does not match indices")
+        if self.num_edges and (
+            int(self.indices.min()) < 0 or int(self.indices.max()) >= self.num_nodes
+        ):
+            raise ValueError("indices reference nodes outside the topology")
+
+    # ------------------------------------------------------------------
+    # Adjacency access (zero-copy on memory-mapped arrays)
+    # ------------------------------------------------------------------
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes."""
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """Number of directed edges."""
+        return len(self.indices)
+
+    def node_id(self, index: int) -> Any:
+        """
+        Get the original node ID for a node index.
+
+        Args:
+            index: Node index
+
+        Returns:
+            Node ID as int or str (matching the source graph)
+        """
+        value = self.node_ids[index]
+        if self.node_id_kind == "int":
+            return int(value)
+        return str(value)
+
+    def index_of(self, node_id: Any) -> int:
+        """
+        Get the node index for a node ID.
+
+        The ID-to-index mapping is built on first use.
+
+        Args:
+            node_id: Node ID
+
+        Returns:
+            Node index
+
+        Raises:
+            KeyError: If the node is not in the topology
+        """
+        if self._index is None:
+            self._index = {self.node_id(i): i for i in range(self.num_nodes)}
+        return self._index[node_id]
+
+    def successor_indices(self, index: int) -> np.ndarray:
+        """
+        Get target node indices of a node's outgoing edges.
+
+        Args:
+            index: Node index
+
+        Returns:
+            View into the indices array (no copy)
+        """
+        return self.indices[self.indptr[index] : self.indptr[index + 1]]
+
+    def out_degrees(self) -> np.ndarray:
+        """Out-degree per node index."""
+        return np.diff(self.indptr)
+
+    def in_degrees(self) -> np.ndarray:
+        """In-degree per node index."""
+        return np.bincount(self.indices, minlength=self.num_nodes)
+
+    def sources(self) -> np.ndarray:
+        """Source node index per edge (expanded from indptr)."""
+        return np.repeat(np.arange(self.num_nodes), self.out_degrees())
+
+    def edge_type_name(self, code: int) -> Optional[str]:
+        """Get the edge type name for an edge type code."""
+        return self.edge_types[code]
+
+    def to_scipy(self):
+        """
+        Get the weighted adjacency matrix as a scipy.sparse CSR matrix.
+
+        The matrix shares the topology's index and weight arrays.
+
+        Returns:
+            scipy.sparse.csr_matrix of shape (num_nodes, num_nodes)
+        """
+        from scipy import sparse
+
+        return sparse.csr_matrix(
+            (self.weight, self.indices, self.indptr),
+            shape=(self.num_nodes, self.num_nodes),
+            copy=False,
+        )
+
+    def to_undirected_adjacency(
+        self, groups: Optional[dict[str, dict[str, list[Any]]]] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get symmetric adjacency without self-loops in METIS (xadj, adjncy) form.
+
+        Args:
+            groups: Optional hub group membership table (edge type → group
+                name → node IDs, as in graph.graph['sample_groups']); the
+                members of each group are made adjacent as if the group were
+                expanded into a clique. Unknown members are ignored.
+
+        Returns:
+            Tuple of (xadj, adjncy) int arrays
+        """
+        from scipy import sparse
+
+        shape = (self.num_nodes, self.num_nodes)
+        pattern = sparse.csr_matrix(
+            (
+                np.ones(self.num_edges, dtype=np.int8),
+                self.indices,
+                self.indptr,
+            ),
+            shape=shape,
+        )
+        symmetric = (pattern + pattern.T).tocsr()
+
+        if groups:
+            rows: list[np.ndarray] = []
+            cols: list[np.ndarray] = []
+            for type_groups in groups.values():
+                for members in type_groups.values():
+                    member_indices = []
+                    for node in members:
+                        try:
+                            member_indices.append(self.index_of(node))
+                        except KeyError:
+                            continue
+                    if len(member_indices) < 2:
+                        continue
+                    block = np.asarray(member_indices, dtype=np.int64)
+                    rows.append(np.repeat(block, len(block)))
+                    cols.append(np.tile(block, len(block)))
+            if rows:
+                row = np.concatenate(rows)
+                clique = sparse.csr_matrix(
+                    (np.ones(len(row), dtype=np.int8), (row, np.concatenate(cols))),
+                    shape=shape,
+                )
+                symmetric = (symmetric + clique).tocsr()
+
+        symmetric.setdiag(0)
+        symmetric.eliminate_zeros()
+        symmetric.sort_indices()
+        return symmetric.indptr, symmetric.indices
+
+    def to_networkx(self) -> nx.DiGraph:
+        """
+        Build a NetworkX DiGraph view with type/weight edge attributes.
+
+        Returns:
+            New nx.DiGraph
+        """
+        graph: nx.DiGraph = nx.DiGraph()
+        node_ids = [self.node_id(i) for i in range(self.num_nodes)]
+        graph.add_nodes_from(node_ids)
+
+        sources = self.sources()
+        targets = np.asarray(self.indices)
+        codes = np.asarray(self.edge_type)
+        weights = np.asarray(self.weight)
+
+        edge_types = self.edge_types
+        graph.add_edges_from(
+            (
+                node_ids[s],
+                node_ids[t],
+                {"type": edge_types[c], "weight": float(w)}
+                if edge_types[c] is not None
+                else {"weight": float(w)},
+            )
+            for s, t, c, w in zip(
+                sources.tolist(), targets.tolist(), codes.tolist(), weights.tolist()
+            )
+        )
+
+        logging.getLogger(__name__).debug(
+            f"Built NetworkX view: {graph.number_of_nodes()} nodes, "
+            f"{graph.number_of_edges()} edges"
+        )
+        return graph
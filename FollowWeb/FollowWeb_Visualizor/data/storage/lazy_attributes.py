@@ -0,0 +1,413 @@
+"""
+Lazy node attributes backed by the SQLite metadata cache.
+
+Resuming a large checkpoint used to decode every metadata row into a per-node
+dict before any work started, so peak memory was dominated by fields that are
+rarely read (previews, descriptions, analysis blobs). This module replaces
+those dicts with lightweight mappings that read from ``MetadataCache`` on
+demand:
+
+- Hot fields (tags, username, pack, num_downloads, duration) are loaded once
+  into compact in-memory columns and served without touching SQLite.
+- Other fields decode the full row, which is kept in a bounded LRU cache.
+- Writing to a node's attributes materializes the row into a plain dict that
+  belongs to the node from then on, so ``graph.nodes[n]['x'] = y`` keeps
+  working and is picked up by the next checkpoint save. List values (such
+  as tags) are returned as lists that materialize the node when modified in
+  place, so ``graph.nodes[n]['tags'].append(t)`` is kept as well.
+
+Existing call sites such as ``graph.nodes[n]['tags']``, ``.get()``,
+``dict(graph.nodes[n])`` and ``graph.nodes(data=True)`` work unchanged.
+Pickling a graph (e.g. ``joblib.dump``) stores plain dicts.
+"""
+
+import json
+import logging
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, MutableMapping
+from pathlib import Path
+from typing import Any, Optional, Union
+
+import networkx as nx
+
+from .metadata_cache import MetadataCache
+
+HOT_FIELDS = ("tags", "username", "pack", "num_downloads", "duration")
+"""Fields kept in compact in-memory columns for every node."""
+
+_MISSING_INT = -1
+_MISSING = object()
+
+
+class LazyAttributeStore:
+    """
+    Shared backing store for lazily loaded node attributes.
+
+    Attributes:
+        db_path: Path to metadata_cache.db
+        cache_size: Maximum decoded rows kept in the LRU cache
+        hits: Row reads served from the LRU cache
+        misses: Row reads that went to SQLite
+        hot_reads: Attribute reads served from in-memory columns
+
+    Example:
+        store = LazyAttributeStore('data/freesound_library/metadata_cache.db')
+        node_ids = store.load_hot_columns()
+        store.attach(graph, node_ids)
+        graph.nodes['12345']['tags']   # served from the tags column
+        graph.nodes['12345']['description']   # decoded from SQLite, cached
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        logger: Optional[logging.Logger] = None,
+        cache_size: int = 10000,
+    ):
+        """
+        Initialize attribute store.
+
+        Args:
+            db_path: Path to metadata_cache.db
+            logger: Optional logger instance
+            cache_size: Maximum decoded rows kept in the LRU cache
+        """
+        self.db_path = Path(db_path)
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+        self.cache_size = max(1, cache_size)
+
+        self._rows: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        # MetadataCache gives each reader thread its own connection
+        self._cache: Optional[MetadataCache] = None
+
+        # Compact hot columns, indexed by position in _index
+        self._index: dict[str, int] = {}
+        self._tags: list[Any] = []
+        self._username: list[Any] = []
+        self._pack: list[Any] = []
+        self._num_downloads = array("q")
+        self._duration = array("d")
+
+        self.hits = 0
+        self.misses = 0
+        self.hot_reads = 0
+
+    def _get_cache(self) -> MetadataCache:
+        """Get (or reopen) the shared MetadataCache."""
+        cache = self._cache
+        if cache is None:
+            with self._lock:
+                if self._cache is None:
+                    self._cache = MetadataCache(str(self.db_path), self.logger)
+                cache = self._cache
+        return cache
+
+    def load_hot_columns(self) -> list[str]:
+        """
+        Load hot fields for every stored sample into in-memory columns.
+
+        Returns:
+            Node IDs (string sample IDs) of all stored samples
+        """
+        intern = sys.intern
+        node_ids = []
+
+        for sample_id, values in self._get_cache().iter_fields(list(HOT_FIELDS)):
+            tags, username, pack, downloads, duration = values
+            node_id = str(sample_id)
+            node_ids.append(node_id)
+            self._index[node_id] = len(self._index)
+
+            self._tags.append(self._decode_tags(tags))
+            self._username.append(
+                intern(username) if isinstance(username, str) else _MISSING
+            )
+            self._pack.append(intern(pack) if isinstance(pack, str) else _MISSING)
+            self._num_downloads.append(
+                downloads
+                if isinstance(downloads, int) and downloads >= 0
+                else _MISSING_INT
+            )
+            self._duration.append(
+                float(duration) if isinstance(duration, (int, float)) else float("nan")
+            )
+
+        self.logger.debug(f"Loaded hot attribute columns for {len(node_ids)} samples")
+        return node_ids
+
+    @staticmethod
+    def _decode_tags(tags: Optional[str]) -> Any:
+        """Decode a JSON tag array into a tuple of interned strings."""
+        if not isinstance(tags, str) or not tags.startswith("["):
+            return _MISSING
+        return tuple(sys.intern(str(tag)) for tag in json.loads(tags))
+
+    def attach(self, graph: nx.DiGraph, node_ids: Iterable[str]) -> int:
+        """
+        Back the attributes of the given nodes with this store.
+
+        Nodes missing from the graph are added. Existing attribute dicts are
+        replaced, so this should run before the graph is used.
+
+        Args:
+            graph: Graph whose node attributes become lazy
+            node_ids: Node IDs stored in the metadata cache
+
+        Returns:
+            Number of nodes attached
+        """
+        count = 0
+        for node_id in node_ids:
+            if node_id not in graph:
+                graph.add_node(node_id)
+            # NetworkX stores node attribute dicts in _node; swapping the dict
+            # is the only way to change how a node's attributes are read
+            graph._node[node_id] = LazyNodeAttributes(node_id, self)
+            count += 1
+        return count
+
+    def hot_value(self, node_id: str, key: str) -> Any:
+        """
+        Get a hot field from the in-memory columns.
+
+        Args:
+            node_id: Node ID
+            key: Field name (one of HOT_FIELDS)
+
+        Returns:
+            Field value, or the _MISSING sentinel if the column has no value
+            (the caller then falls back to the full row)
+        """
+        position = self._index.get(node_id)
+        if position is None:
+            return _MISSING
+
+        if key == "tags":
+            tags = self._tags[position]
+            return _MISSING if tags is _MISSING else list(tags)
+        if key == "username":
+            return self._username[position]
+        if key == "pack":
+            return self._pack[position]
+        if key == "num_downloads":
+            downloads = self._num_downloads[position]
+            return _MISSING if downloads == _MISSING_INT else downloads
+        if key == "duration":
+            duration = self._duration[position]
+            return _MISSING if duration != duration else duration  # NaN check
+        return _MISSING
+
+    def get_row(self, node_id: str) -> dict[str, Any]:
+        """
+        Get the full decoded metadata row for a node (LRU cached).
+
+        Args:
+            node_id: Node ID
+
+        Returns:
+            Metadata dictionary (empty if the sample is not stored)
+        """
+        with self._lock:
+            row = self._rows.get(node_id)
+            if row is not None:
+                self._rows.move_to_end(node_id)
+                self.hits += 1
+                return row
+
+        row = self._get_cache().get(int(node_id)) or {}
+
+        with self._lock:
+            self.misses += 1
+            self._rows[node_id] = row
+            self._rows.move_to_end(node_id)
+            while len(self._rows) > self.cache_size:
+                self._rows.popitem(last=False)
+        return row
+
+    def evict(self, node_id: str) -> None:
+        """
+        Drop a node's decoded row from the LRU cache.
+
+        Args:
+            node_id: Node ID
+        """
+        with self._lock:
+            self._rows.pop(node_id, None)
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and cache sizes
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hot_reads": self.hot_reads,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "cached_rows": len(self._rows),
+            "indexed_nodes": len(self._index),
+        }
+
+    def close(self) -> None:
+        """
+        Close all reader connections.
+
+        Attribute reads after close() transparently reopen a connection.
+        """
+        with self._lock:
+            cache = self._cache
+            self._cache = None
+            self._rows.clear()
+        if cache is not None:
+            cache.close()
+
+
+class _WriteBackList(list):
+    """
+    List read from lazy attributes that is stored on the node when modified.
+
+    The first in-place change materializes the owning node and makes this
+    list its attribute value, so later reads return the modified list.
+    """
+
+    __slots__ = ("_owner", "_key")
+
+    def __init__(self, owner: "LazyNodeAttributes", key: str, values: Iterable[Any]):
+        super().__init__(values)
+        self._owner: Optional[LazyNodeAttributes] = owner
+        self._key = key
+
+    def _write_back(self) -> None:
+        owner = self._owner
+        if owner is not None:
+            self._owner = None
+            owner[self._key] = self
+
+    def __reduce__(self):
+        # Pickle as a plain list, like LazyNodeAttributes pickles as a dict
+        return (list, (list(self),))
+
+
+def _write_back_after(name: str):
+    method = getattr(list, name)
+
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._write_back()
+        return self if result is self else result
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "remove",
+    "pop",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(_WriteBackList, _name, _write_back_after(_name))
+
+
+class LazyNodeAttributes(MutableMapping):
+    """
+    Node attribute mapping that reads from a LazyAttributeStore on demand.
+
+    Until the first write the mapping holds only the node ID; after a write
+    it owns a plain dict with the node's full attributes.
+    """
+
+    __slots__ = ("node_id", "_store", "_data")
+
+    def __init__(self, node_id: str, store: LazyAttributeStore):
+        """
+        Initialize lazy attributes.
+
+        Args:
+            node_id: Node ID
+            store: Shared attribute store
+        """
+        self.node_id = node_id
+        self._store = store
+        self._data: Optional[dict[str, Any]] = None
+
+    @property
+    def is_materialized(self) -> bool:
+        """True once the node owns a modified copy of its attributes."""
+        return self._data is not None
+
+    def _row(self) -> dict[str, Any]:
+        if self._data is not None:
+            return self._data
+        return self._store.get_row(self.node_id)
+
+    def _materialize(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = dict(self._store.get_row(self.node_id))
+            self._store.evict(self.node_id)
+        return self._data
+
+    def __getitem__(self, key: str) -> Any:
+        if self._data is not None:
+            return self._data[key]
+        if key in HOT_FIELDS:
+            value = self._store.hot_value(self.node_id, key)
+            if value is not _MISSING:
+                self._store.hot_reads += 1
+                if isinstance(value, list):
+                    return _WriteBackList(self, key, value)
+                return value
+        value = self._store.get_row(self.node_id)[key]
+        if isinstance(value, list):
+            # The row is shared through the LRU cache, so hand out a copy
+            return _WriteBackList(self, key, value)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        if self._data is None and key in HOT_FIELDS:
+            if self._store.hot_value(self.node_id, key) is not _MISSING:
+                return True
+        return key in self._row()
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._materialize()[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._materialize()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._row()))
+
+    def __len__(self) -> int:
+        return len(self._row())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (dict, LazyNodeAttributes)):
+            return dict(self) == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+    def copy(self) -> dict[str, Any]:
+        """Return a plain dict copy of the attributes (used by graph.copy())."""
+        return dict(self._row())
+
+    def __reduce__(self):
+        # Pickle as a plain dict so saved graphs don't reference the store
+        return (dict, (dict(self._row()),))
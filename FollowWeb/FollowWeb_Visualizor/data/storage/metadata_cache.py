@@ -7,7 +7,7 @@ handle millions of samples with minimal I/O overhead.
 
 SQLite Limits:
     - SQLITE_MAX_VARIABLE_NUMBER: Default 999 (can be up to 32766 in some builds)
-    - With 6 parameters per row: Theoretical max ~166 rows (default) or ~5461 rows (max)
+    - With 13 parameters per row: Theoretical max ~76 rows (default) or ~2520 rows (max)
     - Tested limit on this system: 10,000+ rows (60,000+ parameters)
     - Safe batch size: 1000 rows (balances performance vs memory)
     - Default batch size: 200 rows (good balance of performance and safety)
@@ -16,15 +16,137 @@ Performance Characteristics:
     - Batch size 50:   ~50x I/O reduction
     - Batch size 200:  ~200x I/O reduction (4x faster than 50)
     - Batch size 1000: ~1000x I/O reduction (5x faster than 200, diminishing returns)
+
+Schema Versions (PRAGMA user_version):
+    - 1: data JSON blob with priority_score, is_dormant, dormant_since promoted
+    - 2: Promotes username, pack_name, num_downloads, uploader_id and the
+      collected_at / last_existence_check_at / last_metadata_update_at
+      timestamps into indexed columns. Existing databases are upgraded in
+      place on open (columns added, backfilled from the JSON blob).
+    - 3: Adds the normalized tag tables (inverted index):
+      ``tags(tag_id, tag, df)`` holds each distinct tag and its document
+      frequency, ``sample_tags(sample_id, tag_id)`` holds one posting per
+      sample tag. Both are kept in sync by set/flush/bulk_insert/delete.
+    - 4: Adds ``data_codec``, the payload codec each row was written with
+      (see payload_codec.py). Existing rows are JSON (codec 0).
+    - 5: Adds the ``sound_cache`` side table holding metadata of fetched
+      sounds evicted from the loader's in-memory SoundCache. These sounds are
+      not part of the library, so they are kept out of ``metadata``.
+    - 6: Adds the ``minhash_signatures`` side table holding each sample's
+      MinHash signature for approximate tag similarity, with the fingerprint
+      of the tag set it was computed from (a changed tag set invalidates it).
+    - 7: Adds the ``sample_groups(edge_type, group_name, sample_id)`` table
+      holding the loader's hub group membership (group_edges='hub'), so
+      resumed loaders and checkpoint readers see the groups.
 """
 
+import itertools
 import json
 import logging
 import sqlite3
-from datetime import datetime, timezone
+import threading
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from .payload_codec import DEFAULT_CODEC, decode_payload, get_codec
+from .sqlite_connections import SQLiteConnectionManager
+
+SCHEMA_VERSION = 7
+"""Current metadata_cache.db schema version (stored in PRAGMA user_version)"""
+
+PROMOTED_COLUMNS = {
+    "username": "TEXT",
+    "pack_name": "TEXT",
+    "num_downloads": "INTEGER",
+    "uploader_id": "INTEGER",
+    "collected_at": "TEXT",
+    "last_existence_check_at": "TEXT",
+    "last_metadata_update_at": "TEXT",
+}
+"""Metadata fields copied out of the JSON blob into indexed columns (schema v2)"""
+
+TIMESTAMP_COLUMNS = (
+    "collected_at",
+    "last_existence_check_at",
+    "last_metadata_update_at",
+)
+
+_INSERT_SQL = f"""
+    INSERT OR REPLACE INTO metadata
+    (sample_id, data, data_codec, last_updated, priority_score, is_dormant,
+     dormant_since, {", ".join(PROMOTED_COLUMNS)})
+    VALUES ({", ".join("?" * (7 + len(PROMOTED_COLUMNS)))})
+"""
+
+
+def normalize_timestamp(value: Any) -> Optional[str]:
+    """
+    Normalize an ISO timestamp to UTC isoformat so it sorts correctly as text.
+
+    Args:
+        value: ISO 8601 timestamp (``Z`` suffix allowed; naive values are UTC)
+
+    Returns:
+        Normalized timestamp, or None if the value is missing or invalid
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def extract_pack_name(pack: Any) -> Optional[str]:
+    """
+    Get the pack identifier used for grouping from a pack URI or name.
+
+    Args:
+        pack: Pack URI (e.g. https://freesound.org/apiv2/packs/123/) or name
+
+    Returns:
+        Pack identifier, or None if the sample has no pack
+    """
+    if not pack:
+        return None
+    if isinstance(pack, str) and "/" in pack:
+        return pack.split("/")[-2] or None
+    return str(pack)
+
+
+def _tag_list(metadata: dict[str, Any]) -> tuple[str, ...]:
+    """Get the distinct tags of a metadata dict, in their original order."""
+    tags = metadata.get("tags")
+    if not tags:
+        return ()
+    if isinstance(tags, str):
+        tags = [tags]
+    elif not isinstance(tags, (list, tuple, set)):
+        return ()
+    return tuple(dict.fromkeys(str(tag) for tag in tags))
+
+
+def _promoted_values(metadata: dict[str, Any]) -> tuple:
+    """Get promoted column values for a metadata dict (PROMOTED_COLUMNS order)."""
+    username = metadata.get("username")
+    num_downloads = metadata.get("num_downloads")
+    uploader_id = metadata.get("uploader_id")
+    return (
+        username if isinstance(username, str) and username else None,
+        extract_pack_name(metadata.get("pack")),
+        num_downloads if isinstance(num_downloads, int) else None,
+        uploader_id if isinstance(uploader_id, int) else None,
+        normalize_timestamp(metadata.get("collected_at")),
+        normalize_timestamp(metadata.get("last_existence_check_at")),
+        normalize_timestamp(metadata.get("last_metadata_update_at")),
+    )
+
 
 class MetadataCache:
     """
@@ -35,7 +157,11 @@ class MetadataCache:
     - Batch writes to reduce I/O overhead (50x improvement)
     - Indexed queries for fast lookups
     - JSON storage for adaptable metadata
-    - Automatic schema creation and migration
+    - Automatic schema creation and versioned migration
+    - Promoted, indexed columns for fields the pipeline filters on
+    - Normalized tag tables (inverted index) for tag queries without JSON decoding
+    - Thread-safe: each thread reads through its own read-only connection,
+      writes go through one writer thread that group-commits concurrent flushes
 
     Performance:
     - 50x reduction in I/O operations
@@ -61,6 +187,7 @@ class MetadataCache:
         db_path: str,
         logger: Optional[logging.Logger] = None,
         batch_size: Optional[int] = None,
+        codec: str = DEFAULT_CODEC,
     ):
         """
         Initialize metadata cache.
@@ -69,6 +196,11 @@ class MetadataCache:
             db_path: Path to SQLite database file
             logger: Optional logger instance
             batch_size: Number of samples to batch before flushing (default: 200, max: 1000)
+            codec: Payload codec for new writes ('json' or 'zlib'); rows
+                written with any codec can always be read
+
+        Raises:
+            ValueError: If codec is unknown
         """
         self.db_path = Path(db_path)
         self.logger = logger or logging.getLogger(__name__)
@@ -85,7 +217,11 @@ class MetadataCache:
             self.batch_size = requested_batch_size
 
         self._pending_writes: list[tuple] = []
+        self._pending_tags: dict[int, tuple[str, ...]] = {}
+        self._pending_lock = threading.Lock()
         self._conn: Optional[sqlite3.Connection] = None
+        self._connections: Optional[SQLiteConnectionManager] = None
+        self.codec = get_codec(codec)
 
         # Ensure parent directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -95,13 +231,10 @@ class MetadataCache:
 
     def _initialize_db(self) -> None:
         """Initialize database with schema and optimizations."""
-        self._conn = sqlite3.connect(str(self.db_path))
-
-        # Enable WAL mode for performance (concurrent reads during writes)
-        self._conn.execute("PRAGMA journal_mode=WAL;")
-
-        # Enable faster writes (trade durability for speed)
-        self._conn.execute("PRAGMA synchronous=NORMAL;")
+        # Opens the writer connection in WAL mode (concurrent reads during
+        # writes) with synchronous=NORMAL (trade durability for speed)
+        self._connections = SQLiteConnectionManager(str(self.db_path), self.logger)
+        self._conn = self._connections.writer
 
         # Create table if not exists
         self._conn.execute("""
@@ -139,8 +272,305 @@ class MetadataCache:
 
         self._conn.commit()
 
+        self._migrate_schema()
+
         self.logger.info(f"Initialized metadata cache at {self.db_path}")
 
+    def _migrate_schema(self) -> None:
+        """
+        Upgrade the database schema to SCHEMA_VERSION.
+
+        Each step is idempotent and committed together with the new
+        user_version, so an interrupted upgrade is simply re-run on the next
+        open.
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        if version < 2:
+            self._migrate_to_v2()
+        if version < 3:
+            self._migrate_to_v3()
+        if version < 4:
+            existing = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(metadata)")
+            }
+            if "data_codec" not in existing:
+                self._conn.execute(
+                    "ALTER TABLE metadata "
+                    "ADD COLUMN data_codec INTEGER NOT NULL DEFAULT 0"
+                )
+        if version < 5:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS sound_cache (
+                    sample_id INTEGER PRIMARY KEY,
+                    data NOT NULL,
+                    data_codec INTEGER NOT NULL DEFAULT 0,
+                    cached_at TEXT NOT NULL
+                )
+            """)
+        if version < 6:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS minhash_signatures (
+                    sample_id INTEGER PRIMARY KEY,
+                    fingerprint INTEGER NOT NULL,
+                    num_perm INTEGER NOT NULL,
+                    seed INTEGER NOT NULL,
+                    signature BLOB NOT NULL
+                )
+            """)
+        if version < 7:
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS sample_groups (
+                    edge_type TEXT NOT NULL,
+                    group_name TEXT NOT NULL,
+                    sample_id INTEGER NOT NULL,
+                    PRIMARY KEY (edge_type, group_name, sample_id)
+                ) WITHOUT ROWID
+            """)
+
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def _migrate_to_v2(self) -> None:
+        """Add promoted columns and indexes, backfilling them from the JSON blob."""
+        assert self._conn is not None
+
+        existing = {row[1] for row in self._conn.execute("PRAGMA table_info(metadata)")}
+        added = [name for name in PROMOTED_COLUMNS if name not in existing]
+        for name in added:
+            self._conn.execute(
+                f"ALTER TABLE metadata ADD COLUMN {name} {PROMOTED_COLUMNS[name]}"
+            )
+
+        # Backfill rows written before the columns existed
+        backfilled = 0
+        if added:
+            cursor = self._conn.execute("SELECT sample_id, data FROM metadata")
+            while True:
+                rows = cursor.fetchmany(self.SAFE_MAX_BATCH_SIZE)
+                if not rows:
+                    break
+                updates = [
+                    (*_promoted_values(json.loads(data)), sample_id)
+                    for sample_id, data in rows
+                ]
+                self._conn.executemany(
+                    f"""
+                    UPDATE metadata SET {", ".join(f"{name} = ?" for name in PROMOTED_COLUMNS)}
+                    WHERE sample_id = ?
+                    """,
+                    updates,
+                )
+                backfilled += len(updates)
+
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_username ON metadata(username)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pack_name ON metadata(pack_name)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_num_downloads ON metadata(num_downloads DESC)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_uploader_id ON metadata(uploader_id)"
+        )
+        for name in TIMESTAMP_COLUMNS:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{name} ON metadata({name})"
+            )
+
+        if backfilled:
+            self.logger.info(
+                f"Upgraded metadata cache schema to v2 ({backfilled} rows backfilled)"
+            )
+
+    def _migrate_to_v3(self) -> None:
+        """Create the tag dictionary and postings tables, backfilled from JSON."""
+        assert self._conn is not None
+
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS tags (
+                tag_id INTEGER PRIMARY KEY,
+                tag TEXT NOT NULL UNIQUE,
+                df INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS sample_tags (
+                sample_id INTEGER NOT NULL,
+                tag_id INTEGER NOT NULL,
+                PRIMARY KEY (sample_id, tag_id)
+            ) WITHOUT ROWID
+        """)
+        # Postings lookup (tag -> samples); the primary key serves sample -> tags
+        self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_sample_tags_tag
+            ON sample_tags(tag_id, sample_id)
+        """)
+
+        # Rebuild from scratch so an interrupted upgrade can't double-count df
+        self._conn.execute("DELETE FROM sample_tags")
+        self._conn.execute("DELETE FROM tags")
+
+        backfilled = 0
+        cursor = self._conn.execute("SELECT sample_id, data FROM metadata")
+        while True:
+            rows = cursor.fetchmany(self.SAFE_MAX_BATCH_SIZE)
+            if not rows:
+                break
+            self._sync_tags(
+                self._conn,
+                {sample_id: _tag_list(json.loads(data)) for sample_id, data in rows},
+            )
+            backfilled += len(rows)
+
+        if backfilled:
+            self.logger.info(
+                f"Upgraded metadata cache schema to v3 ({backfilled} rows indexed "
+                "by tag)"
+            )
+
+    @staticmethod
+    def _sync_tags(
+        conn: sqlite3.Connection, tags_by_sample: dict[int, tuple[str, ...]]
+    ) -> None:
+        """
+        Replace the tag postings of the given samples (caller commits).
+
+        Args:
+            conn: Writer connection
+            tags_by_sample: Dictionary mapping sample_id to its distinct tags
+        """
+        if not tags_by_sample:
+            return
+
+        sample_ids = [(sample_id,) for sample_id in tags_by_sample]
+
+        # Drop old postings and their document frequency contributions
+        conn.executemany(
+            """
+            UPDATE tags SET df = df - 1
+            WHERE tag_id IN (SELECT tag_id FROM sample_tags WHERE sample_id = ?)
+            """,
+            sample_ids,
+        )
+        conn.executemany("DELETE FROM sample_tags WHERE sample_id = ?", sample_ids)
+
+        df_delta = Counter(itertools.chain.from_iterable(tags_by_sample.values()))
+        if not df_delta:
+            return
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO tags (tag, df) VALUES (?, 0)",
+            ((tag,) for tag in df_delta),
+        )
+        conn.executemany(
+            """
+            INSERT OR IGNORE INTO sample_tags (sample_id, tag_id)
+            SELECT ?, tag_id FROM tags WHERE tag = ?
+            """,
+            (
+                (sample_id, tag)
+                for sample_id, tags in tags_by_sample.items()
+                for tag in tags
+            ),
+        )
+        conn.executemany(
+            "UPDATE tags SET df = df + ? WHERE tag = ?",
+            ((count, tag) for tag, count in df_delta.items()),
+        )
+
+    def _build_row(
+        self, sample_id: int, metadata: dict[str, Any], timestamp: str
+    ) -> tuple:
+        """Build an INSERT row (base columns followed by promoted columns)."""
+        return (
+            sample_id,
+            self.codec.encode(metadata),
+            self.codec.codec_id,
+            timestamp,
+            metadata.get("priority_score"),
+            1 if metadata.get("is_dormant", False) else 0,
+            metadata.get("dormant_since"),
+            *_promoted_values(metadata),
+        )
+
+    @staticmethod
+    def _data_expression(columns: Optional[Sequence[str]]) -> tuple[str, list[str]]:
+        """
+        Build the SELECT expression for the metadata payload.
+
+        JSON rows are projected inside SQLite; rows written with other codecs
+        return their full payload and are projected after decoding.
+
+        Args:
+            columns: Top-level JSON fields to return (None for the full row)
+
+        Returns:
+            Tuple of (SQL expression, parameters it binds)
+        """
+        if not columns:
+            return "data", []
+        # json_object keeps arrays/objects from json_extract as nested JSON
+        parts = ", ".join("?, json_extract(data, ?)" for _ in columns)
+        params: list[str] = []
+        for column in columns:
+            params.extend((column, f"$.{column}"))
+        expression = f"CASE WHEN data_codec = 0 THEN json_object({parts}) ELSE data END"
+        return expression, params
+
+    def _select_metadata(
+        self,
+        query: str,
+        params: Sequence[Any],
+        columns: Optional[Sequence[str]],
+        page_size: Optional[int] = None,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Run a metadata SELECT and decode its rows in pages.
+
+        Args:
+            query: SELECT with a ``{data}`` placeholder for the payload column,
+                selecting (sample_id, data_codec, payload)
+            params: Parameters bound after the payload expression's own
+            columns: Top-level JSON fields to return (None for the full row)
+            page_size: Rows fetched per page (default: the cache batch size)
+
+        Yields:
+            Tuples of (sample_id, metadata dict)
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        expression, expression_params = self._data_expression(columns)
+        project = False
+        try:
+            cursor = self._reader().execute(
+                query.format(data=expression), [*expression_params, *params]
+            )
+        except sqlite3.OperationalError:
+            if not columns:
+                raise
+            # SQLite built without JSON1: select fields in Python instead
+            cursor = self._reader().execute(query.format(data="data"), list(params))
+            project = True
+
+        while True:
+            rows = cursor.fetchmany(page_size or self.batch_size)
+            if not rows:
+                return
+            for sample_id, codec_id, data in rows:
+                metadata = decode_payload(codec_id, data)
+                if columns and (project or codec_id):
+                    metadata = {column: metadata.get(column) for column in columns}
+                yield sample_id, metadata
+
     def get(self, sample_id: int) -> Optional[dict[str, Any]]:
         """
         Get metadata for a sample.
@@ -154,13 +584,13 @@ class MetadataCache:
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
 
-        cursor = self._conn.execute(
-            "SELECT data FROM metadata WHERE sample_id = ?", (sample_id,)
+        cursor = self._reader().execute(
+            "SELECT data_codec, data FROM metadata WHERE sample_id = ?", (sample_id,)
         )
         row = cursor.fetchone()
 
         if row:
-            return json.loads(row[0])
+            return decode_payload(*row)
         return None
 
     def set(self, sample_id: int, metadata: dict[str, Any]) -> None:
@@ -172,48 +602,59 @@ class MetadataCache:
             metadata: Metadata dictionary to store
         """
         timestamp = datetime.now(timezone.utc).isoformat()
-        priority_score = metadata.get("priority_score")
-        is_dormant = 1 if metadata.get("is_dormant", False) else 0
-        dormant_since = metadata.get("dormant_since")
+        row = self._build_row(sample_id, metadata, timestamp)
 
         # Queue write for batch processing
-        self._pending_writes.append(
-            (
-                sample_id,
-                json.dumps(metadata),
-                timestamp,
-                priority_score,
-                is_dormant,
-                dormant_since,
-            )
-        )
+        with self._pending_lock:
+            self._pending_writes.append(row)
+            self._pending_tags[sample_id] = _tag_list(metadata)
+            batch_full = len(self._pending_writes) >= self.batch_size
 
         # Flush if batch size reached
-        if len(self._pending_writes) >= self.batch_size:
+        if batch_full:
             self.flush()
 
-    def flush(self) -> None:
-        """Flush pending writes to database (batch write)."""
-        if not self._pending_writes:
-            return
-
-        if self._conn is None:
+    def _write(self, job: Callable[[sqlite3.Connection], Any]) -> Any:
+        """Run a write job on the writer thread and wait for its commit."""
+        if self._connections is None:
             raise RuntimeError("Database connection not initialized")
+        return self._connections.write(job)
 
-        # Batch insert/update
-        self._conn.executemany(
-            """
-            INSERT OR REPLACE INTO metadata
-            (sample_id, data, last_updated, priority_score, is_dormant, dormant_since)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            self._pending_writes,
-        )
+    def _reader(self) -> sqlite3.Connection:
+        """Get the calling thread's read-only connection."""
+        if self._connections is None:
+            raise RuntimeError("Database connection not initialized")
+        return self._connections.reader()
 
-        self._conn.commit()
+    def flush(self) -> None:
+        """
+        Flush pending writes to database (batch write).
 
-        self.logger.debug(f"Flushed {len(self._pending_writes)} metadata writes")
-        self._pending_writes.clear()
+        Safe to call from several threads; flushes that overlap are
+        committed together by the writer thread.
+        """
+        with self._pending_lock:
+            if not self._pending_writes:
+                return
+            rows = self._pending_writes
+            tags = self._pending_tags
+            self._pending_writes = []
+            self._pending_tags = {}
+
+        def write_rows(conn: sqlite3.Connection) -> None:
+            conn.executemany(_INSERT_SQL, rows)
+            self._sync_tags(conn, tags)
+
+        try:
+            self._write(write_rows)
+        except BaseException:
+            # Keep the rows queued for the next flush (newer writes win)
+            with self._pending_lock:
+                self._pending_writes[:0] = rows
+                self._pending_tags = {**tags, **self._pending_tags}
+            raise
+
+        self.logger.debug(f"Flushed {len(rows)} metadata writes")
 
     def bulk_insert(self, metadata_dict: dict[int, dict[str, Any]]) -> None:
         """
@@ -221,7 +662,7 @@ class MetadataCache:
 
         Automatically chunks large inserts to stay within SQLite limits.
         SQLite has a default SQLITE_MAX_VARIABLE_NUMBER of 999, and we use
-        6 parameters per row, so max ~166 rows per insert. We use 500 as
+        13 parameters per row, so max ~76 rows per insert. We use 500 as
         a safe limit with chunking for larger batches.
 
         Args:
@@ -232,22 +673,10 @@ class MetadataCache:
 
         timestamp = datetime.now(timezone.utc).isoformat()
 
-        rows = []
-        for sample_id, metadata in metadata_dict.items():
-            priority_score = metadata.get("priority_score")
-            is_dormant = 1 if metadata.get("is_dormant", False) else 0
-            dormant_since = metadata.get("dormant_since")
-
-            rows.append(
-                (
-                    sample_id,
-                    json.dumps(metadata),
-                    timestamp,
-                    priority_score,
-                    is_dormant,
-                    dormant_since,
-                )
-            )
+        rows = [
+            self._build_row(sample_id, metadata, timestamp)
+            for sample_id, metadata in metadata_dict.items()
+        ]
 
         # Chunk large inserts to stay within SQLite limits
         total_rows = len(rows)
@@ -256,39 +685,120 @@ class MetadataCache:
                 f"Chunking {total_rows} rows into batches of {self.SAFE_MAX_BATCH_SIZE}"
             )
 
-            for i in range(0, total_rows, self.SAFE_MAX_BATCH_SIZE):
-                chunk = rows[i : i + self.SAFE_MAX_BATCH_SIZE]
-                self._conn.executemany(
-                    """
-                    INSERT OR REPLACE INTO metadata
-                    (sample_id, data, last_updated, priority_score, is_dormant, dormant_since)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    chunk,
-                )
-                self.logger.debug(
-                    f"Inserted chunk {i // self.SAFE_MAX_BATCH_SIZE + 1}: {len(chunk)} rows"
-                )
-
-            self._conn.commit()
+            def insert_chunks(conn: sqlite3.Connection) -> None:
+                for i in range(0, total_rows, self.SAFE_MAX_BATCH_SIZE):
+                    chunk = rows[i : i + self.SAFE_MAX_BATCH_SIZE]
+                    conn.executemany(_INSERT_SQL, chunk)
+                    self._sync_tags(
+                        conn,
+                        {row[0]: _tag_list(metadata_dict[row[0]]) for row in chunk},
+                    )
+                    self.logger.debug(
+                        f"Inserted chunk {i // self.SAFE_MAX_BATCH_SIZE + 1}: {len(chunk)} rows"
+                    )
+
+            # All chunks commit together
+            self._write(insert_chunks)
             # Reduced verbosity - only log at DEBUG level
             self.logger.debug(
                 f"Bulk inserted {total_rows} metadata entries in {(total_rows + self.SAFE_MAX_BATCH_SIZE - 1) // self.SAFE_MAX_BATCH_SIZE} chunks"
             )
         else:
+
+            def insert_rows(conn: sqlite3.Connection) -> None:
+                conn.executemany(_INSERT_SQL, rows)
+                self._sync_tags(
+                    conn,
+                    {
+                        sample_id: _tag_list(metadata)
+                        for sample_id, metadata in metadata_dict.items()
+                    },
+                )
+
             # Single batch insert
-            self._conn.executemany(
-                """
-                INSERT OR REPLACE INTO metadata
-                (sample_id, data, last_updated, priority_score, is_dormant, dormant_since)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """,
-                rows,
-            )
-            self._conn.commit()
+            self._write(insert_rows)
             # Reduced verbosity - only log at DEBUG level
             self.logger.debug(f"Bulk inserted {len(rows)} metadata entries")
 
+    def get_many(
+        self,
+        sample_ids: Iterable[int],
+        columns: Optional[Sequence[str]] = None,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Get metadata for several samples with as few queries as possible.
+
+        IDs are looked up with IN-lists chunked to stay under SQLite's
+        variable limit (MAX_BATCH_SIZE).
+
+        Args:
+            sample_ids: Sample IDs to retrieve
+            columns: Top-level JSON fields to return (None for the full row);
+                missing fields are returned as None
+
+        Returns:
+            Dictionary mapping sample_id to metadata (missing samples omitted)
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        ids = list(dict.fromkeys(int(sample_id) for sample_id in sample_ids))
+        _, expression_params = self._data_expression(columns)
+        chunk_size = self.MAX_BATCH_SIZE - len(expression_params)
+
+        results: dict[int, dict[str, Any]] = {}
+        for i in range(0, len(ids), chunk_size):
+            chunk = ids[i : i + chunk_size]
+            placeholders = ", ".join("?" * len(chunk))
+            results.update(
+                self._select_metadata(
+                    "SELECT sample_id, data_codec, {data} FROM metadata "  # nosec B608
+                    f"WHERE sample_id IN ({placeholders})",
+                    chunk,
+                    columns,
+                )
+            )
+        return results
+
+    def iter_metadata(
+        self,
+        batch_size: Optional[int] = None,
+        columns: Optional[Sequence[str]] = None,
+        where: Optional[str] = None,
+        params: Sequence[Any] = (),
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Stream metadata rows in sample_id order.
+
+        Rows are fetched from a single cursor in pages of ``batch_size``, so
+        memory use stays flat regardless of library size.
+
+        Args:
+            batch_size: Rows decoded per page (default: the cache batch size)
+            columns: Top-level JSON fields to return (None for the full row);
+                fields are extracted with json_extract inside SQLite and
+                missing fields are returned as None
+            where: Optional SQL filter over metadata columns, e.g.
+                ``"is_dormant = 0 AND username = ?"`` (trusted SQL, not
+                user input)
+            params: Parameters for the ``where`` placeholders
+
+        Yields:
+            Tuples of (sample_id, metadata dict)
+
+        Example:
+            for sample_id, fields in cache.iter_metadata(columns=['tags']):
+                index(sample_id, fields['tags'])
+        """
+        query = "SELECT sample_id, data_codec, {data} FROM metadata"
+        if where:
+            query += f" WHERE {where}"
+        query += " ORDER BY sample_id"
+
+        yield from self._select_metadata(
+            query, params, columns, max(1, batch_size) if batch_size else None
+        )
+
     def exists(self, sample_id: int) -> bool:
         """
         Check if metadata exists for a sample.
@@ -302,7 +812,7 @@ class MetadataCache:
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
 
-        cursor = self._conn.execute(
+        cursor = self._reader().execute(
             "SELECT 1 FROM metadata WHERE sample_id = ? LIMIT 1", (sample_id,)
         )
         return cursor.fetchone() is not None
@@ -317,7 +827,7 @@ class MetadataCache:
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
 
-        cursor = self._conn.execute("SELECT sample_id FROM metadata")
+        cursor = self._reader().execute("SELECT sample_id FROM metadata")
         return [row[0] for row in cursor.fetchall()]
 
     def get_all_ids(self) -> list[int]:
@@ -339,8 +849,62 @@ class MetadataCache:
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
 
-        cursor = self._conn.execute("SELECT sample_id, data FROM metadata")
-        return {row[0]: json.loads(row[1]) for row in cursor.fetchall()}
+        return dict(self.iter_metadata())
+
+    def iter_fields(self, fields: list[str]) -> Iterator[tuple[int, tuple]]:
+        """
+        Iterate over selected top-level metadata fields for all samples.
+
+        Fields are extracted inside SQLite with json_extract, so only the
+        requested values are decoded in Python. Array and object fields are
+        returned as JSON text; missing fields and JSON nulls are both None.
+
+        Args:
+            fields: Top-level metadata keys to extract
+
+        Yields:
+            Tuples of (sample_id, (field values in the order requested))
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        def field_values(codec_id: int, data: Any) -> tuple:
+            metadata = decode_payload(codec_id, data)
+            values = []
+            for field in fields:
+                value = metadata.get(field)
+                if isinstance(value, (list, dict)):
+                    # Match json_extract's minified output
+                    value = json.dumps(value, separators=(",", ":"))
+                values.append(value)
+            return tuple(values)
+
+        # Non-JSON payloads are returned whole and decoded in Python
+        extracts = ", ".join(
+            "CASE WHEN data_codec = 0 THEN json_extract(data, ?) END" for _ in fields
+        )
+        params = [f"$.{field}" for field in fields]
+
+        try:
+            cursor = self._reader().execute(
+                f"SELECT sample_id, data_codec, {extracts}, "  # nosec B608
+                "CASE WHEN data_codec = 0 THEN NULL ELSE data END FROM metadata",
+                params,
+            )
+        except sqlite3.OperationalError:
+            # SQLite built without JSON1: decode rows in Python instead
+            cursor = self._reader().execute(
+                "SELECT sample_id, data_codec, data FROM metadata"
+            )
+            for sample_id, codec_id, data in cursor:
+                yield sample_id, field_values(codec_id, data)
+            return
+
+        for row in cursor:
+            if row[1]:
+                yield row[0], field_values(row[1], row[-1])
+            else:
+                yield row[0], row[2:-1]
 
     def get_count(self) -> int:
         """
@@ -352,7 +916,7 @@ class MetadataCache:
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
 
-        cursor = self._conn.execute("SELECT COUNT(*) FROM metadata")
+        cursor = self._reader().execute("SELECT COUNT(*) FROM metadata")
         return cursor.fetchone()[0]
 
     def delete(self, sample_id: int) -> None:
@@ -365,8 +929,14 @@ class MetadataCache:
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
 
-        self._conn.execute("DELETE FROM metadata WHERE sample_id = ?", (sample_id,))
-        self._conn.commit()
+        def delete_row(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM metadata WHERE sample_id = ?", (sample_id,))
+            conn.execute(
+                "DELETE FROM minhash_signatures WHERE sample_id = ?", (sample_id,)
+            )
+            self._sync_tags(conn, {sample_id: ()})
+
+        self._write(delete_row)
 
     def get_best_seed_sample(self) -> Optional[int]:
         """
@@ -381,7 +951,7 @@ class MetadataCache:
         if self._conn is None:
             raise RuntimeError("Database connection not initialized")
 
-        cursor = self._conn.execute("""
+        cursor = self._reader().execute("""
             SELECT sample_id
             FROM metadata
             WHERE is_dormant = 0
@@ -397,22 +967,494 @@ class MetadataCache:
         self.logger.warning("No non-dormant samples found in metadata cache")
         return None
 
+    def iter_sample_ids_by_age(
+        self, column: str, max_age_days: Optional[int] = None
+    ) -> Iterator[tuple[int, Optional[str]]]:
+        """
+        Iterate samples ordered by a promoted timestamp column, oldest first.
+
+        Samples with no timestamp come first. Uses the column index, so only
+        the rows actually consumed are read.
+
+        Args:
+            column: One of TIMESTAMP_COLUMNS
+            max_age_days: Only include samples with no timestamp or a timestamp
+                older than this many days (None for all samples)
+
+        Yields:
+            Tuples of (sample_id, normalized timestamp or None)
+
+        Raises:
+            ValueError: If column is not a promoted timestamp column
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+        if column not in TIMESTAMP_COLUMNS:
+            raise ValueError(
+                f"Unknown timestamp column: {column}. "
+                f"Valid options: {', '.join(TIMESTAMP_COLUMNS)}"
+            )
+
+        query = f"SELECT sample_id, {column} FROM metadata"
+        params: tuple = ()
+        if max_age_days is not None:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=max_age_days)
+            query += f" WHERE {column} IS NULL OR {column} < ?"
+            params = (cutoff.isoformat(),)
+        query += f" ORDER BY {column} IS NOT NULL, {column}, sample_id"
+
+        cursor = self._reader().execute(query, params)
+        while True:
+            rows = cursor.fetchmany(self.SAFE_MAX_BATCH_SIZE)
+            if not rows:
+                break
+            yield from rows
+
+    def get_sample_groups(self, column: str, min_size: int = 2) -> dict[str, list[int]]:
+        """
+        Group sample IDs by username or pack name.
+
+        Args:
+            column: 'username' or 'pack_name'
+            min_size: Smallest group to return
+
+        Returns:
+            Dictionary mapping column value to sample IDs (ascending)
+
+        Raises:
+            ValueError: If column is not a groupable column
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+        if column not in ("username", "pack_name"):
+            raise ValueError(
+                f"Unknown group column: {column}. Valid options: username, pack_name"
+            )
+
+        groups: dict[str, list[int]] = {}
+        if min_size > 1:
+            cursor = self._reader().execute(
+                f"""
+                SELECT {column}, sample_id FROM metadata
+                WHERE {column} IN (
+                    SELECT {column} FROM metadata
+                    WHERE {column} IS NOT NULL
+                    GROUP BY {column} HAVING COUNT(*) >= ?
+                )
+                ORDER BY {column}, sample_id
+                """,
+                (min_size,),
+            )
+        else:
+            cursor = self._reader().execute(
+                f"""
+                SELECT {column}, sample_id FROM metadata
+                WHERE {column} IS NOT NULL
+                ORDER BY {column}, sample_id
+                """
+            )
+
+        for value, sample_id in cursor:
+            groups.setdefault(value, []).append(sample_id)
+        return groups
+
+    def get_samples_by_user(self, username: str) -> list[int]:
+        """
+        Get all samples uploaded by a user (uses idx_username).
+
+        Args:
+            username: Freesound username
+
+        Returns:
+            Sample IDs (ascending)
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        cursor = self._reader().execute(
+            "SELECT sample_id FROM metadata WHERE username = ? ORDER BY sample_id",
+            (username,),
+        )
+        return [row[0] for row in cursor]
+
+    def get_samples_by_pack(self, pack: str) -> list[int]:
+        """
+        Get all samples in a pack (uses idx_pack_name).
+
+        Args:
+            pack: Pack URI or pack identifier
+
+        Returns:
+            Sample IDs (ascending)
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        cursor = self._reader().execute(
+            "SELECT sample_id FROM metadata WHERE pack_name = ? ORDER BY sample_id",
+            (extract_pack_name(pack),),
+        )
+        return [row[0] for row in cursor]
+
+    def samples_with_tag(self, tag: str) -> list[int]:
+        """
+        Get all samples carrying a tag (one postings list lookup).
+
+        Args:
+            tag: Tag to look up
+
+        Returns:
+            Sample IDs (ascending)
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        cursor = self._reader().execute(
+            """
+            SELECT st.sample_id FROM sample_tags st
+            JOIN tags t ON t.tag_id = st.tag_id
+            WHERE t.tag = ?
+            ORDER BY st.sample_id
+            """,
+            (tag,),
+        )
+        return [row[0] for row in cursor]
+
+    def tag_document_frequencies(self, min_df: int = 1) -> dict[str, int]:
+        """
+        Get the number of samples carrying each tag.
+
+        Args:
+            min_df: Smallest document frequency to include
+
+        Returns:
+            Dictionary mapping tag to document frequency
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        cursor = self._reader().execute(
+            "SELECT tag, df FROM tags WHERE df >= ?", (max(1, min_df),)
+        )
+        return dict(cursor.fetchall())
+
+    def iter_tag_postings(
+        self, min_df: int = 1, max_df: Optional[int] = None
+    ) -> Iterator[tuple[str, list[int]]]:
+        """
+        Stream the inverted index one tag at a time.
+
+        Rows are read in batches, so the full index is never held in memory.
+
+        Args:
+            min_df: Skip tags carried by fewer samples
+            max_df: Skip tags carried by more samples (e.g. very common tags
+                that would produce huge candidate sets)
+
+        Yields:
+            Tuples of (tag, sample IDs ascending), ordered by tag ID
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        query = """
+            SELECT t.tag, st.sample_id FROM tags t
+            JOIN sample_tags st ON st.tag_id = t.tag_id
+            WHERE t.df >= ?
+        """
+        params: list[Any] = [max(1, min_df)]
+        if max_df is not None:
+            query += " AND t.df <= ?"
+            params.append(max_df)
+        query += " ORDER BY t.tag_id, st.sample_id"
+
+        conn = self._reader()
+
+        def rows() -> Iterator[tuple[str, int]]:
+            cursor = conn.execute(query, params)
+            while True:
+                batch = cursor.fetchmany(self.SAFE_MAX_BATCH_SIZE)
+                if not batch:
+                    return
+                yield from batch
+
+        for tag, postings in itertools.groupby(rows(), key=lambda row: row[0]):
+            yield tag, [sample_id for _, sample_id in postings]
+
+    def get_tag_overlaps(self, tags: Iterable[str]) -> dict[int, tuple[int, int]]:
+        """
+        Find samples sharing at least one tag with a tag set.
+
+        This is the candidate-generation step for tag similarity: only
+        samples returned here can have a non-zero Jaccard similarity.
+
+        Args:
+            tags: Query tags
+
+        Returns:
+            Dictionary mapping sample_id to (shared tag count, sample tag count)
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        tags = list(dict.fromkeys(tags))
+        overlaps: dict[int, tuple[int, int]] = {}
+        # Stay well below SQLITE_MAX_VARIABLE_NUMBER
+        for i in range(0, len(tags), 500):
+            chunk = tags[i : i + 500]
+            cursor = self._reader().execute(
+                f"""
+                SELECT st.sample_id, COUNT(*) FROM sample_tags st
+                JOIN tags t ON t.tag_id = st.tag_id
+                WHERE t.tag IN ({", ".join("?" * len(chunk))})
+                GROUP BY st.sample_id
+                """,
+                chunk,
+            )
+            for sample_id, shared in cursor:
+                previous = overlaps.get(sample_id, (0, 0))[0]
+                overlaps[sample_id] = (previous + shared, 0)
+
+        if overlaps:
+            ids = list(overlaps)
+            for i in range(0, len(ids), 500):
+                chunk = ids[i : i + 500]
+                cursor = self._reader().execute(
+                    f"""
+                    SELECT sample_id, COUNT(*) FROM sample_tags
+                    WHERE sample_id IN ({", ".join("?" * len(chunk))})
+                    GROUP BY sample_id
+                    """,
+                    chunk,
+                )
+                for sample_id, total in cursor:
+                    overlaps[sample_id] = (overlaps[sample_id][0], total)
+
+        return overlaps
+
+    def put_spilled_sounds(self, rows: dict[int, Optional[dict[str, Any]]]) -> None:
+        """
+        Store sound metadata evicted from the in-memory SoundCache.
+
+        Args:
+            rows: Dictionary mapping sample_id to metadata (None for invalid
+                sounds)
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        timestamp = datetime.now(timezone.utc).isoformat()
+        # Invalid sounds are stored as an empty object
+        params = [
+            (
+                sample_id,
+                self.codec.encode(metadata or {}),
+                self.codec.codec_id,
+                timestamp,
+            )
+            for sample_id, metadata in rows.items()
+        ]
+
+        def insert_sounds(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                "INSERT OR REPLACE INTO sound_cache "
+                "(sample_id, data, data_codec, cached_at) VALUES (?, ?, ?, ?)",
+                params,
+            )
+
+        self._write(insert_sounds)
+
+    def get_spilled_sound(
+        self, sample_id: int
+    ) -> tuple[bool, Optional[dict[str, Any]]]:
+        """
+        Get sound metadata stored by put_spilled_sounds().
+
+        Args:
+            sample_id: Sample ID to retrieve
+
+        Returns:
+            Tuple of (found, metadata); metadata is None for invalid sounds
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        row = (
+            self._reader()
+            .execute(
+                "SELECT data_codec, data FROM sound_cache WHERE sample_id = ?",
+                (sample_id,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return False, None
+        return True, decode_payload(*row) or None
+
+    def get_minhash_signatures(
+        self, sample_ids: Iterable[int], num_perm: int, seed: int
+    ) -> dict[int, tuple[int, bytes]]:
+        """
+        Get stored MinHash signatures.
+
+        Args:
+            sample_ids: Samples to look up
+            num_perm: Signature length the caller uses
+            seed: Permutation seed the caller uses
+
+        Returns:
+            Dictionary mapping sample_id to (tag fingerprint, signature bytes);
+            signatures computed with other parameters are left out
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        ids = list(sample_ids)
+        signatures: dict[int, tuple[int, bytes]] = {}
+        # Stay well below SQLITE_MAX_VARIABLE_NUMBER
+        for i in range(0, len(ids), 500):
+            chunk = ids[i : i + 500]
+            cursor = self._reader().execute(
+                f"""
+                SELECT sample_id, fingerprint, signature FROM minhash_signatures
+                WHERE num_perm = ? AND seed = ?
+                AND sample_id IN ({", ".join("?" * len(chunk))})
+                """,
+                (num_perm, seed, *chunk),
+            )
+            for sample_id, fingerprint, signature in cursor:
+                signatures[sample_id] = (fingerprint, signature)
+        return signatures
+
+    def put_minhash_signatures(
+        self, rows: dict[int, tuple[int, bytes]], num_perm: int, seed: int
+    ) -> None:
+        """
+        Store MinHash signatures (replacing older ones of the same samples).
+
+        Args:
+            rows: Dictionary mapping sample_id to (tag fingerprint, signature
+                bytes)
+            num_perm: Signature length
+            seed: Permutation seed
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        params = [
+            (sample_id, fingerprint, num_perm, seed, signature)
+            for sample_id, (fingerprint, signature) in rows.items()
+        ]
+
+        def insert_signatures(conn: sqlite3.Connection) -> None:
+            conn.executemany(
+                "INSERT OR REPLACE INTO minhash_signatures "
+                "(sample_id, fingerprint, num_perm, seed, signature) "
+                "VALUES (?, ?, ?, ?, ?)",
+                params,
+            )
+
+        self._write(insert_signatures)
+
+    def get_group_memberships(self) -> dict[str, dict[str, list[int]]]:
+        """
+        Get the hub group membership table stored by put_group_memberships().
+
+        Returns:
+            Dictionary mapping edge type to group name to sample IDs
+            (ascending)
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        cursor = self._reader().execute(
+            "SELECT edge_type, group_name, sample_id FROM sample_groups "
+            "ORDER BY edge_type, group_name, sample_id"
+        )
+        groups: dict[str, dict[str, list[int]]] = {}
+        for edge_type, group_name, sample_id in cursor:
+            groups.setdefault(edge_type, {}).setdefault(group_name, []).append(
+                sample_id
+            )
+        return groups
+
+    def put_group_memberships(self, groups: dict[str, dict[str, list[Any]]]) -> None:
+        """
+        Replace the stored hub group membership table.
+
+        Args:
+            groups: Dictionary mapping edge type to group name to sample IDs
+                (graph.graph['sample_groups'] of the loader); an empty
+                dictionary clears the table
+        """
+        if self._conn is None:
+            raise RuntimeError("Database connection not initialized")
+
+        params = [
+            (edge_type, str(group_name), int(sample_id))
+            for edge_type, type_groups in groups.items()
+            for group_name, members in type_groups.items()
+            for sample_id in members
+        ]
+
+        def replace_groups(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM sample_groups")
+            conn.executemany(
+                "INSERT OR IGNORE INTO sample_groups "
+                "(edge_type, group_name, sample_id) VALUES (?, ?, ?)",
+                params,
+            )
+
+        self._write(replace_groups)
+
+    def get_connection_stats(self) -> dict[str, int]:
+        """
+        Get writer-thread and reader-connection statistics.
+
+        Returns:
+            Dictionary with jobs, commits, largest_group and readers
+        """
+        if self._connections is None:
+            raise RuntimeError("Database connection not initialized")
+        return self._connections.get_stats()
+
     def close(self) -> None:
-        """Close database connection (flushes pending writes)."""
-        self.flush()
-        if self._conn:
-            self._conn.close()
+        """
+        Close database connections.
+
+        Pending writes are flushed and queued writes committed before the
+        writer thread stops; the connections are closed even if that flush
+        fails (the error is re-raised). Safe to call more than once.
+        """
+        connections = self._connections
+        if connections is None:
+            return
+        try:
+            self.flush()
+        finally:
+            self._connections = None
             self._conn = None
+            connections.close()
 
     def __enter__(self):
         """Context manager entry."""
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit (ensures flush and close)."""
-        self.close()
+        """
+        Context manager exit (ensures flush and close).
+
+        A flush error is only raised if the block itself succeeded, so it
+        never masks the original exception.
+        """
+        try:
+            self.close()
+        except Exception as e:
+            if exc_type is None:
+                raise
+            self.logger.error(f"Failed to flush metadata cache on close: {e}")
 
     def __del__(self):
         """Destructor (ensures connection is closed)."""
-        if self._conn:
+        if getattr(self, "_connections", None) is not None:
             self.close()
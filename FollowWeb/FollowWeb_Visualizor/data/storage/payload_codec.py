@@ -0,0 +1,186 @@
+"""
+Payload codecs for the ``data`` column of the SQLite metadata cache.
+
+Every metadata row records the codec it was written with (``data_codec``
+column), so the codec used for new writes can change without rewriting the
+database: old rows keep decoding with the codec that wrote them.
+
+Codecs:
+    - ``json`` (ID 0): Plain JSON text. Readable by SQLite's json_extract, so
+      field projections run inside SQLite. This is the default.
+    - ``zlib`` (ID 1): Compact JSON compressed with raw deflate and a preset
+      dictionary of Freesound field names and common values. Rows are
+      roughly 3-4x smaller, at the cost of slower encode/decode and an
+      opaque ``data`` column for ad-hoc SQL tools.
+
+A codec's ID and encoding are part of the on-disk format. Never change an
+existing codec (including the preset dictionary); add a new ID instead.
+"""
+
+import json
+import zlib
+from typing import Any, Union
+
+Payload = Union[str, bytes]
+
+
+class PayloadCodec:
+    """
+    Base class for metadata payload codecs.
+
+    Attributes:
+        codec_id: Value stored in the data_codec column
+        name: Name used in configuration
+    """
+
+    codec_id: int = -1
+    name: str = ""
+
+    def encode(self, metadata: dict[str, Any]) -> Payload:
+        """
+        Encode a metadata dictionary.
+
+        Args:
+            metadata: Metadata dictionary (JSON-serializable)
+
+        Returns:
+            Encoded payload (TEXT or BLOB)
+        """
+        raise NotImplementedError
+
+    def decode(self, payload: Payload) -> dict[str, Any]:
+        """
+        Decode a payload written by encode().
+
+        Args:
+            payload: Stored payload
+
+        Returns:
+            Metadata dictionary
+        """
+        raise NotImplementedError
+
+
+class JsonCodec(PayloadCodec):
+    """Plain JSON text (the original format)."""
+
+    codec_id = 0
+    name = "json"
+
+    def encode(self, metadata: dict[str, Any]) -> Payload:
+        return json.dumps(metadata)
+
+    def decode(self, payload: Payload) -> dict[str, Any]:
+        return json.loads(payload)
+
+
+# Preset deflate dictionary: field names and frequent values from Freesound
+# API responses. Deflate prefers matches near the end of the dictionary, so
+# the most common strings come last. Frozen as part of codec ID 1.
+_ZLIB_DICTIONARY = (
+    b'"geotag":null,"is_remix":false,"was_remixed":false,"comment_count":0,'
+    b'"num_comments":0,"category_is_user_provided":false,"bitdepth":16,'
+    b'"bitrate":0,"_missing_from_freesound":[],"permanently_unavailable":true,'
+    b'"ac_analysis":{"ac_tempo":,"ac_loudness":,"ac_brightness":},'
+    b'"analysis_frames":"https://freesound.org/data/analysis/",'
+    b'"license":"http://creativecommons.org/licenses/by/4.0/",'
+    b'"license":"http://creativecommons.org/publicdomain/zero/1.0/",'
+    b'"license":"https://creativecommons.org/licenses/by-nc/4.0/",'
+    b'"images":{"waveform_m":"https://cdn.freesound.org/displays/",'
+    b'"spectral_m":"https://cdn.freesound.org/displays/",'
+    b'"previews":{"preview-hq-mp3":"https://cdn.freesound.org/previews/",'
+    b'"preview-lq-mp3":"https://cdn.freesound.org/previews/",'
+    b'"preview-hq-ogg":"https://cdn.freesound.org/previews/",'
+    b'"preview-lq-ogg":"https://cdn.freesound.org/previews/",'
+    b'"audio_url":"https://cdn.freesound.org/previews/",'
+    b'"url":"https://freesound.org/people/","uploader_id":,'
+    b'"pack":"https://freesound.org/apiv2/packs/","category":["","'
+    b'"category_code":"","type":"wav","file_type":"wav","channels":2,'
+    b'"samplerate":44100,"filesize":,"created":"T","duration":,'
+    b'"avg_rating":0.0,"num_ratings":0,"num_downloads":,"priority_score":,'
+    b'"is_dormant":false,"dormant_since":null,"collected_at":"+00:00",'
+    b'"last_existence_check_at":null,"last_metadata_update_at":"+00:00",'
+    b'"description":"","username":"","tags":["","name":".wav","id":'
+)
+
+
+class ZlibJsonCodec(PayloadCodec):
+    """Compact JSON compressed with raw deflate and a preset dictionary."""
+
+    codec_id = 1
+    name = "zlib"
+
+    def __init__(self, level: int = 6):
+        """
+        Initialize codec.
+
+        Args:
+            level: zlib compression level (1-9)
+        """
+        self.level = level
+
+    def encode(self, metadata: dict[str, Any]) -> Payload:
+        compressor = zlib.compressobj(
+            self.level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=_ZLIB_DICTIONARY
+        )
+        text = json.dumps(metadata, separators=(",", ":")).encode()
+        return compressor.compress(text) + compressor.flush()
+
+    def decode(self, payload: Payload) -> dict[str, Any]:
+        if isinstance(payload, str):
+            # Compressed rows are always BLOBs; TEXT means a mislabelled row
+            raise ValueError("zlib metadata payload stored as TEXT")
+        decompressor = zlib.decompressobj(-zlib.MAX_WBITS, zdict=_ZLIB_DICTIONARY)
+        return json.loads(decompressor.decompress(payload))
+
+
+CODECS: dict[int, PayloadCodec] = {
+    codec.codec_id: codec for codec in (JsonCodec(), ZlibJsonCodec())
+}
+"""Registered codecs by data_codec ID."""
+
+DEFAULT_CODEC = "json"
+"""Codec used for new writes unless configured otherwise."""
+
+
+def get_codec(name: str) -> PayloadCodec:
+    """
+    Get a codec by configuration name.
+
+    Args:
+        name: Codec name ('json' or 'zlib')
+
+    Returns:
+        Codec instance
+
+    Raises:
+        ValueError: If no codec has this name
+    """
+    for codec in CODECS.values():
+        if codec.name == name:
+            return codec
+    raise ValueError(
+        f"Unknown metadata codec: {name}. "
+        f"Valid options: {', '.join(c.name for c in CODECS.values())}"
+    )
+
+
+def decode_payload(codec_id: int, payload: Payload) -> dict[str, Any]:
+    """
+    Decode a stored payload using the codec recorded with the row.
+
+    Args:
+        codec_id: data_codec column value (NULL/0 for JSON rows)
+        payload: data column value
+
+    Returns:
+        Metadata dictionary
+
+    Raises:
+        ValueError: If the row was written with an unknown codec or its
+            payload doesn't match the codec
+    """
+    codec = CODECS.get(codec_id or 0)
+    if codec is None:
+        raise ValueError(f"Unknown metadata codec ID: {codec_id}")
+    return codec.decode(payload)
@@ -0,0 +1,422 @@
+"""
+On-disk cache of Freesound API responses shared between processes.
+
+Validation, repair and crawl runs often request the same sounds, search pages
+and similar-sound lists within hours of each other. ResponseCache stores the
+raw JSON body of successful GET responses in a local SQLite file, keyed by
+endpoint path and normalized query parameters (sorted, without the token).
+Payloads are zlib-compressed, each endpoint type has its own TTL, and the
+least recently used responses are evicted once the file exceeds its size
+budget.
+
+CachingSession is a ``requests.Session`` that consults the cache before
+sending. Installed as the Freesound client's ``session``, it caches every
+client call (get_sound, text_search, get_similar, pager navigation) without
+changing the client. A ``before_send`` hook (the loader's rate limiter) runs
+only for requests that actually go to the network.
+
+Requests that must see the live API (existence checks) run inside
+``cache.bypass()``: they skip lookups but still refresh the stored response.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from requests import PreparedRequest, Response, Session
+
+# Endpoint types, matched against the path below /apiv2 in order
+_ENDPOINT_PATTERNS = (
+    ("similar", re.compile(r"^/sounds/\d+/similar/?$")),
+    ("sound", re.compile(r"^/sounds/\d+/?$")),
+    ("search", re.compile(r"^/search/")),
+)
+
+# Query parameters that don't change the response
+_IGNORED_PARAMS = frozenset({"token"})
+
+
+class ResponseCache:
+    """
+    SQLite store of compressed API responses with per-endpoint TTLs.
+
+    Example:
+        cache = ResponseCache("data/freesound_library/http_cache.db")
+        endpoint, key = cache.make_key(url)
+        content = cache.get(endpoint, key)
+        if content is None:
+            content = fetch(url)
+            cache.put(endpoint, key, content)
+    """
+
+    DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+    DEFAULT_TTLS: dict[str, float] = {
+        "sound": 24 * 3600.0,
+        "similar": 24 * 3600.0,
+        "search": 6 * 3600.0,
+        "other": 3600.0,
+    }
+    """Seconds a response stays valid, by endpoint type"""
+
+    EVICT_TO_FRACTION = 0.9
+    """Eviction frees space down to this fraction of max_bytes"""
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: Optional[dict[str, float]] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Open (and create if needed) the response cache.
+
+        Args:
+            db_path: SQLite database file (may be shared by several processes)
+            max_bytes: Budget for stored (compressed) payloads
+            ttls: Per-endpoint TTL overrides in seconds ('sound', 'similar',
+                'search', 'other'); 0 disables caching for that endpoint
+            logger: Optional logger instance
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max(0, int(max_bytes))
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.logger = logger or logging.getLogger(__name__)
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            str(self.db_path), timeout=30.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_last_access "
+            "ON responses(last_access)"
+        )
+        self._conn.commit()
+        self.size_bytes = self._stored_bytes()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.bypassed = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(url: str) -> tuple[str, str]:
+        """
+        Build the endpoint type and cache key of a request URL.
+
+        Args:
+            url: Full request URL including query string
+
+        Returns:
+            Tuple of (endpoint type, cache key)
+        """
+        parts = urlsplit(url)
+        path = parts.path
+        if "/apiv2" in path:
+            path = path.split("/apiv2", 1)[1]
+
+        endpoint = "other"
+        for name, pattern in _ENDPOINT_PATTERNS:
+            if pattern.match(path):
+                endpoint = name
+                break
+
+        params = sorted(
+            (name, value)
+            for name, value in parse_qsl(parts.query, keep_blank_values=True)
+            if name not in _IGNORED_PARAMS
+        )
+        key = f"{path}?{urlencode(params)}" if params else path
+        return endpoint, key
+
+    def _stored_bytes(self) -> int:
+        """Total payload size in the database."""
+        assert self._conn is not None
+        row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+        return int(row.fetchone()[0])
+
+    def _outcome(self) -> dict[str, int]:
+        """Lookup outcomes of the calling thread since the last take."""
+        outcome = getattr(self._local, "outcome", None)
+        if outcome is None:
+            outcome = self._local.outcome = {"hits": 0, "misses": 0}
+        return outcome
+
+    def peek_thread_outcome(self) -> tuple[int, int]:
+        """
+        Get the calling thread's hits and misses without resetting them.
+
+        Lets a caller tell whether a call reached the network (its misses
+        went up) without taking the outcome from take_thread_outcome().
+
+        Returns:
+            Tuple of (hits, misses)
+        """
+        outcome = self._outcome()
+        return outcome["hits"], outcome["misses"]
+
+    def take_thread_outcome(self) -> tuple[int, int]:
+        """
+        Get and reset the calling thread's hits and misses since the last call.
+
+        Lets a caller that counts logical API calls tell whether the call it
+        just made was served entirely from the cache.
+
+        Returns:
+            Tuple of (hits, misses)
+        """
+        outcome = self._outcome()
+        result = (outcome["hits"], outcome["misses"])
+        outcome["hits"] = outcome["misses"] = 0
+        return result
+
+    @contextmanager
+    def bypass(self) -> Iterator[None]:
+        """Skip lookups in the calling thread (responses are still stored)."""
+        previous = getattr(self._local, "bypass", False)
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = previous
+
+    def get(self, endpoint: str, key: str) -> Optional[bytes]:
+        """
+        Look up a response body.
+
+        Args:
+            endpoint: Endpoint type from make_key()
+            key: Cache key from make_key()
+
+        Returns:
+            Response body, or None on a miss, an expired entry or in bypass mode
+        """
+        outcome = self._outcome()
+        ttl = self.ttls.get(endpoint, self.ttls["other"])
+        if getattr(self._local, "bypass", False) or ttl <= 0:
+            with self._lock:
+                self.bypassed += 1
+            outcome["misses"] += 1
+            return None
+
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                outcome["misses"] += 1
+                return None
+            row = self._conn.execute(
+                "SELECT payload, created_at FROM responses WHERE cache_key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                outcome["misses"] += 1
+                return None
+            if now - row[1] > ttl:
+                self.expired += 1
+                self.misses += 1
+                outcome["misses"] += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE cache_key = ?",
+                (now, key),
+            )
+            self._conn.commit()
+            self.hits += 1
+        outcome["hits"] += 1
+        return zlib.decompress(row[0])
+
+    def put(self, endpoint: str, key: str, content: bytes) -> None:
+        """
+        Store a response body, evicting old entries if over budget.
+
+        Args:
+            endpoint: Endpoint type from make_key()
+            key: Cache key from make_key()
+            content: Raw response body
+        """
+        if self.ttls.get(endpoint, self.ttls["other"]) <= 0:
+            return
+        payload = zlib.compress(content, 6)
+        if len(payload) > self.max_bytes:
+            return
+
+        now = time.time()
+        with self._lock:
+            if self._conn is None:
+                return
+            old = self._conn.execute(
+                "SELECT size FROM responses WHERE cache_key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(cache_key, endpoint, payload, size, created_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, endpoint, payload, len(payload), now, now),
+            )
+            self._conn.commit()
+            self.size_bytes += len(payload) - (old[0] if old else 0)
+            self.stores += 1
+
+            if self.size_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete expired, then least recently used entries (lock held)."""
+        assert self._conn is not None
+        now = time.time()
+        for endpoint, ttl in self.ttls.items():
+            if endpoint != "other":
+                self._conn.execute(
+                    "DELETE FROM responses WHERE endpoint = ? AND created_at < ?",
+                    (endpoint, now - ttl),
+                )
+        # Other processes may have written too, so recount from the database
+        self.size_bytes = self._stored_bytes()
+
+        target = int(self.max_bytes * self.EVICT_TO_FRACTION)
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM responses ORDER BY last_access"
+        )
+        evict_keys = []
+        size = self.size_bytes
+        for cache_key, entry_size in rows:
+            if size <= target:
+                break
+            evict_keys.append((cache_key,))
+            size -= entry_size
+
+        self._conn.executemany("DELETE FROM responses WHERE cache_key = ?", evict_keys)
+        self._conn.commit()
+        self.evictions += len(evict_keys)
+        self.size_bytes = size
+        self.logger.debug(
+            f"Response cache evicted {len(evict_keys)} entries "
+            f"({self.size_bytes / (1024 * 1024):.1f} MB stored)"
+        )
+
+    def clear(self) -> None:
+        """Delete all stored responses."""
+        with self._lock:
+            if self._conn is None:
+                return
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self.size_bytes = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "bypassed": self.bypassed,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "size_bytes": self.size_bytes,
+            }
+
+    def close(self) -> None:
+        """Close the database connection (idempotent)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class CachingSession(Session):
+    """
+    requests Session serving GET requests from a ResponseCache.
+
+    Only successful (200) responses are stored. Cached responses carry an
+    ``X-Cache: HIT`` header. ``before_send`` is called before every request
+    that reaches the network, so a rate limiter installed there spends no
+    tokens on cache hits.
+
+    Example:
+        client = freesound.FreesoundClient()
+        client.session = CachingSession(ResponseCache("http_cache.db"))
+    """
+
+    def __init__(
+        self,
+        cache: ResponseCache,
+        before_send: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize session.
+
+        Args:
+            cache: Response cache to read and fill
+            before_send: Optional callable run before each network request
+                (e.g. RateLimiter.acquire)
+        """
+        super().__init__()
+        self.cache = cache
+        self.before_send = before_send
+
+    def send(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Send a request, answering cacheable GETs from the cache."""
+        if request.method != "GET" or not request.url:
+            return self._send_uncached(request, **kwargs)
+
+        endpoint, key = self.cache.make_key(request.url)
+        content = self.cache.get(endpoint, key)
+        if content is not None:
+            return self._cached_response(request, content)
+
+        response = self._send_uncached(request, **kwargs)
+        if response.status_code == 200:
+            self.cache.put(endpoint, key, response.content)
+        return response
+
+    def _send_uncached(self, request: PreparedRequest, **kwargs: Any) -> Response:
+        """Send a request to the network after the before_send hook."""
+        if self.before_send is not None:
+            self.before_send()
+        return super().send(request, **kwargs)
+
+    @staticmethod
+    def _cached_response(request: PreparedRequest, content: bytes) -> Response:
+        """Build a Response object for a cached body."""
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url or ""
+        response.request = request
+        response.encoding = "utf-8"
+        response.headers["Content-Type"] = "application/json"
+        response.headers["X-Cache"] = "HIT"
+        response._content = content
+        return response
@@ -0,0 +1,194 @@
+"""
+Byte-bounded LRU cache of fetched sound metadata with spill-over to SQLite.
+
+Similar-sound and search responses carry full metadata for up to 150 sounds
+per request. Keeping that metadata avoids a get_sound() request when one of
+those sounds is expanded later, but holding the client objects (with their
+analysis payloads) for a whole crawl is the loader's largest source of memory
+growth. SoundCache keeps only extracted metadata dicts, bounded by an
+approximate byte budget (serialized JSON size). Least recently used entries
+are spilled into the metadata cache's ``sound_cache`` side table instead of
+being dropped, so they still count as hits, and spilled entries survive
+restarts.
+
+Invalid sounds (e.g. 0-byte files) are cached as ``None`` so they are not
+fetched again either. The cache is thread-safe.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from .metadata_cache import MetadataCache
+
+
+class SoundCache:
+    """
+    LRU cache of sound metadata dicts bounded by bytes, spilling to SQLite.
+
+    Example:
+        cache = SoundCache(max_bytes=64 * 1024 * 1024, spill_store=metadata_cache)
+        cache.put(12345, metadata)
+        hit, metadata = cache.lookup(12345)
+    """
+
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    SPILL_BATCH_SIZE = 200
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        spill_store: Optional[MetadataCache] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """
+        Initialize sound cache.
+
+        Args:
+            max_bytes: Approximate memory budget (serialized size of entries)
+            spill_store: MetadataCache receiving evicted entries (None drops them)
+            logger: Optional logger instance
+        """
+        self.max_bytes = max(0, max_bytes)
+        self.spill_store = spill_store
+        self.logger = logger or logging.getLogger(__name__)
+
+        self._entries: OrderedDict[int, tuple[Optional[dict[str, Any]], int]] = (
+            OrderedDict()
+        )
+        self._pending_spill: dict[int, Optional[dict[str, Any]]] = {}
+        self._lock = threading.RLock()
+        self.size_bytes = 0
+
+        self.hits = 0
+        self.spill_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.spilled = 0
+
+    @staticmethod
+    def _entry_size(metadata: Optional[dict[str, Any]]) -> int:
+        """Approximate an entry's size by its JSON length."""
+        return len(json.dumps(metadata, default=str))
+
+    def put(self, sample_id: int, metadata: Optional[dict[str, Any]]) -> None:
+        """
+        Cache metadata for a sound (None marks it invalid).
+
+        Args:
+            sample_id: Freesound sample ID
+            metadata: Extracted metadata dict; not copied, so pass a dict the
+                caller won't mutate afterwards
+        """
+        sample_id = int(sample_id)
+        size = self._entry_size(metadata)
+        with self._lock:
+            old = self._entries.pop(sample_id, None)
+            if old is not None:
+                self.size_bytes -= old[1]
+            self._pending_spill.pop(sample_id, None)
+
+            self._entries[sample_id] = (metadata, size)
+            self.size_bytes += size
+            self._evict()
+
+    def lookup(self, sample_id: int) -> tuple[bool, Optional[dict[str, Any]]]:
+        """
+        Look up a sound, checking memory first and then spilled entries.
+
+        Spilled entries found again are moved back into memory.
+
+        Args:
+            sample_id: Freesound sample ID
+
+        Returns:
+            Tuple of (hit, metadata); metadata is a shallow copy, or None for
+            invalid sounds and misses
+        """
+        sample_id = int(sample_id)
+        with self._lock:
+            entry = self._entries.get(sample_id)
+            if entry is not None:
+                self._entries.move_to_end(sample_id)
+                self.hits += 1
+                return True, dict(entry[0]) if entry[0] is not None else None
+
+            if sample_id in self._pending_spill:
+                found, metadata = True, self._pending_spill.pop(sample_id)
+            elif self.spill_store is not None:
+                found, metadata = self.spill_store.get_spilled_sound(sample_id)
+            else:
+                found, metadata = False, None
+
+            if not found:
+                self.misses += 1
+                return False, None
+
+            self.hits += 1
+            self.spill_hits += 1
+            self.put(sample_id, metadata)
+        return True, dict(metadata) if metadata is not None else None
+
+    def __contains__(self, sample_id: object) -> bool:
+        """Check whether a sound is held in memory (spilled entries excluded)."""
+        return sample_id in self._entries
+
+    def __len__(self) -> int:
+        """Number of entries held in memory."""
+        return len(self._entries)
+
+    def _evict(self) -> None:
+        """Evict least recently used entries until within the byte budget."""
+        while self.size_bytes > self.max_bytes and self._entries:
+            sample_id, (metadata, size) = self._entries.popitem(last=False)
+            self.size_bytes -= size
+            self.evictions += 1
+            if self.spill_store is not None:
+                self._pending_spill[sample_id] = metadata
+
+        if len(self._pending_spill) >= self.SPILL_BATCH_SIZE:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write evicted entries waiting in memory to the spill store."""
+        with self._lock:
+            if not self._pending_spill or self.spill_store is None:
+                return
+            rows = self._pending_spill
+            self._pending_spill = {}
+            self.spill_store.put_spilled_sounds(rows)
+            self.spilled += len(rows)
+        self.logger.debug(f"Spilled {len(rows)} cached sounds to SQLite")
+
+    def to_dict(self) -> dict[int, Optional[dict[str, Any]]]:
+        """
+        Get the in-memory entries (e.g. for the legacy checkpoint).
+
+        Returns:
+            Dictionary mapping sample_id to metadata, least recently used first
+        """
+        with self._lock:
+            return {
+                sample_id: metadata
+                for sample_id, (metadata, _) in self._entries.items()
+            }
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss/eviction counters and memory usage
+        """
+        return {
+            "hits": self.hits,
+            "spill_hits": self.spill_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "spilled": self.spilled,
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+        }
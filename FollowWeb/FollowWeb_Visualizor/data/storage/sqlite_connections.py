@@ -0,0 +1,280 @@
+"""
+Connection management for concurrent access to a WAL-mode SQLite database.
+
+SQLite in WAL mode allows any number of readers alongside a single writer.
+SQLiteConnectionManager makes that usable from several threads:
+
+- Each thread gets its own read-only connection (opened on first use), so
+  reads never wait on each other or on the writer. The connection is closed
+  when its thread exits, so short-lived worker threads don't leak handles.
+- All writes run on one writer connection owned by a background thread.
+  Write jobs are queued on a bounded queue (callers block when it is full)
+  and the writer drains whatever is queued into one transaction, so
+  concurrent writers share a single commit (group commit). Each job runs
+  inside its own savepoint, so a failing job is rolled back without
+  affecting the rest of its group.
+"""
+
+import logging
+import queue
+import sqlite3
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Optional
+
+_STOP = object()
+
+
+class _ThreadReader:
+    """Holds a thread's read connection; its finalizer runs on thread exit."""
+
+    __slots__ = ("conn", "__weakref__")
+
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+
+def _release_reader(
+    manager_ref: "weakref.ref[SQLiteConnectionManager]", conn: sqlite3.Connection
+) -> None:
+    """Close a read connection whose thread has exited."""
+    manager = manager_ref()
+    if manager is not None:
+        with manager._lock:
+            manager._readers.discard(conn)
+    conn.close()
+
+
+class SQLiteConnectionManager:
+    """
+    Per-thread read connections and a single group-committing writer thread.
+
+    The writer connection is exposed as ``writer`` for synchronous setup
+    (schema creation, migrations) before the first job is submitted. The
+    writer thread is started lazily, so read-only users never start it.
+
+    Example:
+        manager = SQLiteConnectionManager('metadata_cache.db')
+        manager.write(lambda conn: conn.execute('DELETE FROM metadata'))
+        count = manager.reader().execute('SELECT COUNT(*) FROM metadata')
+        manager.close()
+    """
+
+    DEFAULT_QUEUE_SIZE = 256
+    DEFAULT_MAX_GROUP_SIZE = 64
+
+    def __init__(
+        self,
+        db_path: str,
+        logger: Optional[logging.Logger] = None,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        max_group_size: int = DEFAULT_MAX_GROUP_SIZE,
+    ):
+        """
+        Initialize connection manager and open the writer connection.
+
+        Args:
+            db_path: Path to SQLite database file
+            logger: Optional logger instance
+            queue_size: Maximum number of queued write jobs before submit() blocks
+            max_group_size: Maximum number of jobs committed in one transaction
+        """
+        self.db_path = Path(db_path)
+        self.logger = logger or logging.getLogger(__name__)
+        self.max_group_size = max(1, max_group_size)
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._local = threading.local()
+        self._readers: set[sqlite3.Connection] = set()
+        self._closed = False
+
+        self.jobs = 0
+        self.commits = 0
+        self.largest_group = 0
+
+        # Used from the writer thread once it starts
+        self.writer = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.writer.execute("PRAGMA journal_mode=WAL;")
+        self.writer.execute("PRAGMA synchronous=NORMAL;")
+
+    def reader(self) -> sqlite3.Connection:
+        """
+        Get the calling thread's read-only connection.
+
+        Returns:
+            Read-only connection (sees all committed writes), closed
+            automatically when the calling thread exits
+
+        Raises:
+            RuntimeError: If the manager is closed
+        """
+        if self._closed:
+            raise RuntimeError("Database connection not initialized")
+        holder = getattr(self._local, "reader", None)
+        if holder is not None:
+            return holder.conn
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Database connection not initialized")
+            uri = f"{self.db_path.resolve().as_uri()}?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+            self._readers.add(conn)
+        # Thread-local values are dropped when the thread exits, which runs
+        # the finalizer; it only holds a weak reference to the manager
+        holder = _ThreadReader(conn)
+        weakref.finalize(holder, _release_reader, weakref.ref(self), conn)
+        self._local.reader = holder
+        return conn
+
+    def submit(self, job: Callable[[sqlite3.Connection], Any]) -> Future:
+        """
+        Queue a write job for the writer thread.
+
+        Jobs must not commit or roll back; the writer does that for the group.
+
+        Args:
+            job: Callable receiving the writer connection
+
+        Returns:
+            Future resolved with the job's return value once it is committed
+
+        Raises:
+            RuntimeError: If the manager is closed
+        """
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Database connection not initialized")
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"sqlite-writer-{self.db_path.name}",
+                    daemon=True,
+                )
+                self._thread.start()
+        self._queue.put((job, future))
+        return future
+
+    def write(self, job: Callable[[sqlite3.Connection], Any]) -> Any:
+        """
+        Run a write job on the writer thread and wait for its commit.
+
+        Args:
+            job: Callable receiving the writer connection
+
+        Returns:
+            The job's return value
+
+        Raises:
+            Exception: Whatever the job (or the commit) raised
+        """
+        return self.submit(job).result()
+
+    def _run(self) -> None:
+        """Writer loop: drain queued jobs into group commits until stopped."""
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            group = [item]
+            stop = False
+            while len(group) < self.max_group_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                group.append(item)
+
+            self._commit_group(group)
+            if stop:
+                return
+
+    def _commit_group(self, group: list[tuple[Callable, Future]]) -> None:
+        """Run a group of jobs in one transaction and resolve their futures."""
+        conn = self.writer
+        completed = []
+        try:
+            if not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE")
+            for job, future in group:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                conn.execute("SAVEPOINT write_job")
+                try:
+                    result = job(conn)
+                except BaseException as e:
+                    conn.execute("ROLLBACK TO write_job")
+                    conn.execute("RELEASE write_job")
+                    future.set_exception(e)
+                    continue
+                conn.execute("RELEASE write_job")
+                completed.append((future, result))
+            conn.commit()
+        except BaseException as e:
+            self.logger.error(f"SQLite write transaction failed: {e}")
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            for _, future in group:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.jobs += len(group)
+        self.commits += 1
+        self.largest_group = max(self.largest_group, len(group))
+        for future, result in completed:
+            future.set_result(result)
+
+    def get_stats(self) -> dict[str, int]:
+        """
+        Get writer statistics.
+
+        Returns:
+            Dictionary with jobs, commits, largest_group and readers
+            (open read connections of live threads)
+        """
+        return {
+            "jobs": self.jobs,
+            "commits": self.commits,
+            "largest_group": self.largest_group,
+            "readers": len(self._readers),
+        }
+
+    def close(self) -> None:
+        """
+        Finish queued writes, stop the writer thread and close all connections.
+
+        Jobs queued before close() are committed; submit() and reader()
+        raise RuntimeError afterwards. Safe to call more than once.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+
+        if thread is not None:
+            self._queue.put(_STOP)
+            # The last reference to an owner can be dropped on the writer
+            # thread itself; the loop exits after the stop marker then
+            if thread is not threading.current_thread():
+                thread.join()
+
+        with self._lock:
+            readers = list(self._readers)
+            self._readers.clear()
+        for conn in readers:
+            conn.close()
+        self.writer.close()
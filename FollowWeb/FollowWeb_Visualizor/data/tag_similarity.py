@@ -0,0 +1,801 @@
+"""
+Exact Jaccard similarity join over sample tag sets.
+
+Comparing every new sample with every other tagged sample is quadratic in
+library size, although most pairs share no tag at all. jaccard_pairs()
+finds the same pairs as the nested-loop comparison from an inverted index
+(tag → postings of sets using it):
+
+- Overlap counting: probing a set's tags accumulates the shared tag count
+  of every set it has at least one tag in common with; pairs without a
+  shared tag are never looked at.
+- Size filter: sets x, y can only reach threshold t if
+  ``t * |y| <= |x| <= |y| / t``. Sets are joined in order of size
+  (AllPairs), so postings are trimmed from the front once their sets are
+  too small instead of being checked per candidate, and each pair is
+  counted once.
+- Document-frequency cap: tags used by more than ``max_tag_frequency`` sets
+  ("stop tags") are not counted through postings, which is where most of
+  the work goes. Shared stop tags are intersected per candidate instead,
+  after an upper bound on the similarity shows the pair can still reach t.
+  A pair sharing nothing but stop tags reaches t only if stop tags make up
+  at least a t fraction of both sets, so only such stop-dominated sets are
+  indexed under their stop tags.
+
+The similarity of every returned pair uses the formula of the nested loop,
+so the result does not depend on the filters.
+
+jaccard_edges() is the vectorized form of the same exact join: samples are
+rows of a CSR sample × tag matrix, intersections of a block of rows with
+all samples come from one sparse matrix product, unions from the row sums
+(|a ∪ b| = |a| + |b| - |a ∩ b|), and the threshold is applied inside the
+block. Row blocks can be spread over a pool of spawned processes (forking
+the multithreaded loader could copy locks held by its other threads), and
+the result is a set of (src, dst, weight) arrays ready for bulk insertion. The same
+document-frequency cap applies: a tag used by d sets adds d² entries to the
+products, so stop tag columns are left out of them. Their shared count is
+added per candidate behind the same upper bound, and pairs sharing only
+stop tags come from a product restricted to the stop-dominated rows.
+
+For libraries where even the candidate pairs sharing a tag are too many,
+minhash_pairs() is an approximate alternative: MinHash signatures
+(minhash_signatures(), vectorized with NumPy) are cut into bands, samples
+whose signatures agree on a whole band land in the same LSH bucket, and
+only bucket mates are verified with the exact Jaccard similarity. Every
+returned pair is a true pair; some are missed. lsh_parameters() picks the
+bands and rows that reach a target recall at the threshold, and
+measure_recall() checks it against the exact join.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import zlib
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+# Slack for float rounding in the filters (they only need to be conservative)
+_EPSILON = 1e-9
+
+DEFAULT_NUM_PERM = 128
+"""MinHash permutations per signature"""
+
+MINHASH_SEED = 1
+"""Seed of the MinHash permutations (signatures are only comparable with
+the same seed and number of permutations)"""
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+_BlockState = tuple[
+    sparse.csr_matrix, Optional[sparse.csr_matrix], np.ndarray, np.ndarray, float
+]
+"""Inputs of _join_block() shared by all blocks of one join"""
+
+DEFAULT_BLOCK_SIZE = 1024
+"""Rows per sparse product block in jaccard_edges() (bounds the block's
+intersection matrix, whose size also grows with how common tags are)"""
+
+# Hashed tags per vectorized block (bounds the block to ~64 MB at 128
+# permutations)
+_MINHASH_BLOCK = 1 << 16
+
+
+def jaccard_pairs(
+    tag_sets: Mapping[str, set[str]],
+    threshold: float,
+    query_ids: Optional[Iterable[str]] = None,
+    max_tag_frequency: Optional[int] = None,
+) -> list[tuple[str, str, float]]:
+    """
+    Find pairs of tag sets with Jaccard similarity at or above a threshold.
+
+    Only pairs involving at least one query set are returned, in the order
+    of a nested-loop comparison over tag_sets: query ↔ query pairs first,
+    then query ↔ other pairs.
+
+    Args:
+        tag_sets: Non-empty tag set by sample ID
+        threshold: Minimum Jaccard similarity |a ∩ b| / |a ∪ b|
+        query_ids: IDs whose pairs are wanted (default: all IDs)
+        max_tag_frequency: Document-frequency cap for counted tags (None
+            counts every tag); only changes the work done, not the result
+
+    Returns:
+        (query ID, other ID, similarity) tuples
+    """
+    ids = list(tag_sets)
+    sets = [tag_sets[sample_id] for sample_id in ids]
+    if query_ids is None:
+        queries = list(range(len(ids)))
+        others: list[int] = []
+    else:
+        query_set = set(query_ids)
+        queries = [i for i, sample_id in enumerate(ids) if sample_id in query_set]
+        others = [i for i, sample_id in enumerate(ids) if sample_id not in query_set]
+
+    if threshold <= 0:
+        # Every pair qualifies, including pairs without a shared tag
+        query_pairs = [
+            (a, b, _jaccard(sets[a], sets[b]))
+            for n, a in enumerate(queries)
+            for b in queries[n + 1 :]
+        ]
+        other_pairs = [
+            (a, b, _jaccard(sets[a], sets[b])) for a in queries for b in others
+        ]
+    else:
+        join = _OverlapJoin(sets, threshold, max_tag_frequency)
+        query_pairs = join.self_join(queries)
+        other_pairs = join.cross_join(queries, others)
+
+    return [
+        (ids[a], ids[b], similarity)
+        for pairs in (query_pairs, other_pairs)
+        for a, b, similarity in sorted(pairs)
+    ]
+
+
+def jaccard_edges(
+    tag_sets: Mapping[str, Iterable[str]],
+    threshold: float,
+    query_ids: Optional[Iterable[str]] = None,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    workers: Optional[int] = 1,
+    max_tag_frequency: Optional[int] = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Find pairs of tag sets with Jaccard similarity at or above a threshold.
+
+    Same pairs, weights and order as jaccard_pairs(), computed with sparse
+    matrix products over blocks of query rows.
+
+    Args:
+        tag_sets: Tag set by sample ID
+        threshold: Minimum Jaccard similarity |a ∩ b| / |a ∪ b|
+        query_ids: IDs whose pairs are wanted (default: all IDs)
+        block_size: Query rows per sparse product
+        workers: Processes the blocks are spread over (default: 1, computed
+            in this process; None = CPU count). Pool processes are spawned,
+            never forked
+        max_tag_frequency: Document-frequency cap for tags counted through
+            the sparse products (None counts every tag); only changes the
+            work done, not the result
+
+    Returns:
+        Tuple of (src, dst, weight) arrays; src and dst are int64 positions
+        in tag_sets order, src always a query
+    """
+    ids = list(tag_sets)
+    matrix = _tag_matrix([tag_sets[sample_id] for sample_id in ids])
+    sizes = np.diff(matrix.indptr)
+    stop_matrix = None
+    if max_tag_frequency is not None and threshold > 0:
+        # With threshold 0 every pair is compared anyway
+        is_stop = np.bincount(matrix.indices, minlength=matrix.shape[1]) > (
+            max_tag_frequency
+        )
+        if is_stop.any():
+            stop_matrix = matrix[:, is_stop].tocsr()
+            matrix = matrix[:, ~is_stop].tocsr()
+    is_query: np.ndarray
+    if query_ids is None:
+        is_query = np.ones(len(ids), dtype=bool)
+    else:
+        query_set = set(query_ids)
+        is_query = np.array([sample_id in query_set for sample_id in ids], dtype=bool)
+    queries = np.flatnonzero(is_query)
+    full = bool(is_query.all())
+
+    # Without other sets, a block only needs the columns from its first row
+    # on (pairs are counted once, from their lower row)
+    tasks = [
+        (queries[start : start + block_size], int(queries[start]) if full else 0)
+        for start in range(0, len(queries), max(1, block_size))
+    ]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    state: _BlockState = (matrix, stop_matrix, sizes, is_query, threshold)
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_block_worker,
+            initargs=state,
+        ) as executor:
+            blocks = list(executor.map(_block_worker, tasks))
+    else:
+        blocks = [_join_block(*state, rows, first) for rows, first in tasks]
+
+    if not blocks:
+        empty: np.ndarray = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0, dtype=np.float64)
+    src = np.concatenate([block[0] for block in blocks])
+    dst = np.concatenate([block[1] for block in blocks])
+    weight = np.concatenate([block[2] for block in blocks])
+
+    # Nested-loop order: query ↔ query pairs, then query ↔ other pairs
+    order = np.lexsort((dst, src, ~is_query[dst]))
+    return src[order], dst[order], weight[order]
+
+
+def _tag_matrix(tag_sets: Sequence[Iterable[str]]) -> sparse.csr_matrix:
+    """Binary CSR matrix of tag sets (rows) by tag (columns)."""
+    vocabulary: dict[str, int] = {}
+    indices: list[int] = []
+    indptr = [0]
+    for tags in tag_sets:
+        indices.extend(vocabulary.setdefault(tag, len(vocabulary)) for tag in set(tags))
+        indptr.append(len(indices))
+    return sparse.csr_matrix(
+        (np.ones(len(indices), dtype=np.int32), indices, indptr),
+        shape=(len(tag_sets), max(1, len(vocabulary))),
+    )
+
+
+def _join_block(
+    matrix: sparse.csr_matrix,
+    stop_matrix: Optional[sparse.csr_matrix],
+    sizes: np.ndarray,
+    is_query: np.ndarray,
+    threshold: float,
+    rows: np.ndarray,
+    first_column: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pairs of a block of query rows with the columns from first_column on.
+
+    matrix holds the counted tags; stop_matrix, if given, the stop tags left
+    out of the product (see _add_stop_tags()).
+    """
+    product = matrix[rows] @ matrix[first_column:].T
+    if threshold <= 0:
+        # Every pair qualifies, including pairs without a shared tag
+        shared = product.toarray()
+        block_rows, columns = np.nonzero(np.ones_like(shared, dtype=bool))
+        shared = shared.ravel()
+    else:
+        product = product.tocoo()
+        block_rows, columns, shared = product.row, product.col, product.data
+    src: np.ndarray = rows[block_rows].astype(np.int64)
+    dst: np.ndarray = columns.astype(np.int64) + first_column
+
+    # Each query pair once (from its lower row), no self pairs
+    keep = (dst > src) | ~is_query[dst]
+    src, dst, shared = src[keep], dst[keep], shared[keep]
+
+    if stop_matrix is not None:
+        src, dst, shared = _add_stop_tags(
+            stop_matrix,
+            sizes,
+            is_query,
+            threshold,
+            rows,
+            first_column,
+            src,
+            dst,
+            shared,
+        )
+
+    union = sizes[src] + sizes[dst] - shared
+    weight = np.divide(
+        shared,
+        union,
+        out=np.zeros(len(shared), dtype=np.float64),
+        where=union > 0,
+    )
+    keep = weight >= threshold
+    return src[keep], dst[keep], weight[keep]
+
+
+def _add_stop_tags(
+    stop_matrix: sparse.csr_matrix,
+    sizes: np.ndarray,
+    is_query: np.ndarray,
+    threshold: float,
+    rows: np.ndarray,
+    first_column: int,
+    src: np.ndarray,
+    dst: np.ndarray,
+    shared: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Complete the overlaps of a block with the stop tags left out of it.
+
+    Candidates sharing counted tags get their shared stop tags added once an
+    upper bound shows they can still reach the threshold. Pairs sharing only
+    stop tags reach it only if stop tags make up at least a threshold
+    fraction of both sets, so they come from a product over those rows.
+
+    Returns:
+        (src, dst, shared) arrays with full overlaps
+    """
+    stop_sizes = np.diff(stop_matrix.indptr)
+    counted_keys = src * len(sizes) + dst
+
+    bound = shared + np.minimum(stop_sizes[src], sizes[dst] - shared)
+    possible = bound >= (threshold - _EPSILON) * (sizes[src] + sizes[dst] - bound)
+    src, dst, shared = src[possible], dst[possible], shared[possible]
+    if len(src):
+        shared = shared + np.asarray(
+            stop_matrix[src].multiply(stop_matrix[dst]).sum(axis=1)
+        ).ravel().astype(shared.dtype)
+
+    dominated = (stop_sizes > 0) & (stop_sizes >= threshold * sizes - _EPSILON)
+    block_rows = rows[dominated[rows]]
+    columns: np.ndarray = first_column + np.flatnonzero(dominated[first_column:])
+    if not len(block_rows) or not len(columns):
+        return src, dst, shared
+
+    product = (stop_matrix[block_rows] @ stop_matrix[columns].T).tocoo()
+    stop_src = block_rows[product.row].astype(np.int64)
+    stop_dst = columns[product.col].astype(np.int64)
+    keep = ((stop_dst > stop_src) | ~is_query[stop_dst]) & ~np.isin(
+        stop_src * len(sizes) + stop_dst, counted_keys
+    )
+    return (
+        np.concatenate([src, stop_src[keep]]),
+        np.concatenate([dst, stop_dst[keep]]),
+        np.concatenate([shared, product.data[keep].astype(shared.dtype)]),
+    )
+
+
+# Matrix and parameters of jaccard_edges() in pool worker processes
+_block_state: Optional[_BlockState] = None
+
+
+def _init_block_worker(
+    matrix: sparse.csr_matrix,
+    stop_matrix: Optional[sparse.csr_matrix],
+    sizes: np.ndarray,
+    is_query: np.ndarray,
+    threshold: float,
+) -> None:
+    """Keep the join inputs in the worker (sent once, not per block)."""
+    global _block_state
+    _block_state = (matrix, stop_matrix, sizes, is_query, threshold)
+
+
+def _block_worker(task: tuple[np.ndarray, int]) -> tuple[np.ndarray, ...]:
+    """Join one block of rows in a pool worker."""
+    if _block_state is None:
+        raise RuntimeError("Block worker used without _init_block_worker")
+    rows, first_column = task
+    return _join_block(*_block_state, rows, first_column)
+
+
+def _jaccard(tags1: set[str], tags2: set[str]) -> float:
+    """Jaccard similarity, computed exactly as the nested loop does."""
+    intersection = len(tags1 & tags2)
+    union = len(tags1) + len(tags2) - intersection
+    return intersection / union if union > 0 else 0
+
+
+class _OverlapJoin:
+    """Inverted-index join with the size filter and the stop-tag cap."""
+
+    def __init__(
+        self,
+        sets: list[set[str]],
+        threshold: float,
+        max_tag_frequency: Optional[int],
+    ):
+        self.sets = sets
+        self.sizes = [len(tags) for tags in sets]
+        self.threshold = threshold
+
+        stop_tags: set[str] = set()
+        if max_tag_frequency is not None:
+            frequency: Counter[str] = Counter()
+            for tags in sets:
+                frequency.update(tags)
+            stop_tags = {
+                tag for tag, count in frequency.items() if count > max_tag_frequency
+            }
+
+        # Per set: tags counted through postings, its stop tags, and the stop
+        # tags it is indexed under (only if stop-dominated)
+        self.counted: list[list[str]] = []
+        self.stop_tags: list[set[str]] = []
+        self.stop_index: list[list[str]] = []
+        for tags in sets:
+            own_stop_tags = tags & stop_tags
+            self.counted.append([tag for tag in tags if tag not in own_stop_tags])
+            self.stop_tags.append(own_stop_tags)
+            if own_stop_tags and len(own_stop_tags) >= threshold * len(tags) - _EPSILON:
+                self.stop_index.append(sorted(own_stop_tags))
+            else:
+                self.stop_index.append([])
+
+    def _index(self, i: int, postings: dict[str, list[int]]) -> None:
+        """Add a set to the postings of its counted and indexed stop tags."""
+        for tag in self.counted[i] + self.stop_index[i]:
+            postings.setdefault(tag, []).append(i)
+
+    def self_join(self, positions: list[int]) -> list[tuple[int, int, float]]:
+        """
+        Similar pairs within a group of sets (AllPairs, by set size).
+
+        Returns:
+            (lower position, higher position, similarity) tuples
+        """
+        sizes = self.sizes
+        postings: dict[str, list[int]] = {}
+        starts: dict[str, int] = {}
+        pairs: list[tuple[int, int, float]] = []
+
+        for i in sorted(positions, key=sizes.__getitem__):
+            # Indexed sets are no larger, and the ones too small now stay too
+            # small for the larger sets that follow: skip them for good
+            min_size = self.threshold * sizes[i] - _EPSILON
+            for tag in self.counted[i] + self.stop_index[i]:
+                entries = postings.get(tag)
+                if entries:
+                    start = starts.get(tag, 0)
+                    while start < len(entries) and sizes[entries[start]] < min_size:
+                        start += 1
+                    starts[tag] = start
+
+            pairs.extend(
+                (j, i, similarity) if j < i else (i, j, similarity)
+                for j, similarity in self._probe(i, postings, starts)
+            )
+            self._index(i, postings)
+
+        return pairs
+
+    def cross_join(
+        self, positions: list[int], others: list[int]
+    ) -> list[tuple[int, int, float]]:
+        """
+        Similar pairs between two disjoint groups of sets.
+
+        The first group (the new samples) is indexed and the other group
+        probes it, so an incremental update costs one probe per sample.
+
+        Returns:
+            (position, other position, similarity) tuples
+        """
+        if not positions or not others:
+            return []
+
+        postings: dict[str, list[int]] = {}
+        for i in positions:
+            self._index(i, postings)
+
+        sizes = self.sizes
+        pairs: list[tuple[int, int, float]] = []
+        for j in others:
+            min_size = self.threshold * sizes[j] - _EPSILON
+            max_size = sizes[j] / self.threshold + _EPSILON
+            pairs.extend(
+                (i, j, similarity)
+                for i, similarity in self._probe(j, postings)
+                if min_size <= sizes[i] <= max_size
+            )
+        return pairs
+
+    def _probe(
+        self,
+        i: int,
+        postings: dict[str, list[int]],
+        starts: Optional[dict[str, int]] = None,
+    ) -> Iterator[tuple[int, float]]:
+        """
+        Indexed sets whose similarity with set i reaches the threshold.
+
+        Args:
+            i: Position of the probing set
+            postings: Index to probe
+            starts: First live entry per tag (postings trimmed by size)
+        """
+        starts = starts or {}
+        counts: Counter[int] = Counter()
+        for tag in self.counted[i]:
+            entries = postings.get(tag)
+            if entries:
+                counts.update(entries[starts.get(tag, 0) :])
+
+        threshold = self.threshold
+        sizes = self.sizes
+        size = sizes[i]
+        stop_tags = self.stop_tags[i]
+        if stop_tags:
+            sets = self.sets
+            for j, overlap in counts.items():
+                other_size = sizes[j]
+                bound = overlap + min(len(stop_tags), other_size - overlap)
+                if bound / (size + other_size - bound) < threshold - _EPSILON:
+                    continue
+                overlap += len(stop_tags & sets[j])
+                similarity = overlap / (size + other_size - overlap)
+                if similarity >= threshold:
+                    yield j, similarity
+        else:
+            for j, overlap in counts.items():
+                similarity = overlap / (size + sizes[j] - overlap)
+                if similarity >= threshold:
+                    yield j, similarity
+
+        # Pairs sharing only stop tags (both sets are stop-dominated)
+        stop_candidates: set[int] = set()
+        for tag in self.stop_index[i]:
+            entries = postings.get(tag)
+            if entries:
+                stop_candidates.update(entries[starts.get(tag, 0) :])
+        for j in stop_candidates.difference(counts):
+            similarity = _jaccard(self.sets[i], self.sets[j])
+            if similarity >= threshold:
+                yield j, similarity
+
+
+def tag_fingerprint(tags: Iterable[str]) -> int:
+    """
+    Fingerprint of a tag set, stored with its signature to detect changes.
+
+    Returns:
+        Signed 64-bit integer (fits an SQLite INTEGER)
+    """
+    digest = hashlib.blake2b(
+        "\x1f".join(sorted(tags)).encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def _permutations(num_perm: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Coefficients of the hash functions (a * x + b) mod p."""
+    rng = np.random.RandomState(seed)
+    # Below 2**32 so a * x + b stays within uint64 for 32-bit tag hashes
+    a = rng.randint(1, 1 << 32, size=num_perm, dtype=np.uint64)
+    b = rng.randint(0, 1 << 32, size=num_perm, dtype=np.uint64)
+    return a, b
+
+
+def minhash_signatures(
+    tag_sets: Sequence[Iterable[str]],
+    num_perm: int = DEFAULT_NUM_PERM,
+    seed: int = MINHASH_SEED,
+) -> np.ndarray:
+    """
+    Compute MinHash signatures of tag sets.
+
+    The probability that two signatures agree at a position equals the
+    Jaccard similarity of their tag sets.
+
+    Args:
+        tag_sets: Tag sets (empty sets get an all-maximum signature)
+        num_perm: Permutations (signature length)
+        seed: Permutation seed
+
+    Returns:
+        uint32 array of shape (len(tag_sets), num_perm)
+    """
+    a, b = _permutations(num_perm, seed)
+    tag_hashes: dict[str, int] = {}
+    sets = [list(tags) for tags in tag_sets]
+    lengths = np.array([len(tags) for tags in sets], dtype=np.int64)
+    values = np.array(
+        [
+            tag_hashes.setdefault(tag, zlib.crc32(tag.encode("utf-8")))
+            for tags in sets
+            for tag in tags
+        ],
+        dtype=np.uint64,
+    )
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+    signatures: np.ndarray = np.full((len(sets), num_perm), _MAX_HASH, dtype=np.uint32)
+    start = 0
+    while start < len(sets):
+        # Next block of samples with at most _MINHASH_BLOCK tags (at least one)
+        end = int(
+            np.searchsorted(offsets, offsets[start] + _MINHASH_BLOCK, side="right")
+        )
+        end = min(max(end - 1, start + 1), len(sets))
+        first, last = offsets[start], offsets[end]
+        block: np.ndarray = start + np.flatnonzero(lengths[start:end])
+        if last > first:
+            hashed = (values[first:last, None] * a + b) % _MERSENNE_PRIME & _MAX_HASH
+            signatures[block] = np.minimum.reduceat(
+                hashed, offsets[block] - first, axis=0
+            )
+        start = end
+    return signatures
+
+
+def lsh_parameters(
+    threshold: float, recall: float, num_perm: int = DEFAULT_NUM_PERM
+) -> tuple[int, int]:
+    """
+    Choose LSH bands and rows per band for a threshold and target recall.
+
+    A pair with similarity s becomes a candidate with probability
+    1 - (1 - s**rows)**bands. Recall is that probability averaged over
+    similarities from the threshold to 1 (pairs just above the threshold are
+    found least often). Among the splits of num_perm reaching the target
+    recall, the one with the fewest expected candidates below the threshold
+    wins.
+
+    Args:
+        threshold: Jaccard similarity threshold
+        recall: Target share of pairs at or above the threshold found
+        num_perm: Signature length
+
+    Returns:
+        Tuple of (bands, rows)
+    """
+    below = np.linspace(0.0, threshold, 101)
+    above = np.linspace(threshold, 1.0, 101)
+    best: Optional[tuple[float, int, int]] = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if np.mean(1 - (1 - above**rows) ** bands) < recall:
+            continue
+        false_positives = float(np.mean(1 - (1 - below**rows) ** bands))
+        if best is None or false_positives < best[0]:
+            best = (false_positives, bands, rows)
+    if best is None:
+        # The target is out of reach: use the split with the highest recall
+        return num_perm, 1
+    return best[1], best[2]
+
+
+def lsh_candidate_pairs(
+    signatures: np.ndarray,
+    bands: int,
+    rows: int,
+    query_mask: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Pairs of signatures agreeing on at least one band.
+
+    Args:
+        signatures: Array of shape (n, >= bands * rows)
+        bands: Number of bands
+        rows: Signature positions per band
+        query_mask: Boolean mask of query rows; if given, only pairs with at
+            least one query row are returned
+
+    Returns:
+        int64 array of shape (k, 2) with unique (lower, higher) row pairs
+    """
+    count = len(signatures)
+    queries = None if query_mask is None else np.flatnonzero(query_mask)
+    codes: list[np.ndarray] = []
+    pending = 0
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * rows))).ravel()
+        _, buckets = np.unique(keys, return_inverse=True)
+        buckets = buckets.ravel()
+        order = np.argsort(buckets, kind="stable")
+        starts = np.flatnonzero(np.r_[True, np.diff(buckets[order]) != 0])
+        sizes = np.diff(np.r_[starts, count])
+
+        if queries is None:
+            # Pairs within buckets, all buckets of one size at a time
+            for size in np.unique(sizes[sizes > 1]):
+                members = order[starts[sizes == size, None] + np.arange(size)]
+                first, second = np.triu_indices(size, 1)
+                codes.append(
+                    members[:, first].ravel().astype(np.int64) * count
+                    + members[:, second].ravel()
+                )
+                pending += len(codes[-1])
+        else:
+            # Each query row with every member of its bucket
+            query_buckets = np.searchsorted(buckets[order][starts], buckets[queries])
+            lengths = sizes[query_buckets]
+            left: np.ndarray = np.repeat(queries, lengths)
+            offsets = np.arange(len(left)) - np.repeat(
+                np.cumsum(lengths) - lengths, lengths
+            )
+            right = order[np.repeat(starts[query_buckets], lengths) + offsets]
+            keep = left != right
+            left, right = left[keep], right[keep]
+            codes.append(
+                np.minimum(left, right).astype(np.int64) * count
+                + np.maximum(left, right)
+            )
+            pending += len(codes[-1])
+
+        # Bands find the same pairs again: drop duplicates now and then
+        if pending > _MINHASH_BLOCK * 64:
+            codes = [np.unique(np.concatenate(codes))]
+            pending = len(codes[0])
+
+    if not codes:
+        return np.empty((0, 2), dtype=np.int64)
+    unique = np.unique(np.concatenate(codes))
+    return np.stack((unique // count, unique % count), axis=1)
+
+
+def minhash_pairs(
+    tag_sets: Mapping[str, set[str]],
+    threshold: float,
+    signatures: np.ndarray,
+    bands: int,
+    rows: int,
+    query_ids: Optional[Iterable[str]] = None,
+) -> list[tuple[str, str, float]]:
+    """
+    Find similar pairs among LSH candidates (approximate jaccard_pairs()).
+
+    Candidates are verified with the exact similarity, so every returned
+    pair is one jaccard_pairs() returns too, in the same order and
+    orientation; pairs that share no band are missed.
+
+    Args:
+        tag_sets: Non-empty tag set by sample ID
+        threshold: Minimum Jaccard similarity
+        signatures: MinHash signatures in tag_sets order
+        bands: LSH bands
+        rows: Signature positions per band
+        query_ids: IDs whose pairs are wanted (default: all IDs)
+
+    Returns:
+        (query ID, other ID, similarity) tuples
+    """
+    ids = list(tag_sets)
+    sets = [tag_sets[sample_id] for sample_id in ids]
+    is_query: np.ndarray
+    if query_ids is None:
+        is_query = np.ones(len(ids), dtype=bool)
+    else:
+        query_set = set(query_ids)
+        is_query = np.array([sample_id in query_set for sample_id in ids], dtype=bool)
+
+    query_pairs: list[tuple[int, int, float]] = []
+    other_pairs: list[tuple[int, int, float]] = []
+    candidates = lsh_candidate_pairs(
+        signatures, bands, rows, None if is_query.all() else is_query
+    )
+    for low, high in candidates.tolist():
+        similarity = _jaccard(sets[low], sets[high])
+        if similarity < threshold:
+            continue
+        if is_query[low] and is_query[high]:
+            query_pairs.append((low, high, similarity))
+        elif is_query[low]:
+            other_pairs.append((low, high, similarity))
+        else:
+            other_pairs.append((high, low, similarity))
+
+    return [
+        (ids[a], ids[b], similarity)
+        for pairs in (query_pairs, other_pairs)
+        for a, b, similarity in sorted(pairs)
+    ]
+
+
+def measure_recall(
+    tag_sets: Mapping[str, set[str]],
+    threshold: float,
+    pairs: Iterable[tuple[str, str, float]],
+    sample_ids: Iterable[str],
+) -> Optional[float]:
+    """
+    Share of the exact pairs of some samples that an approximate join found.
+
+    Args:
+        tag_sets: Tag sets the pairs were computed from
+        threshold: Minimum Jaccard similarity
+        pairs: Pairs returned by the approximate join
+        sample_ids: Query IDs to check (their exact pairs are computed)
+
+    Returns:
+        Recall between 0 and 1, or None if the samples have no exact pairs
+    """
+    sample = set(sample_ids)
+    exact = {
+        frozenset((a, b)) for a, b, _ in jaccard_pairs(tag_sets, threshold, sample)
+    }
+    if not exact:
+        return None
+    found = {frozenset((a, b)) for a, b, _ in pairs if a in sample or b in sample}
+    return len(found & exact) / len(exact)
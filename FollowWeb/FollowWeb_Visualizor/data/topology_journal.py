@@ -0,0 +1,360 @@
+"""
+Append-only edge journal for delta checkpoints.
+
+This module stores graph topology changes made between full topology
+snapshots. Each checkpoint save in delta mode appends one JSON line with the
+nodes and edges added since the previous save, so the cost of a save scales
+with the size of the change instead of the size of the library. The sample
+IDs marked as processed since the previous save ride along in the same line.
+
+The journal is replayed on top of the full topology snapshot
+(``graph_topology.gpickle`` or ``graph_topology_csr/``) when a checkpoint is
+loaded, and truncated whenever a full snapshot (compaction) is written.
+Replay is idempotent: re-adding nodes or edges that the snapshot already
+contains is a no-op, so a crash between writing a snapshot and clearing the
+journal cannot corrupt the topology.
+
+A crash in the middle of an append can only leave a partial last line. The
+loader, the checkpoint verifier and the next append all treat that line the
+same way: it is ignored (and truncated before appending). A corrupt line
+followed by further entries cannot come from a crash and is rejected.
+
+TrackedDiGraph counts structural mutations so the loader can tell whether
+every change since the last save went through its journaling wrappers.
+"""
+
+import json
+import logging
+import os
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+
+import networkx as nx
+
+
+class TrackedDiGraph(nx.DiGraph):
+    """
+    DiGraph that counts structural mutations.
+
+    Every node or edge addition and removal increments ``mutation_count``,
+    whichever code path made it. Comparing the counter with the value seen
+    by the last journaled change detects edits that bypassed the journal,
+    including an addition and a removal that leave the counts unchanged.
+
+    Pickles as a plain ``nx.DiGraph`` so exported graphs stay loadable
+    without this module.
+
+    Attributes:
+        mutation_count: Number of structural mutations since creation
+    """
+
+    def __init__(self, incoming_graph_data=None, **attr):
+        # Set first: DiGraph.__init__ adds incoming data through add_*_from
+        self.mutation_count = 0
+        super().__init__(incoming_graph_data, **attr)
+
+    @classmethod
+    def track(cls, graph: nx.DiGraph) -> "TrackedDiGraph":
+        """
+        Start counting mutations of an existing graph.
+
+        A plain DiGraph is converted in place (same adjacency dicts, no copy)
+        so loading a large topology doesn't briefly hold it twice.
+
+        Args:
+            graph: Graph to track
+
+        Returns:
+            The tracked graph (the same object for plain DiGraphs)
+        """
+        if isinstance(graph, cls):
+            return graph
+        if type(graph) is nx.DiGraph:
+            graph.__class__ = cls
+            graph.mutation_count = 0
+            return graph  # type: ignore[return-value]
+        return cls(graph)
+
+    def __reduce__(self):
+        state = dict(self.__dict__)
+        state.pop("mutation_count", None)
+        return (nx.DiGraph, (), state)
+
+    def add_node(self, node_for_adding, **attr):
+        super().add_node(node_for_adding, **attr)
+        self.mutation_count += 1
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        super().add_nodes_from(nodes_for_adding, **attr)
+        self.mutation_count += 1
+
+    def remove_node(self, n):
+        super().remove_node(n)
+        self.mutation_count += 1
+
+    def remove_nodes_from(self, nodes):
+        super().remove_nodes_from(nodes)
+        self.mutation_count += 1
+
+    def add_edge(self, u_of_edge, v_of_edge, **attr):
+        super().add_edge(u_of_edge, v_of_edge, **attr)
+        self.mutation_count += 1
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        super().add_edges_from(ebunch_to_add, **attr)
+        self.mutation_count += 1
+
+    def remove_edge(self, u, v):
+        super().remove_edge(u, v)
+        self.mutation_count += 1
+
+    def remove_edges_from(self, ebunch):
+        super().remove_edges_from(ebunch)
+        self.mutation_count += 1
+
+    def clear(self):
+        super().clear()
+        self.mutation_count += 1
+
+    def clear_edges(self):
+        super().clear_edges()
+        self.mutation_count += 1
+
+
+class TopologyJournal:
+    """
+    Append-only journal of topology changes between full snapshots.
+
+    Each line of the journal file is a JSON object::
+
+        {"timestamp": "...", "nodes": ["123", ...], "edges": [["123", "456"], ...]}
+
+    Edges may also carry their type and weight as ``["123", "456", "user", 1.0]``
+    (CSR topology format); replay restores those as edge attributes. An
+    optional ``"processed"`` list holds the sample IDs marked as processed
+    since the previous save.
+
+    Attributes:
+        journal_path: Path to the journal file
+        logger: Logger instance
+
+    Example:
+        journal = TopologyJournal('data/freesound_library/graph_topology.journal')
+        journal.append(nodes=['123'], edges=[('123', '456')])
+        journal.replay(graph)
+        journal.clear()
+    """
+
+    def __init__(self, journal_path: str, logger: Optional[logging.Logger] = None):
+        """
+        Initialize topology journal.
+
+        Args:
+            journal_path: Path to journal file (created on first append)
+            logger: Optional logger instance
+        """
+        self.journal_path = Path(journal_path)
+        self.logger = logger or logging.getLogger(self.__class__.__name__)
+
+    def append(
+        self,
+        nodes: list[str],
+        edges: list[tuple],
+        processed: Optional[list[str]] = None,
+    ) -> None:
+        """
+        Append one batch of added nodes and edges to the journal.
+
+        The batch is written as a single line and fsynced so a crash cannot
+        leave a partially written batch behind the last complete one. A
+        partial last line left by an earlier crash is truncated first, so it
+        never ends up in the middle of the journal.
+
+        Args:
+            nodes: Node IDs added since the previous save
+            edges: (source, target) or (source, target, type, weight) tuples
+                added since the previous save
+            processed: Sample IDs marked as processed since the previous save
+        """
+        if not nodes and not edges and not processed:
+            return
+
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+
+        record = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "nodes": list(nodes),
+            "edges": [list(edge) for edge in edges],
+        }
+        if processed:
+            record["processed"] = list(processed)
+
+        self._truncate_partial_tail()
+
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.logger.debug(
+            f"Journaled {len(nodes)} nodes and {len(edges)} edges "
+            f"to {self.journal_path.name}"
+        )
+
+    def replay(
+        self, graph: nx.DiGraph, processed_ids: Optional[set[str]] = None
+    ) -> tuple[int, int]:
+        """
+        Apply all journaled batches to a graph.
+
+        A partial last line (from a crash mid-append) is ignored.
+
+        Args:
+            graph: Graph loaded from the last full topology snapshot
+            processed_ids: Optional set to add the journaled processed IDs to
+
+        Returns:
+            Tuple of (batches_replayed, edges_replayed)
+
+        Raises:
+            ValueError: If an entry before the last line is corrupt
+        """
+        batches = 0
+        edge_count = 0
+
+        for record in self.iter_batches():
+            graph.add_nodes_from(record.get("nodes", []))
+            edges = record.get("edges", [])
+            for edge in edges:
+                attrs = {}
+                if len(edge) > 2 and edge[2] is not None:
+                    attrs["type"] = edge[2]
+                if len(edge) > 3 and edge[3] is not None:
+                    attrs["weight"] = edge[3]
+                graph.add_edge(edge[0], edge[1], **attrs)
+            if processed_ids is not None:
+                processed_ids.update(record.get("processed", []))
+            batches += 1
+            edge_count += len(edges)
+
+        if batches:
+            self.logger.info(
+                f"Replayed {batches} journal batches ({edge_count} edges) "
+                f"from {self.journal_path.name}"
+            )
+
+        return batches, edge_count
+
+    def iter_batches(self) -> Iterator[dict[str, Any]]:
+        """
+        Iterate over the journaled batches in append order.
+
+        Shared by replay and verification so both apply the same rule: an
+        unparsable last line is a crash mid-append and is skipped with a
+        warning, an unparsable line followed by more entries is corruption.
+
+        Yields:
+            Batch records with "nodes" and "edges" (and optionally
+            "processed") lists
+
+        Raises:
+            ValueError: If an entry before the last line is corrupt
+        """
+        if not self.exists():
+            return
+
+        corrupt_line: Optional[int] = None
+
+        with open(self.journal_path, encoding="utf-8", errors="replace") as f:
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                if corrupt_line is not None:
+                    raise ValueError(
+                        f"Corrupt journal entry at line {corrupt_line} "
+                        f"of {self.journal_path.name}"
+                    )
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    corrupt_line = line_number
+                    continue
+                yield record
+
+        if corrupt_line is not None:
+            self.logger.warning(
+                f"Ignoring truncated journal entry at line {corrupt_line}"
+            )
+
+    def count_batches(self) -> int:
+        """
+        Count the batches currently stored in the journal.
+
+        Returns:
+            Number of complete journal entries
+
+        Raises:
+            ValueError: If an entry before the last line is corrupt
+        """
+        return sum(1 for _ in self.iter_batches())
+
+    def _truncate_partial_tail(self) -> None:
+        """Cut a partial last line (no trailing newline) off the journal."""
+        if not self.exists():
+            return
+
+        with open(self.journal_path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) == b"\n":
+                return
+
+            # Scan backwards for the end of the last complete line
+            position = size
+            keep = 0
+            while position > 0:
+                chunk_start = max(0, position - 4096)
+                f.seek(chunk_start)
+                chunk = f.read(position - chunk_start)
+                newline = chunk.rfind(b"\n")
+                if newline != -1:
+                    keep = chunk_start + newline + 1
+                    break
+                position = chunk_start
+
+            f.truncate(keep)
+            f.flush()
+            os.fsync(f.fileno())
+
+        self.logger.warning(
+            f"Truncated partial journal entry ({size - keep} bytes) "
+            f"from {self.journal_path.name}"
+        )
+
+    def clear(self) -> None:
+        """
+        Delete the journal file.
+
+        Called after a full snapshot has been written. Safe to call even if
+        the journal doesn't exist.
+        """
+        if self.exists():
+            try:
+                self.journal_path.unlink()
+                self.logger.debug("Topology journal cleared")
+            except Exception as e:
+                self.logger.warning(f"Failed to clear topology journal: {e}")
+
+    def exists(self) -> bool:
+        """
+        Check if journal file exists.
+
+        Returns:
+            True if journal file exists, False otherwise
+        """
+        return self.journal_path.exists()
@@ -48,7 +48,7 @@ from .parallel import (
     log_parallel_usage,
 )
 from .progress import ProgressTracker
-from .rate_limiter import RateLimiter
+from .rate_limiter import AdaptiveRateController, RateLimiter, SharedTokenBucket
 from .validation import (
     ConfigurationErrorHandler,
     ValidationErrorHandler,
@@ -122,6 +122,8 @@ __all__ = [
     "ProgressTracker",
     # Rate limiting
     "RateLimiter",
+    "SharedTokenBucket",
+    "AdaptiveRateController",
     # Failure handling
     "FailureHandler",
     "GitHubIssueCreator",
@@ -10,6 +10,8 @@ where occasional bursts are acceptable but sustained high rates must be prevente
 
 Classes:
     RateLimiter: Thread-safe rate limiter using token bucket algorithm
+    SharedTokenBucket: SQLite-backed bucket state shared between processes
+    AdaptiveRateController: AIMD control of a RateLimiter's rate from 429s
 
 Example:
     Basic usage::
@@ -53,6 +55,18 @@ Example:
         for t in threads:
             t.join()
 
+    Multi-process usage (several scripts on one API key)::
+
+        limiter = RateLimiter(
+            requests_per_minute=60,
+            shared_state_path="data/freesound_library/rate_limit.db",
+        )
+
+    Async usage::
+
+        if await limiter.acquire_async(timeout=5.0):
+            response = await make_async_api_request()
+
 See Also:
     :class:`~FollowWeb_Visualizor.data.loaders.freesound.FreesoundLoader`: Uses RateLimiter
 
@@ -65,12 +79,158 @@ Notes:
     4. If bucket is empty, requests block until tokens are available
 
     This allows bursts up to N requests, then throttles to the average rate.
+
+    A blocked acquire() sleeps for exactly the time until enough tokens are
+    refilled instead of polling, and is woken early by reset().
 """
 
+import asyncio
 import logging
+import sqlite3
 import threading
 import time
-from typing import Optional
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+class SharedTokenBucket:
+    """
+    Token bucket state stored in SQLite, shared by processes on one machine.
+
+    Every operation runs in a ``BEGIN IMMEDIATE`` transaction, so SQLite's
+    file lock serializes refills and withdrawals across processes (the fetch,
+    validation and repair scripts running side by side on one API key).
+    Timestamps are wall-clock seconds since epoch, which all processes share.
+
+    The capacity and refill rate are passed with each call rather than stored,
+    so all processes sharing a bucket should be configured with the same rate.
+
+    Attributes
+    ----------
+    path : Path
+        SQLite database holding the bucket state
+    name : str
+        Bucket name; one database can hold several independent buckets
+    """
+
+    def __init__(
+        self, path: Union[str, Path], name: str = "default", timeout: float = 30.0
+    ):
+        """
+        Open (and create if needed) the shared bucket database.
+
+        Args:
+            path: SQLite database file shared by all processes
+            name: Bucket name within the database
+            timeout: Seconds to wait for another process's transaction
+        """
+        self.path = Path(path)
+        self.name = name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Callers serialize access (RateLimiter holds its lock), so a single
+        # connection can be used from any thread
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            str(self.path),
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS token_buckets (
+                name TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                last_update REAL NOT NULL
+            )
+            """
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a write-locked transaction across all processes."""
+        if self._conn is None:
+            raise RuntimeError("SharedTokenBucket is closed")
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+    def _refill(
+        self, conn: sqlite3.Connection, capacity: int, refill_rate: float
+    ) -> tuple[float, float]:
+        """Get the refilled token count and the current time."""
+        now = time.time()
+        row = conn.execute(
+            "SELECT tokens, last_update FROM token_buckets WHERE name = ?",
+            (self.name,),
+        ).fetchone()
+        if row is None:
+            # New buckets start full, like a local RateLimiter
+            return float(capacity), now
+
+        tokens, last_update = row
+        elapsed = max(0.0, now - last_update)
+        return min(float(capacity), tokens + elapsed * refill_rate), now
+
+    def _store(self, conn: sqlite3.Connection, tokens: float, now: float) -> None:
+        """Write the bucket state."""
+        conn.execute(
+            "INSERT OR REPLACE INTO token_buckets (name, tokens, last_update) "
+            "VALUES (?, ?, ?)",
+            (self.name, tokens, now),
+        )
+
+    def take(self, tokens: int, capacity: int, refill_rate: float) -> float:
+        """
+        Withdraw tokens if they are available.
+
+        Args:
+            tokens: Number of tokens to withdraw
+            capacity: Bucket capacity
+            refill_rate: Tokens refilled per second
+
+        Returns:
+            0.0 if the tokens were withdrawn, otherwise the seconds until
+            enough tokens will be available (nothing is withdrawn)
+        """
+        # A batch larger than the capacity is granted from a full bucket and
+        # leaves it in deficit (see RateLimiter._try_acquire)
+        required = min(tokens, capacity)
+        with self._transaction() as conn:
+            available, now = self._refill(conn, capacity, refill_rate)
+            if available >= required:
+                self._store(conn, available - tokens, now)
+                return 0.0
+            self._store(conn, available, now)
+            return (required - available) / refill_rate
+
+    def peek(self, capacity: int, refill_rate: float) -> float:
+        """Get the number of available tokens without withdrawing any."""
+        with self._transaction() as conn:
+            available, _ = self._refill(conn, capacity, refill_rate)
+            return available
+
+    def reset(self, capacity: int) -> None:
+        """Refill the bucket to capacity."""
+        with self._transaction() as conn:
+            self._store(conn, float(capacity), time.time())
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the server reported throttling."""
+        with self._transaction() as conn:
+            self._store(conn, 0.0, time.time())
+
+    def close(self) -> None:
+        """Close the database connection (idempotent)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
 
 
 class RateLimiter:
@@ -95,6 +255,8 @@ class RateLimiter:
         Timestamp of last token refill (seconds since epoch)
     lock : threading.Lock
         Thread lock for thread-safe operations
+    shared_bucket : SharedTokenBucket or None
+        Cross-process bucket state; when set, tokens and last_update are unused
     logger : logging.Logger
         Logger instance for rate limit events
 
@@ -114,6 +276,11 @@ class RateLimiter:
     The refill rate is calculated as: rate / 60 tokens per second
     For example, 60 requests/minute = 1 token per second
 
+    Waiting threads sleep on a condition variable for exactly the time until
+    their tokens are refilled, so a throttled request adds no polling latency.
+    With shared_state_path, the bucket lives in a SQLite file and several
+    processes on one machine draw from the same budget.
+
     Examples
     --------
     Basic usage::
@@ -145,10 +312,15 @@ class RateLimiter:
     acquire : Acquire tokens from the bucket
     get_available_tokens : Get current token count
     wait_for_capacity : Calculate wait time for tokens
+    acquire_async : Acquire tokens without blocking the event loop
     reset : Reset bucket to full capacity
     """
 
-    def __init__(self, requests_per_minute: int = 60):
+    def __init__(
+        self,
+        requests_per_minute: int = 60,
+        shared_state_path: Optional[Union[str, Path]] = None,
+    ):
         """
         Initialize rate limiter with specified rate.
 
@@ -157,6 +329,10 @@ class RateLimiter:
         requests_per_minute : int, optional
             Maximum requests allowed per minute (default: 60).
             This is both the bucket capacity and the refill rate.
+        shared_state_path : str or Path, optional
+            SQLite file holding the bucket state so that several processes
+            share one budget (default: None, bucket is local to this object).
+            All processes sharing the file should use the same rate.
 
         Raises
         ------
@@ -188,13 +364,22 @@ class RateLimiter:
             raise ValueError("requests_per_minute must be positive")
 
         self.rate = requests_per_minute
+        # Largest batch acquire() accepts; set_rate() may lower the rate below it
+        self.capacity = requests_per_minute
         self.tokens = float(requests_per_minute)
         self.last_update = time.time()
         self.lock = threading.Lock()
+        self._condition = threading.Condition(self.lock)
+        self._paused_until = 0.0
+        self.shared_bucket: Optional[SharedTokenBucket] = None
         self.logger = logging.getLogger(__name__)
 
+        if shared_state_path is not None:
+            self.shared_bucket = SharedTokenBucket(shared_state_path)
+
         self.logger.info(
             f"RateLimiter initialized: {requests_per_minute} requests/minute"
+            + (f" (shared via {shared_state_path})" if self.shared_bucket else "")
         )
 
     def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
@@ -203,7 +388,9 @@ class RateLimiter:
 
         This method blocks the calling thread until the requested number of tokens
         becomes available. Tokens are refilled continuously based on the configured
-        rate.
+        rate. If set_rate() lowered the bucket capacity below ``tokens``, the
+        batch is granted once the bucket is full and the deficit is repaid by
+        later refills, so the average rate still holds.
 
         Args:
             tokens: Number of tokens to acquire (default: 1)
@@ -213,7 +400,8 @@ class RateLimiter:
             True if tokens were acquired, False if timeout was reached
 
         Raises:
-            ValueError: If tokens is not positive
+            ValueError: If tokens is not positive or exceeds the configured
+                capacity (requests_per_minute, or the highest set_rate())
 
         Example:
             >>> limiter = RateLimiter(requests_per_minute=60)
@@ -224,49 +412,139 @@ class RateLimiter:
             ...     # Handle timeout
             ...     pass
         """
-        if tokens <= 0:
-            raise ValueError("tokens must be positive")
+        self._validate_tokens(tokens)
 
-        start_time = time.time()
+        start_time = time.monotonic()
+        deadline = None if timeout is None else start_time + timeout
         wait_logged = False
 
-        with self.lock:
+        with self._condition:
             while True:
-                self._refill_tokens()
-
-                # Check if we have enough tokens
-                if self.tokens >= tokens:
-                    self.tokens -= tokens
+                wait_time = self._try_acquire(tokens)
+                if wait_time <= 0.0:
                     if wait_logged:
-                        elapsed = time.time() - start_time
+                        elapsed = time.monotonic() - start_time
                         self.logger.info(
                             f"Rate limit wait completed after {elapsed:.2f}s"
                         )
                     return True
 
                 # Check timeout
-                if timeout is not None:
-                    elapsed = time.time() - start_time
-                    if elapsed >= timeout:
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         self.logger.warning(
-                            f"Rate limit timeout after {elapsed:.2f}s "
-                            f"(needed {tokens} tokens, have {self.tokens:.2f})"
+                            f"Rate limit timeout after {timeout:.2f}s "
+                            f"(needed {tokens} tokens)"
                         )
                         return False
+                    wait_time = min(wait_time, remaining)
 
                 # Log waiting message (only once per acquire call)
                 if not wait_logged:
-                    wait_time = (tokens - self.tokens) / (self.rate / 60.0)
                     self.logger.debug(
                         f"Rate limit reached, waiting ~{wait_time:.2f}s "
-                        f"(need {tokens} tokens, have {self.tokens:.2f})"
+                        f"(need {tokens} tokens)"
                     )
                     wait_logged = True
 
-                # Release lock briefly to allow other threads
-                self.lock.release()
-                time.sleep(0.1)
-                self.lock.acquire()
+                # Sleep until the tokens are refilled (releases the lock for
+                # other threads); reset() wakes waiters early
+                self._condition.wait(wait_time)
+
+    async def acquire_async(
+        self, tokens: int = 1, timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Acquire tokens from the bucket without blocking the event loop.
+
+        Same semantics as acquire(), but waits with asyncio.sleep(). The bucket
+        is shared with threads using acquire(). With a shared bucket the
+        SQLite transaction runs in the loop's default executor, so only the
+        sleep happens on the event loop.
+
+        Args:
+            tokens: Number of tokens to acquire (default: 1)
+            timeout: Maximum time to wait in seconds (None = wait indefinitely)
+
+        Returns:
+            True if tokens were acquired, False if timeout was reached
+
+        Raises:
+            ValueError: If tokens is not positive or exceeds the configured
+                capacity (requests_per_minute, or the highest set_rate())
+
+        Example:
+            >>> limiter = RateLimiter(requests_per_minute=60)
+            >>> async def fetch():
+            ...     if await limiter.acquire_async(timeout=5.0):
+            ...         pass  # Make API request
+        """
+        self._validate_tokens(tokens)
+
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            if self.shared_bucket is not None:
+                wait_time = await loop.run_in_executor(
+                    None, self._try_acquire_locked, tokens
+                )
+            else:
+                wait_time = self._try_acquire_locked(tokens)
+            if wait_time <= 0.0:
+                return True
+
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    self.logger.warning(
+                        f"Rate limit timeout after {timeout:.2f}s "
+                        f"(needed {tokens} tokens)"
+                    )
+                    return False
+                wait_time = min(wait_time, remaining)
+
+            await asyncio.sleep(wait_time)
+
+    def _validate_tokens(self, tokens: int) -> None:
+        """Reject token counts larger than the configured capacity."""
+        if tokens <= 0:
+            raise ValueError("tokens must be positive")
+        if tokens > self.capacity:
+            raise ValueError(
+                f"tokens ({tokens}) exceeds bucket capacity ({self.capacity})"
+            )
+
+    def _try_acquire_locked(self, tokens: int) -> float:
+        """Run _try_acquire() under the lock (see _try_acquire for the result)."""
+        with self.lock:
+            return self._try_acquire(tokens)
+
+    def _try_acquire(self, tokens: int) -> float:
+        """
+        Withdraw tokens if available. Must be called with the lock held.
+
+        Returns:
+            0.0 if the tokens were withdrawn, otherwise the exact time in
+            seconds until enough tokens will be available
+        """
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            return pause
+
+        refill_rate = self.rate / 60.0
+        if self.shared_bucket is not None:
+            return self.shared_bucket.take(tokens, self.rate, refill_rate)
+
+        # After a rate decrease the bucket may hold fewer tokens than a batch
+        # needs; grant it from a full bucket and let the balance go negative
+        required = min(tokens, self.rate)
+        self._refill_tokens()
+        if self.tokens >= required:
+            self.tokens -= tokens
+            return 0.0
+        return (required - self.tokens) / refill_rate
 
     def _refill_tokens(self) -> None:
         """
@@ -304,6 +582,8 @@ class RateLimiter:
             >>> print(f"Available tokens: {available:.2f}")
         """
         with self.lock:
+            if self.shared_bucket is not None:
+                return self.shared_bucket.peek(self.rate, self.rate / 60.0)
             self._refill_tokens()
             return self.tokens
 
@@ -319,9 +599,13 @@ class RateLimiter:
             >>> limiter.acquire(tokens=50)
             >>> limiter.reset()  # Refill to 60 tokens
         """
-        with self.lock:
+        with self._condition:
+            if self.shared_bucket is not None:
+                self.shared_bucket.reset(self.rate)
             self.tokens = float(self.rate)
             self.last_update = time.time()
+            self._paused_until = 0.0
+            self._condition.notify_all()
             self.logger.info("RateLimiter reset to full capacity")
 
     def wait_for_capacity(self, required_tokens: int = 1) -> float:
@@ -342,14 +626,280 @@ class RateLimiter:
             >>> wait_time = limiter.wait_for_capacity(tokens=10)
             >>> print(f"Need to wait {wait_time:.2f} seconds")
         """
-        with self.lock:
+        available = self.get_available_tokens()
+
+        if available >= min(required_tokens, self.rate):
+            return 0.0
+
+        # Calculate how long until we have enough tokens (a full bucket
+        # suffices for batches above the current capacity)
+        tokens_needed = min(required_tokens, self.rate) - available
+        wait_time = tokens_needed / (self.rate / 60.0)
+
+        return wait_time
+
+    def set_rate(self, requests_per_minute: float) -> None:
+        """
+        Change the refill rate and bucket capacity.
+
+        Tokens above the new capacity are discarded, and waiting threads
+        recompute their wait time. Batches up to the configured capacity
+        can still be acquired (see acquire()).
+
+        Args:
+            requests_per_minute: New rate (must be positive)
+
+        Raises:
+            ValueError: If requests_per_minute is not positive
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+
+        with self._condition:
             self._refill_tokens()
+            self.rate = requests_per_minute
+            self.capacity = max(self.capacity, requests_per_minute)
+            self.tokens = min(self.tokens, float(requests_per_minute))
+            self._condition.notify_all()
+
+    def drain(self, pause_seconds: float = 0.0) -> None:
+        """
+        Empty the bucket and optionally block acquisitions for a while.
+
+        Used after the server reports throttling, so queued requests don't
+        burst into the limit again. With a shared bucket, the tokens of all
+        processes are drained; the pause only applies to this limiter.
+
+        Args:
+            pause_seconds: Time during which no tokens are granted (e.g. the
+                server's Retry-After value)
+        """
+        with self._condition:
+            if self.shared_bucket is not None:
+                self.shared_bucket.drain()
+            self.tokens = 0.0
+            self.last_update = time.time()
+            self._paused_until = max(
+                self._paused_until, time.monotonic() + max(0.0, pause_seconds)
+            )
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """Close the shared bucket database, if any (idempotent)."""
+        with self.lock:
+            if self.shared_bucket is not None:
+                self.shared_bucket.close()
 
-            if self.tokens >= required_tokens:
-                return 0.0
 
-            # Calculate how long until we have enough tokens
-            tokens_needed = required_tokens - self.tokens
-            wait_time = tokens_needed / (self.rate / 60.0)
+class AdaptiveRateController:
+    """
+    Additive-increase/multiplicative-decrease control of a RateLimiter.
+
+    The configured rate of a RateLimiter is only an upper bound on what the
+    server accepts. The controller lowers the limiter's rate by
+    ``decrease_factor`` when a request is throttled (HTTP 429), drains the
+    bucket and honours Retry-After, then raises the rate by
+    ``increase_step`` requests/minute after every ``success_window``
+    consecutive successful requests, up to ``max_rate``.
+
+    A burst of concurrent requests throttled together is one congestion
+    signal, so the rate is decreased at most once per rate epoch: throttles
+    of requests issued before the last decrease (or, without a send time,
+    within ``decrease_cooldown`` seconds of it) only drain the bucket.
+
+    The rate the controller settles at is the learned safe rate; callers can
+    persist it with get_state() and start the next run near it with
+    restore_state().
+
+    Attributes
+    ----------
+    limiter : RateLimiter
+        Limiter whose rate is adjusted
+    max_rate : float
+        Upper bound (the configured requests per minute)
+    min_rate : float
+        Lower bound for decreases
+    trajectory : list of dict
+        Rate changes as {"elapsed", "rate", "reason"}, oldest first (bounded
+        by max_trajectory)
+
+    Example:
+        >>> limiter = RateLimiter(requests_per_minute=60)
+        >>> controller = AdaptiveRateController(limiter)
+        >>> controller.on_throttle(retry_after=5.0)  # 60 -> 30 requests/minute
+        >>> controller.on_success()
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter,
+        min_rate: float = 1.0,
+        decrease_factor: float = 0.5,
+        increase_step: float = 1.0,
+        success_window: int = 20,
+        max_trajectory: int = 200,
+        decrease_cooldown: float = 1.0,
+    ):
+        """
+        Initialize the controller at the limiter's current rate.
+
+        Args:
+            limiter: Limiter whose rate is adjusted (its rate is the ceiling)
+            min_rate: Lowest rate in requests per minute
+            decrease_factor: Rate multiplier applied on throttling (0 < f < 1)
+            increase_step: Requests per minute added after a success window
+            success_window: Consecutive successes required for an increase
+            max_trajectory: Rate changes kept in the trajectory
+            decrease_cooldown: Seconds after a decrease during which
+                throttles without a send time don't decrease the rate again
+
+        Raises:
+            ValueError: If decrease_factor is not in (0, 1) or success_window
+                is not positive
+        """
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if success_window <= 0:
+            raise ValueError("success_window must be positive")
+
+        self.limiter = limiter
+        self.max_rate = float(limiter.rate)
+        self.min_rate = min(float(min_rate), self.max_rate)
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.success_window = success_window
+        self.max_trajectory = max_trajectory
+        self.decrease_cooldown = decrease_cooldown
+
+        self.decreases = 0
+        self.ignored_throttles = 0
+        self.increases = 0
+        self.lowest_rate = self.max_rate
+        self.trajectory: list[dict[str, Any]] = []
+        self._successes = 0
+        self._last_decrease = float("-inf")
+        self._start_time = time.monotonic()
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+        self._record(self.max_rate, "start")
+
+    @property
+    def rate(self) -> float:
+        """Current requests per minute."""
+        return float(self.limiter.rate)
+
+    def _record(self, rate: float, reason: str) -> None:
+        """Append a rate change to the bounded trajectory."""
+        self.trajectory.append(
+            {
+                "elapsed": round(time.monotonic() - self._start_time, 3),
+                "rate": round(rate, 2),
+                "reason": reason,
+            }
+        )
+        if len(self.trajectory) > self.max_trajectory:
+            del self.trajectory[0]
+
+    def _apply(self, rate: float, reason: str) -> None:
+        """Set the limiter's rate and record the change (lock held)."""
+        self.limiter.set_rate(rate)
+        self.lowest_rate = min(self.lowest_rate, rate)
+        self._record(rate, reason)
+
+    def on_success(self) -> None:
+        """Record a successful request; raise the rate after a full window."""
+        with self._lock:
+            self._successes += 1
+            if self._successes < self.success_window:
+                return
+            self._successes = 0
+
+            rate = self.rate
+            if rate >= self.max_rate:
+                return
+            new_rate = min(self.max_rate, rate + self.increase_step)
+            self.increases += 1
+            self._apply(new_rate, "increase")
+            self.logger.debug(
+                f"Adaptive rate increased: {rate:.1f} -> {new_rate:.1f} requests/minute"
+            )
+
+    def on_throttle(
+        self, retry_after: Optional[float] = None, issued_at: Optional[float] = None
+    ) -> None:
+        """
+        Record a throttled (429) request and back off.
+
+        Args:
+            retry_after: Seconds the server asked to wait, if it said so
+            issued_at: time.monotonic() when the throttled request was sent;
+                requests sent before the last decrease don't decrease the
+                rate again
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._successes = 0
+            rate = self.rate
+            if issued_at is None:
+                stale = now - self._last_decrease < self.decrease_cooldown
+            else:
+                stale = issued_at < self._last_decrease
+            if stale:
+                self.ignored_throttles += 1
+            else:
+                new_rate = max(self.min_rate, rate * self.decrease_factor)
+                self.decreases += 1
+                self._last_decrease = now
+                self._apply(new_rate, "throttled")
+
+        self.limiter.drain(retry_after or 0.0)
+        if stale:
+            self.logger.debug(
+                f"Throttle from before the last decrease, rate kept at "
+                f"{rate:.1f} requests/minute"
+            )
+            return
+        self.logger.warning(
+            f"Adaptive rate decreased after throttling: {rate:.1f} -> "
+            f"{new_rate:.1f} requests/minute"
+            + (f" (Retry-After {retry_after:.1f}s)" if retry_after else "")
+        )
+
+    def get_state(self) -> dict[str, Any]:
+        """Get the learned safe rate for persisting between runs."""
+        with self._lock:
+            return {"safe_rate": round(self.rate, 2), "max_rate": self.max_rate}
+
+    def restore_state(self, state: Optional[dict[str, Any]]) -> None:
+        """
+        Start near the safe rate learned by a previous run.
+
+        The restored rate is clamped to this run's min_rate and max_rate.
+
+        Args:
+            state: Dictionary from get_state(), or None
+        """
+        if not state or not state.get("safe_rate"):
+            return
+        with self._lock:
+            safe_rate = float(state["safe_rate"])
+            new_rate = max(self.min_rate, min(self.max_rate, safe_rate))
+            if new_rate != self.rate:
+                self._apply(new_rate, "restored")
+        self.logger.info(
+            f"Adaptive rate restored from checkpoint: {new_rate:.1f} requests/minute"
+        )
 
-            return wait_time
+    def get_stats(self) -> dict[str, Any]:
+        """Get the current rate, bounds, adjustment counts and trajectory."""
+        with self._lock:
+            return {
+                "rate": round(self.rate, 2),
+                "max_rate": self.max_rate,
+                "lowest_rate": round(self.lowest_rate, 2),
+                "decreases": self.decreases,
+                "ignored_throttles": self.ignored_throttles,
+                "increases": self.increases,
+                "trajectory": list(self.trajectory),
+            }
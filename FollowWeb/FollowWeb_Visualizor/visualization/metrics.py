@@ -19,6 +19,7 @@ try:
 except ImportError:
     pass  # nx_parallel not available, use standard NetworkX
 
+from ..analysis.groups import group_degree
 from ..core.types import (
     ColorScheme,
     EdgeMetric,
@@ -271,11 +272,11 @@ class MetricsCalculator:
             nx.set_node_attributes(graph, dict.fromkeys(graph.nodes(), 0), "community")
 
             # Set all centrality/degree to 0 or 1 for visualization fallback
+            # Hub-grouped samples also count the members of their groups
+            degrees = group_degree(graph)
             for n in graph.nodes():
-                node_degree = int(graph.degree(n))  # type: ignore[operator]
-                graph.nodes[n]["degree"] = (
-                    node_degree  # Use actual degree for sizing fallback
-                )
+                # Use actual degree for sizing fallback
+                graph.nodes[n]["degree"] = int(degrees[n])
                 graph.nodes[n]["betweenness"] = 0.0
                 graph.nodes[n]["eigenvector"] = 0.0
 
@@ -42,6 +42,7 @@ from typing import Any, Optional
 
 import networkx as nx
 
+from ...analysis.groups import get_sample_groups
 from ...core.types import VisualizationMetrics
 
 
@@ -422,6 +423,26 @@ class Renderer(ABC):
             }
         return edge_metrics
 
+    def _group_hubs(self, graph: nx.DiGraph) -> list[tuple[str, str, str, list[Any]]]:
+        """
+        Get the hub-represented sample groups of a graph to draw as stars.
+
+        Groups stored in graph.graph['sample_groups'] (same user, same pack)
+        have no edges between their members; renderers draw one hub node per
+        group with a spoke to each member instead.
+
+        Args:
+            graph: The NetworkX directed graph to render
+
+        Returns:
+            List of (hub node ID, edge type, group name, member node IDs)
+        """
+        return [
+            (f"{edge_type}:{name}", edge_type, name, members)
+            for edge_type, type_groups in get_sample_groups(graph).items()
+            for name, members in type_groups.items()
+        ]
+
     def _ensure_output_directory(self, output_filename: str) -> None:
         """
         Ensure output directory exists.
@@ -275,6 +275,21 @@ class PyvisRenderer(Renderer):
 
                 tracker.update(2)  # Edges added
 
+        # Draw hub-represented groups (same user/pack) as stars
+        for hub_id, group_type, name, members in self._group_hubs(graph):
+            net.add_node(
+                hub_id,
+                label=str(name) if show_labels else None,
+                size=min(20, 4 + len(members) ** 0.5),
+                color="#666666",
+                shape="diamond",
+                title=f"{group_type}: {name} ({len(members)} members)"
+                if show_tooltips
+                else None,
+            )
+            for member in members:
+                net.add_edge(hub_id, member, color="#e0e0e0", width=0.5)
+
         try:
             # Add spacing between building network and generating HTML
             self.logger.info("")
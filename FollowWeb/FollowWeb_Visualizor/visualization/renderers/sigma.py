@@ -559,7 +559,8 @@ class SigmaRenderer(Renderer):
             Dictionary with 'nodes' and 'edges' arrays in Sigma.js format
         """
         nodes = []
-        edges = []
+        edges: list[dict[str, Any]] = []
+        positions: dict[Any, tuple[float, float]] = {}
 
         # Get layout positions from metrics, or calculate physics-based layout
         layout = metrics.layout_positions
@@ -594,6 +595,7 @@ class SigmaRenderer(Renderer):
                 x, y = float(pos[0]), float(pos[1])
             else:
                 x, y = 0.0, 0.0
+            positions[node_id] = (x, y)
 
             # Check if this is Instagram data (has followers/following counts)
             is_instagram = (
@@ -730,6 +732,40 @@ class SigmaRenderer(Renderer):
 
             nodes.append(sigma_node)
 
+        # Draw hub-represented groups (same user/pack) as stars: a hub node at
+        # the members' centroid with a spoke to each member
+        for hub_id, group_type, name, members in self._group_hubs(graph):
+            xs, ys = zip(*(positions[member] for member in members))
+            nodes.append(
+                {
+                    "key": hub_id,
+                    "attributes": {
+                        "label": str(name),
+                        "x": float(np.mean(xs)),
+                        "y": float(np.mean(ys)),
+                        "size": float(min(20, 4 + np.sqrt(len(members)))),
+                        "color": "#666666",
+                        "node_type": "group",
+                        "group_type": group_type,
+                        "members": len(members),
+                    },
+                }
+            )
+            edges.extend(
+                {
+                    "source": hub_id,
+                    "target": str(member),
+                    "attributes": {
+                        "size": 0.5,
+                        "color": "#e0e0e0",
+                        "type": "line",
+                        "edge_type": group_type,
+                        "weight": 1.0,
+                    },
+                }
+                for member in members
+            )
+
         # Convert edges
         for source, target in graph.edges():
             edge_metric = edge_metrics.get((source, target), {})
@@ -466,3 +466,587 @@ class TestEdgeGenerationBenchmarks:
                 print(f"  Edges per second: {edge_count / benchmark.stats['mean']:.2f}")
 
             assert edge_count >= 0, "Should create some pack edges"
+
+
+def _populate_synthetic_library(loader, num_samples: int) -> None:
+    """Add picklable synthetic samples with user edges to a loader graph."""
+    for i in range(num_samples):
+        loader._add_node_to_graph(
+            {
+                "id": 100000 + i,
+                "name": f"sample_{i}.wav",
+                "tags": ["drum", "loop", f"tag{i % 40}"],
+                "description": f"Synthetic sample {i}",
+                "duration": 2.5,
+                "username": f"user_{i % 200}",
+                "pack": f"https://freesound.org/apiv2/packs/{i % 100}/",
+                "num_downloads": 1000 - (i % 1000),
+                "filesize": 1024000,
+            }
+        )
+    loader._add_user_edges_batch()
+
+
+class TestCheckpointSaveBenchmarks:
+    """Benchmark tests for per-save checkpoint cost."""
+
+    NUM_SAMPLES = 2000
+
+    @pytest.mark.benchmark
+    def test_checkpoint_save_speed(
+        self, benchmark, loader_config, mock_freesound_client
+    ):
+        """
+        Benchmark: Measure one split-checkpoint save (topology + SQLite + JSON).
+        """
+        from FollowWeb_Visualizor.data.loaders.incremental_freesound import (
+            IncrementalFreesoundLoader,
+        )
+
+        with patch("freesound.FreesoundClient", return_value=mock_freesound_client):
+            loader = IncrementalFreesoundLoader(loader_config)
+            _populate_synthetic_library(loader, self.NUM_SAMPLES)
+
+            benchmark(loader._save_checkpoint)
+
+            if benchmark.stats:
+                print(
+                    f"\n✓ Save time for {self.NUM_SAMPLES} samples: "
+                    f"{benchmark.stats['mean'] * 1000:.1f} ms"
+                )
+
+            loader.close()
+
+    @pytest.mark.performance
+    def test_checkpoint_save_without_legacy_dump(
+        self, loader_config, mock_freesound_client
+    ):
+        """
+        Performance test: Compare per-save time with and without the legacy
+        monolithic joblib dump that previously ran on every save.
+        """
+        from FollowWeb_Visualizor.data.loaders.incremental_freesound import (
+            IncrementalFreesoundLoader,
+        )
+
+        rounds = 3
+
+        with patch("freesound.FreesoundClient", return_value=mock_freesound_client):
+            loader = IncrementalFreesoundLoader(loader_config)
+            _populate_synthetic_library(loader, self.NUM_SAMPLES)
+            loader._save_checkpoint()
+
+            start_time = time.perf_counter()
+            for _ in range(rounds):
+                loader._save_checkpoint()
+                loader.export_legacy_checkpoint()
+            before = (time.perf_counter() - start_time) / rounds
+
+            start_time = time.perf_counter()
+            for _ in range(rounds):
+                loader._save_checkpoint()
+            after = (time.perf_counter() - start_time) / rounds
+
+            print("\n=== Checkpoint Save Time ===")
+            print(f"Samples: {self.NUM_SAMPLES}")
+            print(f"Split + legacy dump (before): {before * 1000:.1f} ms/save")
+            print(f"Split only (after): {after * 1000:.1f} ms/save")
+            print(f"Speedup: {before / after:.2f}x")
+
+            loader.close()
+
+            assert after < before, "Dropping the legacy dump should speed up saves"
+
+    @pytest.mark.performance
+    def test_async_checkpoint_blocking_time(
+        self, loader_config, mock_freesound_client, tmp_path
+    ):
+        """
+        Performance test: Compare how long _save_checkpoint blocks the collector
+        for synchronous saves vs the background checkpoint writer.
+        """
+        from FollowWeb_Visualizor.data.loaders.incremental_freesound import (
+            IncrementalFreesoundLoader,
+        )
+
+        rounds = 5
+        blocking = {}
+
+        with patch("freesound.FreesoundClient", return_value=mock_freesound_client):
+            for async_checkpoints in (False, True):
+                config = dict(
+                    loader_config,
+                    checkpoint_dir=str(tmp_path / f"async_{async_checkpoints}"),
+                    async_checkpoints=async_checkpoints,
+                )
+                loader = IncrementalFreesoundLoader(config)
+                _populate_synthetic_library(loader, self.NUM_SAMPLES)
+
+                start_time = time.perf_counter()
+                for _ in range(rounds):
+                    loader._save_checkpoint()
+                    # Simulate collection work between saves
+                    time.sleep(0.1)
+                blocking[async_checkpoints] = (
+                    time.perf_counter() - start_time
+                ) / rounds - 0.1
+
+                loader.close()
+
+        print("\n=== Checkpoint Blocking Time ===")
+        print(f"Synchronous saves: {blocking[False] * 1000:.1f} ms/save")
+        print(f"Background writer: {blocking[True] * 1000:.1f} ms/save")
+
+        assert blocking[True] < blocking[False], (
+            "Background writer should block the collector less than sync saves"
+        )
+
+
+class TestTopologyLoadBenchmarks:
+    """Benchmark tests for reading checkpoint topology (gpickle vs CSR)."""
+
+    NUM_NODES = 50000
+    EDGES_PER_NODE = 10
+
+    @staticmethod
+    def _synthetic_graph(num_nodes: int, edges_per_node: int):
+        """Build a random typed graph with numeric string node IDs."""
+        import networkx as nx
+        import numpy as np
+
+        rng = np.random.default_rng(42)
+        graph = nx.DiGraph()
+        graph.add_nodes_from(str(100000 + i) for i in range(num_nodes))
+        targets = rng.integers(0, num_nodes, size=(num_nodes, edges_per_node))
+        for i in range(num_nodes):
+            source = str(100000 + i)
+            for j in targets[i]:
+                if j != i:
+                    graph.add_edge(
+                        source, str(100000 + int(j)), type="similar_tags", weight=0.5
+                    )
+        return graph
+
+    @pytest.mark.performance
+    def test_csr_vs_gpickle_load_time(self, tmp_path):
+        """
+        Performance test: Compare opening graph_topology.gpickle with opening
+        the memory-mapped CSR topology and reading adjacency from it.
+        """
+        import pickle
+
+        import networkx as nx
+
+        from FollowWeb_Visualizor.data.storage import CSRTopology
+
+        graph = self._synthetic_graph(self.NUM_NODES, self.EDGES_PER_NODE)
+
+        gpickle_path = tmp_path / "graph_topology.gpickle"
+        clean: nx.DiGraph = nx.DiGraph()
+        clean.add_nodes_from(graph.nodes())
+        clean.add_edges_from(graph.edges())
+        with open(gpickle_path, "wb") as f:
+            pickle.dump(clean, f, pickle.HIGHEST_PROTOCOL)
+
+        csr_path = tmp_path / "graph_topology_csr"
+        CSRTopology.from_graph(graph).save(csr_path)
+
+        start_time = time.perf_counter()
+        with open(gpickle_path, "rb") as f:
+            loaded = pickle.load(f)  # nosec B301
+        gpickle_degrees = [d for _, d in loaded.out_degree()]
+        gpickle_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        topology = CSRTopology.load(csr_path)
+        csr_degrees = topology.out_degrees()
+        csr_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        topology.to_networkx()
+        view_time = time.perf_counter() - start_time
+
+        print("\n=== Topology Load Time ===")
+        print(f"Nodes: {self.NUM_NODES}, edges: {topology.num_edges}")
+        print(f"gpickle load + degrees: {gpickle_time * 1000:.1f} ms")
+        print(f"CSR mmap load + degrees: {csr_time * 1000:.1f} ms")
+        print(f"CSR -> NetworkX view (on demand): {view_time * 1000:.1f} ms")
+
+        assert sum(gpickle_degrees) == int(csr_degrees.sum())
+        assert csr_time < gpickle_time, "Memory-mapped CSR should open faster"
+
+
+class TestLazyAttributeBenchmarks:
+    """Benchmark tests for resuming with lazy vs eager node attributes."""
+
+    NUM_SAMPLES = 20000
+
+    @pytest.mark.performance
+    def test_lazy_attribute_resume(
+        self, loader_config, mock_freesound_client, tmp_path
+    ):
+        """
+        Performance test: Compare resume time and peak Python memory with
+        eager metadata hydration vs lazy node attributes.
+        """
+        import pickle
+        import tracemalloc
+
+        import networkx as nx
+
+        from FollowWeb_Visualizor.data.loaders.incremental_freesound import (
+            IncrementalFreesoundLoader,
+        )
+        from FollowWeb_Visualizor.data.storage import MetadataCache
+
+        checkpoint_dir = tmp_path / "library"
+        checkpoint_dir.mkdir()
+        topology: nx.DiGraph = nx.DiGraph()
+        with MetadataCache(str(checkpoint_dir / "metadata_cache.db")) as cache:
+            rows = {}
+            for i in range(self.NUM_SAMPLES):
+                sample_id = 100000 + i
+                topology.add_node(str(sample_id))
+                rows[sample_id] = {
+                    "id": sample_id,
+                    "name": f"sample_{i}.wav",
+                    "tags": ["drum", "loop", f"tag{i % 40}"],
+                    "username": f"user_{i % 200}",
+                    "pack": f"https://freesound.org/apiv2/packs/{i % 100}/",
+                    "num_downloads": i,
+                    "duration": 2.5,
+                    "description": f"Synthetic sample {i} " * 30,
+                    "previews": {"preview-hq-mp3": f"https://cdn/{i}.mp3"},
+                    "ac_analysis": {f"feature_{k}": k * 0.5 for k in range(20)},
+                }
+            cache.bulk_insert(rows)
+        with open(checkpoint_dir / "graph_topology.gpickle", "wb") as f:
+            pickle.dump(topology, f, pickle.HIGHEST_PROTOCOL)
+
+        results = {}
+        with patch("freesound.FreesoundClient", return_value=mock_freesound_client):
+            for lazy in (False, True):
+                config = dict(
+                    loader_config,
+                    checkpoint_dir=str(checkpoint_dir),
+                    lazy_node_attributes=lazy,
+                )
+                tracemalloc.start()
+                start_time = time.perf_counter()
+                loader = IncrementalFreesoundLoader(config)
+                elapsed = time.perf_counter() - start_time
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+                assert loader.graph.nodes["100005"]["tags"][0] == "drum"
+                results[lazy] = (elapsed, peak)
+                loader.close()
+
+        print("\n=== Resume With Node Attributes ===")
+        print(f"Samples: {self.NUM_SAMPLES}")
+        for lazy, label in ((False, "Eager"), (True, "Lazy")):
+            elapsed, peak = results[lazy]
+            print(f"{label}: {elapsed * 1000:.0f} ms, peak {peak / 1024 / 1024:.1f} MB")
+
+        assert results[True][1] < results[False][1], (
+            "Lazy attributes should lower peak memory on resume"
+        )
+
+
+class TestMetadataCodecBenchmarks:
+    """Benchmark tests for MetadataCache payload codecs (JSON vs zlib)."""
+
+    NUM_SAMPLES = 500000
+    CHUNK_SIZE = 50000
+
+    @staticmethod
+    def _synthetic_rows(start: int, count: int) -> dict:
+        """Build Freesound-like metadata rows."""
+        rows = {}
+        for i in range(start, start + count):
+            sample_id = 100000 + i
+            rows[sample_id] = {
+                "id": sample_id,
+                "name": f"sample_{i}.wav",
+                "tags": ["drum", "loop", f"tag{i % 400}", f"genre{i % 25}"],
+                "description": f"Synthetic sample {i} recorded for benchmarks. " * 3,
+                "username": f"user_{i % 5000}",
+                "uploader_id": i % 5000,
+                "pack": f"https://freesound.org/apiv2/packs/{i % 20000}/",
+                "license": "http://creativecommons.org/licenses/by/4.0/",
+                "created": "2024-01-01T12:00:00",
+                "url": f"https://freesound.org/people/user_{i % 5000}/sounds/{i}/",
+                "type": "wav",
+                "channels": 2,
+                "filesize": 1024000 + i,
+                "samplerate": 44100,
+                "duration": 2.5 + (i % 100) / 10,
+                "num_downloads": i % 10000,
+                "avg_rating": 4.5,
+                "num_ratings": i % 50,
+                "num_comments": i % 7,
+                "previews": {
+                    "preview-hq-mp3": f"https://cdn.freesound.org/previews/{i}-hq.mp3",
+                    "preview-lq-mp3": f"https://cdn.freesound.org/previews/{i}-lq.mp3",
+                },
+                "collected_at": "2024-06-01T00:00:00+00:00",
+                "last_existence_check_at": None,
+                "last_metadata_update_at": "2024-06-01T00:00:00+00:00",
+                "priority_score": float(i % 1000),
+                "is_dormant": False,
+            }
+        return rows
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_json_vs_zlib_codec(self, tmp_path):
+        """
+        Performance test: Compare DB size, bulk-insert throughput and
+        full-scan decode time for the JSON and zlib payload codecs.
+        """
+        import os
+
+        from FollowWeb_Visualizor.data.storage import MetadataCache
+
+        results = {}
+        for codec in ("json", "zlib"):
+            db_path = tmp_path / f"metadata_{codec}.db"
+            insert_time = 0.0
+            with MetadataCache(str(db_path), codec=codec) as cache:
+                for start in range(0, self.NUM_SAMPLES, self.CHUNK_SIZE):
+                    rows = self._synthetic_rows(start, self.CHUNK_SIZE)
+                    start_time = time.perf_counter()
+                    cache.bulk_insert(rows)
+                    insert_time += time.perf_counter() - start_time
+                cache._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+                start_time = time.perf_counter()
+                count = sum(1 for _ in cache.iter_metadata(batch_size=2500))
+                scan_time = time.perf_counter() - start_time
+
+                payload_bytes = cache._conn.execute(
+                    "SELECT SUM(length(data)) FROM metadata"
+                ).fetchone()[0]
+
+            assert count == self.NUM_SAMPLES
+            results[codec] = {
+                "db_size": os.path.getsize(db_path),
+                "payload_bytes": payload_bytes,
+                "insert_rate": self.NUM_SAMPLES / insert_time,
+                "scan_time": scan_time,
+            }
+
+        print("\n=== Metadata Payload Codecs ===")
+        print(f"Samples: {self.NUM_SAMPLES}")
+        for codec, stats in results.items():
+            print(
+                f"{codec}: DB {stats['db_size'] / 1024 / 1024:.1f} MB "
+                f"(payload {stats['payload_bytes'] / 1024 / 1024:.1f} MB), "
+                f"bulk insert {stats['insert_rate']:.0f} rows/s, "
+                f"full scan {stats['scan_time']:.2f} s"
+            )
+
+        assert results["zlib"]["payload_bytes"] < results["json"]["payload_bytes"]
+        assert results["zlib"]["db_size"] < results["json"]["db_size"]
+
+
+class _LatencySound:
+    """Sound from _LatencyClient with a deterministic similarity list."""
+
+    def __init__(self, client, sound_id):
+        self.client = client
+        self.id = sound_id
+        self.name = f"sample_{sound_id}"
+        self.tags = ["bench"]
+        self.duration = 1.0
+        self.username = f"user_{sound_id % 50}"
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "tags": self.tags,
+            "duration": self.duration,
+            "username": self.username,
+            "filesize": 1024,
+            "num_downloads": 100000 - self.id,
+            "avg_rating": 4.5,
+        }
+
+    def get_similar(self, page_size=15, fields=None):
+        time.sleep(self.client.latency)
+        return [
+            _LatencySound(self.client, (self.id * 31 + k) % 5000 + 1)
+            for k in range(1, 16)
+        ]
+
+
+class _LatencyClient:
+    """Fake Freesound client adding a fixed round-trip latency per request."""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def get_sound(self, sound_id, **kwargs):
+        time.sleep(self.latency)
+        return _LatencySound(self, sound_id)
+
+
+class TestConcurrentFetchBenchmarks:
+    """Benchmarks for prefetching similar sounds during recursive discovery."""
+
+    NUM_SAMPLES = 200
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_throughput_vs_latency(self, tmp_path):
+        """
+        Performance test: Samples discovered per second by the serial crawl
+        and the fetch engine as request latency grows.
+        """
+        from FollowWeb_Visualizor.data.loaders.incremental_freesound import (
+            IncrementalFreesoundLoader,
+        )
+
+        latencies = (0.0, 0.01, 0.05)
+        worker_counts = (1, 4, 8)
+        throughput = {}
+
+        for latency in latencies:
+            for workers in worker_counts:
+                with patch("freesound.FreesoundClient"):
+                    loader = IncrementalFreesoundLoader(
+                        {
+                            "api_key": "test_key",
+                            "checkpoint_dir": str(
+                                tmp_path / f"fetch_{latency}_{workers}"
+                            ),
+                            "checkpoint_interval": 1000,
+                            "requests_per_minute": 1_000_000,
+                            "max_requests": 100_000,
+                            "fetch_workers": workers,
+                        }
+                    )
+                loader.client = _LatencyClient(latency)
+                seeds = [
+                    loader._extract_sample_metadata(_LatencySound(loader.client, i))
+                    for i in (1, 2, 3)
+                ]
+
+                start_time = time.perf_counter()
+                loader._process_samples_recursive(
+                    seeds, depth=5, max_total_samples=self.NUM_SAMPLES
+                )
+                elapsed = time.perf_counter() - start_time
+                loader.close()
+
+                assert loader.graph.number_of_nodes() == self.NUM_SAMPLES
+                throughput[latency, workers] = self.NUM_SAMPLES / elapsed
+
+        print("\n=== Recursive Discovery Throughput (samples/s) ===")
+        print("latency  " + "  ".join(f"{w:>2} workers" for w in worker_counts))
+        for latency in latencies:
+            row = "  ".join(f"{throughput[latency, w]:>10.1f}" for w in worker_counts)
+            print(f"{latency * 1000:>5.0f} ms  {row}")
+
+        assert throughput[0.05, 4] > throughput[0.05, 1] * 2, (
+            "Prefetching should hide most of the request latency"
+        )
+
+
+class _PagedLatencyClient:
+    """Fake paginated search client adding a fixed latency per request."""
+
+    def __init__(self, latency, num_sounds):
+        self.latency = latency
+        self.num_sounds = num_sounds
+
+    def text_search(self, page=1, page_size=15, **kwargs):
+        time.sleep(self.latency)
+        start = (page - 1) * page_size
+        results = [
+            _LatencySound(self, i)
+            for i in range(start + 1, min(start + page_size, self.num_sounds) + 1)
+        ]
+        page_results = MagicMock()
+        page_results.__iter__.return_value = iter(results)
+        page_results.next = (
+            f"page{page + 1}" if start + page_size < self.num_sounds else None
+        )
+        page_results.count = self.num_sounds
+        return page_results
+
+    def get_sound(self, sound_id, **kwargs):
+        time.sleep(self.latency)
+        return _LatencySound(self, sound_id)
+
+
+class TestSearchPrefetchBenchmarks:
+    """Benchmarks for prefetching search pages in pagination mode."""
+
+    NUM_SOUNDS = 3000
+    PAGE_SIZE = 150
+
+    @pytest.mark.performance
+    @pytest.mark.slow
+    def test_pages_per_second_vs_latency(self, tmp_path):
+        """
+        Performance test: Search pages processed per second with and without
+        page prefetching, for a rescan of known samples (no get_sound calls)
+        and a library where 2% of the results are new.
+        """
+        from FollowWeb_Visualizor.data.loaders.incremental_freesound import (
+            IncrementalFreesoundLoader,
+        )
+
+        # (new samples per 50 results, latency)
+        scenarios = ((0, 0.0), (0, 0.02), (0, 0.1), (1, 0.02), (1, 0.1))
+        prefetch_depths = (0, 2, 4)
+        num_pages = self.NUM_SOUNDS // self.PAGE_SIZE
+        throughput = {}
+
+        for new_per_50, latency in scenarios:
+            for prefetch_pages in prefetch_depths:
+                with patch("freesound.FreesoundClient"):
+                    loader = IncrementalFreesoundLoader(
+                        {
+                            "api_key": "test_key",
+                            "checkpoint_dir": str(
+                                tmp_path
+                                / f"pages_{new_per_50}_{latency}_{prefetch_pages}"
+                            ),
+                            "checkpoint_interval": 1000,
+                            "requests_per_minute": 1_000_000,
+                            "max_requests": 100_000,
+                            "page_size": self.PAGE_SIZE,
+                            "search_prefetch_pages": prefetch_pages,
+                        }
+                    )
+                loader.client = _PagedLatencyClient(latency, self.NUM_SOUNDS)
+                loader.metadata_cache.bulk_insert(
+                    {
+                        i: {"id": i, "name": f"sample_{i}"}
+                        for i in range(1, self.NUM_SOUNDS + 1)
+                        if i % 50 >= new_per_50
+                    }
+                )
+                loader._save_checkpoint = Mock()
+
+                start_time = time.perf_counter()
+                loader._search_with_pagination(query="bench")
+                throughput[new_per_50, latency, prefetch_pages] = num_pages / (
+                    time.perf_counter() - start_time
+                )
+                loader.close()
+
+        print("\n=== Pagination Throughput (pages/s) ===")
+        print("new  latency  " + "  ".join(f"prefetch {d}" for d in prefetch_depths))
+        for new_per_50, latency in scenarios:
+            row = "  ".join(
+                f"{throughput[new_per_50, latency, d]:>10.1f}" for d in prefetch_depths
+            )
+            print(f"{new_per_50 * 2:>2}%  {latency * 1000:>5.0f} ms  {row}")
+
+        assert throughput[0, 0.1, 2] > throughput[0, 0.1, 0] * 1.5, (
+            "Prefetching pages should hide search latency"
+        )
@@ -0,0 +1,186 @@
+"""
+Benchmarks for tag similarity edge generation on a 200k-sample tag corpus.
+
+Compares the inverted-index join (jaccard_pairs) with the nested-loop
+comparison it replaced in IncrementalFreesoundLoader._add_tag_edges_incremental.
+The nested loop is only run on a sample of the corpus; its full-corpus time
+is extrapolated from the measured cost per comparison. The sparse matrix
+kernel (jaccard_edges) is timed against the inverted index. The MinHash-LSH mode
+(minhash_pairs) is timed against the exact join, with its recall.
+
+Synthetic corpus: 200,000 samples with 3-12 tags each, drawn from a
+50,000-tag vocabulary with Zipf-like frequencies (a few tags such as
+"field-recording" are used by thousands of samples, most by a handful).
+
+Usage:
+    pytest tests/performance/test_tag_similarity_benchmarks.py -m performance -n 0 -s
+"""
+
+import random
+import time
+from itertools import accumulate
+
+import pytest
+
+from FollowWeb_Visualizor.data import (
+    jaccard_edges,
+    jaccard_pairs,
+    lsh_parameters,
+    minhash_pairs,
+    minhash_signatures,
+)
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+CORPUS_SIZE = 200_000
+VOCABULARY_SIZE = 50_000
+THRESHOLD = 0.3
+
+
+def synthetic_corpus(size, seed=42):
+    """Tag sets with a Zipf-like tag distribution."""
+    rng = random.Random(seed)
+    vocabulary = [f"tag{rank}" for rank in range(VOCABULARY_SIZE)]
+    cum_weights = list(accumulate(1 / (rank + 100) for rank in range(VOCABULARY_SIZE)))
+    return {
+        str(sample_id): set(
+            rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(3, 12))
+        )
+        for sample_id in range(size)
+    }
+
+
+def nested_loop(tag_sets, threshold, query_ids=None):
+    """The pairwise comparison replaced by the inverted index."""
+    ids = list(tag_sets)
+    new = [i for i in ids if query_ids is None or i in query_ids]
+    existing = [i for i in ids if query_ids is not None and i not in query_ids]
+    pairs = []
+    for n, a in enumerate(new):
+        for b in new[n + 1 :] + existing:
+            intersection = len(tag_sets[a] & tag_sets[b])
+            union = len(tag_sets[a] | tag_sets[b])
+            similarity = intersection / union if union > 0 else 0
+            if similarity >= threshold:
+                pairs.append((a, b, similarity))
+    # Nested-loop order: new ↔ new pairs first, then new ↔ existing
+    new_set = set(new)
+    return [p for p in pairs if p[1] in new_set] + [
+        p for p in pairs if p[1] not in new_set
+    ]
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    """200k-sample synthetic tag corpus."""
+    return synthetic_corpus(CORPUS_SIZE)
+
+
+@pytest.fixture(scope="module")
+def comparison_cost(corpus):
+    """Measured nested-loop seconds per pair comparison (3000-sample sample)."""
+    sample = dict(list(corpus.items())[:3000])
+    start = time.time()
+    expected = nested_loop(sample, THRESHOLD)
+    elapsed = time.time() - start
+
+    assert jaccard_pairs(sample, THRESHOLD) == expected
+    return elapsed / (len(sample) * (len(sample) - 1) / 2)
+
+
+class TestTagSimilarityBenchmarks:
+    """Inverted-index join vs nested loop at library scale."""
+
+    def test_full_regeneration_200k(self, corpus, comparison_cost):
+        """Full regeneration: every sample is new."""
+        start = time.time()
+        pairs = jaccard_pairs(corpus, THRESHOLD)
+        elapsed = time.time() - start
+
+        comparisons = CORPUS_SIZE * (CORPUS_SIZE - 1) / 2
+        nested_loop_estimate = comparisons * comparison_cost
+
+        print("\n=== Full Tag Edge Regeneration (200k samples) ===")
+        print(f"Similar pairs: {len(pairs)}")
+        print(f"Inverted index: {elapsed:.1f}s")
+        print(f"Nested loop (estimated): {nested_loop_estimate / 3600:.1f}h")
+        print(f"Speedup: {nested_loop_estimate / elapsed:.0f}x")
+
+        assert elapsed * 20 < nested_loop_estimate
+
+    def test_incremental_update_200k(self, corpus, comparison_cost):
+        """Incremental update: 1000 new samples against the library."""
+        new_ids = set(list(corpus)[-1000:])
+
+        start = time.time()
+        pairs = jaccard_pairs(corpus, THRESHOLD, query_ids=new_ids)
+        elapsed = time.time() - start
+
+        comparisons = len(new_ids) * (CORPUS_SIZE - len(new_ids) / 2)
+        nested_loop_estimate = comparisons * comparison_cost
+
+        print("\n=== Incremental Tag Edges (1000 new of 200k samples) ===")
+        print(f"Similar pairs: {len(pairs)}")
+        print(f"Inverted index: {elapsed:.1f}s")
+        print(f"Nested loop (estimated): {nested_loop_estimate:.0f}s")
+        print(f"Speedup: {nested_loop_estimate / elapsed:.0f}x")
+
+        assert all(a in new_ids for a, _, _ in pairs)
+        assert elapsed * 5 < nested_loop_estimate
+
+    @pytest.mark.parametrize("new_count", [None, 1000])
+    def test_sparse_kernel_200k(self, corpus, new_count):
+        """Sparse matrix kernel vs inverted index (one worker process)."""
+        new_ids = None if new_count is None else set(list(corpus)[-new_count:])
+
+        start = time.time()
+        pairs = jaccard_pairs(corpus, THRESHOLD, query_ids=new_ids)
+        index_elapsed = time.time() - start
+
+        start = time.time()
+        src, dst, weight = jaccard_edges(corpus, THRESHOLD, new_ids, workers=1)
+        kernel_elapsed = time.time() - start
+
+        print(f"\n=== Sparse Kernel ({new_count or 'all'} new of 200k samples) ===")
+        print(f"Similar pairs: {len(src)}")
+        print(f"Inverted index: {index_elapsed:.1f}s")
+        print(f"Sparse kernel: {kernel_elapsed:.1f}s")
+        print(f"Speedup: {index_elapsed / kernel_elapsed:.1f}x")
+
+        ids = list(corpus)
+        assert [
+            (ids[a], ids[b], w)
+            for a, b, w in zip(src.tolist(), dst.tolist(), weight.tolist())
+        ] == pairs
+        assert kernel_elapsed < index_elapsed
+
+    def test_minhash_full_regeneration_200k(self, corpus):
+        """MinHash-LSH vs the exact join, with the recall it reaches."""
+        start = time.time()
+        exact = jaccard_pairs(corpus, THRESHOLD)
+        exact_elapsed = time.time() - start
+
+        start = time.time()
+        signatures = minhash_signatures(list(corpus.values()))
+        signature_elapsed = time.time() - start
+
+        bands, rows = lsh_parameters(THRESHOLD, 0.95)
+        start = time.time()
+        pairs = minhash_pairs(corpus, THRESHOLD, signatures, bands, rows)
+        lsh_elapsed = time.time() - start
+
+        exact_set = {(a, b) for a, b, _ in exact}
+        found = {(a, b) for a, b, _ in pairs}
+        recall = len(found) / len(exact_set)
+
+        print("\n=== MinHash-LSH Tag Edges (200k samples) ===")
+        print(f"Bands x rows: {bands} x {rows}")
+        print(f"Exact join: {exact_elapsed:.1f}s, {len(exact)} pairs")
+        print(f"Signatures: {signature_elapsed:.1f}s")
+        print(f"MinHash-LSH: {lsh_elapsed:.1f}s, {len(pairs)} pairs")
+        print(f"Recall: {recall:.1%}")
+
+        # Most pairs of this corpus are just above the threshold, where LSH
+        # misses the most: the recall is below the 95% averaged over [t, 1]
+        assert found <= exact_set
+        assert recall >= 0.75
@@ -5,17 +5,31 @@ Tests incremental loading with checkpoint support, time limits, deleted sample
 cleanup, and metadata updates with mocked checkpoint and API operations.
 """
 
+import json
+import pickle
 import tempfile
+import threading
 import time
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import networkx as nx
 import pytest
 
 from FollowWeb_Visualizor.core.exceptions import DataProcessingError
+from FollowWeb_Visualizor.data.checkpoint_reader import (
+    load_checkpoint_csr,
+    load_checkpoint_sample_groups,
+    load_checkpoint_topology,
+)
+from FollowWeb_Visualizor.data.checkpoint_verifier import CheckpointVerifier
 from FollowWeb_Visualizor.data.loaders.incremental_freesound import (
     IncrementalFreesoundLoader,
 )
+from FollowWeb_Visualizor.data.storage import (
+    CSRTopology,
+    LazyNodeAttributes,
+)
 
 pytestmark = [pytest.mark.unit, pytest.mark.data]
 
@@ -202,13 +216,15 @@ class TestIncrementalFreesoundLoaderCheckpoint:
 
         loader.client.get_sound.side_effect = get_sound_side_effect
 
-        # Mock the checkpoint save method on the loader's checkpoint instance
-        loader.checkpoint.save = Mock()
-
-        loader.fetch_data(query="test", max_samples=5)
+        with patch.object(
+            loader, "_save_checkpoint", wraps=loader._save_checkpoint
+        ) as save_spy:
+            loader.fetch_data(query="test", max_samples=5)
 
         # Should save at intervals: after 2, 4, and final
-        assert loader.checkpoint.save.call_count >= 1  # At least final save
+        assert save_spy.call_count >= 1  # At least final save
+        # The split checkpoint no longer writes the legacy monolithic dump
+        assert not mock_checkpoint.save.called
 
     def test_no_checkpoint_load_starts_fresh(
         self, mock_freesound_client, mock_checkpoint, tmp_path
@@ -374,9 +390,6 @@ class TestIncrementalFreesoundLoaderTimeLimit:
 
         loader.client.get_sound.side_effect = get_sound_side_effect
 
-        # Mock the checkpoint save
-        loader.checkpoint.save = Mock()
-
         # Add delay to ensure time limit is hit
         original_add = loader._add_sample_to_graph
 
@@ -385,7 +398,10 @@ class TestIncrementalFreesoundLoaderTimeLimit:
             return original_add(*args, **kwargs)
 
         with patch.object(loader, "_add_sample_to_graph", side_effect=slow_add):
-            data = loader.fetch_data(query="test", max_samples=100)
+            with patch.object(
+                loader, "_save_checkpoint", wraps=loader._save_checkpoint
+            ) as save_spy:
+                data = loader.fetch_data(query="test", max_samples=100)
 
         # Should process fewer samples due to time limit, or all if processing was very fast
         # The time limit check happens inside the processing loop
@@ -393,11 +409,11 @@ class TestIncrementalFreesoundLoaderTimeLimit:
         if len(data["samples"]) == 100:
             # If all samples were processed, the time limit was likely not hit
             # This can happen in fast CI environments - just verify checkpoint was saved
-            assert loader.checkpoint.save.called
+            assert save_spy.called
         else:
             # Time limit was hit - should have processed fewer samples
             assert len(data["samples"]) < 100
-            assert loader.checkpoint.save.called
+            assert save_spy.called
 
     def test_no_time_limit_processes_all(self, loader_with_mocks, mock_checkpoint):
         """Test processes all samples when no time limit."""
@@ -428,11 +444,35 @@ class TestIncrementalFreesoundLoaderTimeLimit:
         assert len(data["samples"]) == 5
 
 
+class FakeSearchClient:
+    """Local stand-in for the Freesound client's id:(a OR b ...) filter search."""
+
+    def __init__(self, existing_ids, fail=False, sounds=None):
+        self.existing_ids = set(existing_ids)
+        self.fail = fail
+        self.sounds = sounds or {}
+        self.requests = []
+        self.fields = []
+
+    def text_search(self, query="", filter=None, page_size=15, fields=None, **kwargs):
+        if self.fail:
+            raise Exception("500 Server Error")
+        requested = filter[len("id:(") : -1].split(" OR ")
+        self.requests.append(requested)
+        self.fields.append(fields)
+        assert len(requested) <= page_size
+        return [
+            self.sounds.get(int(i), Mock(id=int(i)))
+            for i in requested
+            if int(i) in self.existing_ids
+        ]
+
+
 class TestIncrementalFreesoundLoaderDeletedSamples:
     """Test deleted sample cleanup."""
 
     def test_cleanup_removes_deleted_samples(self, loader_with_mocks):
-        """Test cleanup removes samples that return 404."""
+        """Test cleanup removes samples missing from the batch search."""
         loader = loader_with_mocks
         loader.verify_existing_sounds = True
 
@@ -442,15 +482,8 @@ class TestIncrementalFreesoundLoaderDeletedSamples:
         loader.graph.add_node("3", name="sound3")
         loader.processed_ids = {"1", "2", "3"}
 
-        # Mock API responses: sample 2 is deleted (404)
-        def mock_get_sound(sample_id):
-            if sample_id == 2:
-                raise Exception("404 Not Found")
-            return create_mock_sound(
-                sample_id, f"sound{sample_id}", [], 1.0, f"user{sample_id}", {}
-            )
-
-        loader.client.get_sound.side_effect = mock_get_sound
+        # Sample 2 is deleted
+        loader.client = FakeSearchClient({1, 3})
 
         deleted_count = loader.cleanup_deleted_samples()
 
@@ -459,6 +492,8 @@ class TestIncrementalFreesoundLoaderDeletedSamples:
         assert not loader.graph.has_node("2")
         assert loader.graph.has_node("3")
         assert "2" not in loader.processed_ids
+        assert len(loader.client.requests) == 1
+        assert loader.graph.nodes["1"]["last_existence_check_at"] is not None
 
     def test_cleanup_requires_verification_enabled(self, loader_with_mocks):
         """Test cleanup raises error when verification not enabled."""
@@ -469,21 +504,54 @@ class TestIncrementalFreesoundLoaderDeletedSamples:
             loader.cleanup_deleted_samples()
 
     def test_cleanup_handles_api_errors(self, loader_with_mocks):
-        """Test cleanup handles non-404 API errors gracefully."""
+        """Test cleanup handles API errors gracefully."""
         loader = loader_with_mocks
         loader.verify_existing_sounds = True
 
         loader.graph.add_node("1", name="sound1")
         loader.processed_ids = {"1"}
 
-        # Mock API error that's not 404
-        loader.client.get_sound.side_effect = Exception("500 Server Error")
+        # Failed requests must not be mistaken for deletions
+        loader.client = FakeSearchClient({1}, fail=True)
 
-        # Should not raise, just skip the sample
+        # Should not raise, just skip the batch
         deleted_count = loader.cleanup_deleted_samples()
 
         assert deleted_count == 0
         assert loader.graph.has_node("1")
+        assert "last_existence_check_at" not in loader.graph.nodes["1"]
+
+    def test_cleanup_batches_requests(self, loader_with_mocks):
+        """Test IDs are verified 150 per request."""
+        loader = loader_with_mocks
+        loader.verify_existing_sounds = True
+
+        for sample_id in range(1, 401):
+            loader.graph.add_node(str(sample_id), name=f"sound{sample_id}")
+        loader.client = FakeSearchClient(set(range(1, 401)) - {7, 300})
+
+        deleted_count = loader.cleanup_deleted_samples()
+
+        assert deleted_count == 2
+        assert [len(batch) for batch in loader.client.requests] == [150, 150, 100]
+        assert loader.session_request_count == 3
+        assert loader.stats["api_requests_saved"] == 397
+        assert loader.graph.number_of_nodes() == 398
+
+    def test_cleanup_by_existence_check_age(self, loader_with_mocks):
+        """Test verification can be limited to the least recently checked."""
+        loader = loader_with_mocks
+        loader.verify_existing_sounds = True
+
+        loader.graph.add_node("1", last_existence_check_at="2024-03-01T00:00:00+00:00")
+        loader.graph.add_node("2", last_existence_check_at="2024-01-01T00:00:00+00:00")
+        loader.graph.add_node("3")
+        loader.client = FakeSearchClient({1, 2, 3})
+
+        loader.cleanup_deleted_samples(limit=2)
+
+        assert loader.client.requests == [["3", "2"]]
+        assert loader.get_samples_by_existence_check_age(limit=1) == ["1"]
 
 
 class TestIncrementalFreesoundLoaderMetadataUpdate:
@@ -593,6 +661,306 @@ class TestIncrementalFreesoundLoaderMetadataUpdate:
         assert stats["nodes_failed"] == 1
 
 
+class TestIncrementalFreesoundLoaderBatchedMetadataUpdate:
+    """Test metadata refresh a page of samples per request."""
+
+    @pytest.fixture
+    def loader(self, loader_with_mocks):
+        """Loader with three stored samples and a fake search client."""
+        loader = loader_with_mocks
+        for sample_id in (1, 2, 3):
+            loader.graph.add_node(
+                str(sample_id),
+                id=sample_id,
+                name=f"sound{sample_id}",
+                tags=["test"],
+                duration=1.0,
+                username="user",
+                filesize=1024,
+            )
+        loader.client = FakeSearchClient(
+            {1, 2},
+            sounds={
+                1: create_mock_sound(1, "renamed", ["test"], 1.0, "user"),
+                2: create_mock_sound(2, "sound2", ["test"], 1.0, "user"),
+            },
+        )
+        return loader
+
+    def test_merge_writes_only_changed_rows(self, loader):
+        """Test unchanged samples are not rewritten to the metadata cache."""
+        stats = loader.update_metadata(mode="merge", batched=True)
+
+        assert stats["nodes_updated"] == 1
+        assert stats["nodes_unchanged"] == 1
+        assert stats["nodes_missing"] == 1
+        assert stats["requests_saved"] == 2
+        assert stats["fields_updated"] == {"name"}
+        assert loader.client.fields == [loader.COMPREHENSIVE_FIELDS]
+        assert loader.session_request_count == 1
+        assert loader.stats["batched_requests_saved"] == 2
+
+        assert loader.graph.nodes["1"]["name"] == "renamed"
+        assert "last_metadata_update_at" in loader.graph.nodes["1"]
+        assert "last_metadata_update_at" not in loader.graph.nodes["2"]
+        assert loader.metadata_cache.get(1)["name"] == "renamed"
+        # The final checkpoint stores every node; unchanged rows keep their state
+        assert "last_metadata_update_at" not in loader.metadata_cache.get(2)
+        assert loader.graph.has_node("3")
+
+    def test_replace_mode(self, loader):
+        """Test replace mode drops fields missing from the response."""
+        loader.graph.nodes["2"]["custom_field"] = "custom_value"
+
+        stats = loader.update_metadata(mode="replace", sample_ids=["2"], batched=True)
+
+        assert stats["nodes_updated"] == 1
+        assert "custom_field" not in loader.graph.nodes["2"]
+        assert loader.graph.nodes["2"]["type"] == "sample"
+
+    def test_replace_mode_ignores_crawl_attributes(self, loader):
+        """Test crawl attributes neither count as changes nor get dropped."""
+        loader.update_metadata(mode="replace", sample_ids=["2"], batched=True)
+        loader.graph.nodes["2"].update(
+            priority_score=3.5, collected_at="2024-01-01", is_dormant=True
+        )
+
+        stats = loader.update_metadata(mode="replace", sample_ids=["2"], batched=True)
+
+        assert stats["nodes_updated"] == 0
+        assert stats["nodes_unchanged"] == 1
+        assert loader.graph.nodes["2"]["priority_score"] == 3.5
+
+        loader.graph.nodes["2"]["name"] = "stale"
+        stats = loader.update_metadata(mode="replace", sample_ids=["2"], batched=True)
+
+        assert stats["nodes_updated"] == 1
+        assert loader.graph.nodes["2"]["name"] == "sound2"
+        assert loader.graph.nodes["2"]["priority_score"] == 3.5
+        assert loader.graph.nodes["2"]["collected_at"] == "2024-01-01"
+
+    def test_saves_final_checkpoint(self, loader, tmp_path):
+        """Test the batched path persists run-level checkpoint metadata."""
+        loader.update_metadata(mode="merge", batched=True)
+
+        metadata_path = tmp_path / "checkpoints" / "checkpoint_metadata.json"
+        with open(metadata_path) as f:
+            checkpoint_metadata = json.load(f)
+        assert checkpoint_metadata["metadata_updated"] is True
+
+    def test_failed_request_counts_batch(self, loader):
+        """Test a failed lookup marks the whole batch as failed."""
+        loader.client.fail = True
+
+        stats = loader.update_metadata(batched=True)
+
+        assert stats["nodes_failed"] == 3
+        assert stats["nodes_updated"] == 0
+
+
+class TestIncrementalFreesoundLoaderSoundCache:
+    """Test reuse of metadata from similar-sound responses."""
+
+    @pytest.fixture
+    def loader(self, loader_with_mocks):
+        """Loader whose sample 1 has two similar sounds, one invalid."""
+        loader = loader_with_mocks
+        source = create_mock_sound(1)
+        source.get_similar.return_value = [
+            create_mock_sound(1),
+            create_mock_sound(2, "similar.wav"),
+            create_mock_sound(3, filesize=0),
+        ]
+        loader.client.get_sound.return_value = source
+        return loader
+
+    def test_similar_sound_metadata_is_reused(self, loader):
+        """Test expanding a similar sound needs no get_sound() request."""
+        loader._fetch_similar_sounds_for_sample(1)
+        loader.client.get_sound.reset_mock()
+
+        metadata = loader._fetch_sample_metadata(2)
+
+        assert metadata["name"] == "similar.wav"
+        assert "last_metadata_update_at" in metadata
+        loader.client.get_sound.assert_not_called()
+        assert loader._cache_hits == 1
+        assert loader._cache_misses == 0
+
+        with pytest.raises(ValueError):
+            loader._fetch_sample_metadata(3)
+        loader.client.get_sound.assert_not_called()
+
+    def test_evicted_sounds_are_served_from_metadata_cache(self, loader):
+        """Test sounds evicted from memory still count as hits."""
+        loader._sound_cache.max_bytes = 0
+        loader._fetch_similar_sounds_for_sample(1)
+        loader.client.get_sound.reset_mock()
+
+        assert len(loader._sound_cache) == 0
+        assert loader._fetch_sample_metadata(2)["name"] == "similar.wav"
+        loader.client.get_sound.assert_not_called()
+        assert loader._sound_cache.get_stats()["spill_hits"] == 1
+
+
+class FakeSimilarSound:
+    """Sound returned by FakeSimilarClient."""
+
+    def __init__(self, client, sound_id):
+        self.client = client
+        self.id = sound_id
+        self.name = f"sound{sound_id}"
+        self.tags = ["test"]
+        self.duration = 1.0
+        self.username = f"user{sound_id % 5}"
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "tags": self.tags,
+            "duration": self.duration,
+            "username": self.username,
+            "filesize": 1024,
+            "num_downloads": 10000 - self.id,
+            "avg_rating": 4.0,
+        }
+
+    def get_similar(self, page_size=15, fields=None):
+        self.client.request()
+        return [
+            FakeSimilarSound(self.client, similar_id)
+            for similar_id in self.client.similar_ids(self.id)
+        ]
+
+
+class FakeSimilarClient:
+    """Local stand-in for get_sound()/get_similar() with injected latency."""
+
+    def __init__(self, num_sounds=60, latency=0.0):
+        self.num_sounds = num_sounds
+        self.latency = latency
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def request(self):
+        with self._lock:
+            self.requests += 1
+        time.sleep(self.latency)
+
+    def similar_ids(self, sound_id):
+        return [(sound_id * 7 + k) % self.num_sounds + 1 for k in range(1, 6)]
+
+    def get_sound(self, sound_id, **kwargs):
+        self.request()
+        return FakeSimilarSound(self, sound_id)
+
+
+class TestIncrementalFreesoundLoaderConcurrentFetch:
+    """Test prefetching similar sounds during recursive discovery."""
+
+    def _run(self, tmp_path, fetch_workers, latency=0.0, **config):
+        """Crawl the fake similarity graph and return the loader."""
+        with patch("freesound.FreesoundClient"):
+            loader = IncrementalFreesoundLoader(
+                config={
+                    "api_key": "test_key",
+                    "checkpoint_dir": str(tmp_path / f"workers_{fetch_workers}"),
+                    "requests_per_minute": 1_000_000,
+                    "fetch_workers": fetch_workers,
+                    **config,
+                }
+            )
+        loader.client = FakeSimilarClient(latency=latency)
+        seeds = [
+            loader._extract_sample_metadata(FakeSimilarSound(loader.client, i))
+            for i in (1, 2)
+        ]
+        loader._process_samples_recursive(seeds, depth=3, max_total_samples=25)
+        loader.close()
+        return loader
+
+    def test_matches_serial_crawl(self, tmp_path):
+        """Test workers produce the same graph, in the same order, as serial."""
+        serial = self._run(tmp_path, fetch_workers=1)
+        concurrent = self._run(tmp_path, fetch_workers=4, latency=0.005)
+
+        assert list(concurrent.graph.nodes) == list(serial.graph.nodes)
+        assert sorted(concurrent.graph.edges) == sorted(serial.graph.edges)
+        assert concurrent.graph.number_of_nodes() == 25
+
+    def test_respects_request_budget(self, tmp_path):
+        """Test prefetching never pushes requests past max_requests."""
+        loader = self._run(tmp_path, fetch_workers=4, latency=0.005, max_requests=12)
+
+        assert loader.client.requests == loader.session_request_count
+        assert loader.session_request_count <= 12
+
+    def test_overlaps_latency(self, tmp_path):
+        """Test workers hide request latency compared to the serial crawl."""
+        start_time = time.perf_counter()
+        self._run(tmp_path, fetch_workers=1, latency=0.02)
+        serial_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self._run(tmp_path, fetch_workers=4, latency=0.02)
+        concurrent_time = time.perf_counter() - start_time
+
+        assert concurrent_time < serial_time
+
+
+class TestIncrementalFreesoundLoaderPersistentFrontier:
+    """Test resuming recursive discovery from the persistent frontier."""
+
+    def _run(self, checkpoint_dir, **config):
+        """Crawl the fake similarity graph and return the closed loader."""
+        with patch("freesound.FreesoundClient"):
+            loader = IncrementalFreesoundLoader(
+                config={
+                    "api_key": "test_key",
+                    "checkpoint_dir": str(checkpoint_dir),
+                    "requests_per_minute": 1_000_000,
+                    "persistent_frontier": True,
+                    **config,
+                }
+            )
+        loader.client = FakeSimilarClient()
+        seeds = [
+            loader._extract_sample_metadata(FakeSimilarSound(loader.client, i))
+            for i in (1, 2)
+        ]
+        loader._process_samples_recursive(seeds, depth=3, max_total_samples=25)
+        loader.frontier_stats = loader.frontier.get_stats()
+        loader.close()
+        return loader
+
+    def test_disabled_by_default(self, loader_with_mocks):
+        """Test the queue stays in memory without persistent_frontier."""
+        assert loader_with_mocks.frontier is None
+
+    def test_stopped_crawl_keeps_candidates(self, tmp_path):
+        """Test candidates and relationships survive the circuit breaker."""
+        loader = self._run(tmp_path / "stopped", max_requests=12)
+
+        assert loader.frontier_stats["queued"] > 0
+        assert loader.frontier_stats["pending_edges"] > 0
+        assert (tmp_path / "stopped" / "crawl_frontier.db").exists()
+
+    def test_resumed_crawl_matches_uninterrupted(self, tmp_path):
+        """Test a resumed crawl ends like one run, without repeating requests."""
+        uninterrupted = self._run(tmp_path / "once")
+
+        stopped = self._run(tmp_path / "resumed", max_requests=12)
+        resumed = self._run(tmp_path / "resumed")
+
+        assert list(resumed.graph.nodes) == list(uninterrupted.graph.nodes)
+        assert sorted(resumed.graph.edges) == sorted(uninterrupted.graph.edges)
+        assert (
+            stopped.client.requests + resumed.client.requests
+            == uninterrupted.client.requests
+        )
+
+
 class TestIncrementalFreesoundLoaderBuildGraph:
     """Test build_graph method."""
 
@@ -692,7 +1060,7 @@ class TestIncrementalFreesoundLoaderIntegration:
 
                         assert graph.number_of_nodes() == 3
                         assert len(loader.processed_ids) == 3
-                        assert mock_checkpoint.save.called
+                        assert (Path(tmpdir) / "checkpoint_metadata.json").exists()
             finally:
                 # Ensure cleanup
                 loader.close()
@@ -870,6 +1238,23 @@ class TestIncrementalFreesoundLoaderPagination:
         assert loader.pagination_state["query"] == "test"
         assert loader.pagination_state["sort"] == "downloads_desc"
 
+    def test_search_samples_skips_invalid_samples(self, loader_with_mocks):
+        """Test invalid first-page samples are cached as invalid, not returned."""
+        loader = loader_with_mocks
+        loader.pagination_state = {"page": 1, "query": "", "sort": "downloads_desc"}
+
+        mock_results = Mock()
+        mock_results.__iter__ = Mock(
+            return_value=iter([create_mock_sound(1), create_mock_sound(2, filesize=0)])
+        )
+        mock_results.next = None
+        loader.client.text_search.return_value = mock_results
+
+        result = loader._search_samples("test", None, max_samples=10)
+
+        assert [sample["id"] for sample in result] == [1]
+        assert loader._sound_cache.lookup(2) == (True, None)
+
     def test_search_with_pagination_resumes_from_checkpoint(self, loader_with_mocks):
         """Test pagination resumes from saved state."""
         loader = loader_with_mocks
@@ -1098,14 +1483,16 @@ class TestIncrementalFreesoundLoaderPagination:
             )
 
         loader.client.get_sound = mock_get_sound
-        loader.checkpoint.save = Mock()
 
-        result = loader._search_with_pagination(
-            query="test", sort_order="downloads_desc"
-        )
+        with patch.object(
+            loader, "_save_checkpoint", wraps=loader._save_checkpoint
+        ) as save_spy:
+            result = loader._search_with_pagination(
+                query="test", sort_order="downloads_desc"
+            )
 
         # Should save checkpoint after each page (2 pages)
-        assert loader.checkpoint.save.call_count >= 1  # At least final save
+        assert save_spy.call_count >= 1  # At least final save
         assert len(result) == 4
 
     def test_search_with_pagination_handles_empty_results(self, loader_with_mocks):
@@ -1144,6 +1531,104 @@ class TestIncrementalFreesoundLoaderPagination:
         # Pages processed internally
 
 
+class FakePage(list):
+    """Search result page with the pager's next/count attributes."""
+
+    def __init__(self, sounds, next_page, count):
+        super().__init__(sounds)
+        self.next = next_page
+        self.count = count
+
+
+class FakePagedClient:
+    """Local stand-in for paginated text_search() with injected latency."""
+
+    def __init__(self, num_sounds=20, page_latency=0.0):
+        self.num_sounds = num_sounds
+        self.page_latency = page_latency
+        self.pages_requested = []
+        self.sounds_requested = []
+        self._lock = threading.Lock()
+
+    def text_search(self, page=1, page_size=15, **kwargs):
+        with self._lock:
+            self.pages_requested.append(page)
+        time.sleep(self.page_latency)
+        start = (page - 1) * page_size
+        ids = range(start + 1, min(start + page_size, self.num_sounds) + 1)
+        has_next = start + page_size < self.num_sounds
+        return FakePage(
+            [create_mock_sound(i) for i in ids],
+            f"page{page + 1}" if has_next else None,
+            self.num_sounds,
+        )
+
+    def get_sound(self, sound_id, **kwargs):
+        with self._lock:
+            self.sounds_requested.append(sound_id)
+        return create_mock_sound(sound_id)
+
+
+class TestIncrementalFreesoundLoaderPagePrefetch:
+    """Test prefetching search pages in pagination mode."""
+
+    def _loader(self, tmp_path, prefetch_pages, **config):
+        """Loader with a fake paged client (5 results per page)."""
+        with patch("freesound.FreesoundClient"):
+            loader = IncrementalFreesoundLoader(
+                config={
+                    "api_key": "test_key",
+                    "checkpoint_dir": str(tmp_path / f"prefetch_{prefetch_pages}"),
+                    "requests_per_minute": 1_000_000,
+                    "page_size": 5,
+                    "search_prefetch_pages": prefetch_pages,
+                    **config,
+                }
+            )
+        loader.client = FakePagedClient()
+        loader.pagination_state = {"page": 1, "query": "test", "sort": "downloads_desc"}
+        return loader
+
+    def test_matches_serial_search(self, tmp_path):
+        """Test prefetching collects the same samples in the same order."""
+        serial = self._loader(tmp_path, prefetch_pages=0)
+        prefetched = self._loader(tmp_path, prefetch_pages=2)
+
+        expected = serial._search_with_pagination(query="test")
+        result = prefetched._search_with_pagination(query="test")
+
+        assert [s["id"] for s in result] == [s["id"] for s in expected]
+        assert [s["id"] for s in result] == list(range(1, 21))
+        assert sorted(prefetched.client.pages_requested) == [1, 2, 3, 4]
+        assert prefetched.pagination_state["page"] == 1
+        serial.close()
+        prefetched.close()
+
+    def test_resume_page_is_exact_when_budget_runs_out(self, tmp_path):
+        """Test only fully processed pages advance pagination_state."""
+        loader = self._loader(tmp_path, prefetch_pages=2, max_requests=9)
+
+        result = loader._search_with_pagination(query="test")
+
+        # Page 1 (1 + 5 requests) completes; page 2 is cut off after 2 samples
+        assert [s["id"] for s in result] == [1, 2, 3, 4, 5, 6, 7]
+        assert loader.pagination_state["page"] == 2
+        assert loader.session_request_count <= 9
+        # The budget couldn't process page 3, so it was never requested
+        assert 3 not in loader.client.pages_requested
+        loader.close()
+
+    def test_interrupted_page_without_prefetch(self, tmp_path):
+        """Test the resume point also stays on an interrupted page serially."""
+        loader = self._loader(tmp_path, prefetch_pages=0, max_requests=4)
+
+        result = loader._search_with_pagination(query="test")
+
+        assert [s["id"] for s in result] == [1, 2, 3]
+        assert loader.pagination_state["page"] == 1
+        loader.close()
+
+
 class TestIncrementalFreesoundLoaderTagEdges:
     """Test tag-based edge generation."""
 
@@ -1300,3 +1785,1190 @@ class TestIncrementalFreesoundLoaderTagEdges:
         # Should not make any API requests
         assert loader.session_request_count == initial_request_count
         assert edge_count == 2
+
+    @pytest.mark.parametrize(
+        ("workers", "max_tag_frequency"), [(None, None), (1, None), (1, 2)]
+    )
+    def test_add_tag_edges_match_pairwise_comparison(
+        self, loader_with_mocks, workers, max_tag_frequency
+    ):
+        """Test the sparse kernel finds exactly the pairs of a full comparison."""
+        loader = loader_with_mocks
+        loader.config["tag_similarity_workers"] = workers
+        loader.config["max_tag_frequency"] = max_tag_frequency
+        tags = {
+            "1": ["drum", "kick", "loop"],
+            "2": ["drum", "loop"],
+            "3": ["loop"],
+            "4": ["synth", "pad", "loop"],
+            "5": ["synth", "pad"],
+            "6": ["noise"],
+        }
+        for node_id, node_tags in tags.items():
+            loader.graph.add_node(node_id, name=f"sound{node_id}", tags=node_tags)
+
+        loader._add_tag_edges_incremental(0.3, {"1", "2", "3"})
+        loader._add_tag_edges_incremental(0.3, {"4", "5", "6"})
+
+        expected = {}
+        for a in tags:
+            for b in tags:
+                tags_a, tags_b = set(tags[a]), set(tags[b])
+                similarity = len(tags_a & tags_b) / len(tags_a | tags_b)
+                if a != b and similarity >= 0.3:
+                    expected[(a, b)] = similarity
+        assert {
+            (u, v): data["weight"] for u, v, data in loader.graph.edges(data=True)
+        } == expected
+        assert len(loader._journal_edges) == len(expected)
+
+    def test_add_tag_edges_minhash_mode(self, loader_with_mocks):
+        """Test MinHash mode adds true pairs and stores signatures for reuse."""
+        loader = loader_with_mocks
+        loader.tag_similarity_mode = "minhash"
+        tags = {
+            "1": ["drum", "kick", "loop"],
+            "2": ["drum", "kick", "loop", "808"],
+            "3": ["synth", "pad"],
+            "4": ["synth", "pad", "ambient"],
+        }
+        for node_id, node_tags in tags.items():
+            loader.graph.add_node(node_id, name=f"sound{node_id}", tags=node_tags)
+
+        loader._add_tag_edges_incremental(0.5, {"1", "2"})
+        stored = loader.metadata_cache.get_minhash_signatures([1, 2, 3, 4], 128, 1)
+        loader._add_tag_edges_incremental(0.5, {"3", "4"})
+
+        assert set(stored) == {1, 2, 3, 4}
+        assert set(loader.graph.edges()) == {
+            ("1", "2"),
+            ("2", "1"),
+            ("3", "4"),
+            ("4", "3"),
+        }
+        assert loader.stats["tag_similarity_recall"] == 1.0
+        assert (
+            loader.metadata_cache.get_minhash_signatures([1, 2, 3, 4], 128, 1) == stored
+        )
+
+    def test_invalid_tag_similarity_mode(self, mock_freesound_client, mock_checkpoint):
+        """Test unknown tag similarity modes are rejected."""
+        with pytest.raises(ValueError):
+            IncrementalFreesoundLoader(
+                config={"api_key": "test_key", "tag_similarity_mode": "fuzzy"}
+            )
+
+
+class TestIncrementalFreesoundLoaderEdgeWatermarks:
+    """Test incremental edge generation across runs."""
+
+    @pytest.fixture
+    def watermark_config(self, tmp_path):
+        """Config for a loader with an isolated checkpoint dir and user edges."""
+        return {
+            "api_key": "test_key",
+            "checkpoint_dir": str(tmp_path / "checkpoints"),
+            "group_edges": "clique",
+        }
+
+    @staticmethod
+    def _sample(sample_id, tags, username="alice"):
+        return {
+            "id": sample_id,
+            "name": f"sound{sample_id}.wav",
+            "tags": tags,
+            "username": username,
+            "filesize": 1024,
+        }
+
+    @staticmethod
+    def _edges(loader, edge_type):
+        return {
+            (u, v)
+            for u, v, data in loader.graph.edges(data=True)
+            if data.get("type") == edge_type
+        }
+
+    def test_second_run_only_processes_new_nodes(
+        self, mock_freesound_client, mock_checkpoint, watermark_config
+    ):
+        """Test a later run pairs only the new nodes with the graph."""
+        loader = IncrementalFreesoundLoader(config=watermark_config)
+        loader._add_node_to_graph(self._sample(1, ["pad"], "alice"))
+        loader._add_node_to_graph(self._sample(2, ["drum", "kick"], "bob"))
+        loader._generate_all_edges(include_tag=True, tag_threshold=0.3)
+
+        loader._add_node_to_graph(self._sample(3, ["drum", "kick"], "alice"))
+        with (
+            patch.object(
+                loader, "_add_tag_edges_batch", wraps=loader._add_tag_edges_batch
+            ) as full_tag_pass,
+            patch.object(
+                loader,
+                "_add_tag_edges_incremental",
+                wraps=loader._add_tag_edges_incremental,
+            ) as incremental_tag_pass,
+        ):
+            stats = loader._generate_all_edges(include_tag=True, tag_threshold=0.3)
+
+        full_tag_pass.assert_not_called()
+        incremental_tag_pass.assert_called_once_with(0.3, {"3"})
+        assert stats["user_edges"] == stats["tag_edges"] == 2
+        assert self._edges(loader, "by_same_user") == {("1", "3"), ("3", "1")}
+        assert self._edges(loader, "similar_tags") == {("2", "3"), ("3", "2")}
+        loader.close()
+
+    def test_tag_config_change_regenerates_tag_edges(
+        self, mock_freesound_client, mock_checkpoint, watermark_config
+    ):
+        """Test a raised threshold removes tag edges below it."""
+        loader = IncrementalFreesoundLoader(config=watermark_config)
+        loader._add_node_to_graph(self._sample(1, ["a", "b"], "alice"))
+        loader._add_node_to_graph(self._sample(2, ["a", "b", "c"], "bob"))
+        loader._add_node_to_graph(self._sample(3, ["a"], "carol"))
+        loader._generate_all_edges(include_tag=True, tag_threshold=0.3)
+        assert len(self._edges(loader, "similar_tags")) == 6
+
+        loader._generate_all_edges(include_tag=True, tag_threshold=0.6)
+
+        assert self._edges(loader, "similar_tags") == {("1", "2"), ("2", "1")}
+        assert loader._force_full_checkpoint
+        loader.close()
+
+    def test_threshold_only_checkpoint_keeps_tag_edges(
+        self, mock_freesound_client, mock_checkpoint, watermark_config
+    ):
+        """Test a checkpoint without watermarks keeps edges at the same threshold."""
+        loader = IncrementalFreesoundLoader(config=watermark_config)
+        loader._add_node_to_graph(self._sample(1, ["a", "b"], "alice"))
+        loader._add_node_to_graph(self._sample(2, ["a", "b"], "bob"))
+        loader._generate_all_edges(include_tag=True, tag_threshold=0.3)
+        loader._edge_watermarks = {}
+
+        with patch.object(loader, "_remove_edges_of_type") as remove_edges:
+            loader._generate_all_edges(include_tag=True, tag_threshold=0.3)
+
+        remove_edges.assert_not_called()
+        assert self._edges(loader, "similar_tags") == {("1", "2"), ("2", "1")}
+        loader.close()
+
+    def test_watermarks_survive_resume(
+        self, mock_freesound_client, mock_checkpoint, watermark_config
+    ):
+        """Test a resumed loader continues from the saved watermarks."""
+        loader = IncrementalFreesoundLoader(config=watermark_config)
+        loader._add_node_to_graph(self._sample(1, ["drum"]))
+        loader._generate_all_edges(include_tag=True, tag_threshold=0.3)
+        loader._add_node_to_graph(self._sample(2, ["drum"]))
+        loader._save_checkpoint()
+        loader.close()
+
+        resumed = IncrementalFreesoundLoader(config=watermark_config)
+
+        assert resumed._edge_update_nodes("user", {"representation": "clique"}) == {"2"}
+        assert resumed._edge_update_nodes("user", {"representation": "hub"}) is None
+        assert resumed._edge_update_nodes(
+            "tag", {"threshold": 0.3, "mode": "exact"}
+        ) == {"2"}
+        assert resumed._edge_update_nodes("tag", {"threshold": 0.5}) is None
+        resumed.close()
+
+    def test_incremental_edges_disabled(
+        self, mock_freesound_client, mock_checkpoint, watermark_config
+    ):
+        """Test incremental_edges=False regenerates every run."""
+        watermark_config["incremental_edges"] = False
+        loader = IncrementalFreesoundLoader(config=watermark_config)
+        loader._add_node_to_graph(self._sample(1, ["drum"]))
+        loader._generate_all_edges()
+
+        assert loader._edge_update_nodes("user", {}) is None
+        loader.close()
+
+
+class TestIncrementalFreesoundLoaderGroupHubs:
+    """Test hub and clique representations of user and pack relationships."""
+
+    GROUPS = {
+        "by_same_user": {"alice": ["1", "2", "3"]},
+        "in_same_pack": {"drums": ["1", "2", "4"]},
+    }
+
+    @pytest.fixture
+    def group_config(self, tmp_path):
+        """Config for a hub-mode loader with an isolated checkpoint dir."""
+        return {
+            "api_key": "test_key",
+            "checkpoint_dir": str(tmp_path / "checkpoints"),
+            "group_edges": "hub",
+        }
+
+    @staticmethod
+    def _add_samples(loader):
+        for sample_id, username, pack in [
+            (1, "alice", "drums"),
+            (2, "alice", "drums"),
+            (3, "alice", ""),
+            (4, "bob", "drums"),
+            (5, "carol", ""),
+        ]:
+            loader._add_node_to_graph(
+                {
+                    "id": sample_id,
+                    "name": f"sound{sample_id}.wav",
+                    "username": username,
+                    "pack": f"https://freesound.org/apiv2/packs/{pack}/"
+                    if pack
+                    else "",
+                    "filesize": 1024,
+                }
+            )
+
+    def test_hub_mode_stores_groups_without_edges(
+        self, mock_freesound_client, mock_checkpoint, group_config
+    ):
+        """Test hub mode stores membership lists instead of clique edges."""
+        loader = IncrementalFreesoundLoader(config=group_config)
+        self._add_samples(loader)
+
+        stats = loader._generate_all_edges()
+
+        assert stats["total_edges"] == 0
+        assert loader.graph.number_of_edges() == 0
+        assert loader.graph.graph["sample_groups"] == self.GROUPS
+        loader.close()
+
+    def test_clique_is_default(self, mock_freesound_client, mock_checkpoint, tmp_path):
+        """Test loaders store clique edges unless hubs are requested."""
+        loader = IncrementalFreesoundLoader(
+            config={"api_key": "test_key", "checkpoint_dir": str(tmp_path)}
+        )
+
+        assert loader.group_edges == "clique"
+        loader.close()
+
+    def test_groups_survive_checkpoint_round_trip(
+        self, mock_freesound_client, mock_checkpoint, group_config
+    ):
+        """Test saved groups are restored by a resumed loader and the reader."""
+        checkpoint_dir = Path(group_config["checkpoint_dir"])
+        loader = IncrementalFreesoundLoader(config=group_config)
+        self._add_samples(loader)
+        loader._generate_all_edges()
+        loader._save_checkpoint()
+        loader.close()
+
+        # Restored on load, before build_graph refreshes the tables
+        resumed = IncrementalFreesoundLoader(config=group_config)
+        assert resumed.graph.graph["sample_groups"] == self.GROUPS
+        resumed.close()
+
+        assert load_checkpoint_sample_groups(checkpoint_dir) == self.GROUPS
+        graph = load_checkpoint_topology(checkpoint_dir)
+        assert graph.graph["sample_groups"] == self.GROUPS
+
+    def test_delta_checkpoint_saves_group_changes(
+        self, mock_freesound_client, mock_checkpoint, group_config
+    ):
+        """Test a delta save persists groups dropped by switching to cliques."""
+        group_config["checkpoint_mode"] = "delta"
+        checkpoint_dir = Path(group_config["checkpoint_dir"])
+        loader = IncrementalFreesoundLoader(config=group_config)
+        self._add_samples(loader)
+        loader._generate_all_edges()
+        loader._save_checkpoint()
+        assert load_checkpoint_sample_groups(checkpoint_dir) == self.GROUPS
+
+        loader.group_edges = "clique"
+        loader._generate_all_edges()
+        loader._force_full_checkpoint = False
+        loader._save_checkpoint()
+
+        assert loader._delta_saves_since_compaction == 1
+        assert load_checkpoint_sample_groups(checkpoint_dir) == {}
+        loader.close()
+
+    def test_expanded_hubs_match_clique_mode(
+        self, mock_freesound_client, mock_checkpoint, group_config, tmp_path
+    ):
+        """Test expanding hubs gives the edges the clique opt-in adds."""
+        from FollowWeb_Visualizor.analysis import expand_groups
+
+        hub_loader = IncrementalFreesoundLoader(config=group_config)
+        self._add_samples(hub_loader)
+        hub_loader._generate_all_edges()
+        clique_loader = IncrementalFreesoundLoader(
+            config=dict(
+                group_config,
+                checkpoint_dir=str(tmp_path / "clique"),
+                group_edges="clique",
+            )
+        )
+        self._add_samples(clique_loader)
+        clique_loader._generate_all_edges()
+
+        expanded = expand_groups(hub_loader.graph)
+
+        assert clique_loader.graph.number_of_edges() == 10
+        assert list(expanded.edges(data=True)) == list(
+            clique_loader.graph.edges(data=True)
+        )
+        hub_loader.close()
+        clique_loader.close()
+
+    def test_switching_representation_regenerates(
+        self, mock_freesound_client, mock_checkpoint, group_config
+    ):
+        """Test switching mode drops the other representation."""
+        group_config["group_edges"] = "clique"
+        loader = IncrementalFreesoundLoader(config=group_config)
+        self._add_samples(loader)
+        loader._generate_all_edges()
+        loader._force_full_checkpoint = False
+
+        loader.group_edges = "hub"
+        loader._generate_all_edges()
+
+        assert loader.graph.number_of_edges() == 0
+        assert loader._force_full_checkpoint
+        assert "by_same_user" in loader.graph.graph["sample_groups"]
+
+        loader.group_edges = "clique"
+        loader._generate_all_edges()
+
+        assert loader.graph.number_of_edges() == 10
+        assert loader.graph.graph["sample_groups"] == {}
+        loader.close()
+
+    def test_build_graph_refreshes_groups(
+        self, mock_freesound_client, mock_checkpoint, group_config
+    ):
+        """Test build_graph rebuilds the tables from the current nodes."""
+        loader = IncrementalFreesoundLoader(config=group_config)
+        self._add_samples(loader)
+        loader._generate_all_edges()
+        loader._save_checkpoint()
+        loader.close()
+
+        resumed = IncrementalFreesoundLoader(config=group_config)
+        resumed.graph.remove_node("2")
+        graph = resumed.build_graph({})
+
+        assert graph.graph["sample_groups"] == {
+            "by_same_user": {"alice": ["1", "3"]},
+            "in_same_pack": {"drums": ["1", "4"]},
+        }
+        resumed.close()
+
+    def test_invalid_group_edges(
+        self, mock_freesound_client, mock_checkpoint, group_config
+    ):
+        """Test an unknown representation is rejected."""
+        group_config["group_edges"] = "bundle"
+
+        with pytest.raises(ValueError):
+            IncrementalFreesoundLoader(config=group_config)
+
+
+class TestIncrementalFreesoundLoaderDeltaCheckpoint:
+    """Test delta checkpoint mode (topology journal + dirty-node upserts)."""
+
+    @pytest.fixture
+    def delta_config(self, tmp_path):
+        """Config for a loader using delta checkpoints."""
+        return {
+            "api_key": "test_key",
+            "checkpoint_dir": str(tmp_path / "checkpoints"),
+            "checkpoint_mode": "delta",
+            "checkpoint_compaction_interval": 2,
+        }
+
+    @staticmethod
+    def _sample(sample_id, tags=None):
+        return {
+            "id": sample_id,
+            "name": f"sound{sample_id}.wav",
+            "tags": tags or ["drum"],
+            "filesize": 1024,
+        }
+
+    def test_invalid_checkpoint_mode(self, mock_freesound_client, mock_checkpoint):
+        """Test unknown checkpoint modes are rejected."""
+        with pytest.raises(ValueError):
+            IncrementalFreesoundLoader(
+                config={"api_key": "test_key", "checkpoint_mode": "sometimes"}
+            )
+
+    def test_delta_save_appends_journal(
+        self, mock_freesound_client, mock_checkpoint, delta_config, tmp_path
+    ):
+        """Test saves after the first snapshot only journal the changes."""
+        loader = IncrementalFreesoundLoader(config=delta_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._save_checkpoint()
+
+        # First save has no topology file yet, so it is a full snapshot
+        topology_path = tmp_path / "checkpoints" / "graph_topology.gpickle"
+        snapshot_mtime = topology_path.stat().st_mtime_ns
+        assert not loader.topology_journal.exists()
+
+        loader._add_node_to_graph(self._sample(2))
+        loader._add_edge("1", "2", type="similar", weight=1.0)
+        loader._save_checkpoint()
+
+        assert loader.topology_journal.count_batches() == 1
+        assert topology_path.stat().st_mtime_ns == snapshot_mtime
+        assert loader.metadata_cache.exists(2)
+        assert not loader._dirty_nodes
+        loader.close()
+
+    def test_delta_checkpoint_resumes(
+        self, mock_freesound_client, mock_checkpoint, delta_config
+    ):
+        """Test a reloaded loader replays the journal onto the snapshot."""
+        loader = IncrementalFreesoundLoader(config=delta_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._save_checkpoint()
+        loader._add_node_to_graph(self._sample(2))
+        loader._add_edge("2", "1", type="similar", weight=1.0)
+        loader._save_checkpoint()
+        loader.close()
+
+        resumed = IncrementalFreesoundLoader(config=delta_config)
+
+        assert set(resumed.graph.nodes()) == {"1", "2"}
+        assert resumed.graph.has_edge("2", "1")
+        assert resumed._delta_saves_since_compaction == 1
+        resumed.close()
+
+    def test_delta_save_journals_processed_ids(
+        self, mock_freesound_client, mock_checkpoint, delta_config, tmp_path
+    ):
+        """Test delta saves journal processed IDs instead of rewriting the set."""
+        checkpoint_dir = tmp_path / "checkpoints"
+        loader = IncrementalFreesoundLoader(config=delta_config)
+        loader._mark_processed("1")
+        loader._add_node_to_graph(self._sample(1))
+        loader._save_checkpoint()
+        with open(checkpoint_dir / "processed_ids.json") as f:
+            assert json.load(f) == ["1"]
+
+        loader._mark_processed("2")
+        loader._save_checkpoint()
+
+        with open(checkpoint_dir / "checkpoint_metadata.json") as f:
+            assert "processed_ids" not in json.load(f)
+        batches = list(loader.topology_journal.iter_batches())
+        assert batches[-1]["processed"] == ["2"]
+        loader.close()
+
+        resumed = IncrementalFreesoundLoader(config=delta_config)
+        assert resumed.processed_ids == {"1", "2"}
+
+        # Discarding bypasses the journal, so the set is written in full
+        resumed.processed_ids.discard("2")
+        resumed._save_checkpoint()
+        assert not resumed.topology_journal.exists()
+        with open(checkpoint_dir / "checkpoint_metadata.json") as f:
+            assert json.load(f)["processed_ids"] == ["1"]
+        resumed.close()
+
+    def test_compaction_after_interval(
+        self, mock_freesound_client, mock_checkpoint, delta_config
+    ):
+        """Test a full snapshot is written once the compaction interval is hit."""
+        loader = IncrementalFreesoundLoader(config=delta_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._save_checkpoint()
+
+        for sample_id in (2, 3):
+            loader._add_node_to_graph(self._sample(sample_id))
+            loader._save_checkpoint()
+        assert loader.topology_journal.count_batches() == 2
+
+        loader._add_node_to_graph(self._sample(4))
+        loader._save_checkpoint()
+
+        assert not loader.topology_journal.exists()
+        assert loader._delta_saves_since_compaction == 0
+        loader.close()
+
+    def test_untracked_change_forces_full_snapshot(
+        self, mock_freesound_client, mock_checkpoint, delta_config
+    ):
+        """Test direct graph edits fall back to a full snapshot."""
+        loader = IncrementalFreesoundLoader(config=delta_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._add_node_to_graph(self._sample(2))
+        loader._save_checkpoint()
+
+        # Bypasses _add_edge, so the journal cannot describe it
+        loader.graph.add_edge("1", "2")
+        loader._save_checkpoint()
+
+        assert not loader.topology_journal.exists()
+        loader.close()
+
+    def test_add_and_remove_forces_full_snapshot(
+        self, mock_freesound_client, mock_checkpoint, delta_config
+    ):
+        """Test a mutation pair that keeps the counts equal is still detected."""
+        loader = IncrementalFreesoundLoader(config=delta_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._add_node_to_graph(self._sample(2))
+        loader._save_checkpoint()
+
+        loader.graph.add_edge("1", "2")
+        loader.graph.remove_edge("1", "2")
+        loader._add_node_to_graph(self._sample(3))
+        loader._save_checkpoint()
+
+        assert not loader.topology_journal.exists()
+        loader.close()
+
+    def test_final_save_compacts_journal(
+        self, mock_freesound_client, mock_checkpoint, delta_config, tmp_path
+    ):
+        """Test the checkpoint a run hands off has no pending journal."""
+        loader = IncrementalFreesoundLoader(config=delta_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._save_checkpoint()
+        loader._add_node_to_graph(self._sample(2))
+        loader._save_checkpoint()
+        assert loader.topology_journal.count_batches() == 1
+
+        loader._save_final_checkpoint({"completed": True})
+
+        assert not loader.topology_journal.exists()
+        with open(tmp_path / "checkpoints" / "graph_topology.gpickle", "rb") as f:
+            assert set(pickle.load(f).nodes()) == {"1", "2"}
+        loader.close()
+
+    def test_export_legacy_checkpoint(self, loader_with_mocks, mock_checkpoint):
+        """Test the monolithic checkpoint is only written on explicit export."""
+        loader = loader_with_mocks
+        loader._add_node_to_graph(self._sample(1))
+        loader._save_checkpoint()
+        assert not mock_checkpoint.save.called
+
+        loader.export_legacy_checkpoint()
+
+        mock_checkpoint.save.assert_called_once()
+        saved = mock_checkpoint.save.call_args.kwargs
+        assert "1" in saved["graph"]
+        assert saved["metadata"]["nodes"] == 1
+        loader.close()
+
+
+class TestIncrementalFreesoundLoaderCSRTopology:
+    """Test the memory-mappable CSR topology format."""
+
+    @pytest.fixture
+    def csr_config(self, tmp_path):
+        """Config for a loader storing topology as CSR arrays."""
+        return {
+            "api_key": "test_key",
+            "checkpoint_dir": str(tmp_path / "checkpoints"),
+            "checkpoint_mode": "delta",
+            "topology_format": "csr",
+        }
+
+    @staticmethod
+    def _sample(sample_id):
+        return {"id": sample_id, "name": f"sound{sample_id}", "filesize": 1024}
+
+    def test_invalid_topology_format(self, mock_freesound_client, mock_checkpoint):
+        """Test unknown topology formats are rejected."""
+        with pytest.raises(ValueError):
+            IncrementalFreesoundLoader(
+                config={"api_key": "test_key", "topology_format": "graphml"}
+            )
+
+    def test_csr_checkpoint_resumes_with_edge_types(
+        self, mock_freesound_client, mock_checkpoint, csr_config, tmp_path
+    ):
+        """Test snapshot + journal round-trip through the CSR format."""
+        loader = IncrementalFreesoundLoader(config=csr_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._add_node_to_graph(self._sample(2))
+        loader._add_edge("1", "2", type="by_same_user", weight=1.0)
+        loader._save_checkpoint()
+        loader._add_node_to_graph(self._sample(3))
+        loader._add_edge("3", "1", type="similar_tags", weight=0.5)
+        loader._save_checkpoint()
+        loader.close()
+
+        checkpoint_dir = tmp_path / "checkpoints"
+        assert CSRTopology.exists(checkpoint_dir / "graph_topology_csr")
+        # The pickle is kept for scripts that read it directly
+        assert (checkpoint_dir / "graph_topology.gpickle").exists()
+
+        resumed = IncrementalFreesoundLoader(config=csr_config)
+
+        assert set(resumed.graph.nodes()) == {"1", "2", "3"}
+        assert resumed.graph["1"]["2"]["type"] == "by_same_user"
+        assert resumed.graph["3"]["1"]["weight"] == pytest.approx(0.5)
+        resumed.close()
+
+    def test_gpickle_checkpoint_migrates_to_csr(
+        self, mock_freesound_client, mock_checkpoint, csr_config, tmp_path
+    ):
+        """Test an existing graph_topology.gpickle is converted on load."""
+        gpickle_config = dict(csr_config, topology_format="gpickle")
+        loader = IncrementalFreesoundLoader(config=gpickle_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._add_node_to_graph(self._sample(2))
+        loader._add_edge("2", "1", type="in_same_pack", weight=1.0)
+        loader._save_checkpoint()
+        loader.close()
+
+        checkpoint_dir = tmp_path / "checkpoints"
+        assert (checkpoint_dir / "graph_topology.gpickle").exists()
+
+        migrated = IncrementalFreesoundLoader(config=csr_config)
+
+        assert migrated.graph.has_edge("2", "1")
+        assert (checkpoint_dir / "graph_topology.gpickle").exists()
+        topology = CSRTopology.load(checkpoint_dir / "graph_topology_csr")
+        assert topology.num_nodes == 2
+        assert topology.num_edges == 1
+        migrated.close()
+
+    def test_csr_checkpoint_readable_by_gpickle_consumers(
+        self, mock_freesound_client, mock_checkpoint, csr_config, tmp_path
+    ):
+        """Test CSR checkpoints pass verification and load from the pickle."""
+        loader = IncrementalFreesoundLoader(config=csr_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._add_node_to_graph(self._sample(2))
+        loader._add_edge("1", "2", type="by_same_user", weight=1.0)
+        loader._save_checkpoint()
+        loader._add_node_to_graph(self._sample(3))
+        loader._add_edge("3", "2", type="similar_tags", weight=0.5)
+        loader._save_checkpoint()
+        loader.close()
+
+        checkpoint_dir = tmp_path / "checkpoints"
+        success, message = CheckpointVerifier(checkpoint_dir).verify_checkpoint_files()
+        assert success, message
+
+        graph = load_checkpoint_topology(checkpoint_dir)
+        topology = load_checkpoint_csr(checkpoint_dir)
+
+        assert set(graph.edges()) == {("1", "2"), ("3", "2")}
+        assert topology.num_nodes == 3
+        assert topology.num_edges == 2
+        row = topology.successor_indices(topology.index_of("3"))
+        assert [topology.node_id(i) for i in row] == ["2"]
+
+    def test_gpickle_format_removes_stale_csr(
+        self, mock_freesound_client, mock_checkpoint, csr_config, tmp_path
+    ):
+        """Test switching back to gpickle drops the CSR snapshot on load."""
+        loader = IncrementalFreesoundLoader(config=csr_config)
+        loader._add_node_to_graph(self._sample(1))
+        loader._save_checkpoint()
+        loader.close()
+
+        checkpoint_dir = tmp_path / "checkpoints"
+        gpickle_config = dict(csr_config, topology_format="gpickle")
+        resumed = IncrementalFreesoundLoader(config=gpickle_config)
+        resumed._add_node_to_graph(self._sample(2))
+        resumed._save_checkpoint()
+        resumed.close()
+
+        assert not (checkpoint_dir / "graph_topology_csr").exists()
+        assert load_checkpoint_csr(checkpoint_dir).num_nodes == 2
+
+
+class TestIncrementalFreesoundLoaderLazyAttributes:
+    """Test resuming with node attributes loaded from SQLite on demand."""
+
+    @pytest.fixture
+    def lazy_config(self, tmp_path):
+        """Config for a loader using lazy node attributes."""
+        return {
+            "api_key": "test_key",
+            "checkpoint_dir": str(tmp_path / "checkpoints"),
+            "checkpoint_mode": "delta",
+            "lazy_node_attributes": True,
+        }
+
+    @staticmethod
+    def _sample(sample_id):
+        return {
+            "id": sample_id,
+            "name": f"sound{sample_id}",
+            "tags": ["drum", "loop"],
+            "username": "producer",
+            "filesize": 1024,
+        }
+
+    def _create_checkpoint(self, config):
+        loader = IncrementalFreesoundLoader(
+            config=dict(config, lazy_node_attributes=False)
+        )
+        for sample_id in (1, 2, 3):
+            loader._add_node_to_graph(self._sample(sample_id))
+        loader._add_edge("1", "2", type="by_same_user", weight=1.0)
+        loader._save_checkpoint()
+        loader.close()
+
+    def test_resume_reads_attributes_lazily(
+        self, mock_freesound_client, mock_checkpoint, lazy_config
+    ):
+        """Test resumed nodes expose their metadata without eager hydration."""
+        self._create_checkpoint(lazy_config)
+
+        loader = IncrementalFreesoundLoader(config=lazy_config)
+
+        assert isinstance(loader.graph.nodes["3"], LazyNodeAttributes)
+        assert loader.graph.nodes["3"]["tags"] == ["drum", "loop"]
+        assert loader.graph.nodes["3"]["name"] == "sound3"
+        assert loader.attribute_store.get_stats()["indexed_nodes"] == 3
+        loader.close()
+
+    def test_eager_resume_restores_attributes(
+        self, mock_freesound_client, mock_checkpoint, lazy_config
+    ):
+        """Test eager mode restores attributes for nodes in the topology."""
+        self._create_checkpoint(lazy_config)
+
+        loader = IncrementalFreesoundLoader(
+            config=dict(lazy_config, lazy_node_attributes=False)
+        )
+
+        assert type(loader.graph.nodes["1"]) is dict
+        assert loader.graph.nodes["1"]["username"] == "producer"
+        loader.close()
+
+    def test_only_modified_lazy_nodes_are_saved(
+        self, mock_freesound_client, mock_checkpoint, lazy_config
+    ):
+        """Test full snapshots skip unmodified lazy rows but keep edits."""
+        self._create_checkpoint(lazy_config)
+        loader = IncrementalFreesoundLoader(
+            config=dict(lazy_config, checkpoint_mode="full")
+        )
+        loader.graph.nodes["2"]["is_dormant"] = True
+
+        snapshot = loader._capture_checkpoint_snapshot()
+
+        assert set(snapshot.metadata_rows) == {2}
+        assert snapshot.metadata_rows[2]["is_dormant"] is True
+        assert snapshot.metadata_rows[2]["name"] == "sound2"
+        loader.close()
+
+    def test_age_queries_merge_sql_and_modified_nodes(
+        self, mock_freesound_client, mock_checkpoint, lazy_config
+    ):
+        """Test age ordering combines indexed rows with in-memory edits."""
+        self._create_checkpoint(lazy_config)
+        loader = IncrementalFreesoundLoader(config=lazy_config)
+        loader.graph.nodes["2"]["last_metadata_update_at"] = "2020-01-01T00:00:00Z"
+
+        assert loader._nodes_needing_python_scan() == ["2"]
+        assert loader.get_samples_by_metadata_age(limit=1) == ["2"]
+        assert loader.get_samples_by_metadata_age(max_age_days=1) == ["2"]
+        assert loader.get_samples_by_existence_check_age(limit=2) == ["1", "3"]
+        loader.close()
+
+    def test_user_groups_include_new_nodes(
+        self, mock_freesound_client, mock_checkpoint, lazy_config
+    ):
+        """Test username groups from SQL are joined by unsaved nodes."""
+        self._create_checkpoint(lazy_config)
+        loader = IncrementalFreesoundLoader(
+            config=dict(lazy_config, group_edges="clique")
+        )
+        loader._add_node_to_graph(self._sample(4))
+
+        groups = loader._group_nodes_by_attribute("username")
+
+        assert sorted(groups["producer"]) == ["1", "2", "3", "4"]
+        assert loader._add_user_edges_batch() == 11  # 12 directed pairs minus 1->2
+        loader.close()
+
+    def test_tag_edges_use_tag_index(
+        self, mock_freesound_client, mock_checkpoint, lazy_config
+    ):
+        """Test new nodes find lazily loaded tag neighbours via the tag index."""
+        self._create_checkpoint(lazy_config)
+        loader = IncrementalFreesoundLoader(config=lazy_config)
+        loader._add_node_to_graph(dict(self._sample(4), tags=["drum", "kick"]))
+
+        with patch.object(
+            loader.metadata_cache,
+            "get_tag_overlaps",
+            wraps=loader.metadata_cache.get_tag_overlaps,
+        ) as overlaps:
+            added = loader._add_tag_edges_incremental(0.3, {"4"})
+
+        overlaps.assert_called_once()
+        assert added == 6
+        assert loader.graph["4"]["1"]["weight"] == pytest.approx(1 / 3)
+        assert all(
+            not isinstance(loader.graph.nodes[n], LazyNodeAttributes)
+            or not loader.graph.nodes[n].is_materialized
+            for n in ("1", "2", "3")
+        )
+        loader.close()
+
+
+class TestIncrementalFreesoundLoaderAsyncCheckpoint:
+    """Test background checkpoint writing."""
+
+    @pytest.fixture
+    def async_loader(self, mock_freesound_client, mock_checkpoint, tmp_path):
+        """Loader writing checkpoints on a background thread."""
+        loader = IncrementalFreesoundLoader(
+            config={
+                "api_key": "test_key",
+                "checkpoint_dir": str(tmp_path / "checkpoints"),
+                "async_checkpoints": True,
+                "checkpoint_mode": "delta",
+            }
+        )
+        yield loader
+        loader.close()
+
+    @staticmethod
+    def _sample(sample_id):
+        return {"id": sample_id, "name": f"sound{sample_id}", "filesize": 1024}
+
+    def test_async_save_persists_after_flush(self, async_loader, tmp_path):
+        """Test snapshots are written by the writer thread and visible after flush."""
+        async_loader._add_node_to_graph(self._sample(1))
+        async_loader._save_checkpoint()
+        async_loader._add_node_to_graph(self._sample(2))
+        async_loader._add_edge("1", "2", type="similar", weight=1.0)
+        async_loader._save_checkpoint({"progress": 1})
+        async_loader.flush_checkpoints()
+
+        checkpoint_dir = tmp_path / "checkpoints"
+        assert (checkpoint_dir / "graph_topology.gpickle").exists()
+        assert async_loader.topology_journal.count_batches() == 1
+        assert async_loader.metadata_cache.exists(2)
+
+    def test_snapshot_isolated_from_later_mutations(self, async_loader):
+        """Test graph changes after _save_checkpoint don't leak into the snapshot."""
+        async_loader._add_node_to_graph(self._sample(1))
+        snapshot = async_loader._capture_checkpoint_snapshot()
+
+        async_loader._add_node_to_graph(self._sample(2))
+        async_loader.graph.nodes["1"]["name"] = "renamed"
+
+        assert snapshot.nodes == ["1"]
+        assert snapshot.metadata_rows[1]["name"] == "sound1"
+
+    def test_snapshot_isolated_from_in_place_edits(self, async_loader):
+        """Test mutable attribute values are copied, not shared."""
+        async_loader._add_node_to_graph(dict(self._sample(1), tags=["drum"]))
+        snapshot = async_loader._capture_checkpoint_snapshot()
+
+        async_loader.graph.nodes["1"]["tags"].append("loop")
+        async_loader.graph.nodes["1"]["images"]["waveform"] = "changed"
+
+        assert snapshot.metadata_rows[1]["tags"] == ["drum"]
+        assert snapshot.metadata_rows[1]["images"] == {}
+
+    def test_async_writes_share_metadata_connection(self, async_loader):
+        """Test the writer thread uses the loader's connection manager."""
+        jobs = async_loader.metadata_cache.get_connection_stats()["jobs"]
+        async_loader._add_node_to_graph(self._sample(1))
+        async_loader._save_checkpoint()
+        async_loader.flush_checkpoints()
+
+        assert async_loader.metadata_cache.get_connection_stats()["jobs"] > jobs
+        assert async_loader.metadata_cache.exists(1)
+
+    def test_async_failure_surfaces_on_flush(self, async_loader):
+        """Test a failed background save is raised in the collector thread."""
+        async_loader._add_node_to_graph(self._sample(1))
+
+        with patch.object(
+            async_loader.topology_journal,
+            "clear",
+            side_effect=RuntimeError("Checkpoint verification failed"),
+        ):
+            async_loader._save_checkpoint()
+            with pytest.raises(RuntimeError, match="verification failed"):
+                async_loader.flush_checkpoints()
+
+        assert async_loader._force_full_checkpoint is True
+
+    def test_close_flushes_pending_saves(
+        self, mock_freesound_client, mock_checkpoint, tmp_path
+    ):
+        """Test close() waits for queued snapshots before returning."""
+        loader = IncrementalFreesoundLoader(
+            config={
+                "api_key": "test_key",
+                "checkpoint_dir": str(tmp_path / "checkpoints"),
+                "async_checkpoints": True,
+            }
+        )
+        loader._add_node_to_graph(self._sample(1))
+        loader._save_checkpoint()
+        loader.close()
+
+        assert loader._checkpoint_writer is None
+        assert (tmp_path / "checkpoints" / "checkpoint_metadata.json").exists()
+
+
+class TestIncrementalFreesoundLoaderAdaptiveRate:
+    """Test AIMD request rate control driven by 429 responses."""
+
+    @pytest.fixture
+    def adaptive_config(self, tmp_path):
+        """Config for a loader with adaptive rate control."""
+        return {
+            "api_key": "test_key",
+            "checkpoint_dir": str(tmp_path / "checkpoints"),
+            "requests_per_minute": 60,
+            "adaptive_rate_limit": True,
+        }
+
+    @staticmethod
+    def _throttled(*args, **kwargs):
+        import freesound
+
+        raise freesound.FreesoundException(429, {"retry_after": 0})
+
+    def test_disabled_by_default(self, loader_with_mocks):
+        """Test the configured rate stays fixed without adaptive_rate_limit."""
+        assert loader_with_mocks.rate_controller is None
+
+    def test_throttle_lowers_rate(
+        self, mock_freesound_client, mock_checkpoint, adaptive_config
+    ):
+        """Test a 429 halves the rate and successes raise it again."""
+        import freesound
+
+        loader = IncrementalFreesoundLoader(config=adaptive_config)
+        with pytest.raises(freesound.FreesoundException):
+            loader._retry_with_backoff(self._throttled, max_retries=1)
+
+        assert loader.rate_limiter.rate == 30
+
+        for _ in range(loader.rate_controller.success_window):
+            loader._retry_with_backoff(lambda: "ok")
+
+        assert loader.rate_limiter.rate == 31
+        stats = loader.rate_controller.get_stats()
+        assert [point["reason"] for point in stats["trajectory"]] == [
+            "start",
+            "throttled",
+            "increase",
+        ]
+        loader.close()
+
+    def test_learned_rate_is_resumed(
+        self, mock_freesound_client, mock_checkpoint, adaptive_config
+    ):
+        """Test the next run starts at the rate saved in checkpoint metadata."""
+        import freesound
+
+        loader = IncrementalFreesoundLoader(config=adaptive_config)
+        with pytest.raises(freesound.FreesoundException):
+            loader._retry_with_backoff(self._throttled, max_retries=1)
+        loader._add_node_to_graph({"id": 1, "name": "sound1.wav", "filesize": 1})
+        loader._save_checkpoint()
+        loader.close()
+
+        resumed = IncrementalFreesoundLoader(config=adaptive_config)
+
+        assert resumed.rate_limiter.rate == 30
+        assert resumed.rate_controller.max_rate == 60
+        resumed.close()
+
+    def test_efficiency_stats_log_trajectory(
+        self, mock_freesound_client, mock_checkpoint, adaptive_config, caplog
+    ):
+        """Test log_api_efficiency_stats() reports the rate trajectory."""
+        import logging
+
+        loader = IncrementalFreesoundLoader(config=adaptive_config)
+        loader.rate_controller.on_throttle()
+
+        with caplog.at_level(logging.INFO):
+            loader.log_api_efficiency_stats()
+
+        assert "Rate trajectory: 60@0s -> 30@0s" in caplog.text
+        loader.close()
+
+
+class TestIncrementalFreesoundLoaderResponseCache:
+    """Test the on-disk API response cache and request budget accounting."""
+
+    @pytest.fixture
+    def cached_loader(self, tmp_path):
+        """Loader with a response cache and a real client on a fake transport."""
+        import json
+
+        import freesound
+        from requests import Response
+        from requests.adapters import BaseAdapter
+
+        class SearchAdapter(BaseAdapter):
+            def __init__(self):
+                super().__init__()
+                self.requests = 0
+
+            def send(self, request, **kwargs):
+                self.requests += 1
+                response = Response()
+                response.status_code = 200
+                response.url = request.url
+                response.request = request
+                response._content = json.dumps(
+                    {"count": 1, "next": None, "results": [{"id": 1}]}
+                ).encode()
+                return response
+
+            def close(self):
+                pass
+
+        with patch("freesound.FreesoundClient"):
+            loader = IncrementalFreesoundLoader(
+                config={
+                    "api_key": "test_key",
+                    "checkpoint_dir": str(tmp_path / "checkpoints"),
+                    "http_cache_path": str(tmp_path / "http_cache.db"),
+                }
+            )
+        assert loader.client.session.cache is loader.response_cache
+
+        adapter = SearchAdapter()
+        session = loader.client.session
+        loader.client = freesound.FreesoundClient()
+        loader.client.session = session
+        loader.client.session.mount("https://", adapter)
+        loader.adapter = adapter
+        yield loader
+        loader.close()
+
+    def test_cache_hits_do_not_use_request_budget(self, cached_loader):
+        """Test a repeated lookup is served from disk and counted as saved."""
+        assert set(cached_loader._search_samples_by_id(["1"])) == {"1"}
+        assert set(cached_loader._search_samples_by_id(["1"])) == {"1"}
+
+        assert cached_loader.adapter.requests == 1
+        assert cached_loader.session_request_count == 1
+        assert cached_loader.stats["http_cache_requests_saved"] == 1
+
+    def test_cache_hits_do_not_raise_adaptive_rate(self, cached_loader):
+        """Test only calls that reach the API count as AIMD successes."""
+        from FollowWeb_Visualizor.utils.rate_limiter import AdaptiveRateController
+
+        controller = AdaptiveRateController(
+            cached_loader.rate_limiter, success_window=1
+        )
+        cached_loader.rate_controller = controller
+        controller.on_throttle()
+
+        cached_loader._search_samples_by_id(["1"])
+        assert controller.increases == 1
+
+        cached_loader._search_samples_by_id(["1"])
+        assert cached_loader.adapter.requests == 1
+        assert controller.increases == 1
+
+    def test_cache_hits_take_no_rate_limit_token(self, cached_loader):
+        """Test a token is taken only for the request that reached the API."""
+        cached_loader._search_samples_by_id(["1"])
+        cached_loader._search_samples_by_id(["1"])
+
+        assert cached_loader.adapter.requests == 1
+        tokens = cached_loader.rate_limiter.get_available_tokens()
+        assert 58.5 < tokens < 59.5
+
+    def test_fresh_lookups_bypass_cache(self, cached_loader):
+        """Test existence checks always reach the API."""
+        cached_loader._search_samples_by_id(["1"])
+        cached_loader._search_samples_by_id(["1"], fresh=True)
+
+        assert cached_loader.adapter.requests == 2
+        assert cached_loader.session_request_count == 2
+        assert cached_loader.stats["http_cache_requests_saved"] == 0
+
+
+class TestIncrementalFreesoundLoaderRequestBudget:
+    """Test spending the daily request budget planned per activity."""
+
+    @pytest.fixture
+    def budget_config(self, tmp_path):
+        """Config for a loader with a daily budget of 10 requests."""
+        return {
+            "api_key": "test_key",
+            "checkpoint_dir": str(tmp_path / "checkpoints"),
+            "verify_existing_sounds": True,
+            "daily_request_budget": 10,
+        }
+
+    def test_disabled_by_default(self, loader_with_mocks):
+        """Test only max_requests limits a run without daily_request_budget."""
+        assert loader_with_mocks.budget_planner is None
+        assert loader_with_mocks._request_limit() == loader_with_mocks.max_requests
+
+    def test_cleanup_stops_at_validation_share(
+        self, mock_freesound_client, mock_checkpoint, budget_config
+    ):
+        """Test existence checks spend only validation's share and log the yield."""
+        loader = IncrementalFreesoundLoader(config=budget_config)
+        for sample_id in range(1, 401):
+            loader.graph.add_node(str(sample_id), name=f"sound{sample_id}")
+        loader.client = FakeSearchClient(set(range(1, 401)) - {7, 300})
+
+        deleted_count = loader.cleanup_deleted_samples()
+
+        # 20% of 10 requests: two of the three batches
+        assert len(loader.client.requests) == 2
+        assert deleted_count == 2
+        assert loader._request_limit() == loader.max_requests
+        (entry,) = loader.budget_planner.get_state()["log"]
+        assert entry["activity"] == "validation"
+        assert entry["allowance"] == 2
+        assert entry["requests"] == 2
+        assert entry["yield"] == 2
+        loader.close()
+
+    def test_budget_is_saved_and_resumed(
+        self, mock_freesound_client, mock_checkpoint, budget_config, tmp_path
+    ):
+        """Test today's spending and the allocation log go into the checkpoint."""
+        import json
+
+        loader = IncrementalFreesoundLoader(config=budget_config)
+        loader.graph.add_node("1", name="sound1")
+        loader.client = FakeSearchClient({1})
+        loader.cleanup_deleted_samples()
+        loader.close()
+
+        metadata_path = tmp_path / "checkpoints" / "checkpoint_metadata.json"
+        with open(metadata_path) as f:
+            request_budget = json.load(f)["request_budget"]
+        assert request_budget["spent"]["validation"] == 1
+        assert request_budget["log"][0]["requests"] == 1
+
+        resumed = IncrementalFreesoundLoader(config=budget_config)
+        assert resumed.budget_planner.spent["validation"] == 1
+        # No deletions found: validation's share shrinks below what was spent
+        assert resumed.budget_planner.observed_yield("validation") == 0.0
+        assert resumed.budget_planner.allowance("validation") == 0
+        resumed.close()
+
+    def test_new_nodes_count_as_discovery_yield(
+        self, mock_freesound_client, mock_checkpoint, budget_config
+    ):
+        """Test nodes added while discovering are credited to discovery."""
+        loader = IncrementalFreesoundLoader(config=budget_config)
+
+        with loader._spending("discovery"):
+            assert loader._request_limit() == 7
+            loader._increment_request_count()
+            loader._add_node_to_graph({"id": 1, "name": "sound1.wav", "filesize": 1})
+            loader._add_node_to_graph({"id": 2, "name": "sound2.wav", "filesize": 1})
+
+        assert loader.budget_planner.observed_yield("discovery") == 2.0
+        loader.close()
@@ -0,0 +1,126 @@
+"""
+Unit tests for RequestBudgetPlanner.
+
+Tests weighted allocation, yield-driven rebalancing, daily spending and the
+persisted allocation log.
+"""
+
+import pytest
+
+from FollowWeb_Visualizor.data import RequestBudgetPlanner
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+def run(planner, activity, requests, yield_count):
+    """Spend requests on an activity and record its yield."""
+    allowance = planner.begin(activity)
+    planner.charge(activity, requests)
+    planner.add_yield(activity, yield_count)
+    planner.end(activity)
+    return allowance
+
+
+class TestRequestBudgetPlanner:
+    """Test daily budget allocation."""
+
+    def test_default_weights(self):
+        """Test shares follow the weights before any yield is known."""
+        planner = RequestBudgetPlanner(daily_budget=1000)
+
+        assert planner.allocation() == {
+            "discovery": 700,
+            "validation": 200,
+            "refresh": 100,
+        }
+        assert planner.allowance("validation") == 200
+
+    def test_allowance_shrinks_with_spending(self):
+        """Test requests charged today reduce the activity's allowance."""
+        planner = RequestBudgetPlanner(
+            daily_budget=100, weights={"discovery": 1, "validation": 1, "refresh": 0}
+        )
+
+        planner.begin("discovery")
+        planner.charge("discovery", 30)
+
+        assert planner.allowance("discovery") == 20
+        assert planner.allowance("validation") == 50
+        assert planner.allowance("refresh") == 0
+
+    def test_yield_shifts_budget(self):
+        """Test a low-yield activity cedes budget to a high-yield one."""
+        planner = RequestBudgetPlanner(
+            daily_budget=1000,
+            weights={"discovery": 1, "validation": 1, "refresh": 0},
+        )
+
+        run(planner, "discovery", requests=100, yield_count=400)  # factor 4
+        run(planner, "validation", requests=10, yield_count=0)  # factor 0.25
+
+        allocation = planner.allocation()
+        assert allocation["discovery"] == 941
+        assert allocation["validation"] == 58
+        assert planner.observed_yield("discovery") == 4.0
+
+    def test_open_run_does_not_change_yield(self):
+        """Test the yield of a run in progress only counts once it ends."""
+        planner = RequestBudgetPlanner(daily_budget=100)
+
+        planner.begin("validation")
+        planner.charge("validation", 5)
+        assert planner.observed_yield("validation") is None
+
+        planner.end("validation")
+        assert planner.observed_yield("validation") == 0.0
+
+    def test_allocation_log(self):
+        """Test every run is logged with its allowance, requests and yield."""
+        planner = RequestBudgetPlanner(daily_budget=1000)
+
+        run(planner, "validation", requests=3, yield_count=2)
+
+        (entry,) = planner.get_state()["log"]
+        assert entry["activity"] == "validation"
+        assert entry["allowance"] == 200
+        assert entry["allocation"]["discovery"] == 700
+        assert entry["requests"] == 3
+        assert entry["yield"] == 2
+        assert "finished_at" in entry
+
+    def test_state_round_trip(self):
+        """Test a new planner continues today's spending and yield history."""
+        first = RequestBudgetPlanner(daily_budget=1000)
+        run(first, "discovery", requests=50, yield_count=100)
+        state = first.get_state()
+
+        resumed = RequestBudgetPlanner(daily_budget=1000)
+        resumed.restore_state(state)
+
+        assert resumed.spent["discovery"] == 50
+        assert resumed.observed_yield("discovery") == 2.0
+        assert resumed.allowance("discovery") == first.allowance("discovery")
+
+    def test_spending_resets_on_a_new_day(self):
+        """Test spending of an earlier day is not restored."""
+        first = RequestBudgetPlanner(daily_budget=1000)
+        run(first, "discovery", requests=50, yield_count=100)
+        state = first.get_state()
+        state["day"] = "2020-01-01"
+
+        resumed = RequestBudgetPlanner(daily_budget=1000)
+        resumed.restore_state(state)
+
+        assert resumed.spent["discovery"] == 0
+        assert len(resumed.log) == 1
+
+    def test_invalid_configuration(self):
+        """Test unknown activities and invalid values are rejected."""
+        with pytest.raises(ValueError):
+            RequestBudgetPlanner(daily_budget=-1)
+        with pytest.raises(ValueError):
+            RequestBudgetPlanner(daily_budget=100, weights={"crawl": 1})
+        with pytest.raises(ValueError):
+            RequestBudgetPlanner(daily_budget=100, reference_yields={"refresh": 0})
+        with pytest.raises(ValueError):
+            RequestBudgetPlanner(daily_budget=100).begin("crawl")
@@ -0,0 +1,97 @@
+"""
+Unit tests for CheckpointWriter.
+
+Tests ordered background writes, back-pressure, deferred failure reporting
+and flush-and-join shutdown.
+"""
+
+import threading
+
+import pytest
+
+from FollowWeb_Visualizor.data.checkpoint_writer import CheckpointWriter
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+class TestCheckpointWriter:
+    """Test CheckpointWriter threading behavior."""
+
+    def test_writes_in_submission_order(self):
+        """Test snapshots are written in the order they were submitted."""
+        written = []
+        writer = CheckpointWriter(written.append, max_pending=4)
+
+        for i in range(10):
+            writer.submit(i)
+        writer.flush()
+
+        assert written == list(range(10))
+        assert writer.saves_completed == 10
+        assert writer.pending == 0
+        writer.close()
+
+    def test_back_pressure_blocks_submit(self):
+        """Test submit blocks while the writer is busy and the queue is full."""
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow_write(snapshot):
+            started.set()
+            release.wait(timeout=5)
+
+        writer = CheckpointWriter(slow_write, max_pending=1)
+        writer.submit("in-flight")
+        started.wait(timeout=5)
+        writer.submit("queued")
+
+        submitted = threading.Event()
+
+        def third_submit():
+            writer.submit("blocked")
+            submitted.set()
+
+        thread = threading.Thread(target=third_submit)
+        thread.start()
+
+        assert not submitted.wait(timeout=0.2)
+        release.set()
+        thread.join(timeout=5)
+        assert submitted.is_set()
+        writer.close()
+
+    def test_failure_raised_on_flush(self):
+        """Test a background failure surfaces in the caller and drops later writes."""
+        written = []
+
+        def failing_write(snapshot):
+            if snapshot == "bad":
+                raise RuntimeError("disk full")
+            written.append(snapshot)
+
+        writer = CheckpointWriter(failing_write, max_pending=4)
+        writer.submit("bad")
+        writer.submit("after")
+
+        with pytest.raises(RuntimeError, match="disk full"):
+            writer.flush()
+        assert written == []
+        writer.close()
+
+    def test_close_flushes_and_runs_exit_hook(self):
+        """Test close writes pending snapshots and calls on_exit in the writer thread."""
+        written = []
+        exit_threads = []
+        writer = CheckpointWriter(
+            written.append,
+            on_exit=lambda: exit_threads.append(threading.current_thread().name),
+        )
+
+        writer.submit("last")
+        writer.close()
+        writer.close()  # Idempotent
+
+        assert written == ["last"]
+        assert exit_threads == ["checkpoint-writer"]
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.submit("late")
@@ -0,0 +1,88 @@
+"""
+Unit tests for CrawlFrontier.
+
+Tests priority-ordered batched pops, merging of queued samples, priority
+updates, deduplication against processed samples and stored relationships.
+"""
+
+import pytest
+
+from FollowWeb_Visualizor.data.storage import CrawlFrontier
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+def sample(sample_id):
+    """Minimal sample metadata."""
+    return {"id": sample_id, "name": f"sound{sample_id}.wav"}
+
+
+@pytest.fixture
+def frontier(tmp_path):
+    """Create a crawl frontier."""
+    frontier = CrawlFrontier(tmp_path / "crawl_frontier.db")
+    yield frontier
+    frontier.close()
+
+
+class TestCrawlFrontier:
+    """Test the persistent priority queue."""
+
+    def test_pop_batch_in_priority_order(self, frontier):
+        """Test batches come out highest priority first and leave the table."""
+        frontier.push_many([(sample(i), float(i), 1) for i in range(1, 6)])
+
+        first = frontier.pop_batch(2)
+        second = frontier.pop_batch(10)
+
+        assert [s["id"] for s, _, _ in first] == [5, 4]
+        assert [s["id"] for s, _, _ in second] == [3, 2, 1]
+        assert len(frontier) == 0
+        assert frontier.best_priority() is None
+
+    def test_push_merges_queued_sample(self, frontier):
+        """Test a sample is queued once with its best priority and depth."""
+        frontier.push_many([(sample(1), 5.0, 2)])
+        frontier.push_many([(sample(1), 3.0, 1), (sample(1), 8.0, 3)])
+
+        assert len(frontier) == 1
+        ((_, priority, depth),) = frontier.pop_batch(5)
+        assert priority == 8.0
+        assert depth == 1
+
+    def test_update_priorities(self, frontier):
+        """Test re-scored samples move in the pop order."""
+        frontier.push_many([(sample(1), 1.0, 0), (sample(2), 2.0, 0)])
+
+        frontier.update_priorities({"1": 3.0, "99": 10.0})
+
+        assert frontier.get_priority("1") == 3.0
+        assert frontier.get_priority("99") is None
+        assert [s["id"] for s, _, _ in frontier.pop_batch(2)] == [1, 2]
+
+    def test_pop_skips_processed_samples(self, frontier):
+        """Test processed samples are dropped and the batch is still filled."""
+        frontier.push_many([(sample(i), float(i), 0) for i in range(1, 6)])
+
+        batch = frontier.pop_batch(2, processed_ids={"5", "3"})
+
+        assert [s["id"] for s, _, _ in batch] == [4, 2]
+        assert "5" not in frontier
+        assert "1" in frontier
+
+    def test_edges_round_trip_and_prune(self, frontier):
+        """Test relationships are kept until both samples are in the graph."""
+        frontier.add_edges("1", [(2, 0.9), (3, 0.5)])
+
+        assert frontier.load_edges() == {"1": [("2", 0.9), ("3", 0.5)]}
+        assert frontier.prune_edges({"1", "2"}) == 1
+        assert frontier.load_edges() == {"1": [("3", 0.5)]}
+
+    def test_survives_reopen(self, frontier, tmp_path):
+        """Test queued samples are still there for the next run."""
+        frontier.push_many([(sample(7), 1.5, 2)])
+        frontier.close()
+
+        reopened = CrawlFrontier(tmp_path / "crawl_frontier.db")
+        assert reopened.pop_batch(1) == [(sample(7), 1.5, 2)]
+        reopened.close()
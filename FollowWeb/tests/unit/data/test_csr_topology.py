@@ -0,0 +1,140 @@
+"""
+Unit tests for CSRTopology.
+
+Tests conversion from NetworkX, atomic save/memory-mapped load, adjacency
+access, and the on-demand NetworkX view.
+"""
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from FollowWeb_Visualizor.data.storage import CSRTopology
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+@pytest.fixture
+def graph():
+    """Create a small typed, weighted graph with an isolated node."""
+    g = nx.DiGraph()
+    g.add_node("40")
+    g.add_edge("10", "20", type="by_same_user", weight=1.0)
+    g.add_edge("20", "10", type="by_same_user", weight=1.0)
+    g.add_edge("10", "30", type="similar_tags", weight=0.25)
+    g.add_edge("30", "20")
+    return g
+
+
+class TestCSRTopology:
+    """Test CSRTopology construction, persistence and views."""
+
+    def test_from_graph_builds_sorted_rows(self, graph):
+        """Test rows are contiguous and targets sorted by node index."""
+        topology = CSRTopology.from_graph(graph)
+
+        assert topology.num_nodes == 4
+        assert topology.num_edges == 4
+        assert topology.node_id_kind == "str_int"
+
+        row = topology.successor_indices(topology.index_of("10"))
+        targets = [topology.node_id(i) for i in row]
+        assert sorted(targets) == ["20", "30"]
+        assert list(row) == sorted(row)
+        assert list(topology.out_degrees()) == [
+            graph.out_degree(topology.node_id(i)) for i in range(4)
+        ]
+
+    def test_save_and_mmap_load(self, graph, tmp_path):
+        """Test arrays round-trip and are memory-mapped read-only."""
+        path = tmp_path / "graph_topology_csr"
+        CSRTopology.from_graph(graph).save(path)
+
+        topology = CSRTopology.load(path)
+        topology.validate()
+
+        assert CSRTopology.exists(path)
+        assert isinstance(topology.indices, np.memmap)
+        assert not topology.indices.flags.writeable
+        assert topology.weight.dtype == np.float32
+        assert topology.edge_type.dtype == np.uint8
+
+    def test_save_replaces_existing(self, graph, tmp_path):
+        """Test saving over an existing topology leaves no temp directories."""
+        path = tmp_path / "graph_topology_csr"
+        CSRTopology.from_graph(graph).save(path)
+
+        graph.add_edge("40", "10")
+        CSRTopology.from_graph(graph).save(path)
+
+        assert CSRTopology.load(path).num_edges == 5
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["graph_topology_csr"]
+
+    def test_to_networkx_round_trip(self, graph, tmp_path):
+        """Test the NetworkX view restores nodes, edges, types and weights."""
+        path = tmp_path / "graph_topology_csr"
+        CSRTopology.from_graph(graph).save(path)
+
+        restored = CSRTopology.load(path).to_networkx()
+
+        assert set(restored.nodes()) == set(graph.nodes())
+        assert set(restored.edges()) == set(graph.edges())
+        assert restored["10"]["30"]["type"] == "similar_tags"
+        assert restored["10"]["30"]["weight"] == pytest.approx(0.25)
+        assert "type" not in restored["30"]["20"]
+
+    def test_to_scipy_shares_arrays(self, graph):
+        """Test the scipy adjacency matrix matches the topology."""
+        topology = CSRTopology.from_graph(graph)
+
+        matrix = topology.to_scipy()
+
+        assert matrix.shape == (4, 4)
+        assert matrix.nnz == 4
+        source = topology.index_of("10")
+        target = topology.index_of("30")
+        assert matrix[source, target] == pytest.approx(0.25)
+
+    def test_non_numeric_node_ids(self, tmp_path):
+        """Test string node IDs that are not integers are preserved."""
+        g = nx.DiGraph()
+        g.add_edge("alice", "bob")
+        CSRTopology.from_graph(g).save(tmp_path / "csr")
+
+        topology = CSRTopology.load(tmp_path / "csr")
+
+        assert topology.node_id_kind == "str"
+        assert set(topology.to_networkx().edges()) == {("alice", "bob")}
+
+    def test_extend_matches_networkx_replay(self, graph, tmp_path):
+        """Test extend() gives the same topology as add_edge on a DiGraph."""
+        path = tmp_path / "graph_topology_csr"
+        CSRTopology.from_graph(graph).save(path)
+        nodes = ["50", "10"]
+        edges = [
+            ("50", "10", "similar_tags", 0.5),
+            ("10", "30", None, 0.75),
+            ("60", "20", "by_same_user", None),
+        ]
+
+        extended = CSRTopology.load(path).extend(nodes, edges)
+        graph.add_nodes_from(nodes)
+        for source, target, edge_type, weight in edges:
+            attrs = {"type": edge_type, "weight": weight}
+            graph.add_edge(
+                source, target, **{k: v for k, v in attrs.items() if v is not None}
+            )
+
+        extended.validate()
+        restored = extended.to_networkx()
+        assert set(restored.nodes()) == set(graph.nodes())
+        assert set(restored.edges()) == set(graph.edges())
+        # Existing edge keeps its type, takes the new weight
+        assert restored["10"]["30"]["type"] == "similar_tags"
+        assert restored["10"]["30"]["weight"] == pytest.approx(0.75)
+        assert restored["60"]["20"]["type"] == "by_same_user"
+
+    def test_load_missing_raises(self, tmp_path):
+        """Test loading an incomplete topology raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            CSRTopology.load(tmp_path / "missing")
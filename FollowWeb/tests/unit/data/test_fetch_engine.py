@@ -0,0 +1,156 @@
+"""
+Unit tests for FetchEngine.
+
+Tests prefetching, direct fetches, the pending limit, error propagation and
+shutdown behaviour.
+"""
+
+import threading
+import time
+
+import pytest
+
+from FollowWeb_Visualizor.data.fetch_engine import FetchEngine
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+class SlowFetcher:
+    """Fetch function with injected latency that records concurrency."""
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, key):
+        with self._lock:
+            self.calls.append(key)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(self.latency)
+            if key == "boom":
+                raise ValueError("fetch failed")
+            return key * 2
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestFetchEngine:
+    """Test FetchEngine behaviour."""
+
+    def test_prefetched_results_are_returned(self):
+        """Test results come back for the key they were fetched for."""
+        fetcher = SlowFetcher()
+        engine = FetchEngine(fetcher, max_workers=4)
+        try:
+            for key in (1, 2, 3):
+                assert engine.prefetch(key)
+            assert [engine.result(key) for key in (3, 1, 2)] == [6, 2, 4]
+            assert engine.pending == 0
+            assert engine.get_stats()["prefetch_hits"] == 3
+        finally:
+            engine.close()
+
+    def test_prefetches_run_concurrently(self):
+        """Test prefetched keys overlap their latency."""
+        fetcher = SlowFetcher(latency=0.1)
+        engine = FetchEngine(fetcher, max_workers=4)
+        try:
+            for key in range(4):
+                engine.prefetch(key)
+            for key in range(4):
+                engine.result(key)
+        finally:
+            engine.close()
+
+        assert fetcher.max_active > 1
+
+    def test_unknown_key_is_fetched_directly(self):
+        """Test result() falls back to a synchronous fetch."""
+        fetcher = SlowFetcher(latency=0)
+        engine = FetchEngine(fetcher, max_workers=2)
+        try:
+            assert engine.result(5) == 10
+            assert engine.get_stats()["direct_fetches"] == 1
+        finally:
+            engine.close()
+
+    def test_pending_limit(self):
+        """Test prefetch() refuses keys beyond max_pending."""
+        engine = FetchEngine(SlowFetcher(), max_workers=2, max_pending=2)
+        try:
+            assert engine.prefetch(1)
+            assert engine.prefetch(2)
+            assert engine.full
+            assert not engine.prefetch(3)
+            assert engine.prefetch(1)  # already pending
+            assert 3 not in engine
+        finally:
+            engine.close()
+
+    def test_errors_are_raised_by_result(self):
+        """Test exceptions from the fetch function reach the consumer."""
+        engine = FetchEngine(SlowFetcher(latency=0), max_workers=2)
+        try:
+            engine.prefetch("boom")
+            with pytest.raises(ValueError, match="fetch failed"):
+                engine.result("boom")
+        finally:
+            engine.close()
+
+    def test_wait_keeps_results(self):
+        """Test wait() blocks until prefetches finish without consuming them."""
+        fetcher = SlowFetcher(latency=0.05)
+        engine = FetchEngine(fetcher, max_workers=2)
+        try:
+            engine.prefetch(1)
+            engine.prefetch(2)
+            engine.wait()
+            assert engine.running == 0
+            assert engine.pending == 2
+            assert engine.result(2) == 4
+        finally:
+            engine.close()
+
+    def test_discard(self):
+        """Test discarded keys are no longer pending."""
+        engine = FetchEngine(SlowFetcher(latency=0), max_workers=1)
+        try:
+            engine.prefetch(1)
+            engine.discard(1)
+            engine.discard(2)  # unknown keys are ignored
+            assert engine.keys() == []
+        finally:
+            engine.close()
+
+    def test_close_cancels_unstarted_prefetches(self):
+        """Test close() cancels queued work and counts fetched results as wasted."""
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def blocking_fetch(key):
+            calls.append(key)
+            started.set()
+            release.wait(5)
+            return key
+
+        engine = FetchEngine(blocking_fetch, max_workers=1, max_pending=3)
+        for key in (1, 2, 3):
+            engine.prefetch(key)
+        assert started.wait(5)
+
+        threading.Timer(0.05, release.set).start()
+        engine.close()
+        engine.close()  # idempotent
+
+        stats = engine.get_stats()
+        assert stats["wasted"] == 1
+        assert stats["cancelled"] == 2
+        assert calls == [1]
+        assert not engine.prefetch(4)
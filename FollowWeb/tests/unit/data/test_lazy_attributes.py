@@ -0,0 +1,149 @@
+"""
+Unit tests for LazyAttributeStore and LazyNodeAttributes.
+
+Tests hot-column reads, LRU-bounded row decoding, write materialization,
+and compatibility with NetworkX graph operations and pickling.
+"""
+
+import pickle
+
+import networkx as nx
+import pytest
+
+from FollowWeb_Visualizor.data.storage import (
+    LazyAttributeStore,
+    LazyNodeAttributes,
+    MetadataCache,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Create a metadata cache with a few samples."""
+    path = tmp_path / "metadata_cache.db"
+    with MetadataCache(str(path)) as cache:
+        cache.bulk_insert(
+            {
+                sample_id: {
+                    "id": sample_id,
+                    "name": f"sound{sample_id}",
+                    "tags": ["drum", f"tag{sample_id}"],
+                    "username": f"user{sample_id % 2}",
+                    "pack": None,
+                    "num_downloads": sample_id * 10,
+                    "duration": 1.5,
+                    "description": "long text " * 20,
+                }
+                for sample_id in range(1, 6)
+            }
+        )
+    return path
+
+
+@pytest.fixture
+def lazy_graph(db_path):
+    """Create a graph whose node attributes are backed by the store."""
+    store = LazyAttributeStore(db_path, cache_size=2)
+    graph = nx.DiGraph()
+    graph.add_edge("1", "2")
+    store.attach(graph, store.load_hot_columns())
+    yield graph, store
+    store.close()
+
+
+class TestLazyNodeAttributes:
+    """Test lazy attribute access through graph.nodes."""
+
+    def test_hot_fields_served_from_columns(self, lazy_graph):
+        """Test hot fields don't decode rows."""
+        graph, store = lazy_graph
+
+        assert graph.nodes["3"]["tags"] == ["drum", "tag3"]
+        assert graph.nodes["3"]["username"] == "user1"
+        assert graph.nodes["3"]["num_downloads"] == 30
+        assert graph.nodes["3"]["duration"] == 1.5
+        assert store.misses == 0
+        assert store.hot_reads == 4
+
+    def test_cold_fields_decode_row(self, lazy_graph):
+        """Test other fields (and null hot fields) fall back to the row."""
+        graph, store = lazy_graph
+
+        assert graph.nodes["1"]["name"] == "sound1"
+        assert graph.nodes["1"]["pack"] is None
+        assert graph.nodes["1"].get("missing", "default") == "default"
+        assert store.misses == 1
+        assert store.hits == 2
+
+    def test_row_cache_is_bounded(self, lazy_graph):
+        """Test the LRU keeps at most cache_size decoded rows."""
+        graph, store = lazy_graph
+
+        for node_id in ("1", "2", "3", "4", "5"):
+            graph.nodes[node_id]["description"]
+
+        assert store.get_stats()["cached_rows"] == 2
+
+    def test_nodes_with_data_and_dict(self, lazy_graph):
+        """Test iteration and dict() expose the full attributes."""
+        graph, _ = lazy_graph
+
+        data = dict(graph.nodes(data=True))
+        assert set(data) == {"1", "2", "3", "4", "5"}
+        assert dict(data["4"])["description"].startswith("long text")
+        assert "tags" in graph.nodes["4"]
+        assert nx.get_node_attributes(graph, "num_downloads")["5"] == 50
+
+    def test_write_materializes(self, lazy_graph):
+        """Test writes are kept on the node and survive cache eviction."""
+        graph, _ = lazy_graph
+        attrs = graph.nodes["2"]
+        assert isinstance(attrs, LazyNodeAttributes)
+        assert not attrs.is_materialized
+
+        graph.nodes["2"]["is_dormant"] = True
+        graph.nodes["2"].update({"tags": ["changed"]})
+        for node_id in ("3", "4", "5"):
+            graph.nodes[node_id]["description"]
+
+        assert attrs.is_materialized
+        assert graph.nodes["2"]["is_dormant"] is True
+        assert graph.nodes["2"]["tags"] == ["changed"]
+        assert graph.nodes["2"]["name"] == "sound2"
+
+    def test_in_place_list_edits_are_kept(self, lazy_graph):
+        """Test appending to a list attribute materializes the node."""
+        graph, store = lazy_graph
+        tags = graph.nodes["4"]["tags"]
+        tags.append("added")
+        tags.append("again")
+
+        for node_id in ("1", "2", "3"):
+            graph.nodes[node_id]["description"]
+
+        assert graph.nodes["4"].is_materialized
+        assert graph.nodes["4"]["tags"] == ["drum", "tag4", "added", "again"]
+        # The shared hot column is left untouched
+        assert store.hot_value("4", "tags") == ["drum", "tag4"]
+        assert type(pickle.loads(pickle.dumps(graph.nodes["4"]["tags"]))) is list
+
+    def test_copy_and_pickle_produce_plain_dicts(self, lazy_graph):
+        """Test graph copies and pickles don't reference the store."""
+        graph, _ = lazy_graph
+
+        copied = graph.copy()
+        restored = pickle.loads(pickle.dumps(graph))
+
+        for result in (copied, restored):
+            assert type(result.nodes["1"]) is dict
+            assert result.nodes["1"]["tags"] == ["drum", "tag1"]
+            assert result.has_edge("1", "2")
+
+    def test_reads_after_close_reopen(self, lazy_graph):
+        """Test attributes remain readable after the store is closed."""
+        graph, store = lazy_graph
+        store.close()
+
+        assert graph.nodes["5"]["name"] == "sound5"
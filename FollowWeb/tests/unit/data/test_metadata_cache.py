@@ -2,16 +2,25 @@
 Unit tests for MetadataCache SQL-based seed selection.
 
 Tests get_best_seed_sample() with various priority scenarios,
-dormant node filtering, and edge cases.
+dormant node filtering, and edge cases, plus the promoted columns,
+tag index, batched reads and payload codecs added by later schema versions,
+and concurrent access from several threads.
 """
 
+import json
 import logging
+import sqlite3
 import tempfile
+import threading
 from pathlib import Path
 
 import pytest
 
-from FollowWeb_Visualizor.data.storage.metadata_cache import MetadataCache
+from FollowWeb_Visualizor.data.storage.metadata_cache import (
+    SCHEMA_VERSION,
+    MetadataCache,
+)
+from FollowWeb_Visualizor.data.storage.payload_codec import get_codec
 
 pytestmark = [pytest.mark.unit, pytest.mark.data]
 
@@ -294,3 +303,374 @@ class TestEdgeCases:
 
         # Should return same result each time
         assert result1 == result2 == result3 == 130001
+
+
+@pytest.mark.unit
+class TestPromotedColumns:
+    """Test promoted, indexed columns and the schema upgrade."""
+
+    def test_upgrade_v1_database(self, temp_db, mock_logger):
+        """Test an existing v1 database gains backfilled promoted columns."""
+        conn = sqlite3.connect(temp_db)
+        conn.execute("""
+            CREATE TABLE metadata (
+                sample_id INTEGER PRIMARY KEY,
+                data JSON NOT NULL,
+                last_updated TEXT NOT NULL,
+                priority_score REAL,
+                is_dormant INTEGER DEFAULT 0,
+                dormant_since TEXT
+            )
+        """)
+        conn.execute(
+            "INSERT INTO metadata (sample_id, data, last_updated) VALUES (?, ?, ?)",
+            (
+                1,
+                json.dumps(
+                    {
+                        "username": "alice",
+                        "pack": "https://freesound.org/apiv2/packs/42/",
+                        "num_downloads": 7,
+                        "last_existence_check_at": "2024-01-01T00:00:00Z",
+                    }
+                ),
+                "2024-01-01T00:00:00+00:00",
+            ),
+        )
+        conn.commit()
+        conn.close()
+
+        with MetadataCache(temp_db, mock_logger) as cache:
+            row = cache._conn.execute(
+                "SELECT username, pack_name, num_downloads, last_existence_check_at "
+                "FROM metadata"
+            ).fetchone()
+            version = cache._conn.execute("PRAGMA user_version").fetchone()[0]
+            indexes = {
+                row[1] for row in cache._conn.execute("PRAGMA index_list(metadata)")
+            }
+
+        assert row == ("alice", "42", 7, "2024-01-01T00:00:00+00:00")
+        assert version == SCHEMA_VERSION
+        assert {"idx_username", "idx_pack_name", "idx_last_existence_check_at"} <= (
+            indexes
+        )
+
+    def test_sample_ids_by_age(self, metadata_cache):
+        """Test ordering puts missing timestamps first, then oldest."""
+        metadata_cache.bulk_insert(
+            {
+                1: {"last_metadata_update_at": "2024-03-01T00:00:00+00:00"},
+                2: {"last_metadata_update_at": None},
+                3: {"last_metadata_update_at": "2024-01-01T00:00:00+00:00"},
+                4: {"last_metadata_update_at": "not a timestamp"},
+            }
+        )
+
+        ordered = [
+            sample_id
+            for sample_id, _ in metadata_cache.iter_sample_ids_by_age(
+                "last_metadata_update_at"
+            )
+        ]
+
+        assert ordered == [2, 4, 3, 1]
+        with pytest.raises(ValueError):
+            list(metadata_cache.iter_sample_ids_by_age("data"))
+
+    def test_sample_groups(self, metadata_cache):
+        """Test grouping by username and pack name."""
+        metadata_cache.bulk_insert(
+            {
+                1: {"username": "alice", "pack": "https://x/packs/9/"},
+                2: {"username": "alice", "pack": "https://x/packs/9/"},
+                3: {"username": "bob", "pack": None},
+            }
+        )
+
+        assert metadata_cache.get_sample_groups("username") == {"alice": [1, 2]}
+        assert metadata_cache.get_sample_groups("username", min_size=1) == {
+            "alice": [1, 2],
+            "bob": [3],
+        }
+        assert metadata_cache.get_sample_groups("pack_name") == {"9": [1, 2]}
+        assert metadata_cache.get_samples_by_pack("https://x/packs/9/") == [1, 2]
+        assert metadata_cache.get_samples_by_user("bob") == [3]
+
+    def test_group_memberships_replace_table(self, metadata_cache):
+        """Test the hub group table is stored whole and replaced on each put."""
+        metadata_cache.put_group_memberships(
+            {"by_same_user": {"alice": ["2", "1"]}, "in_same_pack": {"9": ["1", "3"]}}
+        )
+
+        assert metadata_cache.get_group_memberships() == {
+            "by_same_user": {"alice": [1, 2]},
+            "in_same_pack": {"9": [1, 3]},
+        }
+
+        metadata_cache.put_group_memberships({"in_same_pack": {"9": ["3", "4"]}})
+        assert metadata_cache.get_group_memberships() == {"in_same_pack": {"9": [3, 4]}}
+
+        metadata_cache.put_group_memberships({})
+        assert metadata_cache.get_group_memberships() == {}
+
+
+@pytest.mark.unit
+class TestTagIndex:
+    """Test the normalized tag tables and inverted index queries."""
+
+    def test_postings_follow_writes(self, metadata_cache):
+        """Test set/flush, bulk_insert and delete keep postings and df in sync."""
+        metadata_cache.bulk_insert(
+            {
+                1: {"tags": ["drum", "loop", "drum"]},
+                2: {"tags": ["drum"]},
+                3: {"tags": []},
+            }
+        )
+        metadata_cache.set(2, {"tags": ["bass"]})
+        metadata_cache.flush()
+        metadata_cache.delete(1)
+
+        assert metadata_cache.samples_with_tag("bass") == [2]
+        assert metadata_cache.samples_with_tag("drum") == []
+        assert metadata_cache.tag_document_frequencies() == {"bass": 1}
+
+    def test_iter_tag_postings(self, metadata_cache):
+        """Test postings stream grouped by tag with df filters."""
+        metadata_cache.bulk_insert(
+            {
+                1: {"tags": ["drum", "loop"]},
+                2: {"tags": ["drum"]},
+                3: {"tags": ["drum", "kick"]},
+            }
+        )
+
+        postings = dict(metadata_cache.iter_tag_postings())
+
+        assert postings == {"drum": [1, 2, 3], "loop": [1], "kick": [3]}
+        assert dict(metadata_cache.iter_tag_postings(min_df=2)) == {"drum": [1, 2, 3]}
+        assert dict(metadata_cache.iter_tag_postings(max_df=1)) == {
+            "loop": [1],
+            "kick": [3],
+        }
+
+    def test_tag_overlaps(self, metadata_cache):
+        """Test candidates report shared and total tag counts."""
+        metadata_cache.bulk_insert(
+            {
+                1: {"tags": ["drum", "loop", "kick"]},
+                2: {"tags": ["bass"]},
+            }
+        )
+
+        assert metadata_cache.get_tag_overlaps(["drum", "kick", "snare"]) == {1: (2, 3)}
+
+    def test_upgrade_indexes_existing_tags(self, temp_db, mock_logger):
+        """Test a v2 database is indexed by tag on upgrade."""
+        with MetadataCache(temp_db, mock_logger) as cache:
+            cache.bulk_insert({1: {"tags": ["drum"]}, 2: {"tags": ["drum"]}})
+            cache._conn.execute("DROP TABLE sample_tags")
+            cache._conn.execute("DROP TABLE tags")
+            cache._conn.execute("PRAGMA user_version = 2")
+            cache._conn.commit()
+
+        with MetadataCache(temp_db, mock_logger) as cache:
+            assert cache.tag_document_frequencies() == {"drum": 2}
+            assert cache.samples_with_tag("drum") == [1, 2]
+
+
+class TestMinHashSignatures:
+    """Test the stored MinHash signatures."""
+
+    def test_round_trip_by_parameters(self, metadata_cache):
+        """Test signatures come back only for the parameters they were made with."""
+        metadata_cache.put_minhash_signatures({1: (-5, b"abcd"), 2: (7, b"efgh")}, 1, 1)
+
+        assert metadata_cache.get_minhash_signatures([1, 2, 3], 1, 1) == {
+            1: (-5, b"abcd"),
+            2: (7, b"efgh"),
+        }
+        assert metadata_cache.get_minhash_signatures([1, 2], 2, 1) == {}
+        assert metadata_cache.get_minhash_signatures([1, 2], 1, 2) == {}
+
+        # One signature per sample: new parameters replace the old one
+        metadata_cache.put_minhash_signatures({1: (-5, b"ijklmnop")}, 2, 1)
+
+        assert metadata_cache.get_minhash_signatures([1, 2], 1, 1) == {2: (7, b"efgh")}
+        assert metadata_cache.get_minhash_signatures([1], 2, 1) == {
+            1: (-5, b"ijklmnop")
+        }
+
+    def test_delete_drops_signature(self, metadata_cache):
+        """Test deleting a sample deletes its signature."""
+        metadata_cache.bulk_insert({1: {"tags": ["drum"]}})
+        metadata_cache.put_minhash_signatures({1: (0, b"abcd")}, 1, 1)
+
+        metadata_cache.delete(1)
+
+        assert metadata_cache.get_minhash_signatures([1], 1, 1) == {}
+
+
+@pytest.mark.unit
+class TestBatchedReads:
+    """Test get_many and iter_metadata."""
+
+    def test_get_many_chunks_large_id_lists(self, metadata_cache):
+        """Test lookups larger than the SQLite variable limit."""
+        metadata_cache.bulk_insert(
+            {i: {"name": f"sound{i}", "tags": ["a"]} for i in range(1, 2001)}
+        )
+
+        results = metadata_cache.get_many([*range(1, 2001), 99999])
+
+        assert len(results) == 2000
+        assert results[1500] == {"name": "sound1500", "tags": ["a"]}
+
+    def test_get_many_selected_columns(self, metadata_cache):
+        """Test json_extract projections keep nested values and None-fill gaps."""
+        metadata_cache.bulk_insert({1: {"name": "a", "tags": ["x", "y"]}})
+
+        assert metadata_cache.get_many([1], columns=["tags", "pack"]) == {
+            1: {"tags": ["x", "y"], "pack": None}
+        }
+
+    def test_iter_metadata_pages_and_filters(self, metadata_cache):
+        """Test streaming in sample_id order with a WHERE filter."""
+        metadata_cache.bulk_insert(
+            {
+                i: {"username": "alice" if i % 2 else "bob", "num_downloads": i}
+                for i in range(10, 0, -1)
+            }
+        )
+
+        rows = list(
+            metadata_cache.iter_metadata(
+                batch_size=2,
+                columns=["num_downloads"],
+                where="username = ?",
+                params=("alice",),
+            )
+        )
+
+        assert rows == [(i, {"num_downloads": i}) for i in (1, 3, 5, 7, 9)]
+        assert len(metadata_cache.get_all_metadata()) == 10
+
+
+@pytest.mark.unit
+class TestPayloadCodecs:
+    """Test per-row payload codecs."""
+
+    def test_mixed_codec_rows_read_back(self, temp_db, mock_logger):
+        """Test JSON and zlib rows coexist and decode through every read path."""
+        row = {"name": "kick", "tags": ["drum", "kick"], "username": "alice"}
+        with MetadataCache(temp_db, mock_logger) as cache:
+            cache.bulk_insert({1: row})
+        with MetadataCache(temp_db, mock_logger, codec="zlib") as cache:
+            cache.set(2, dict(row, name="snare"))
+            cache.flush()
+
+            codecs = dict(
+                cache._conn.execute("SELECT sample_id, data_codec FROM metadata")
+            )
+            assert codecs == {1: 0, 2: 1}
+            assert cache.get(2)["name"] == "snare"
+            assert cache.get_many([1, 2], columns=["name", "pack"]) == {
+                1: {"name": "kick", "pack": None},
+                2: {"name": "snare", "pack": None},
+            }
+            assert dict(cache.iter_fields(["name", "tags"])) == {
+                1: ("kick", '["drum","kick"]'),
+                2: ("snare", '["drum","kick"]'),
+            }
+            assert [sample_id for sample_id, _ in cache.iter_metadata()] == [1, 2]
+            assert cache.samples_with_tag("kick") == [1, 2]
+
+    def test_zlib_rows_are_smaller(self, temp_db, mock_logger):
+        """Test the zlib codec stores a smaller payload than JSON."""
+        row = {
+            "name": "sample.wav",
+            "description": "a long description " * 10,
+            "license": "http://creativecommons.org/licenses/by/4.0/",
+            "previews": {"preview-hq-mp3": "https://cdn.freesound.org/previews/1.mp3"},
+        }
+        with MetadataCache(temp_db, mock_logger) as cache:
+            cache.bulk_insert({1: row})
+            cache.codec = get_codec("zlib")
+            cache.bulk_insert({2: row})
+            sizes = dict(
+                cache._conn.execute("SELECT sample_id, length(data) FROM metadata")
+            )
+
+        assert sizes[2] < sizes[1] / 2
+
+    def test_zlib_rejects_text_payload(self):
+        """Test a TEXT payload labelled as zlib raises ValueError."""
+        with pytest.raises(ValueError, match="stored as TEXT"):
+            get_codec("zlib").decode('{"id": 1}')
+
+    def test_unknown_codec_rejected(self, temp_db, mock_logger):
+        """Test configuring an unknown codec raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown metadata codec"):
+            MetadataCache(temp_db, mock_logger, codec="msgpack")
+
+
+class TestConcurrentAccess:
+    """Test reads and writes from several threads."""
+
+    def test_threads_write_and_read(self, temp_db, mock_logger):
+        """Test concurrent set/flush and reads from worker threads."""
+        errors = []
+
+        with MetadataCache(temp_db, mock_logger, batch_size=10) as cache:
+
+            def worker(offset):
+                try:
+                    for i in range(50):
+                        sample_id = offset * 1000 + i
+                        cache.set(sample_id, {"id": sample_id, "tags": [f"t{offset}"]})
+                    cache.flush()
+                    assert cache.get(offset * 1000) == {
+                        "id": offset * 1000,
+                        "tags": [f"t{offset}"],
+                    }
+                    assert len(cache.samples_with_tag(f"t{offset}")) == 50
+                except Exception as e:
+                    errors.append(e)
+
+            threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert errors == []
+            assert cache.get_count() == 200
+            stats = cache.get_connection_stats()
+            assert stats["jobs"] >= 20
+            # Worker readers are closed when their threads exit
+            assert stats["readers"] == 1
+
+    def test_close_flushes_pending_writes(self, temp_db, mock_logger):
+        """Test close() commits queued rows and is idempotent."""
+        cache = MetadataCache(temp_db, mock_logger)
+        cache.set(1, {"id": 1})
+        cache.close()
+        cache.close()
+
+        with pytest.raises(RuntimeError):
+            cache.get(1)
+        with MetadataCache(temp_db, mock_logger) as reopened:
+            assert reopened.get(1) == {"id": 1}
+
+    def test_exit_does_not_mask_exception(self, temp_db, mock_logger):
+        """Test a failing flush on exit doesn't replace the block's error."""
+        with pytest.raises(KeyError):
+            with MetadataCache(temp_db, mock_logger) as cache:
+                cache.set(1, {"id": 1})
+                cache._pending_writes.append(("not", "a", "row"))
+                raise KeyError("original")
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            with MetadataCache(temp_db, mock_logger) as cache:
+                cache._pending_writes.append(("not", "a", "row"))
@@ -0,0 +1,204 @@
+"""
+Unit tests for ResponseCache and CachingSession.
+
+Tests cache key normalization, per-endpoint TTLs, size-bounded eviction,
+bypass mode, sharing between instances and serving Freesound client calls.
+"""
+
+import json
+import os
+import time
+
+import pytest
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from FollowWeb_Visualizor.data.storage import CachingSession, ResponseCache
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+BASE = "https://freesound.org/apiv2"
+
+
+class FakeAdapter(BaseAdapter):
+    """Transport adapter answering every request with a JSON body."""
+
+    def __init__(self, status_code=200):
+        super().__init__()
+        self.status_code = status_code
+        self.urls = []
+
+    def send(self, request, **kwargs):
+        self.urls.append(request.url)
+        response = Response()
+        response.status_code = self.status_code
+        response.url = request.url
+        response.request = request
+        response._content = json.dumps(
+            {"id": 1, "name": "sound1.wav", "call": len(self.urls)}
+        ).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a response cache."""
+    cache = ResponseCache(tmp_path / "http_cache.db")
+    yield cache
+    cache.close()
+
+
+def caching_session(cache, adapter):
+    """Create a caching session whose network requests go to adapter."""
+    session = CachingSession(cache)
+    session.mount("https://", adapter)
+    return session
+
+
+class TestResponseCache:
+    """Test the SQLite response store."""
+
+    def test_make_key_normalizes_parameters(self):
+        """Test parameter order and the token don't change the key."""
+        endpoint, key = ResponseCache.make_key(
+            f"{BASE}/search/text/?query=drum&token=abc&page=2"
+        )
+        _, same_key = ResponseCache.make_key(
+            f"{BASE}/search/text/?page=2&query=drum&token=xyz"
+        )
+
+        assert endpoint == "search"
+        assert key == same_key == "/search/text/?page=2&query=drum"
+        assert ResponseCache.make_key(f"{BASE}/sounds/12/")[0] == "sound"
+        assert ResponseCache.make_key(f"{BASE}/sounds/12/similar/")[0] == "similar"
+        assert ResponseCache.make_key(f"{BASE}/packs/3/")[0] == "other"
+
+    def test_put_and_get(self, cache):
+        """Test stored bodies round-trip and are stored compressed."""
+        content = json.dumps({"results": ["x" * 50] * 100}).encode()
+        cache.put("search", "/search/text/?query=a", content)
+
+        assert cache.get("search", "/search/text/?query=a") == content
+        assert cache.get("search", "/search/text/?query=b") is None
+        assert cache.get_stats()["size_bytes"] < len(content) / 5
+        assert cache.take_thread_outcome() == (1, 1)
+        assert cache.take_thread_outcome() == (0, 0)
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test responses expire per endpoint type."""
+        cache = ResponseCache(tmp_path / "ttl.db", ttls={"search": 0.05})
+        cache.put("search", "/search/text/", b"{}")
+        cache.put("sound", "/sounds/1/", b"{}")
+        time.sleep(0.1)
+
+        assert cache.get("search", "/search/text/") is None
+        assert cache.get("sound", "/sounds/1/") == b"{}"
+        assert cache.get_stats()["expired"] == 1
+        cache.close()
+
+    def test_zero_ttl_disables_endpoint(self, tmp_path):
+        """Test a TTL of 0 neither stores nor serves that endpoint."""
+        cache = ResponseCache(tmp_path / "off.db", ttls={"search": 0})
+        cache.put("search", "/search/text/", b"{}")
+
+        assert cache.get("search", "/search/text/") is None
+        assert cache.get_stats()["stores"] == 0
+        cache.close()
+
+    def test_eviction_keeps_recently_used(self, tmp_path):
+        """Test least recently used responses are evicted over the budget."""
+        cache = ResponseCache(tmp_path / "small.db", max_bytes=4000)
+        for i in range(3):
+            # Incompressible bodies of ~1000 bytes
+            cache.put("sound", f"/sounds/{i}/", os.urandom(1000))
+            time.sleep(0.01)
+        cache.get("sound", "/sounds/0/")
+        time.sleep(0.01)
+        cache.put("sound", "/sounds/3/", os.urandom(1000))
+
+        stats = cache.get_stats()
+        assert stats["evictions"] > 0
+        assert stats["size_bytes"] <= 4000
+        assert cache.get("sound", "/sounds/0/") is not None
+        assert cache.get("sound", "/sounds/1/") is None
+        cache.close()
+
+    def test_bypass_skips_lookups_but_stores(self, cache):
+        """Test bypass mode always misses and refreshes the stored body."""
+        cache.put("sound", "/sounds/1/", b"old")
+
+        with cache.bypass():
+            assert cache.get("sound", "/sounds/1/") is None
+            cache.put("sound", "/sounds/1/", b"new")
+
+        assert cache.get("sound", "/sounds/1/") == b"new"
+        assert cache.get_stats()["bypassed"] == 1
+
+    def test_shared_between_instances(self, cache, tmp_path):
+        """Test a second process (instance) sees stored responses."""
+        cache.put("sound", "/sounds/1/", b"{}")
+
+        other = ResponseCache(tmp_path / "http_cache.db")
+        assert other.get("sound", "/sounds/1/") == b"{}"
+        other.close()
+
+
+class TestCachingSession:
+    """Test serving requests from the cache."""
+
+    def test_second_request_is_served_from_cache(self, cache):
+        """Test only the first GET reaches the network."""
+        adapter = FakeAdapter()
+        session = caching_session(cache, adapter)
+
+        first = session.get(f"{BASE}/sounds/1/", params={"fields": "id,name"})
+        second = session.get(f"{BASE}/sounds/1/", params={"fields": "id,name"})
+
+        assert len(adapter.urls) == 1
+        assert second.json() == first.json()
+        assert second.headers["X-Cache"] == "HIT"
+
+    def test_errors_are_not_cached(self, cache):
+        """Test non-200 responses are sent again."""
+        adapter = FakeAdapter(status_code=429)
+        session = caching_session(cache, adapter)
+
+        session.get(f"{BASE}/sounds/1/")
+        session.get(f"{BASE}/sounds/1/")
+
+        assert len(adapter.urls) == 2
+
+    def test_before_send_runs_only_on_misses(self, cache):
+        """Test the rate-limit hook is skipped for cached responses."""
+        adapter = FakeAdapter()
+        calls = []
+        session = CachingSession(cache, before_send=lambda: calls.append(1))
+        session.mount("https://", adapter)
+
+        session.get(f"{BASE}/sounds/1/")
+        session.get(f"{BASE}/sounds/1/")
+        session.get(f"{BASE}/sounds/2/")
+
+        assert len(adapter.urls) == 2
+        assert len(calls) == 2
+
+    def test_freesound_client_calls(self, cache):
+        """Test get_sound() and text_search() results come from the cache."""
+        import freesound
+
+        adapter = FakeAdapter()
+        client = freesound.FreesoundClient()
+        client.set_token("test_key")
+        client.session = caching_session(cache, adapter)
+
+        assert client.get_sound(1).name == "sound1.wav"
+        sound = client.get_sound(1)
+        client.text_search(query="drum", filter="id:(1)")
+        client.text_search(filter="id:(1)", query="drum")
+
+        assert sound.as_dict()["call"] == 1
+        assert len(adapter.urls) == 2
+        assert cache.get_stats()["hits"] == 2
@@ -0,0 +1,139 @@
+"""
+Unit tests for SoundCache.
+
+Tests byte-bounded LRU eviction, spilling to MetadataCache, invalid-sound
+markers and statistics.
+"""
+
+import pytest
+
+from FollowWeb_Visualizor.data.storage import MetadataCache, SoundCache
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+def sample(sample_id, padding=100):
+    """Build a metadata dict of roughly padding bytes."""
+    return {"id": sample_id, "name": f"sample_{sample_id}", "pad": "x" * padding}
+
+
+@pytest.fixture
+def metadata_cache(tmp_path):
+    """Create a metadata cache used as spill store."""
+    cache = MetadataCache(str(tmp_path / "metadata_cache.db"))
+    yield cache
+    cache.close()
+
+
+class TestSoundCache:
+    """Test in-memory behaviour of SoundCache."""
+
+    def test_put_and_lookup(self):
+        """Test that cached metadata is returned as a copy."""
+        cache = SoundCache()
+        cache.put(1, sample(1))
+
+        hit, metadata = cache.lookup(1)
+        assert hit
+        assert metadata["name"] == "sample_1"
+
+        metadata["name"] = "changed"
+        assert cache.lookup(1)[1]["name"] == "sample_1"
+
+    def test_miss(self):
+        """Test that unknown sounds are misses."""
+        cache = SoundCache()
+        assert cache.lookup(42) == (False, None)
+        assert cache.get_stats()["misses"] == 1
+
+    def test_invalid_sound_is_a_hit(self):
+        """Test that None marks a sound as known-invalid."""
+        cache = SoundCache()
+        cache.put(1, None)
+        assert cache.lookup(1) == (True, None)
+
+    def test_string_ids_are_normalized(self):
+        """Test that IDs from JSON checkpoints match integer lookups."""
+        cache = SoundCache()
+        cache.put("7", sample(7))
+        assert 7 in cache
+        assert cache.lookup(7)[0]
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Test that the byte budget evicts least recently used entries."""
+        entry_size = SoundCache._entry_size(sample(1))
+        cache = SoundCache(max_bytes=entry_size * 3)
+        for sample_id in (1, 2, 3):
+            cache.put(sample_id, sample(sample_id))
+
+        cache.lookup(1)  # 2 becomes least recently used
+        cache.put(4, sample(4))
+
+        assert 2 not in cache
+        assert {1, 3, 4} <= set(cache.to_dict())
+        assert cache.size_bytes <= cache.max_bytes
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_without_spill_store_evicted_entries_are_dropped(self):
+        """Test that eviction without a spill store loses the entry."""
+        cache = SoundCache(max_bytes=0)
+        cache.put(1, sample(1))
+        assert len(cache) == 0
+        assert cache.lookup(1) == (False, None)
+
+
+class TestSoundCacheSpill:
+    """Test spilling evicted entries to MetadataCache."""
+
+    def test_spilled_entries_are_hits(self, metadata_cache):
+        """Test that evicted entries are found in the spill store."""
+        cache = SoundCache(max_bytes=0, spill_store=metadata_cache)
+        cache.put(1, sample(1))
+        cache.put(2, None)
+        cache.flush()
+
+        assert len(cache) == 0
+        assert cache.get_stats()["spilled"] == 2
+
+        hit, metadata = cache.lookup(1)
+        assert hit
+        assert metadata == sample(1)
+        assert cache.lookup(2) == (True, None)
+        assert cache.get_stats()["spill_hits"] == 2
+
+    def test_pending_spill_is_readable_before_flush(self, metadata_cache):
+        """Test that entries waiting to be spilled are still hits."""
+        cache = SoundCache(max_bytes=0, spill_store=metadata_cache)
+        cache.put(1, sample(1))
+
+        assert cache.lookup(1) == (True, sample(1))
+        assert metadata_cache.get_spilled_sound(1) == (False, None)
+
+    def test_spills_in_batches(self, metadata_cache):
+        """Test that evictions are written once a batch is full."""
+        cache = SoundCache(max_bytes=0, spill_store=metadata_cache)
+        for sample_id in range(SoundCache.SPILL_BATCH_SIZE):
+            cache.put(sample_id, sample(sample_id))
+
+        assert cache.get_stats()["spilled"] == SoundCache.SPILL_BATCH_SIZE
+        assert metadata_cache.get_spilled_sound(0) == (True, sample(0))
+
+    def test_spilled_sounds_do_not_count_as_processed(self, metadata_cache):
+        """Test that spilled sounds stay out of the metadata table."""
+        cache = SoundCache(max_bytes=0, spill_store=metadata_cache)
+        cache.put(1, sample(1))
+        cache.flush()
+
+        assert not metadata_cache.exists(1)
+
+    def test_spilled_sounds_survive_reopen(self, tmp_path):
+        """Test that spilled entries are available after a restart."""
+        db_path = str(tmp_path / "metadata_cache.db")
+        with MetadataCache(db_path) as metadata_cache:
+            cache = SoundCache(max_bytes=0, spill_store=metadata_cache)
+            cache.put(1, sample(1))
+            cache.flush()
+
+        with MetadataCache(db_path) as metadata_cache:
+            cache = SoundCache(spill_store=metadata_cache)
+            assert cache.lookup(1) == (True, sample(1))
@@ -0,0 +1,143 @@
+"""
+Unit tests for SQLiteConnectionManager.
+
+Tests per-thread read connections, group commit on the writer thread,
+per-job rollback and shutdown behaviour.
+"""
+
+import gc
+import sqlite3
+import threading
+
+import pytest
+
+from FollowWeb_Visualizor.data.storage import SQLiteConnectionManager
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Create a manager over a database with one table."""
+    manager = SQLiteConnectionManager(str(tmp_path / "test.db"))
+    manager.writer.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, value TEXT)")
+    manager.writer.commit()
+    yield manager
+    manager.close()
+
+
+def insert(item_id, value="x"):
+    """Build a write job inserting one row."""
+    return lambda conn: conn.execute(
+        "INSERT INTO items (id, value) VALUES (?, ?)", (item_id, value)
+    )
+
+
+def count(manager):
+    """Count rows through the calling thread's reader."""
+    return manager.reader().execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+class TestSQLiteConnectionManager:
+    """Test reader connections and the writer thread."""
+
+    def test_reader_per_thread(self, manager):
+        """Test each thread gets its own read-only connection."""
+        readers = []
+        thread = threading.Thread(target=lambda: readers.append(manager.reader()))
+        thread.start()
+        thread.join()
+
+        assert manager.reader() is manager.reader()
+        assert readers[0] is not manager.reader()
+        with pytest.raises(sqlite3.OperationalError):
+            manager.reader().execute("INSERT INTO items (id) VALUES (1)")
+
+    def test_reader_closed_when_thread_exits(self, manager):
+        """Test short-lived threads don't leave read connections open."""
+        readers = []
+
+        def read():
+            readers.append(manager.reader())
+            readers[-1].execute("SELECT COUNT(*) FROM items").fetchone()
+
+        for _ in range(5):
+            thread = threading.Thread(target=read)
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert manager.get_stats()["readers"] == 0
+        for conn in readers:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+        assert count(manager) == 0
+
+    def test_write_visible_after_commit(self, manager):
+        """Test write() returns after the job is committed."""
+        assert manager.write(lambda conn: conn.execute("SELECT 42").fetchone()[0]) == 42
+        manager.write(insert(1))
+
+        assert count(manager) == 1
+        assert manager.get_stats()["commits"] == 2
+
+    def test_group_commit(self, manager):
+        """Test jobs queued while the writer is busy share one commit."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_job(conn):
+            started.set()
+            release.wait(5)
+
+        first = manager.submit(blocking_job)
+        started.wait(5)
+        futures = [manager.submit(insert(i)) for i in range(10)]
+        release.set()
+
+        first.result()
+        for future in futures:
+            future.result()
+
+        stats = manager.get_stats()
+        assert count(manager) == 10
+        assert stats["jobs"] == 11
+        assert stats["commits"] == 2
+        assert stats["largest_group"] == 10
+
+    def test_failed_job_rolled_back_alone(self, manager):
+        """Test a failing job doesn't undo the other jobs in its group."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocking_job(conn):
+            started.set()
+            release.wait(5)
+
+        manager.submit(blocking_job)
+        started.wait(5)
+        good = manager.submit(insert(1))
+        bad = manager.submit(lambda conn: (insert(2)(conn), insert(1)(conn)))
+        release.set()
+
+        good.result()
+        with pytest.raises(sqlite3.IntegrityError):
+            bad.result()
+        ids = manager.reader().execute("SELECT id FROM items").fetchall()
+        assert ids == [(1,)]
+
+    def test_close_commits_queued_writes(self, tmp_path, manager):
+        """Test close() drains the queue and rejects later use."""
+        futures = [manager.submit(insert(i)) for i in range(5)]
+        manager.close()
+        manager.close()
+
+        assert all(future.done() for future in futures)
+        with pytest.raises(RuntimeError):
+            manager.submit(insert(6))
+        with pytest.raises(RuntimeError):
+            manager.reader()
+
+        conn = sqlite3.connect(str(tmp_path / "test.db"))
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 5
+        conn.close()
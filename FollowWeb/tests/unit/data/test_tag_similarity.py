@@ -0,0 +1,322 @@
+"""
+Unit tests for the tag similarity joins.
+
+Tests that jaccard_pairs() and the sparse kernel jaccard_edges() return
+exactly the pairs, weights and order of the nested-loop comparison for any
+threshold, query subset, document-frequency cap and block split, and that
+the MinHash-LSH join returns a subset of them with the recall it was
+configured for.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from FollowWeb_Visualizor.data import (
+    jaccard_edges,
+    jaccard_pairs,
+    lsh_parameters,
+    measure_recall,
+    minhash_pairs,
+    minhash_signatures,
+)
+from FollowWeb_Visualizor.data.tag_similarity import (
+    lsh_candidate_pairs,
+    tag_fingerprint,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+def nested_loop(tag_sets, threshold, query_ids=None):
+    """Reference: compare every query set with every other set."""
+    ids = list(tag_sets)
+    queries = [i for i in ids if query_ids is None or i in query_ids]
+    others = [i for i in ids if query_ids is not None and i not in query_ids]
+
+    def similar(a, b):
+        intersection = len(tag_sets[a] & tag_sets[b])
+        union = len(tag_sets[a] | tag_sets[b])
+        similarity = intersection / union if union > 0 else 0
+        return [(a, b, similarity)] if similarity >= threshold else []
+
+    pairs = []
+    for n, a in enumerate(queries):
+        for b in queries[n + 1 :]:
+            pairs += similar(a, b)
+    for a in queries:
+        for b in others:
+            pairs += similar(a, b)
+    return pairs
+
+
+def random_corpus(rng, count):
+    """Tag sets with a skewed tag distribution."""
+    vocabulary = [f"tag{i}" for i in range(40)]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    return {
+        str(i): set(rng.choices(vocabulary, weights, k=rng.randint(1, 8)))
+        for i in range(count)
+    }
+
+
+class TestJaccardPairs:
+    """Test the inverted-index join against the nested loop."""
+
+    def test_basic_pairs(self):
+        """Test only pairs reaching the threshold are returned."""
+        tag_sets = {
+            "1": {"drum", "kick", "bass"},
+            "2": {"drum", "kick"},
+            "3": {"synth", "pad"},
+        }
+
+        assert jaccard_pairs(tag_sets, 0.3) == [("1", "2", 2 / 3)]
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.1, 0.15, 0.3, 1 / 3, 0.5, 1.0])
+    def test_matches_nested_loop(self, threshold):
+        """Test identical pairs, weights and order for every threshold."""
+        rng = random.Random(7)
+        for _ in range(20):
+            tag_sets = random_corpus(rng, rng.randint(2, 60))
+            query_ids = set(rng.sample(list(tag_sets), rng.randint(1, len(tag_sets))))
+
+            assert jaccard_pairs(tag_sets, threshold) == nested_loop(
+                tag_sets, threshold
+            )
+            assert jaccard_pairs(tag_sets, threshold, query_ids) == nested_loop(
+                tag_sets, threshold, query_ids
+            )
+
+    @pytest.mark.parametrize("max_tag_frequency", [0, 1, 5, 20])
+    def test_frequency_cap_does_not_change_result(self, max_tag_frequency):
+        """Test stop tags change the work done, not the pairs."""
+        rng = random.Random(11)
+        for _ in range(20):
+            tag_sets = random_corpus(rng, 50)
+            query_ids = set(rng.sample(list(tag_sets), 10))
+            for threshold in (0.15, 0.5):
+                assert jaccard_pairs(
+                    tag_sets, threshold, max_tag_frequency=max_tag_frequency
+                ) == nested_loop(tag_sets, threshold)
+                assert jaccard_pairs(
+                    tag_sets,
+                    threshold,
+                    query_ids,
+                    max_tag_frequency=max_tag_frequency,
+                ) == nested_loop(tag_sets, threshold, query_ids)
+
+    def test_pairs_sharing_only_stop_tags(self):
+        """Test sets made of common tags still match each other."""
+        tag_sets = {str(i): {"field-recording", f"rare{i}"} for i in range(5)}
+        tag_sets["a"] = {"field-recording"}
+        tag_sets["b"] = {"field-recording"}
+
+        pairs = jaccard_pairs(tag_sets, 0.5, max_tag_frequency=2)
+
+        assert pairs == nested_loop(tag_sets, 0.5)
+        assert ("a", "b", 1.0) in pairs
+
+    def test_no_query_ids(self):
+        """Test an empty query set returns no pairs."""
+        tag_sets = {"1": {"a"}, "2": {"a"}}
+
+        assert jaccard_pairs(tag_sets, 0.5, query_ids=[]) == []
+
+
+class TestJaccardEdges:
+    """Test the sparse matrix kernel against the nested loop."""
+
+    @staticmethod
+    def edge_list(tag_sets, edges):
+        """Edge arrays as (ID, ID, weight) tuples."""
+        ids = list(tag_sets)
+        src, dst, weight = edges
+        return [
+            (ids[a], ids[b], w)
+            for a, b, w in zip(src.tolist(), dst.tolist(), weight.tolist())
+        ]
+
+    @pytest.mark.parametrize("threshold", [0.0, 0.15, 1 / 3, 0.5, 1.0])
+    @pytest.mark.parametrize("block_size", [1, 7, 1024])
+    def test_matches_nested_loop(self, threshold, block_size):
+        """Test identical pairs, weights and order for any block split."""
+        rng = random.Random(5)
+        for _ in range(10):
+            tag_sets = random_corpus(rng, rng.randint(2, 60))
+            query_ids = set(rng.sample(list(tag_sets), rng.randint(1, len(tag_sets))))
+
+            for queries in (None, query_ids):
+                edges = jaccard_edges(
+                    tag_sets, threshold, queries, block_size=block_size, workers=1
+                )
+                assert self.edge_list(tag_sets, edges) == nested_loop(
+                    tag_sets, threshold, queries
+                )
+
+    @pytest.mark.parametrize("max_tag_frequency", [0, 1, 5, 20])
+    @pytest.mark.parametrize("block_size", [3, 1024])
+    def test_frequency_cap_does_not_change_result(self, max_tag_frequency, block_size):
+        """Test stop tag columns change the work done, not the edges."""
+        rng = random.Random(11)
+        for _ in range(10):
+            tag_sets = random_corpus(rng, 50)
+            query_ids = set(rng.sample(list(tag_sets), 10))
+            for threshold in (0.0, 0.15, 0.5):
+                for queries in (None, query_ids):
+                    edges = jaccard_edges(
+                        tag_sets,
+                        threshold,
+                        queries,
+                        block_size=block_size,
+                        workers=1,
+                        max_tag_frequency=max_tag_frequency,
+                    )
+                    assert self.edge_list(tag_sets, edges) == nested_loop(
+                        tag_sets, threshold, queries
+                    )
+
+    def test_pairs_sharing_only_stop_tags(self):
+        """Test sets made of common tags still match each other."""
+        tag_sets = {str(i): {"field-recording", f"rare{i}"} for i in range(5)}
+        tag_sets["a"] = {"field-recording"}
+        tag_sets["b"] = {"field-recording"}
+
+        edges = jaccard_edges(tag_sets, 0.5, workers=1, max_tag_frequency=2)
+
+        assert self.edge_list(tag_sets, edges) == nested_loop(tag_sets, 0.5)
+        assert ("a", "b", 1.0) in self.edge_list(tag_sets, edges)
+
+    def test_process_pool(self):
+        """Test blocks computed in worker processes give the same edges."""
+        rng = random.Random(9)
+        tag_sets = random_corpus(rng, 200)
+        query_ids = set(rng.sample(list(tag_sets), 50))
+
+        edges = jaccard_edges(tag_sets, 0.3, query_ids, block_size=16, workers=2)
+
+        assert self.edge_list(tag_sets, edges) == nested_loop(tag_sets, 0.3, query_ids)
+
+        edges = jaccard_edges(
+            tag_sets, 0.3, query_ids, block_size=16, workers=2, max_tag_frequency=20
+        )
+
+        assert self.edge_list(tag_sets, edges) == nested_loop(tag_sets, 0.3, query_ids)
+
+    def test_pool_is_opt_in_and_spawned(self, monkeypatch):
+        """Test the default runs in process and pools never fork."""
+        from FollowWeb_Visualizor.data import tag_similarity
+
+        contexts = []
+
+        class RecordingPool(tag_similarity.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs):
+                contexts.append(kwargs["mp_context"].get_start_method())
+                super().__init__(*args, **kwargs)
+
+        monkeypatch.setattr(tag_similarity, "ProcessPoolExecutor", RecordingPool)
+        tag_sets = random_corpus(random.Random(4), 60)
+
+        jaccard_edges(tag_sets, 0.3, block_size=8)
+        assert contexts == []
+
+        jaccard_edges(tag_sets, 0.3, block_size=8, workers=2)
+        assert contexts == ["spawn"]
+
+    def test_array_types(self):
+        """Test edges come back as position and weight arrays."""
+        src, dst, weight = jaccard_edges({"1": ["a", "a", "b"], "2": ["a"]}, 0.5)
+
+        assert src.dtype == np.int64 and dst.dtype == np.int64
+        assert weight.dtype == np.float64
+        assert (src.tolist(), dst.tolist(), weight.tolist()) == ([0], [1], [0.5])
+
+    def test_no_query_ids(self):
+        """Test an empty query set returns no edges."""
+        src, dst, weight = jaccard_edges({"1": {"a"}, "2": {"a"}}, 0.5, [])
+
+        assert len(src) == len(dst) == len(weight) == 0
+
+
+def clustered_corpus(rng, count):
+    """Tag sets that are noisy copies of a few templates (many similar pairs)."""
+    vocabulary = [f"tag{i}" for i in range(300)]
+    templates = [set(rng.sample(vocabulary, 8)) for _ in range(count // 10)]
+    corpus = {}
+    for i in range(count):
+        tags = set(rng.choice(templates))
+        tags -= set(rng.sample(sorted(tags), rng.randint(0, 3)))
+        tags |= set(rng.sample(vocabulary, rng.randint(0, 3)))
+        corpus[str(i)] = tags or {"tag0"}
+    return corpus
+
+
+class TestMinHash:
+    """Test MinHash signatures, LSH parameters and the approximate join."""
+
+    def test_signature_agreement_estimates_jaccard(self):
+        """Test the share of equal signature positions tracks similarity."""
+        a = {f"t{i}" for i in range(20)}
+        b = {f"t{i}" for i in range(10, 30)}
+        signatures = minhash_signatures([a, b, a, set()], num_perm=512)
+
+        assert signatures.shape == (4, 512)
+        assert signatures.dtype == np.uint32
+        assert (signatures[0] == signatures[2]).all()
+        assert np.mean(signatures[0] == signatures[1]) == pytest.approx(1 / 3, abs=0.07)
+        assert (signatures[3] == np.iinfo(np.uint32).max).all()
+
+    def test_signatures_are_deterministic(self):
+        """Test stored signatures stay valid across runs."""
+        tag_sets = [{"drum", "kick"}, {"pad"}]
+
+        assert (minhash_signatures(tag_sets) == minhash_signatures(tag_sets)).all()
+        assert tag_fingerprint({"kick", "drum"}) == tag_fingerprint(["drum", "kick"])
+        assert tag_fingerprint({"drum"}) != tag_fingerprint({"kick"})
+
+    @pytest.mark.parametrize("threshold", [0.15, 0.3, 0.5, 0.8])
+    def test_lsh_parameters_reach_recall(self, threshold):
+        """Test the chosen split fits the signature and reaches the recall."""
+        bands, rows = lsh_parameters(threshold, 0.95, 128)
+        similarities = np.linspace(threshold, 1, 101)
+
+        assert bands * rows <= 128
+        assert np.mean(1 - (1 - similarities**rows) ** bands) >= 0.95
+
+    def test_lsh_candidates(self):
+        """Test identical signatures collide and query mode keeps query pairs."""
+        signatures = np.array([[1, 2], [1, 2], [3, 4], [3, 5]], dtype=np.uint32)
+
+        assert lsh_candidate_pairs(signatures, 1, 2).tolist() == [[0, 1]]
+        assert lsh_candidate_pairs(signatures, 2, 1).tolist() == [[0, 1], [2, 3]]
+        assert lsh_candidate_pairs(
+            signatures, 2, 1, np.array([False, False, False, True])
+        ).tolist() == [[2, 3]]
+
+    @pytest.mark.parametrize("threshold", [0.3, 0.5])
+    def test_minhash_pairs_subset_of_exact(self, threshold):
+        """Test approximate pairs are exact pairs, in the exact order."""
+        rng = random.Random(3)
+        tag_sets = clustered_corpus(rng, 400)
+        bands, rows = lsh_parameters(threshold, 0.95)
+        signatures = minhash_signatures(list(tag_sets.values()))
+        query_ids = set(rng.sample(list(tag_sets), 40))
+
+        for queries in (None, query_ids):
+            exact = jaccard_pairs(tag_sets, threshold, queries)
+            approximate = minhash_pairs(
+                tag_sets, threshold, signatures, bands, rows, queries
+            )
+
+            assert [p for p in exact if p in set(approximate)] == approximate
+            assert len(approximate) >= 0.9 * len(exact)
+
+    def test_measure_recall(self):
+        """Test recall is the share of the sample's exact pairs found."""
+        tag_sets = {"1": {"a", "b"}, "2": {"a", "b"}, "3": {"a"}, "4": {"c"}}
+        exact = jaccard_pairs(tag_sets, 0.5)
+
+        assert measure_recall(tag_sets, 0.5, exact, ["1", "4"]) == 1.0
+        assert measure_recall(tag_sets, 0.5, exact[:1], ["1"]) == 0.5
+        assert measure_recall(tag_sets, 0.5, [], ["4"]) is None
@@ -0,0 +1,223 @@
+"""
+Unit tests for TopologyJournal.
+
+Tests appending topology deltas, idempotent replay onto a snapshot graph,
+tolerance of a truncated trailing entry, and TrackedDiGraph mutation counts.
+"""
+
+import pickle
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from FollowWeb_Visualizor.data.checkpoint_reader import (
+    load_checkpoint_csr,
+    load_checkpoint_topology,
+)
+from FollowWeb_Visualizor.data.storage import CSRTopology
+from FollowWeb_Visualizor.data.topology_journal import TopologyJournal, TrackedDiGraph
+
+pytestmark = [pytest.mark.unit, pytest.mark.data]
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Create a journal in a temporary directory."""
+    return TopologyJournal(str(tmp_path / "graph_topology.journal"))
+
+
+class TestTopologyJournal:
+    """Test TopologyJournal append/replay/clear."""
+
+    def test_append_and_replay(self, journal):
+        """Test journaled nodes and edges are applied to a graph."""
+        journal.append(nodes=["1", "2"], edges=[("1", "2")])
+        journal.append(nodes=["3"], edges=[("2", "3"), ("3", "1")])
+
+        graph = nx.DiGraph()
+        batches, edges = journal.replay(graph)
+
+        assert batches == 2
+        assert edges == 3
+        assert set(graph.nodes()) == {"1", "2", "3"}
+        assert graph.has_edge("1", "2")
+        assert graph.has_edge("3", "1")
+        assert journal.count_batches() == 2
+
+    def test_replay_collects_processed_ids(self, journal):
+        """Test processed-ID additions are journaled even without topology."""
+        journal.append(nodes=["1"], edges=[], processed=["1"])
+        journal.append(nodes=[], edges=[], processed=["9"])
+
+        processed_ids = set()
+        batches, _ = journal.replay(nx.DiGraph(), processed_ids)
+
+        assert batches == 2
+        assert processed_ids == {"1", "9"}
+
+    def test_empty_append_writes_nothing(self, journal):
+        """Test an empty delta does not create the journal file."""
+        journal.append(nodes=[], edges=[])
+
+        assert not journal.exists()
+        assert journal.count_batches() == 0
+
+    def test_replay_is_idempotent(self, journal):
+        """Test replaying onto a graph that already has the edges is a no-op."""
+        graph = nx.DiGraph()
+        graph.add_edge("1", "2")
+        journal.append(nodes=["1", "2"], edges=[("1", "2")])
+
+        journal.replay(graph)
+        journal.replay(graph)
+
+        assert graph.number_of_nodes() == 2
+        assert graph.number_of_edges() == 1
+
+    def test_replay_ignores_truncated_entry(self, journal):
+        """Test a partially written trailing line is skipped."""
+        journal.append(nodes=["1"], edges=[("1", "2")])
+        with open(journal.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"nodes": ["3"], "edges": [["3"')
+
+        graph = nx.DiGraph()
+        batches, _ = journal.replay(graph)
+
+        assert batches == 1
+        assert "3" not in graph
+
+    def test_replay_rejects_corruption_before_last_line(self, journal):
+        """Test a corrupt entry followed by more entries is an error."""
+        with open(journal.journal_path, "w", encoding="utf-8") as f:
+            f.write('{"nodes": ["1"], "edg\n{"nodes": ["2"], "edges": []}\n')
+
+        with pytest.raises(ValueError, match="line 1"):
+            journal.replay(nx.DiGraph())
+        with pytest.raises(ValueError):
+            journal.count_batches()
+
+    def test_append_truncates_partial_tail(self, journal):
+        """Test appending after a crash mid-append keeps the journal valid."""
+        journal.append(nodes=["1"], edges=[])
+        with open(journal.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"nodes": ["3"], "edges": [["3"')
+
+        journal.append(nodes=["2"], edges=[("2", "1")])
+
+        graph = nx.DiGraph()
+        assert journal.replay(graph) == (2, 1)
+        assert set(graph.nodes()) == {"1", "2"}
+
+    def test_clear_removes_file(self, journal):
+        """Test clear deletes the journal and replay becomes a no-op."""
+        journal.append(nodes=["1"], edges=[])
+        journal.clear()
+
+        assert not journal.exists()
+        assert journal.replay(nx.DiGraph()) == (0, 0)
+
+
+class TestTrackedDiGraph:
+    """Test structural mutation counting."""
+
+    def test_counts_add_and_remove(self):
+        """Test an add followed by a remove is visible despite equal counts."""
+        graph = TrackedDiGraph()
+        graph.add_edge("1", "2")
+        before = graph.mutation_count
+
+        graph.add_node("3")
+        graph.remove_node("3")
+
+        assert graph.number_of_nodes() == 2
+        assert graph.mutation_count == before + 2
+
+    def test_track_converts_in_place(self):
+        """Test tracking a plain DiGraph reuses its adjacency."""
+        plain = nx.DiGraph()
+        plain.add_edge("1", "2")
+
+        tracked = TrackedDiGraph.track(plain)
+        tracked.add_edge("2", "3")
+
+        assert tracked is plain
+        assert tracked.mutation_count == 1
+        assert TrackedDiGraph.track(tracked) is tracked
+
+    def test_pickles_as_plain_digraph(self):
+        """Test exported graphs don't depend on the tracking class."""
+        graph = TrackedDiGraph()
+        graph.add_edge("1", "2", type="similar")
+
+        restored = pickle.loads(pickle.dumps(graph))
+
+        assert type(restored) is nx.DiGraph
+        assert restored.edges["1", "2"]["type"] == "similar"
+
+
+class TestLoadCheckpointTopology:
+    """Test the shared checkpoint topology reader used by scripts."""
+
+    def test_replays_journal_onto_snapshot(self, tmp_path):
+        """Test journaled nodes and edges are part of the loaded topology."""
+        snapshot = nx.DiGraph()
+        snapshot.add_edge("1", "2")
+        with open(tmp_path / "graph_topology.gpickle", "wb") as f:
+            pickle.dump(snapshot, f)
+        TopologyJournal(str(tmp_path / "graph_topology.journal")).append(
+            nodes=["3"], edges=[("3", "1")]
+        )
+
+        graph = load_checkpoint_topology(tmp_path)
+
+        assert set(graph.nodes()) == {"1", "2", "3"}
+        assert graph.has_edge("3", "1")
+
+    def test_missing_snapshot(self, tmp_path):
+        """Test a directory without a topology snapshot is an error."""
+        with pytest.raises(FileNotFoundError):
+            load_checkpoint_topology(tmp_path)
+
+
+class TestLoadCheckpointCSR:
+    """Test the CSR checkpoint reader used by sparse analysis."""
+
+    def test_memory_maps_without_journal(self, tmp_path):
+        """Test an empty journal returns the memory-mapped snapshot as is."""
+        snapshot = nx.DiGraph()
+        snapshot.add_edge("1", "2", type="by_same_user", weight=1.0)
+        CSRTopology.from_graph(snapshot).save(tmp_path / "graph_topology_csr")
+
+        topology = load_checkpoint_csr(tmp_path)
+
+        assert isinstance(topology.indices, np.memmap)
+        assert topology.num_edges == 1
+
+    def test_merges_journal(self, tmp_path):
+        """Test journaled nodes and edges are merged into the CSR arrays."""
+        snapshot = nx.DiGraph()
+        snapshot.add_edge("1", "2", type="by_same_user", weight=1.0)
+        CSRTopology.from_graph(snapshot).save(tmp_path / "graph_topology_csr")
+        TopologyJournal(str(tmp_path / "graph_topology.journal")).append(
+            nodes=["3"], edges=[("3", "1", "similar_tags", 0.5)]
+        )
+
+        topology = load_checkpoint_csr(tmp_path)
+        graph = topology.to_networkx()
+
+        assert set(graph.nodes()) == {"1", "2", "3"}
+        assert graph["3"]["1"]["type"] == "similar_tags"
+        assert graph["3"]["1"]["weight"] == pytest.approx(0.5)
+
+    def test_converts_gpickle_snapshot(self, tmp_path):
+        """Test checkpoints without CSR arrays are read from the pickle."""
+        snapshot = nx.DiGraph()
+        snapshot.add_edge("1", "2")
+        with open(tmp_path / "graph_topology.gpickle", "wb") as f:
+            pickle.dump(snapshot, f)
+
+        topology = load_checkpoint_csr(tmp_path)
+
+        assert topology.num_nodes == 2
+        assert topology.num_edges == 1
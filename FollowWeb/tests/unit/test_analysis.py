@@ -2,7 +2,7 @@
 Unit tests for network analysis module.
 
 Tests graph loading, filtering, pruning, network analysis algorithms,
-path analysis, and fame analysis functionality.
+path analysis, fame analysis and sample group expansion functionality.
 """
 
 import os
@@ -14,8 +14,18 @@ from FollowWeb_Visualizor.analysis import (
     FameAnalyzer,
     NetworkAnalyzer,
     PathAnalyzer,
+    calculate_connectivity_metrics,
+    calculate_topology_connectivity,
+    expand_groups,
+    get_sample_groups,
+    group_degree,
+    group_edge_count,
+    group_membership,
+    group_neighbors,
+    iter_group_edges,
 )
 from FollowWeb_Visualizor.data.loaders import InstagramLoader
+from FollowWeb_Visualizor.data.storage import CSRTopology
 from FollowWeb_Visualizor.data.strategies import GraphStrategy
 
 pytestmark = [pytest.mark.unit, pytest.mark.analysis]
@@ -241,6 +251,30 @@ class TestNetworkAnalyzer:
         assert isinstance(result, nx.Graph)
         assert result.number_of_nodes() == 1
 
+    def test_analyze_network_expands_sample_groups(self):
+        """Test communities and centrality see hub-represented group edges."""
+        analyzer = NetworkAnalyzer()
+        graph = nx.DiGraph()
+        graph.add_nodes_from(str(i) for i in range(1, 7))
+        graph.add_edge("3", "4", type="similar_tags", weight=0.5)
+        graph.graph["sample_groups"] = {
+            "by_same_user": {"alice": ["1", "2", "3"], "bob": ["4", "5", "6"]}
+        }
+
+        result = analyzer.analyze_network(graph)
+
+        communities = nx.get_node_attributes(result, "community")
+        assert result is graph
+        assert communities["1"] == communities["2"] == communities["3"]
+        assert communities["4"] == communities["5"] == communities["6"]
+        assert communities["1"] != communities["4"]
+        assert graph.nodes["1"]["degree"] == 4
+        assert graph.nodes["3"]["degree"] == 5
+        assert graph.nodes["3"]["betweenness"] > graph.nodes["1"]["betweenness"]
+        # The graph itself keeps the compact representation
+        assert graph.number_of_edges() == 1
+        assert "sample_groups" in graph.graph
+
 
 class TestPathAnalyzer:
     """Test PathAnalyzer functionality."""
@@ -481,3 +515,109 @@ class TestFameAnalyzer:
                 os.chmod(temp_file, 0o644)
             except BaseException:
                 pass  # Ignore permission restore errors
+
+
+class TestTopologyConnectivity:
+    """Test connectivity metrics computed on CSR topology arrays."""
+
+    def test_matches_networkx_metrics(self):
+        """Test CSR metrics equal calculate_connectivity_metrics()."""
+        graph = nx.DiGraph()
+        graph.add_edges_from(
+            [("1", "2"), ("2", "3"), ("3", "1"), ("3", "4"), ("4", "3"), ("5", "6")]
+        )
+        graph.add_edge("6", "6")
+        graph.add_node("7")
+
+        expected = calculate_connectivity_metrics(graph)
+        metrics = calculate_topology_connectivity(CSRTopology.from_graph(graph))
+
+        assert metrics["num_components"] == expected["num_components"]
+        assert metrics["largest_component_size"] == expected["largest_component_size"]
+        assert metrics["density"] == pytest.approx(expected["density"])
+        assert metrics["avg_clustering"] == pytest.approx(expected["avg_clustering"])
+        assert metrics["is_connected"] is False
+
+    def test_empty_topology(self):
+        """Test an empty topology returns zeroed metrics."""
+        metrics = calculate_topology_connectivity(CSRTopology.from_edges([], []))
+
+        assert metrics["num_components"] == 0
+        assert metrics["is_connected"] is False
+
+
+class TestSampleGroups:
+    """Test expansion of hub-represented sample groups."""
+
+    @pytest.fixture
+    def grouped_graph(self):
+        """Graph with a user group, a pack group and one existing edge."""
+        graph = nx.DiGraph()
+        graph.add_nodes_from(["1", "2", "3", "4"])
+        graph.add_edge("1", "2", type="similar_tags", weight=0.5)
+        graph.graph["sample_groups"] = {
+            "by_same_user": {"alice": ["1", "2", "3"], "bob": ["4", "deleted"]},
+            "in_same_pack": {"drums": ["3", "4"]},
+        }
+        return graph
+
+    def test_groups_restricted_to_graph_nodes(self, grouped_graph):
+        """Test deleted members and groups left with one member are dropped."""
+        assert get_sample_groups(grouped_graph) == {
+            "by_same_user": {"alice": ["1", "2", "3"]},
+            "in_same_pack": {"drums": ["3", "4"]},
+        }
+        assert get_sample_groups(grouped_graph, ["in_same_pack"]) == {
+            "in_same_pack": {"drums": ["3", "4"]}
+        }
+        assert group_edge_count(grouped_graph) == 8
+
+    def test_iter_group_edges_in_clique_order(self, grouped_graph):
+        """Test virtual edges come pairwise in both directions."""
+        edges = list(iter_group_edges(grouped_graph, ["by_same_user"]))
+
+        assert [(u, v) for u, v, _ in edges] == [
+            ("1", "2"),
+            ("2", "1"),
+            ("1", "3"),
+            ("3", "1"),
+            ("2", "3"),
+            ("3", "2"),
+        ]
+        assert edges[0][2] == {"type": "by_same_user", "weight": 1.0}
+
+    def test_group_neighbors(self, grouped_graph):
+        """Test a node's virtual neighbours span all its groups."""
+        membership = group_membership(grouped_graph)
+
+        assert membership["3"] == [("by_same_user", "alice"), ("in_same_pack", "drums")]
+        assert group_neighbors(grouped_graph, "3", membership) == {"1", "2", "4"}
+        assert group_neighbors(grouped_graph, "4") == {"3"}
+        assert group_neighbors(grouped_graph, "missing") == set()
+
+    def test_group_degree(self, grouped_graph):
+        """Test degrees count missing group edges without expanding them."""
+        expanded = expand_groups(grouped_graph)
+
+        assert group_degree(grouped_graph) == dict(expanded.degree())
+        assert grouped_graph.number_of_edges() == 1
+
+    def test_expand_groups(self, grouped_graph):
+        """Test expansion adds missing edges to a copy and keeps existing ones."""
+        expanded = expand_groups(grouped_graph)
+
+        assert expanded.number_of_edges() == 8
+        assert expanded["1"]["2"]["type"] == "similar_tags"
+        assert expanded["2"]["1"]["type"] == "by_same_user"
+        assert expanded["4"]["3"]["type"] == "in_same_pack"
+        assert "sample_groups" not in expanded.graph
+        assert grouped_graph.number_of_edges() == 1
+        assert "sample_groups" in grouped_graph.graph
+
+    def test_expand_some_groups_in_place(self, grouped_graph):
+        """Test expanding one group type leaves the other in the table."""
+        expanded = expand_groups(grouped_graph, ["in_same_pack"], copy=False)
+
+        assert expanded is grouped_graph
+        assert grouped_graph.number_of_edges() == 3
+        assert list(grouped_graph.graph["sample_groups"]) == ["by_same_user"]
@@ -49,6 +49,48 @@ class TestCheckpointVerifier:
         assert success is True
         assert "verified" in message.lower()
 
+    @staticmethod
+    def _write_valid_checkpoint(tmp_path):
+        """Write a minimal valid split checkpoint."""
+        import pickle
+        import sqlite3
+
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_node("1")
+        with open(tmp_path / "graph_topology.gpickle", "wb") as f:
+            pickle.dump(graph, f)
+        conn = sqlite3.connect(str(tmp_path / "metadata_cache.db"))
+        conn.execute("CREATE TABLE metadata (sample_id INTEGER PRIMARY KEY, data TEXT)")
+        conn.execute("INSERT INTO metadata VALUES (1, '{}')")
+        conn.commit()
+        conn.close()
+        (tmp_path / "checkpoint_metadata.json").write_text('{"nodes": 1}')
+
+    def test_verify_accepts_truncated_journal_tail(self, tmp_path):
+        """Test a partial last journal line (crash mid-append) passes."""
+        self._write_valid_checkpoint(tmp_path)
+        (tmp_path / "graph_topology.journal").write_text(
+            '{"nodes": ["2"], "edges": []}\n{"nodes": ["3"], "edg'
+        )
+
+        success, _ = CheckpointVerifier(tmp_path).verify_checkpoint_files()
+
+        assert success is True
+
+    def test_verify_rejects_corrupt_journal_entry(self, tmp_path):
+        """Test a corrupt journal line followed by more entries fails."""
+        self._write_valid_checkpoint(tmp_path)
+        (tmp_path / "graph_topology.journal").write_text(
+            '{"nodes": ["2"], "edg\n{"nodes": ["3"], "edges": []}\n'
+        )
+
+        success, message = CheckpointVerifier(tmp_path).verify_checkpoint_files()
+
+        assert success is False
+        assert "journal" in message
+
     def test_verify_missing_topology(self, tmp_path):
         """Test verification fails when topology file is missing."""
         # Create only some files
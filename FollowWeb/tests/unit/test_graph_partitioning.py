@@ -21,6 +21,7 @@ from FollowWeb_Visualizor.analysis.partition_worker import (
     PartitionResults,
 )
 from FollowWeb_Visualizor.analysis.partitioning import GraphPartitioner, PartitionInfo
+from FollowWeb_Visualizor.data.storage import CSRTopology
 
 # Skip all tests in this module on Windows (pymetis not available)
 pytestmark = [
@@ -210,6 +211,44 @@ class TestGraphPartitioner:
         for partition in partitions:
             assert partition.number_of_nodes() > 0
 
+    def test_partition_topology_matches_graph_nodes(self, small_graph):
+        """Test partitioning a CSR topology covers every node exactly once."""
+        partitioner = GraphPartitioner()
+        topology = CSRTopology.from_graph(small_graph)
+
+        partitions = partitioner.partition_topology(topology, num_partitions=2)
+
+        assert len(partitions) == 2
+        assigned = [node for partition in partitions for node in partition]
+        assert sorted(assigned) == sorted(small_graph.nodes())
+        for partition in partitions:
+            assert len(partition) > 0
+
+    def test_partitions_keep_sample_groups_together(self):
+        """Test hub-represented groups are partitioned as cliques."""
+        partitioner = GraphPartitioner()
+        graph = nx.DiGraph()
+        graph.add_nodes_from(f"node_{i}" for i in range(20))
+        groups = {
+            "by_same_user": {
+                "alice": [f"node_{i}" for i in range(0, 20, 2)],
+                "bob": [f"node_{i}" for i in range(1, 20, 2)],
+            }
+        }
+        graph.graph["sample_groups"] = groups
+        expected = sorted(
+            sorted(members) for members in groups["by_same_user"].values()
+        )
+
+        partitions = partitioner.partition_graph(graph, num_partitions=2)
+        node_lists = partitioner.partition_topology(
+            CSRTopology.from_graph(graph), num_partitions=2, sample_groups=groups
+        )
+
+        assert sorted(sorted(p.nodes()) for p in partitions) == expected
+        assert sorted(sorted(nodes) for nodes in node_lists) == expected
+        assert graph.number_of_edges() == 0
+
     def test_partition_balance(self, medium_graph):
         """Test partition balance and edge cut minimization."""
         partitioner = GraphPartitioner()
@@ -0,0 +1,330 @@
+"""
+Unit tests for RateLimiter.
+
+Tests exact waits, timeouts, the async acquire path, token buckets shared
+through SQLite and adaptive (AIMD) rate control.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from FollowWeb_Visualizor.utils.rate_limiter import (
+    AdaptiveRateController,
+    RateLimiter,
+    SharedTokenBucket,
+)
+
+pytestmark = [pytest.mark.unit, pytest.mark.utils]
+
+
+class TestRateLimiter:
+    """Test the local token bucket."""
+
+    def test_burst_up_to_capacity(self):
+        """Test a full bucket grants its capacity without waiting."""
+        limiter = RateLimiter(requests_per_minute=60)
+
+        start_time = time.monotonic()
+        for _ in range(60):
+            assert limiter.acquire()
+        elapsed = time.monotonic() - start_time
+
+        assert elapsed < 0.5
+        assert limiter.get_available_tokens() < 1
+
+    def test_waits_for_refill(self):
+        """Test an empty bucket blocks until one token is refilled."""
+        limiter = RateLimiter(requests_per_minute=600)  # 10 tokens/s
+        limiter.acquire(tokens=600)
+
+        start_time = time.monotonic()
+        assert limiter.acquire()
+        elapsed = time.monotonic() - start_time
+
+        assert 0.08 <= elapsed < 0.5
+
+    def test_timeout(self):
+        """Test acquire() gives up once the timeout has passed."""
+        limiter = RateLimiter(requests_per_minute=6)  # 1 token per 10 s
+        limiter.acquire(tokens=6)
+
+        start_time = time.monotonic()
+        assert not limiter.acquire(timeout=0.1)
+        elapsed = time.monotonic() - start_time
+
+        assert 0.1 <= elapsed < 1.0
+
+    def test_reset_wakes_waiters(self):
+        """Test reset() wakes a thread waiting for a slow refill."""
+        limiter = RateLimiter(requests_per_minute=6)
+        limiter.acquire(tokens=6)
+        acquired = threading.Event()
+
+        def waiter():
+            if limiter.acquire(timeout=5.0):
+                acquired.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        time.sleep(0.05)
+        limiter.reset()
+        thread.join(timeout=5.0)
+
+        assert acquired.is_set()
+
+    def test_invalid_token_counts(self):
+        """Test non-positive and over-capacity requests are rejected."""
+        limiter = RateLimiter(requests_per_minute=10)
+
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=0)
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=11)
+
+    def test_wait_for_capacity(self):
+        """Test wait_for_capacity() reports the refill time without consuming."""
+        limiter = RateLimiter(requests_per_minute=60)
+        limiter.acquire(tokens=60)
+
+        wait_time = limiter.wait_for_capacity(required_tokens=2)
+
+        assert 1.9 < wait_time <= 2.0
+        assert limiter.wait_for_capacity(required_tokens=2) > 1.9
+
+    def test_acquire_async(self):
+        """Test the async acquire waits for a refill without blocking the loop."""
+        limiter = RateLimiter(requests_per_minute=600)
+        limiter.acquire(tokens=600)
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def main():
+            results = await asyncio.gather(limiter.acquire_async(), ticker())
+            return results[0]
+
+        assert asyncio.run(main())
+        assert len(ticks) == 5
+
+    def test_acquire_async_timeout(self):
+        """Test the async acquire honours its timeout."""
+        limiter = RateLimiter(requests_per_minute=6)
+        limiter.acquire(tokens=6)
+
+        assert not asyncio.run(limiter.acquire_async(timeout=0.05))
+
+
+class TestSharedTokenBucket:
+    """Test token buckets shared between limiters through SQLite."""
+
+    def test_limiters_share_one_budget(self, tmp_path):
+        """Test two limiters on one file draw from the same tokens."""
+        path = tmp_path / "rate_limit.db"
+        first = RateLimiter(requests_per_minute=10, shared_state_path=path)
+        second = RateLimiter(requests_per_minute=10, shared_state_path=path)
+        try:
+            for _ in range(6):
+                assert first.acquire(timeout=0)
+            for _ in range(4):
+                assert second.acquire(timeout=0)
+
+            assert not first.acquire(timeout=0)
+            assert not second.acquire(timeout=0)
+            assert first.get_available_tokens() < 1
+            assert second.wait_for_capacity() > 0
+        finally:
+            first.close()
+            second.close()
+
+    def test_reset_is_shared(self, tmp_path):
+        """Test reset() refills the bucket for every limiter."""
+        path = tmp_path / "rate_limit.db"
+        first = RateLimiter(requests_per_minute=10, shared_state_path=path)
+        second = RateLimiter(requests_per_minute=10, shared_state_path=path)
+        try:
+            first.acquire(tokens=10)
+            second.reset()
+            assert first.get_available_tokens() == pytest.approx(10)
+        finally:
+            first.close()
+            second.close()
+
+    def test_acquire_async_runs_bucket_off_loop(self, tmp_path):
+        """Test the async acquire does its SQLite work outside the event loop."""
+        limiter = RateLimiter(
+            requests_per_minute=600, shared_state_path=tmp_path / "rate_limit.db"
+        )
+        threads = []
+        take = limiter.shared_bucket.take
+
+        def recording_take(*args, **kwargs):
+            threads.append(threading.get_ident())
+            return take(*args, **kwargs)
+
+        limiter.shared_bucket.take = recording_take
+        try:
+            limiter.acquire(tokens=600)
+            threads.clear()
+
+            assert asyncio.run(limiter.acquire_async())
+            assert len(threads) >= 2
+            assert threading.get_ident() not in threads
+        finally:
+            limiter.close()
+
+    def test_take_reports_exact_wait(self, tmp_path):
+        """Test take() returns the refill time without withdrawing tokens."""
+        bucket = SharedTokenBucket(tmp_path / "bucket.db")
+        try:
+            assert bucket.take(5, capacity=5, refill_rate=1.0) == 0.0
+            wait_time = bucket.take(2, capacity=5, refill_rate=1.0)
+            assert 1.9 < wait_time <= 2.0
+            assert bucket.peek(capacity=5, refill_rate=1.0) < 0.5
+        finally:
+            bucket.close()
+            bucket.close()  # idempotent
+
+    def test_take_batch_above_capacity(self, tmp_path):
+        """Test a batch above the capacity is granted from a full bucket."""
+        bucket = SharedTokenBucket(tmp_path / "bucket.db")
+        try:
+            assert bucket.take(8, capacity=5, refill_rate=1.0) == 0.0
+            assert bucket.peek(capacity=5, refill_rate=1.0) < -2.5
+            assert bucket.take(8, capacity=5, refill_rate=1.0) > 7.5
+        finally:
+            bucket.close()
+
+
+class TestAdaptiveRateController:
+    """Test additive-increase/multiplicative-decrease rate control."""
+
+    def test_decrease_and_recover(self):
+        """Test throttling halves the rate and success windows add to it."""
+        limiter = RateLimiter(requests_per_minute=60)
+        controller = AdaptiveRateController(
+            limiter, decrease_factor=0.5, increase_step=2, success_window=3
+        )
+
+        controller.on_throttle()
+        assert limiter.rate == 30
+        assert limiter.get_available_tokens() < 1
+
+        for _ in range(6):
+            controller.on_success()
+        assert limiter.rate == 34
+
+        stats = controller.get_stats()
+        assert stats["decreases"] == 1
+        assert stats["increases"] == 2
+        assert stats["lowest_rate"] == 30
+        assert [point["rate"] for point in stats["trajectory"]] == [60, 30, 32, 34]
+
+    def test_batch_above_backed_off_rate(self):
+        """Test a batch larger than the reduced rate is still granted."""
+        limiter = RateLimiter(requests_per_minute=60)
+        controller = AdaptiveRateController(limiter, decrease_factor=0.5)
+
+        controller.on_throttle()
+        limiter.reset()
+
+        assert limiter.rate == 30
+        assert limiter.acquire(tokens=45, timeout=1.0)
+        # The deficit is repaid before the next batch: 16 tokens at 0.5/s
+        assert limiter.wait_for_capacity(1) == pytest.approx(32, abs=1)
+        assert not limiter.acquire(tokens=45, timeout=0.05)
+        with pytest.raises(ValueError):
+            limiter.acquire(tokens=61)
+
+    def test_rate_stays_within_bounds(self):
+        """Test the rate never drops below min_rate or exceeds the configured rate."""
+        limiter = RateLimiter(requests_per_minute=10)
+        controller = AdaptiveRateController(
+            limiter, min_rate=4, success_window=1, decrease_cooldown=0
+        )
+
+        for _ in range(5):
+            controller.on_throttle()
+        assert limiter.rate == 4
+
+        for _ in range(20):
+            controller.on_success()
+        assert limiter.rate == 10
+
+    def test_throttle_resets_success_window(self):
+        """Test successes before a 429 don't count towards the next increase."""
+        limiter = RateLimiter(requests_per_minute=60)
+        controller = AdaptiveRateController(
+            limiter, success_window=3, decrease_cooldown=0
+        )
+
+        controller.on_throttle()
+        controller.on_success()
+        controller.on_success()
+        controller.on_throttle()
+        controller.on_success()
+
+        assert limiter.rate == 15
+        assert controller.increases == 0
+
+    def test_throttle_burst_decreases_once(self):
+        """Test 429s of requests sent before the last decrease are one signal."""
+        limiter = RateLimiter(requests_per_minute=64)
+        controller = AdaptiveRateController(limiter, decrease_cooldown=60)
+
+        # Four concurrent requests sent together, all throttled
+        issued_at = time.monotonic()
+        for _ in range(4):
+            controller.on_throttle(issued_at=issued_at)
+        assert limiter.rate == 32
+
+        # Without a send time, throttles within the cooldown are the same burst
+        controller.on_throttle()
+        assert limiter.rate == 32
+
+        # A request sent after the decrease and still throttled backs off again
+        controller.on_throttle(issued_at=time.monotonic())
+        assert limiter.rate == 16
+        assert controller.get_stats()["ignored_throttles"] == 4
+
+    def test_retry_after_pauses_acquire(self):
+        """Test Retry-After blocks new tokens for the requested time."""
+        limiter = RateLimiter(requests_per_minute=6000)
+        controller = AdaptiveRateController(limiter)
+
+        controller.on_throttle(retry_after=0.2)
+
+        start_time = time.monotonic()
+        assert limiter.acquire(timeout=5.0)
+        assert time.monotonic() - start_time >= 0.19
+
+    def test_state_round_trip(self):
+        """Test a restored safe rate is clamped to the new configuration."""
+        first = AdaptiveRateController(RateLimiter(requests_per_minute=60))
+        first.on_throttle()
+        state = first.get_state()
+        assert state["safe_rate"] == 30
+
+        resumed = AdaptiveRateController(RateLimiter(requests_per_minute=60))
+        resumed.restore_state(state)
+        assert resumed.rate == 30
+
+        lower = AdaptiveRateController(RateLimiter(requests_per_minute=20))
+        lower.restore_state(state)
+        assert lower.rate == 20
+
+        untouched = AdaptiveRateController(RateLimiter(requests_per_minute=20))
+        untouched.restore_state(None)
+        assert untouched.rate == 20
+
+    def test_invalid_parameters(self):
+        """Test decrease factors outside (0, 1) are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveRateController(RateLimiter(), decrease_factor=1.0)
+        with pytest.raises(ValueError):
+            AdaptiveRateController(RateLimiter(), success_window=0)
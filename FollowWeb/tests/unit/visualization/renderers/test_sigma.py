@@ -206,6 +206,44 @@ class TestSigmaRendererDataConversion:
         assert edge["attributes"]["edge_type"] == "similar"
         assert edge["attributes"]["weight"] == 0.9
 
+    def test_convert_sample_groups_to_stars(self):
+        """Test hub-represented groups become a hub node with spokes."""
+        renderer = SigmaRenderer({"sigma_interactive": {}})
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(["1", "2", "3"])
+        graph.graph["sample_groups"] = {
+            "by_same_user": {"alice": ["1", "2", "3"]},
+            "in_same_pack": {"drums": ["1", "deleted"]},
+        }
+
+        from FollowWeb_Visualizor.core.types import ColorScheme, VisualizationMetrics
+
+        metrics = VisualizationMetrics(
+            node_metrics={},
+            edge_metrics={},
+            layout_positions={"1": (0, 0), "2": (3, 0), "3": (0, 3)},
+            color_schemes=ColorScheme({}, {}, "#6e6e6e", "#c0c0c0"),
+            graph_hash="test_hash",
+        )
+
+        sigma_data = renderer._convert_to_sigma_format(graph, {}, {}, metrics)
+
+        hub = sigma_data["nodes"][-1]
+        assert len(sigma_data["nodes"]) == 4
+        assert hub["key"] == "by_same_user:alice"
+        assert hub["attributes"]["node_type"] == "group"
+        assert hub["attributes"]["members"] == 3
+        assert (hub["attributes"]["x"], hub["attributes"]["y"]) == (1.0, 1.0)
+        assert [
+            (e["source"], e["target"], e["attributes"]["edge_type"])
+            for e in sigma_data["edges"]
+        ] == [
+            ("by_same_user:alice", "1", "by_same_user"),
+            ("by_same_user:alice", "2", "by_same_user"),
+            ("by_same_user:alice", "3", "by_same_user"),
+        ]
+
 
 class TestSigmaRendererHTMLGeneration:
     """Test SigmaRenderer HTML generation."""
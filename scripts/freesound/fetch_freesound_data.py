@@ -291,6 +291,61 @@ Examples:
         help="Minimum Jaccard similarity for tag edges (0.0-1.0, default: 0.3)",
     )
 
+    parser.add_argument(
+        "--group-edges",
+        type=str,
+        choices=["hub", "clique"],
+        default="clique",
+        help="Store same-user and same-pack relationships as one hub per group "
+        "or as edges between all members (default: clique)",
+    )
+
+    parser.add_argument(
+        "--full-edge-regeneration",
+        action="store_true",
+        help="Regenerate all user, pack and tag edges instead of only those of "
+        "samples added since the previous run",
+    )
+
+    parser.add_argument(
+        "--max-tag-frequency",
+        type=int,
+        default=None,
+        help="Match tags used by more samples than this per candidate instead of "
+        "through the sparse tag products; edges are unchanged (default: None)",
+    )
+
+    parser.add_argument(
+        "--tag-similarity-workers",
+        type=int,
+        default=1,
+        help="Processes computing tag similarity edges; 0 = one per CPU core "
+        "(default: 1, in the pipeline process)",
+    )
+
+    parser.add_argument(
+        "--tag-similarity-mode",
+        type=str,
+        choices=["exact", "minhash"],
+        default="exact",
+        help="Find tag similarity pairs exactly or approximately with "
+        "MinHash-LSH (default: exact)",
+    )
+
+    parser.add_argument(
+        "--minhash-permutations",
+        type=int,
+        default=128,
+        help="MinHash signature length in minhash mode (default: 128)",
+    )
+
+    parser.add_argument(
+        "--minhash-recall",
+        type=float,
+        default=0.95,
+        help="Target recall of tag similarity pairs in minhash mode (default: 0.95)",
+    )
+
     # Checkpoint configuration
     parser.add_argument(
         "--checkpoint-dir",
@@ -306,6 +361,95 @@ Examples:
         help="Number of samples between checkpoint saves (default: 50)",
     )
 
+    parser.add_argument(
+        "--checkpoint-mode",
+        type=str,
+        choices=["full", "delta"],
+        default="full",
+        help="Checkpoint save strategy: full snapshot or delta journal (default: full)",
+    )
+
+    parser.add_argument(
+        "--async-checkpoints",
+        action="store_true",
+        help="Write checkpoints on a background thread so saves don't block collection",
+    )
+
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=1,
+        help="Threads fetching similar sounds ahead of recursive discovery (default: 1)",
+    )
+
+    parser.add_argument(
+        "--search-prefetch-pages",
+        type=int,
+        default=0,
+        help="Search pages requested ahead in pagination mode (default: 0)",
+    )
+
+    parser.add_argument(
+        "--persistent-frontier",
+        action="store_true",
+        help="Keep the recursive discovery queue on disk so stopped crawls resume with it",
+    )
+
+    parser.add_argument(
+        "--rate-limit-state",
+        type=str,
+        default=None,
+        help="SQLite file for a rate limit shared with other scripts on the same API key",
+    )
+
+    parser.add_argument(
+        "--adaptive-rate-limit",
+        action="store_true",
+        help="Lower the request rate on 429 responses and resume at the learned rate next run",
+    )
+
+    parser.add_argument(
+        "--daily-request-budget",
+        type=int,
+        default=None,
+        help="API requests per day shared with validation and refresh runs; the crawl only spends its planned share (default: no daily budget)",
+    )
+
+    parser.add_argument(
+        "--http-cache",
+        type=str,
+        default=None,
+        help="SQLite file caching API responses across runs and scripts (default: disabled)",
+    )
+
+    parser.add_argument(
+        "--topology-format",
+        type=str,
+        choices=["gpickle", "csr"],
+        default="gpickle",
+        help="Topology snapshot format: pickled graph or memory-mappable CSR arrays (default: gpickle)",
+    )
+
+    parser.add_argument(
+        "--metadata-codec",
+        type=str,
+        choices=["json", "zlib"],
+        default="json",
+        help="Encoding of new metadata cache rows: plain JSON or zlib-compressed JSON (default: json)",
+    )
+
+    parser.add_argument(
+        "--lazy-node-attributes",
+        action="store_true",
+        help="Read resumed node attributes from the metadata cache on demand",
+    )
+
+    parser.add_argument(
+        "--export-legacy-checkpoint",
+        action="store_true",
+        help="Also export the monolithic freesound_library.pkl checkpoint after the run",
+    )
+
     # Output configuration
     parser.add_argument(
         "--output-dir",
@@ -444,6 +588,25 @@ def main() -> int:
             "api_key": api_key,
             "checkpoint_dir": args.checkpoint_dir,
             "checkpoint_interval": args.checkpoint_interval,
+            "checkpoint_mode": args.checkpoint_mode,
+            "async_checkpoints": args.async_checkpoints,
+            "fetch_workers": args.fetch_workers,
+            "search_prefetch_pages": args.search_prefetch_pages,
+            "persistent_frontier": args.persistent_frontier,
+            "group_edges": args.group_edges,
+            "incremental_edges": not args.full_edge_regeneration,
+            "max_tag_frequency": args.max_tag_frequency,
+            "tag_similarity_workers": args.tag_similarity_workers or None,
+            "tag_similarity_mode": args.tag_similarity_mode,
+            "minhash_permutations": args.minhash_permutations,
+            "minhash_recall": args.minhash_recall,
+            "rate_limit_state_path": args.rate_limit_state,
+            "adaptive_rate_limit": args.adaptive_rate_limit,
+            "http_cache_path": args.http_cache,
+            "daily_request_budget": args.daily_request_budget,
+            "topology_format": args.topology_format,
+            "metadata_codec": args.metadata_codec,
+            "lazy_node_attributes": args.lazy_node_attributes,
             "max_runtime_hours": args.max_runtime,
         }
         loader = IncrementalFreesoundLoader(config)
@@ -494,6 +657,11 @@ def main() -> int:
         with error_context("graph save", logger):
             joblib.dump(graph, output_filename)
 
+        # Optional monolithic checkpoint for tools that read the legacy format
+        if args.export_legacy_checkpoint:
+            with error_context("legacy checkpoint export", logger):
+                loader.export_legacy_checkpoint()
+
         # Log statistics and output file path
         logger.info("=" * 70)
         logger.info(EmojiFormatter.format("completion", "Fetch Complete!"))
@@ -33,6 +33,7 @@ from FollowWeb_Visualizor.data.loaders.incremental_freesound import (  # noqa: E
 from FollowWeb_Visualizor.output.formatters import EmojiFormatter  # noqa: E402
 from FollowWeb_Visualizor.utils.files import ErrorRecoveryManager  # noqa: E402
 from FollowWeb_Visualizor.utils.progress import ProgressTracker  # noqa: E402
+from FollowWeb_Visualizor.utils.rate_limiter import RateLimiter  # noqa: E402
 
 
 class SampleValidator:
@@ -50,16 +51,24 @@ class SampleValidator:
     - Support for full and partial validation modes
     """
 
-    def __init__(self, api_key: str, logger: logging.Logger):
+    def __init__(
+        self,
+        api_key: str,
+        logger: logging.Logger,
+        rate_limiter: Optional[RateLimiter] = None,
+    ):
         """
         Initialize sample validator.
 
         Args:
             api_key: Freesound API key
             logger: Logger instance
+            rate_limiter: Limiter acquired before each API request (None = no
+                throttling)
         """
         self.api_key = api_key
         self.logger = logger
+        self.rate_limiter = rate_limiter
         self.error_recovery = ErrorRecoveryManager(logger)
         self.api_base_url = "https://freesound.org/apiv2"
 
@@ -128,7 +137,11 @@ class SampleValidator:
         return sample_ids
 
     def validate_and_clean_checkpoint(
-        self, graph: nx.DiGraph, processed_ids: Set[str], mode: str = "full"
+        self,
+        graph: nx.DiGraph,
+        processed_ids: Set[str],
+        mode: str = "full",
+        max_requests: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Validate samples in the checkpoint and remove deleted ones.
@@ -141,6 +154,8 @@ class SampleValidator:
             graph: NetworkX graph containing samples
             processed_ids: Set of processed sample IDs
             mode: Validation mode - 'full' (all samples) or 'partial' (300 oldest)
+            max_requests: Stop after this many batch requests (None = no
+                limit); samples checked longest ago are validated first
 
         Returns:
             Dictionary with validation statistics
@@ -153,6 +168,7 @@ class SampleValidator:
             "edges_removed": 0,
             "metadata_refreshed": 0,
             "invalid_filesize_removed": 0,
+            "api_requests": 0,
         }
 
         # Get sample IDs based on validation mode
@@ -166,8 +182,11 @@ class SampleValidator:
                 )
             )
         else:
-            # Full validation - all samples
-            sample_ids = [str(node) for node in graph.nodes()]
+            # Full validation - all samples (stalest first if the budget may run out)
+            if max_requests is not None:
+                sample_ids = self.get_samples_by_existence_check_age(graph)
+            else:
+                sample_ids = [str(node) for node in graph.nodes()]
             self.logger.info(
                 EmojiFormatter.format(
                     "info",
@@ -266,10 +285,21 @@ class SampleValidator:
         ) as progress:
             # Process samples in batches
             for i in range(0, len(sample_ids), batch_size):
+                if max_requests is not None and stats["api_requests"] >= max_requests:
+                    self.logger.info(
+                        EmojiFormatter.format(
+                            "warning",
+                            f"Request budget of {max_requests} reached, "
+                            f"validated {i} of {len(sample_ids)} samples",
+                        )
+                    )
+                    break
+
                 batch = sample_ids[i : i + batch_size]
 
                 # Batch check existence AND refresh metadata (zero additional cost!)
                 existence_map, metadata_map = self._check_samples_batch(batch)
+                stats["api_requests"] += 1
 
                 # Process results
                 for sample_id in batch:
@@ -410,6 +440,8 @@ class SampleValidator:
 
         def batch_check_operation():
             """Operation to batch check sample existence with retry logic."""
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             response = requests.get(url, params=params, timeout=30)
 
             if response.status_code == 200:
@@ -501,6 +533,8 @@ class SampleValidator:
 
         def check_operation():
             """Operation to check sample existence with retry logic."""
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
             response = requests.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
@@ -573,6 +607,22 @@ def parse_arguments() -> argparse.Namespace:
         help="Validation mode: full (all samples) or partial (300 oldest samples)",
     )
 
+    parser.add_argument(
+        "--rate-limit-state",
+        type=str,
+        default=None,
+        help="SQLite file for a rate limit shared with other scripts on the same "
+        "API key; validation requests are only throttled when set",
+    )
+
+    parser.add_argument(
+        "--daily-request-budget",
+        type=int,
+        default=None,
+        help="API requests per day shared with fetch and refresh runs; validation "
+        "only spends its planned share (no limit when unset)",
+    )
+
     return parser.parse_args()
 
 
@@ -636,6 +686,8 @@ def main() -> int:
             "checkpoint_dir": args.checkpoint_dir,
             "checkpoint_interval": 1,
             "max_runtime_hours": None,
+            "rate_limit_state_path": args.rate_limit_state,
+            "daily_request_budget": args.daily_request_budget,
         }
         loader = IncrementalFreesoundLoader(loader_config)
 
@@ -657,23 +709,43 @@ def main() -> int:
         )
 
         # Create validator
-        validator = SampleValidator(api_key, logger)
+        validator = SampleValidator(
+            api_key,
+            logger,
+            rate_limiter=loader.rate_limiter if args.rate_limit_state else None,
+        )
+
+        # Ask the budget planner how many requests validation may spend today
+        planner = loader.budget_planner
+        max_requests = planner.begin("validation") if planner is not None else None
 
         # Validate and clean checkpoint
         logger.info(EmojiFormatter.format("rocket", "Starting validation..."))
 
         stats = validator.validate_and_clean_checkpoint(
-            loader.graph, loader.processed_ids, mode=args.mode
+            loader.graph,
+            loader.processed_ids,
+            mode=args.mode,
+            max_requests=max_requests,
         )
 
+        if planner is not None:
+            deleted_from_api = sum(
+                1
+                for sample in stats["deleted_samples"]
+                if sample["reason"] == "deleted_from_api"
+            )
+            planner.charge("validation", stats["api_requests"])
+            planner.add_yield("validation", deleted_from_api)
+            planner.end("validation")
+
         # Update validation history in checkpoint metadata
-        # Get existing validation history
-        existing_checkpoint = loader.checkpoint.load()
+        # Get existing validation history from the split checkpoint metadata
         validation_history = {}
-        if existing_checkpoint and "metadata" in existing_checkpoint:
-            validation_history = existing_checkpoint["metadata"].get(
-                "validation_history", {}
-            )
+        checkpoint_meta_path = Path(args.checkpoint_dir) / "checkpoint_metadata.json"
+        if checkpoint_meta_path.exists():
+            with open(checkpoint_meta_path) as f:
+                validation_history = json.load(f).get("validation_history", {})
 
         # Update with current validation timestamp
         current_time = datetime.now().isoformat()
@@ -31,7 +31,12 @@ import networkx as nx
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+from FollowWeb.FollowWeb_Visualizor.data.checkpoint_reader import (
+    load_checkpoint_topology,
+)
 from FollowWeb.FollowWeb_Visualizor.data.storage import MetadataCache
+from FollowWeb.FollowWeb_Visualizor.data.tag_similarity import jaccard_edges
+from FollowWeb.FollowWeb_Visualizor.data.topology_journal import TopologyJournal
 
 
 def setup_logging() -> logging.Logger:
@@ -60,6 +65,8 @@ class EdgeGenerator:
 
         # Checkpoint file paths
         self.graph_path = self.checkpoint_dir / "graph_topology.gpickle"
+        self.journal_path = self.checkpoint_dir / "graph_topology.journal"
+        self.processed_ids_path = self.checkpoint_dir / "processed_ids.json"
         self.metadata_db_path = self.checkpoint_dir / "metadata_cache.db"
         self.checkpoint_meta_path = self.checkpoint_dir / "checkpoint_metadata.json"
 
@@ -132,6 +139,7 @@ class EdgeGenerator:
 
         # Save checkpoint
         self.logger.info("Saving updated checkpoint...")
+        self._compact_processed_ids(checkpoint_meta)
         self._save_graph(graph)
         self._save_checkpoint_metadata(checkpoint_meta)
         self.logger.info("✓ Checkpoint saved")
@@ -149,16 +157,19 @@ class EdgeGenerator:
         Returns:
             Number of edges added
         """
-        # Group samples by username
+        # Group samples by username (streamed, only the user fields decoded)
         samples_by_user = defaultdict(list)
+        node_by_cache_id = {int(node_id): node_id for node_id in graph.nodes()}
 
-        for node_id in graph.nodes():
-            # Convert node_id to int for metadata cache lookup
-            metadata = metadata_cache.get(int(node_id))
-            if metadata:
-                username = metadata.get("username") or metadata.get("user")
-                if username:
-                    samples_by_user[username].append(node_id)
+        for sample_id, metadata in metadata_cache.iter_metadata(
+            columns=["username", "user"]
+        ):
+            node_id = node_by_cache_id.get(sample_id)
+            if node_id is None:
+                continue
+            username = metadata.get("username") or metadata.get("user")
+            if username:
+                samples_by_user[username].append(node_id)
 
         # Create edges between all samples by same user
         edges_added = 0
@@ -183,16 +194,17 @@ class EdgeGenerator:
         Returns:
             Number of edges added
         """
-        # Group samples by pack
+        # Group samples by pack (streamed, only the pack field decoded)
         samples_by_pack = defaultdict(list)
+        node_by_cache_id = {int(node_id): node_id for node_id in graph.nodes()}
 
-        for node_id in graph.nodes():
-            # Convert node_id to int for metadata cache lookup
-            metadata = metadata_cache.get(int(node_id))
-            if metadata:
-                pack = metadata.get("pack")
-                if pack:
-                    samples_by_pack[pack].append(node_id)
+        for sample_id, metadata in metadata_cache.iter_metadata(columns=["pack"]):
+            node_id = node_by_cache_id.get(sample_id)
+            if node_id is None:
+                continue
+            pack = metadata.get("pack")
+            if pack:
+                samples_by_pack[pack].append(node_id)
 
         # Create edges between all samples in same pack
         edges_added = 0
@@ -215,7 +227,9 @@ class EdgeGenerator:
         """
         Generate edges between samples with similar tags.
 
-        Uses Jaccard similarity: |A ∩ B| / |A ∪ B|
+        Uses Jaccard similarity: |A ∩ B| / |A ∪ B|, computed for every pair
+        with the sparse tag matrix kernel (jaccard_edges), whose row blocks
+        run on all CPU cores.
 
         Args:
             graph: NetworkX graph
@@ -225,60 +239,35 @@ class EdgeGenerator:
         Returns:
             Number of edges added
         """
-        # Get all node IDs
-        node_ids = list(graph.nodes())
-
-        # Compute tag similarity for all pairs
-        edges_added = 0
-        total_pairs = len(node_ids) * (len(node_ids) - 1) // 2
-
-        # For large graphs, sample pairs to avoid O(n^2) complexity
-        if total_pairs > 100000:
-            self.logger.warning(
-                f"Large graph ({len(node_ids)} nodes, {total_pairs} pairs). "
-                "Sampling 100,000 pairs for tag similarity..."
-            )
-            import random
+        # Collect tag sets (streamed, only the tags field decoded)
+        tag_sets = {}
+        node_by_cache_id = {int(node_id): node_id for node_id in graph.nodes()}
 
-            pairs = random.sample(list(combinations(node_ids, 2)), 100000)
-        else:
-            pairs = combinations(node_ids, 2)
-
-        for node1, node2 in pairs:
-            # Skip if edge already exists
-            if graph.has_edge(node1, node2):
+        for sample_id, metadata in metadata_cache.iter_metadata(columns=["tags"]):
+            node_id = node_by_cache_id.get(sample_id)
+            if node_id is None:
                 continue
+            tags = metadata.get("tags")
+            if tags:
+                tag_sets[node_id] = set(tags)
 
-            # Get tags for both samples (convert node IDs to int)
-            metadata1 = metadata_cache.get(int(node1))
-            metadata2 = metadata_cache.get(int(node2))
-
-            if not metadata1 or not metadata2:
-                continue
+        self.logger.info(f"Comparing tags of {len(tag_sets)} samples...")
+        src, dst, weight = jaccard_edges(tag_sets, threshold)
 
-            tags1 = set(metadata1.get("tags", []))
-            tags2 = set(metadata2.get("tags", []))
-
-            if not tags1 or not tags2:
-                continue
+        # Add all new edges in one graph update
+        node_ids = list(tag_sets)
+        edges = [
+            (node_ids[a], node_ids[b], {"edge_type": "tag", "similarity": similarity})
+            for a, b, similarity in zip(src.tolist(), dst.tolist(), weight.tolist())
+            if not graph.has_edge(node_ids[a], node_ids[b])
+        ]
+        graph.add_edges_from(edges)
 
-            # Compute Jaccard similarity
-            intersection = len(tags1 & tags2)
-            union = len(tags1 | tags2)
-
-            if union > 0:
-                similarity = intersection / union
-
-                if similarity >= threshold:
-                    graph.add_edge(node1, node2, edge_type="tag", similarity=similarity)
-                    edges_added += 1
-
-        return edges_added
+        return len(edges)
 
     def _load_graph(self) -> nx.Graph:
-        """Load graph topology from pickle file."""
-        with open(self.graph_path, "rb") as f:
-            return pickle.load(f)
+        """Load graph topology (snapshot + delta checkpoint journal)."""
+        return load_checkpoint_topology(self.checkpoint_dir, self.logger)
 
     def _load_metadata_cache(self) -> MetadataCache:
         """Load metadata cache from SQLite database."""
@@ -289,10 +278,38 @@ class EdgeGenerator:
         with open(self.checkpoint_meta_path, "r") as f:
             return json.load(f)
 
+    def _compact_processed_ids(self, checkpoint_meta: dict[str, Any]) -> None:
+        """
+        Merge journaled processed IDs into the full set before the journal is cleared.
+
+        Delta checkpoints keep the full set in processed_ids.json (omitted from
+        checkpoint_metadata.json) and journal later additions.
+        """
+        journal = TopologyJournal(str(self.journal_path), self.logger)
+        journaled: set[str] = set()
+        for record in journal.iter_batches():
+            journaled.update(record.get("processed", []))
+
+        if "processed_ids" in checkpoint_meta:
+            processed_ids = set(checkpoint_meta["processed_ids"])
+        elif self.processed_ids_path.exists():
+            with open(self.processed_ids_path) as f:
+                processed_ids = set(json.load(f))
+        else:
+            return
+        processed_ids |= journaled
+
+        checkpoint_meta["processed_ids"] = sorted(processed_ids)
+        if self.processed_ids_path.exists():
+            with open(self.processed_ids_path, "w") as f:
+                json.dump(checkpoint_meta["processed_ids"], f, separators=(",", ":"))
+
     def _save_graph(self, graph: nx.Graph) -> None:
         """Save graph topology to pickle file."""
         with open(self.graph_path, "wb") as f:
             pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # The pickle now holds every journaled change
+        TopologyJournal(str(self.journal_path), self.logger).clear()
 
     def _save_checkpoint_metadata(self, metadata: dict[str, Any]) -> None:
         """Save checkpoint metadata to JSON file."""
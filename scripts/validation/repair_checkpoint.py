@@ -69,6 +69,9 @@ EXPECTED_METADATA_FIELDS = {
     "geotag": str,
 }
 
+# Nodes whose cached metadata is fetched with one batched lookup
+METADATA_LOOKUP_BATCH_SIZE = 1000
+
 
 def setup_logging() -> logging.Logger:
     """Set up logging configuration."""
@@ -177,13 +180,20 @@ class ComprehensiveRepairer:
             metadata_cache: Metadata cache
         """
         nodes_to_remove = []
+        node_ids = list(graph.nodes())
+        cached_metadata: dict[int, dict[str, Any]] = {}
 
-        for node_id in graph.nodes():
+        for index, node_id in enumerate(node_ids):
             self.stats["nodes_checked"] += 1
 
-            # Get current metadata
+            # Get current metadata (fetched in batches of the fields we repair)
+            if index % METADATA_LOOKUP_BATCH_SIZE == 0:
+                cached_metadata = metadata_cache.get_many(
+                    node_ids[index : index + METADATA_LOOKUP_BATCH_SIZE],
+                    columns=list(EXPECTED_METADATA_FIELDS),
+                )
             node_data = graph.nodes[node_id]
-            metadata = metadata_cache.get(node_id)
+            metadata = cached_metadata.get(int(node_id))
 
             # Check for invalid filesize (0 bytes) - mark for removal
             filesize = node_data.get("filesize", 0)
@@ -460,10 +460,13 @@ class CheckpointValidator:
         # Sample nodes for performance
         sample_nodes = list(graph.nodes())[:VALIDATION_SAMPLE_SIZE]
 
+        # Convert string node IDs to integers for one batched cache lookup
+        found = metadata_cache.get_many(
+            (graph_id_to_cache_id(node_id) for node_id in sample_nodes),
+            columns=["id"],
+        )
         for node_id in sample_nodes:
-            # Convert string node ID to integer for metadata cache lookup
-            cache_id = graph_id_to_cache_id(node_id)
-            if metadata_cache.get(cache_id) is None:
+            if graph_id_to_cache_id(node_id) not in found:
                 missing_metadata.append(node_id)
 
         if missing_metadata:
@@ -489,8 +492,6 @@ class CheckpointValidator:
             Dictionary with samples_with_issues, total_issues, issues_by_field,
             and samples_needing_repair (list of sample IDs)
         """
-        import sqlite3
-
         # ALL expected fields (matches comprehensive_data_repair.py)
         expected_fields = {
             # Critical for visualization
@@ -520,20 +521,20 @@ class CheckpointValidator:
         issues_by_field = {}
         samples_needing_repair = []
 
-        conn = sqlite3.connect(str(self.metadata_db_path))
-        cursor = conn.cursor()
-        cursor.execute("SELECT sample_id, data FROM metadata")
-
-        for sample_id, data_json in cursor.fetchall():
-            data = json.loads(data_json)
-
+        # Stream only the fields being checked; missing fields come back as None
+        columns = [
+            *expected_fields,
+            "permanently_unavailable",
+            "_missing_from_freesound",
+        ]
+        for sample_id, data in metadata_cache.iter_metadata(columns=columns):
             # Skip samples marked as permanently unavailable
             # (tried twice: collection + repair, data doesn't exist on Freesound)
             if data.get("permanently_unavailable"):
                 continue
 
             # Get list of fields marked as missing from Freesound
-            missing_from_freesound = data.get("_missing_from_freesound", [])
+            missing_from_freesound = data.get("_missing_from_freesound") or []
 
             sample_has_issues = False
             for field_name, expected_type in expected_fields.items():
@@ -556,8 +557,6 @@ class CheckpointValidator:
                 samples_with_issues += 1
                 samples_needing_repair.append(sample_id)
 
-        conn.close()
-
         # Save results to file for repair script to read (avoid double scanning)
         results_file = self.checkpoint_dir / "data_quality_scan.json"
         with open(results_file, "w") as f:
@@ -8,7 +8,6 @@ and generates a Sigma.js visualization.
 
 import argparse
 import logging
-import pickle
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -17,13 +16,17 @@ from pathlib import Path
 repo_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(repo_root / "FollowWeb"))
 
-import networkx as nx  # noqa: E402
+from FollowWeb_Visualizor.analysis.groups import (  # noqa: E402
+    get_sample_groups,
+    group_edge_count,
+)
+from FollowWeb_Visualizor.data.checkpoint_reader import (  # noqa: E402
+    load_checkpoint_topology,
+)
 from FollowWeb_Visualizor.data.storage import MetadataCache  # noqa: E402
 from FollowWeb_Visualizor.visualization.renderers.sigma import SigmaRenderer  # noqa: E402
 
-
-# Checkpoint filenames
-GRAPH_TOPOLOGY_FILENAME = "graph_topology.gpickle"
+# Checkpoint filenames (topology files are resolved by load_checkpoint_topology)
 METADATA_CACHE_FILENAME = "metadata_cache.db"
 CHECKPOINT_META_FILENAME = "checkpoint_metadata.json"
 
@@ -36,19 +39,6 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
-def load_graph(graph_path: Path) -> nx.DiGraph:
-    """Load graph topology from pickle file."""
-    with open(graph_path, "rb") as f:
-        graph = pickle.load(f)  # nosec B301
-
-    if not isinstance(graph, (nx.Graph, nx.DiGraph)):
-        raise TypeError(
-            f"Expected NetworkX Graph or DiGraph, got {type(graph).__name__}"
-        )
-
-    return graph
-
-
 def main():
     """Load checkpoint and generate visualization."""
     parser = argparse.ArgumentParser(
@@ -71,24 +61,29 @@ def main():
         return 2
 
     # Load checkpoint components
-    graph_path = checkpoint_dir / GRAPH_TOPOLOGY_FILENAME
     metadata_db_path = checkpoint_dir / METADATA_CACHE_FILENAME
 
-    if not graph_path.exists():
-        logger.error(f"Graph topology file not found: {graph_path}")
-        return 2
-
     if not metadata_db_path.exists():
         logger.error(f"Metadata cache file not found: {metadata_db_path}")
         return 2
 
-    # Load graph
-    logger.info(f"Loading graph from: {graph_path}")
+    # Load graph (topology snapshot + delta checkpoint journal + hub groups)
+    logger.info(f"Loading graph from: {checkpoint_dir}")
     try:
-        graph = load_graph(graph_path)
+        graph = load_checkpoint_topology(checkpoint_dir, logger)
         logger.info(
             f"Loaded graph: {graph.number_of_nodes()} nodes, {graph.number_of_edges()} edges"
         )
+        # Hub groups are drawn as stars and counted in node sizes
+        group_count = sum(len(groups) for groups in get_sample_groups(graph).values())
+        if group_count:
+            logger.info(
+                f"Loaded {group_count} sample groups "
+                f"(standing for {group_edge_count(graph)} clique edges)"
+            )
+    except FileNotFoundError as e:
+        logger.error(f"Graph topology file not found: {e}")
+        return 2
     except Exception as e:
         logger.error(f"Failed to load graph: {e}")
         import traceback
@@ -100,15 +95,13 @@ def main():
     logger.info(f"Loading metadata from: {metadata_db_path}")
     try:
         with MetadataCache(str(metadata_db_path), logger) as metadata_cache:
-            # Attach metadata to nodes
-            for node_id in graph.nodes():
-                # Convert string node ID to integer for metadata lookup
-                cache_id = int(node_id)
-                metadata = metadata_cache.get(cache_id)
-                if metadata:
+            # Attach metadata to nodes (streamed in pages, one query)
+            for sample_id, metadata in metadata_cache.iter_metadata():
+                # Cache IDs are integers, graph node IDs are strings
+                node_id = str(sample_id)
+                if metadata and node_id in graph:
                     # Attach metadata as node attributes
-                    for key, value in metadata.items():
-                        graph.nodes[node_id][key] = value
+                    graph.nodes[node_id].update(metadata)
 
             logger.info(f"Attached metadata to {graph.number_of_nodes()} nodes")
     except Exception as e: